@@ -0,0 +1,91 @@
+"""Headroom-driven adaptive hard-channel sampling interval (T5).
+
+A fixed :attr:`~llama_optimizer.supervisor.SupervisorConfig.interval`
+over-samples idle finalists that sit gigabytes below the ceiling and
+under-samples configs hovering just beneath it. With an
+:class:`AdaptiveIntervalConfig` the supervisor asks an :class:`AdaptivePacer`
+for the wait before each next read:
+
+* within ``margin`` of the ceiling, or rising at least ``rise_rate`` bytes/s,
+  the pacer drops straight to ``min_interval``;
+* otherwise it backs off geometrically by ``backoff`` toward ``max_interval``;
+* while used bytes are rising at all, it never sleeps past half the projected
+  time to the ceiling;
+* the result is always clamped to ``max_staleness``, so the hard channel is
+  never left unread for longer than a reading is allowed to age.
+
+Every chosen interval is recorded beside its reading in the telemetry series.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Final, final
+
+from llama_optimizer.telemetry import VRAM_CEILING_BYTES, Bytes
+
+_GIB: Final[int] = 1 << 30
+_MIB: Final[int] = 1 << 20
+_DEFAULT_MARGIN: Final[Bytes] = Bytes(_GIB)
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveIntervalConfig:
+    """Bounds and triggers for adaptive pacing; validated on construction."""
+
+    min_interval: timedelta = timedelta(milliseconds=50)
+    max_interval: timedelta = timedelta(seconds=2)
+    margin: Bytes = _DEFAULT_MARGIN
+    rise_rate: float = 256 * _MIB
+    backoff: float = 2.0
+
+    def __post_init__(self) -> None:
+        """Reject empty ranges and non-growing backoff."""
+        if not timedelta(0) < self.min_interval <= self.max_interval:
+            msg = "need 0 < min_interval <= max_interval"
+            raise ValueError(msg)
+        if int(self.margin) < 0 or self.rise_rate <= 0:
+            msg = "margin must be >= 0 and rise_rate > 0"
+            raise ValueError(msg)
+        if self.backoff <= 1.0:
+            msg = f"backoff must be > 1, got {self.backoff}"
+            raise ValueError(msg)
+
+
+@final
+class AdaptivePacer:
+    """Chooses the wait before the next hard-channel read from the last two readings."""
+
+    def __init__(
+        self,
+        config: AdaptiveIntervalConfig,
+        *,
+        initial: timedelta,
+        max_staleness: timedelta,
+        ceiling: Bytes = VRAM_CEILING_BYTES,
+    ) -> None:
+        self._config: Final = config
+        self._ceiling: Final[int] = int(ceiling)
+        self._cap: Final[timedelta] = min(config.max_interval, max_staleness)
+        self._current: timedelta = min(max(initial, config.min_interval), self._cap)
+        self._last: tuple[float, int] | None = None
+
+    def next_interval(self, elapsed: timedelta, used: Bytes) -> timedelta:
+        """Record one reading at ``elapsed`` since launch and return the next wait."""
+        now = elapsed.total_seconds()
+        rate = 0.0
+        if self._last is not None and now > self._last[0]:
+            rate = (int(used) - self._last[1]) / (now - self._last[0])
+        self._last = (now, int(used))
+        headroom = self._ceiling - int(used)
+        config = self._config
+        if headroom <= int(config.margin) or rate >= config.rise_rate:
+            self._current = config.min_interval
+        else:
+            self._current = min(self._current * config.backoff, config.max_interval)
+            if rate > 0:
+                half_time_to_ceiling = timedelta(seconds=headroom / rate / 2)
+                self._current = max(config.min_interval, min(self._current, half_time_to_ceiling))
+        self._current = min(self._current, self._cap)
+        return self._current
@@ -6,13 +6,27 @@ importing from ``llama_optimizer.bench``.
 
 from __future__ import annotations
 
-from llama_optimizer.bench_command import build_bench_command
-from llama_optimizer.bench_parser import parse_bench_jsonl
-from llama_optimizer.bench_runner import classify_child_exit, run_supervised_bench
+from llama_optimizer.bench_command import build_bench_command, build_sweep_command
+from llama_optimizer.bench_depth import DEFAULT_DEPTH_PROFILE, depth_metrics
+from llama_optimizer.bench_drift import (
+    DriftCurve,
+    DriftReference,
+    DriftScreening,
+    screen_with_drift,
+)
+from llama_optimizer.bench_parser import demux_bench_jsonl, parse_bench_jsonl
+from llama_optimizer.bench_runner import (
+    classify_child_exit,
+    run_supervised_bench,
+    run_supervised_bench_sweep,
+)
+from llama_optimizer.bench_sweep import plan_bench_sweeps
 from llama_optimizer.bench_types import (
     DEFAULT_BENCH_CONFIG,
     PP512,
     TG128,
+    AdaptiveRepetitions,
+    BenchCacheLookup,
     BenchConfig,
     BenchIdentity,
     BenchMeasurement,
@@ -20,14 +34,22 @@ from llama_optimizer.bench_types import (
     BenchSample,
     BenchScreenRequest,
     BenchScreenResult,
+    BenchSweepResult,
     BenchWorkload,
+    CachePolicy,
+    CacheProvenance,
+    DepthPoint,
     MeasurementFailureError,
+    StopReason,
 )
 
 __all__ = (
     "DEFAULT_BENCH_CONFIG",
+    "DEFAULT_DEPTH_PROFILE",
     "PP512",
     "TG128",
+    "AdaptiveRepetitions",
+    "BenchCacheLookup",
     "BenchConfig",
     "BenchIdentity",
     "BenchMeasurement",
@@ -35,10 +57,24 @@ __all__ = (
     "BenchSample",
     "BenchScreenRequest",
     "BenchScreenResult",
+    "BenchSweepResult",
     "BenchWorkload",
+    "CachePolicy",
+    "CacheProvenance",
+    "DepthPoint",
+    "DriftCurve",
+    "DriftReference",
+    "DriftScreening",
     "MeasurementFailureError",
+    "StopReason",
     "build_bench_command",
+    "build_sweep_command",
     "classify_child_exit",
+    "demux_bench_jsonl",
+    "depth_metrics",
     "parse_bench_jsonl",
+    "plan_bench_sweeps",
     "run_supervised_bench",
+    "run_supervised_bench_sweep",
+    "screen_with_drift",
 )
@@ -0,0 +1,153 @@
+"""Sequential early stopping for llama-bench repetitions (T6).
+
+:data:`~llama_optimizer.bench_types.DEFAULT_BENCH_CONFIG` runs a fixed three
+repetitions whether the samples agree to 0.1% or scatter by 10%. With
+``BenchConfig.adaptive`` set, ``repetitions`` becomes a hard cap and the screen
+runs llama-bench in rounds: llama-bench only reports samples when its process
+finishes, so a round is one launch of ``-r batch`` (the page-cache warmer
+keeps relaunch cost low). After each round the pooled per-repetition samples
+of every workload decide whether to launch another:
+
+* ``converged`` - every workload's Student-t confidence interval on ``avg_ts``
+  is narrower than ``target_rel_ci`` of its mean;
+* ``dominated`` - the request names the incumbent's ``avg_ts`` per workload and
+  this config's upper confidence bound is below it on every named workload;
+* ``capped`` - ``repetitions`` samples per workload have been collected.
+
+A round that exits cleanly but adds no sample to some workload (an empty or
+duplicate JSONL) ends the screen as ``aborted``, which scores it as a
+measurement failure; ``repetitions`` also bounds the number of rounds, since
+every productive round adds at least one sample.
+
+Each round's JSONL stays on disk as ``<stem>.round-<n>.*`` and the pooled
+stream is the recorded artifact, so every sample remains in the evidence trail.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from dataclasses import replace
+from pathlib import Path
+from statistics import fmean, stdev
+from typing import TYPE_CHECKING
+
+from llama_optimizer.bench_command import build_bench_command
+from llama_optimizer.bench_parser import parse_bench_jsonl
+from llama_optimizer.bench_stats import t_quantile
+from llama_optimizer.bench_supervision import supervise_bench
+from llama_optimizer.bench_types import MIN_CI_SAMPLES, MeasurementFailureError, StopReason
+from llama_optimizer.phase_spans import SpanRecorder
+from llama_optimizer.stdio_capture import CapturedStream
+from llama_optimizer.supervisor import ChildExit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from llama_optimizer.bench_supervision import BenchSupervision, SupervisedBench
+    from llama_optimizer.bench_types import AdaptiveRepetitions, BenchResult, BenchScreenRequest
+    from llama_optimizer.ledger_records import PhaseSpanRow
+    from llama_optimizer.page_cache import PrewarmReport
+    from llama_optimizer.supervisor import SupervisorResult
+
+
+def mean_ci(values: Sequence[float], confidence: float) -> tuple[float, float]:
+    """Return the mean and its two-sided CI half-width (``inf`` below :data:`MIN_CI_SAMPLES`)."""
+    mean = fmean(values)
+    if len(values) < MIN_CI_SAMPLES:
+        return mean, math.inf
+    return mean, t_quantile(confidence, len(values) - 1) * stdev(values) / math.sqrt(len(values))
+
+
+def stop_reason(
+    result: BenchResult,
+    rule: AdaptiveRepetitions,
+    *,
+    cap: int,
+    incumbent: Mapping[str, float] | None = None,
+) -> StopReason | None:
+    """Decide from pooled samples whether another round is needed (``None``)."""
+    collected = min(len(m.samples) for m in result.measurements)
+    if collected < rule.min_samples:
+        return StopReason.CAPPED if collected >= cap else None
+    intervals = {
+        m.workload_name: mean_ci([s.ts for s in m.samples], rule.confidence)
+        for m in result.measurements
+    }
+    if all(half <= rule.target_rel_ci * abs(mean) for mean, half in intervals.values()):
+        return StopReason.CONVERGED
+    named = [
+        (intervals[name], best) for name, best in (incumbent or {}).items() if name in intervals
+    ]
+    if named and all(mean + half < best for (mean, half), best in named):
+        return StopReason.DOMINATED
+    return StopReason.CAPPED if collected >= cap else None
+
+
+def supervise_adaptive(
+    sup: BenchSupervision, request: BenchScreenRequest, stem: str
+) -> SupervisedBench:
+    """Run llama-bench in rounds until :func:`stop_reason` or a failed round ends it.
+
+    The returned run pools every round's JSONL into ``<stem>.stdout.jsonl``
+    and carries the last round's supervisor result (earlier ones in
+    ``earlier``), so a failed round is classified exactly as a one-shot run.
+    A round that adds no samples, or running out of rounds, sets ``aborted``.
+    """
+    config = request.bench_config
+    rule = config.adaptive
+    if rule is None:
+        msg = "supervise_adaptive needs a bench config with adaptive repetitions"
+        raise ValueError(msg)
+    names = tuple(w.name for w in config.workloads)
+    earlier: list[SupervisorResult] = []
+    spans: list[PhaseSpanRow] = []
+    prewarm: PrewarmReport | None = None
+    pooled = ""
+    collected = 0
+    stalled: str | None = None
+    while True:
+        reps = min(max(rule.batch, rule.min_samples - collected), config.repetitions - collected)
+        command = build_bench_command(
+            request.binary, replace(config, repetitions=reps), request.identity
+        )
+        run = supervise_bench(
+            sup, request, command, (request.identity,), f"{stem}.round-{len(earlier)}"
+        )
+        prewarm = prewarm or run.prewarm
+        if run.raw_jsonl.strip():
+            pooled += run.raw_jsonl.rstrip("\n") + "\n"
+        spans.extend(run.spans.spans)
+        reason: StopReason | None = None
+        if run.result.outcome != ChildExit(0) or run.aborted is not None:
+            break
+        try:
+            parsed = parse_bench_jsonl(
+                pooled, expected=request.identity, expected_workload_names=names
+            )
+        except MeasurementFailureError:
+            break
+        if min(len(m.samples) for m in parsed.measurements) <= collected:
+            stalled = f"adaptive round {len(earlier)} added no samples"
+            break
+        collected = min(len(m.samples) for m in parsed.measurements)
+        reason = stop_reason(parsed, rule, cap=config.repetitions, incumbent=request.incumbent)
+        if reason is not None:
+            break
+        if len(earlier) + 1 >= config.repetitions:
+            stalled = f"no stopping rule fired within {config.repetitions} rounds"
+            break
+        earlier.append(run.result)
+    stdout = Path(f"{stem}.stdout.jsonl")
+    _ = stdout.write_text(pooled)
+    digest = hashlib.sha256(pooled.encode()).hexdigest()
+    return replace(
+        run,
+        raw_jsonl=pooled,
+        stdout=CapturedStream(stdout, digest, len(pooled.encode())),
+        spans=SpanRecorder(initial=spans),
+        prewarm=prewarm,
+        aborted=run.aborted or stalled,
+        earlier=tuple(earlier),
+        stop_reason=reason,
+    )
@@ -0,0 +1,181 @@
+"""Content-addressed cross-run cache of llama-bench measurements (T6).
+
+Re-running the optimizer after a profile tweak would otherwise re-measure
+every (llama.cpp build, model sha256, backend, :class:`BenchIdentity`, bench
+config) combination from scratch. A :class:`MeasurementKey` hashes those
+fields as canonical JSON; each successful screen stores its raw JSONL plus an
+``entry.json`` (key, provenance, JSONL hash, parsed samples) under
+``<root>/<digest>/``, the entry being published last so a half-written entry is
+never visible.
+
+A lookup re-hashes the cached JSONL and re-parses it against the request's
+identity, so a corrupted or mismatched entry is a miss rather than a wrong
+number. Screens an adaptive rule stopped as ``dominated`` are not stored: how
+early they stopped depended on that run's incumbent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.bench_parser import parse_bench_jsonl
+from llama_optimizer.bench_types import (
+    CachePolicy,
+    CacheProvenance,
+    MeasurementFailureError,
+    StopReason,
+)
+from llama_optimizer.ledger_io import atomic_publish
+from llama_optimizer.server_json import loads_mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from llama_optimizer.bench_types import (
+        BenchCacheLookup,
+        BenchConfig,
+        BenchIdentity,
+        BenchResult,
+        BenchScreenRequest,
+    )
+    from llama_optimizer.models import LlamaCppBuild, Sha256Hex
+
+#: Ledger artifact kind of the cache entry a reused attempt was answered from.
+BENCH_CACHE_ARTIFACT_KIND: Final[str] = "bench-cache-entry"
+
+_ENTRY: Final[str] = "entry.json"
+_JSONL: Final[str] = "bench.jsonl"
+
+
+@dataclass(frozen=True, slots=True)
+class MeasurementKey:
+    """Every input that determines a llama-bench measurement."""
+
+    build: LlamaCppBuild
+    model_sha256: Sha256Hex
+    backend: str
+    identity: BenchIdentity
+    bench_config: BenchConfig
+
+    @classmethod
+    def for_request(cls, request: BenchScreenRequest, lookup: BenchCacheLookup) -> MeasurementKey:
+        """Combine the request's identity and config with the lookup's build fields."""
+        return cls(
+            lookup.build,
+            lookup.model_sha256,
+            lookup.backend,
+            request.identity,
+            request.bench_config,
+        )
+
+    def canonical(self) -> dict[str, object]:
+        """Return the key as JSON-compatible primitives."""
+        return asdict(self)
+
+    def digest(self) -> str:
+        """Return the SHA-256 of the key's canonical (sorted, compact) JSON."""
+        text = json.dumps(self.canonical(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(text.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedMeasurement:
+    """A verified cache entry: its files, their hashes, and the parsed result."""
+
+    entry: Path
+    entry_sha256: str
+    jsonl: Path
+    jsonl_sha256: str
+    result: BenchResult
+    provenance: CacheProvenance
+
+
+def lookup_measurement(request: BenchScreenRequest) -> CachedMeasurement | None:
+    """Return the request's cached measurement if its policy allows reuse."""
+    lookup = request.cache
+    if lookup is None or lookup.policy is CachePolicy.REMEASURE:
+        return None
+    directory = lookup.root / MeasurementKey.for_request(request, lookup).digest()
+    try:
+        entry_bytes = (directory / _ENTRY).read_bytes()
+        raw = (directory / _JSONL).read_bytes()
+        entry = loads_mapping(entry_bytes.decode(), error=MeasurementFailureError)
+        provenance = _provenance(entry)
+        if entry.get("jsonl_sha256") != hashlib.sha256(raw).hexdigest():
+            return None
+        result = parse_bench_jsonl(
+            raw.decode(),
+            expected=request.identity,
+            expected_workload_names=tuple(w.name for w in request.bench_config.workloads),
+        )
+    except (OSError, UnicodeDecodeError, MeasurementFailureError):
+        return None
+    max_age = lookup.max_age
+    if lookup.policy is CachePolicy.REUSE_IF_FRESH and (
+        max_age is None or datetime.now(UTC) - provenance.recorded_at > max_age
+    ):
+        return None
+    return CachedMeasurement(
+        entry=directory / _ENTRY,
+        entry_sha256=hashlib.sha256(entry_bytes).hexdigest(),
+        jsonl=directory / _JSONL,
+        jsonl_sha256=hashlib.sha256(raw).hexdigest(),
+        result=result,
+        provenance=provenance,
+    )
+
+
+def store_measurement(
+    request: BenchScreenRequest,
+    result: BenchResult,
+    provenance: CacheProvenance,
+    stop_reason: StopReason | None = None,
+) -> Path | None:
+    """Publish a successful screen's JSONL and entry; return the entry path.
+
+    Returns ``None`` when the request has no cache or the screen stopped as
+    ``dominated``.
+    """
+    lookup = request.cache
+    if lookup is None or stop_reason is StopReason.DOMINATED:
+        return None
+    key = MeasurementKey.for_request(request, lookup)
+    directory = lookup.root / key.digest()
+    raw = result.raw_jsonl.encode()
+    atomic_publish(directory / _JSONL, raw)
+    entry = {
+        "key": key.canonical(),
+        "run_id": provenance.run_id,
+        "attempt_id": provenance.attempt_id,
+        "recorded_at": provenance.recorded_at.isoformat(),
+        "jsonl_sha256": hashlib.sha256(raw).hexdigest(),
+        "model": result.model,
+        "build": result.build,
+        "samples": {
+            m.workload_name: [[s.ns, s.ts] for s in m.samples] for m in result.measurements
+        },
+    }
+    atomic_publish(
+        directory / _ENTRY, (json.dumps(entry, sort_keys=True, indent=2) + "\n").encode()
+    )
+    return directory / _ENTRY
+
+
+def _provenance(entry: Mapping[str, object]) -> CacheProvenance:
+    """Read the originating run, attempt, and timestamp from a cache entry."""
+    run_id, attempt_id = entry.get("run_id"), entry.get("attempt_id")
+    recorded_at = entry.get("recorded_at")
+    if not (
+        isinstance(run_id, str) and isinstance(attempt_id, str) and isinstance(recorded_at, str)
+    ):
+        raise MeasurementFailureError(reason="cache entry lacks its provenance")
+    try:
+        stamp = datetime.fromisoformat(recorded_at)
+    except ValueError as exc:
+        raise MeasurementFailureError(reason=f"cache entry recorded_at: {exc}") from exc
+    return CacheProvenance(run_id, attempt_id, stamp)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from llama_optimizer.bench_types import BenchConfig, BenchIdentity
 
 
@@ -15,15 +17,40 @@ def build_bench_command(
 ) -> list[str]:
     """Construct the llama-bench argument array without shell interpolation.
 
-    Forces ``-o jsonl``, exact depth ``32768``, warmup enabled (``--no-warmup``
+    Forces ``-o jsonl``, exact depth ``32768`` (or the config's depth profile,
+    which always includes it), warmup enabled (``--no-warmup``
     is never passed), repetitions/delay from the config, and explicit
-    backend/model/config flags from the identity. All values are separate argv
-    elements; no shell interpolation is used.
+    backend/model/config flags from the identity. Split mode is always explicit;
+    tensor split (``/``-separated per-card proportions) is passed only when set.
+    All values are separate argv elements; no shell interpolation is used.
+    """
+    return build_sweep_command(binary, config, (identity,))
+
+
+def build_sweep_command(
+    binary: str,
+    config: BenchConfig,
+    identities: Sequence[BenchIdentity],
+) -> list[str]:
+    """Construct one llama-bench run covering every identity in ``identities``.
+
+    The identities must share the model load (:func:`sweep_load_key`); the
+    per-config flags (``-ngl -b -ub -ctk -ctv -t -fa``) become comma-joined
+    lists of their distinct values in first-seen order. llama-bench runs the
+    cartesian product of those lists, so callers bound the extra combinations
+    (see :mod:`llama_optimizer.bench_sweep`). A single identity yields exactly
+    the :func:`build_bench_command` argv.
     """
-    fa_val = "on" if identity.flash_attn == 1 else "off"
-    mmp_val = "1" if identity.use_mmap else "0"
+    if not identities:
+        msg = "a bench sweep needs at least one identity"
+        raise ValueError(msg)
+    first = identities[0]
+    if any(sweep_load_key(i) != sweep_load_key(first) for i in identities):
+        msg = "a bench sweep cannot mix models, mmap, or split settings"
+        raise ValueError(msg)
     prompt_values = ",".join(str(w.n_prompt) for w in config.workloads)
     gen_values = ",".join(str(w.n_gen) for w in config.workloads)
+    split = ["-ts", first.tensor_split] if first.tensor_split else []
     return [
         binary,
         "-o",
@@ -33,27 +60,40 @@ def build_bench_command(
         "--delay",
         str(config.delay_seconds),
         "-d",
-        str(config.context_size),
+        _joined(config.depth_profile or (config.context_size,)),
         "-m",
-        identity.model_filename,
+        first.model_filename,
         "-ngl",
-        str(identity.n_gpu_layers),
+        _joined(i.n_gpu_layers for i in identities),
         "-b",
-        str(identity.n_batch),
+        _joined(i.n_batch for i in identities),
         "-ub",
-        str(identity.n_ubatch),
+        _joined(i.n_ubatch for i in identities),
         "-ctk",
-        identity.type_k,
+        _joined(i.type_k for i in identities),
         "-ctv",
-        identity.type_v,
+        _joined(i.type_v for i in identities),
         "-t",
-        str(identity.n_threads),
+        _joined(i.n_threads for i in identities),
         "-fa",
-        fa_val,
+        _joined("on" if i.flash_attn == 1 else "off" for i in identities),
         "-mmp",
-        mmp_val,
+        "1" if first.use_mmap else "0",
+        "-sm",
+        first.split_mode,
+        *split,
         "-p",
         prompt_values,
         "-n",
         gen_values,
     ]
+
+
+def sweep_load_key(identity: BenchIdentity) -> tuple[str, bool, str, str]:
+    """Return the fields one llama-bench process cannot vary without another run."""
+    return (identity.model_filename, identity.use_mmap, identity.split_mode, identity.tensor_split)
+
+
+def _joined(values: Iterable[object]) -> str:
+    """Comma-join the distinct values in first-seen order."""
+    return ",".join(dict.fromkeys(str(v) for v in values))
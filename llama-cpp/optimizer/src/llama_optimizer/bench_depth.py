@@ -0,0 +1,59 @@
+"""Throughput-vs-KV-depth summaries for depth-profile screens (T6).
+
+Comparable screening pins llama-bench at the full 32768 context depth, but
+agentic sessions spend most of their time far shallower. A
+:class:`~llama_optimizer.bench_types.BenchConfig` with a ``depth_profile``
+(e.g. :data:`DEFAULT_DEPTH_PROFILE`) measures every workload at each depth in
+the same launch; the 32768 rows remain the comparable measurements and the
+rest form the parsed ``depth_curve``.
+
+Each workload's curve is summarized as two ranking metrics:
+
+* ``<workload>_depth_slope_ts`` - the least-squares slope of ``avg_ts`` over
+  depth, in tokens/s per 1024 tokens of depth (negative when depth hurts);
+* ``<workload>_depth_auc_ts`` - the trapezoidal area under the curve divided
+  by the depth span, i.e. the mean throughput across the profiled depths.
+"""
+
+from __future__ import annotations
+
+import statistics
+from itertools import pairwise
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.bench_types import BenchResult, DepthPoint
+
+#: A shallow-to-full depth profile for agentic workloads.
+DEFAULT_DEPTH_PROFILE: Final[tuple[int, ...]] = (0, 4096, 16384, 32768)
+_DEPTH_UNIT: Final[int] = 1024
+
+
+def depth_slope(curve: Sequence[DepthPoint]) -> float:
+    """Return the least-squares ``avg_ts`` slope per 1024 tokens of depth."""
+    slope, _ = statistics.linear_regression(
+        [p.n_depth / _DEPTH_UNIT for p in curve], [p.avg_ts for p in curve]
+    )
+    return slope
+
+
+def depth_auc(curve: Sequence[DepthPoint]) -> float:
+    """Return the trapezoidal area under ``avg_ts`` over depth, per unit of depth."""
+    span = curve[-1].n_depth - curve[0].n_depth
+    area = sum((b.n_depth - a.n_depth) * (a.avg_ts + b.avg_ts) / 2 for a, b in pairwise(curve))
+    return area / span
+
+
+def depth_metrics(result: BenchResult) -> dict[str, float]:
+    """Summarize each workload's depth curve (empty without a depth profile)."""
+    curves: dict[str, list[DepthPoint]] = {}
+    for point in result.depth_curve:
+        curves.setdefault(point.workload_name, []).append(point)
+    metrics: dict[str, float] = {}
+    for name, curve in curves.items():
+        if len(curve) > 1:
+            metrics[f"{name}_depth_slope_ts"] = depth_slope(curve)
+            metrics[f"{name}_depth_auc_ts"] = depth_auc(curve)
+    return metrics
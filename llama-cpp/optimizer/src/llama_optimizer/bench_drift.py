@@ -0,0 +1,187 @@
+"""Drift-corrected llama-bench screening with an interleaved reference (T6).
+
+T9 shuffles finalists so thermal warmup or cooldown favours none of them, but
+screening runs configs in optimizer order, and over a long sweep the card
+heats and every later config reads slower. :func:`screen_with_drift`
+therefore re-measures one fixed reference config before the first trial,
+after every ``every`` trials, and after the last. Each reference measurement
+is its own ledger trial (``<config_id>~ref<n>``). No optimizer trial stands
+behind these IDs, so each is abandoned as soon as its attempt is recorded: a
+scored one as ``invalid`` for search with a drift-reference reason (its
+metrics stay on its succeeded attempt), one that did not score with its own
+outcome.
+
+The reference's ``avg_ts`` per workload, relative to its first measurement,
+is the drift curve, linearly interpolated between reference points (and held
+flat before the first and after the last). Every measured trial keeps its raw
+``<workload>_avg_ts`` and additionally gets ``<workload>_drift_factor`` and the
+drift-normalised ``<workload>_avg_ts_drift_norm`` (raw divided by the factor),
+so a trial screened at minute 5 compares with one screened at minute 90.
+The reference always re-measures; trial results reused from the measurement
+cache are not normalised.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from llama_optimizer.bench_runner import run_supervised_bench
+from llama_optimizer.lifecycle import NonScoredOutcome
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from datetime import datetime
+
+    from llama_optimizer.bench_supervision import BenchSupervision
+    from llama_optimizer.bench_types import BenchScreenRequest, BenchScreenResult
+    from llama_optimizer.ledger import Ledger
+    from llama_optimizer.ledger_records import TrialConfig
+
+
+@dataclass(frozen=True, slots=True)
+class DriftReference:
+    """The fixed reference config and how many trials run between its re-measurements.
+
+    ``request`` is a template: each re-measurement replaces its ``trial_id``
+    with a fresh trial derived from ``trial``.
+    """
+
+    trial: TrialConfig
+    request: BenchScreenRequest
+    every: int = 5
+
+    def __post_init__(self) -> None:
+        """Require at least one trial between reference measurements."""
+        if self.every < 1:
+            msg = f"reference interval must be >= 1 trial, got {self.every}"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class DriftPoint:
+    """One successful reference measurement: its midpoint time and ``avg_ts`` per workload."""
+
+    at: datetime
+    avg_ts: Mapping[str, float]
+
+
+@dataclass(frozen=True, slots=True)
+class DriftCurve:
+    """Reference throughput over time, relative to the first reference measurement."""
+
+    points: tuple[DriftPoint, ...]
+
+    def factor(self, workload: str, at: datetime) -> float | None:
+        """Return the interpolated slowdown factor at ``at`` (``None`` without references)."""
+        series = [(p.at, p.avg_ts[workload]) for p in self.points if workload in p.avg_ts]
+        if not series:
+            return None
+        base = series[0][1]
+        times = [t for t, _ in series]
+        right = bisect_right(times, at)
+        if right == 0:
+            return 1.0
+        if right == len(series):
+            return series[-1][1] / base
+        (t0, v0), (t1, v1) = series[right - 1], series[right]
+        weight = (at - t0) / (t1 - t0)
+        return (v0 + weight * (v1 - v0)) / base
+
+
+@dataclass(frozen=True, slots=True)
+class DriftScreening:
+    """Screened trials (with normalised metrics), reference results, and the curve."""
+
+    trials: tuple[BenchScreenResult, ...]
+    references: tuple[BenchScreenResult, ...]
+    curve: DriftCurve
+
+
+def _midpoint(result: BenchScreenResult) -> datetime:
+    started = result.supervisor_result.started_at
+    return started + (result.supervisor_result.ended_at - started) / 2
+
+
+def _measure_reference(
+    sup: BenchSupervision, ledger: Ledger, reference: DriftReference, number: int
+) -> BenchScreenResult:
+    """Create, start, screen, and finalize the ``number``-th reference trial.
+
+    The trial is always abandoned once its attempt is recorded: with its own
+    outcome if it did not score, otherwise as ``invalid`` for search.
+    """
+    config = reference.trial
+    trial = ledger.create_trial(
+        replace(
+            config,
+            config_id=f"{config.config_id}~ref{number}",
+            config_hash=f"{config.config_hash}~ref{number}",
+        )
+    )
+    _ = ledger.start_trial(trial.trial_id)
+    # A reference answered from the measurement cache would say nothing about now.
+    request = replace(reference.request, trial_id=trial.trial_id, cache=None)
+    result = run_supervised_bench(sup.supervisor, sup.provider, sup.config, ledger, request)
+    if result.outcome is None:
+        outcome = NonScoredOutcome.INVALID
+        reason = "drift reference: scored for the drift curve, not a search trial"
+    else:
+        outcome = result.outcome
+        reason = f"drift reference did not score: {result.outcome.value}"
+    ledger.abandon_trial(trial.trial_id, outcome=outcome, reason=reason)
+    return result
+
+
+def _normalised(result: BenchScreenResult, curve: DriftCurve) -> dict[str, float]:
+    """Return the drift factor and normalised ``avg_ts`` of each measured workload."""
+    if result.result is None or result.reused_from is not None:
+        return {}
+    metrics: dict[str, float] = {}
+    for m in result.result.measurements:
+        factor = curve.factor(m.workload_name, _midpoint(result))
+        if factor is not None and factor > 0:
+            metrics[f"{m.workload_name}_drift_factor"] = factor
+            metrics[f"{m.workload_name}_avg_ts_drift_norm"] = m.avg_ts / factor
+    return metrics
+
+
+def screen_with_drift(
+    sup: BenchSupervision,
+    ledger: Ledger,
+    requests: Sequence[BenchScreenRequest],
+    reference: DriftReference,
+) -> DriftScreening:
+    """Screen ``requests`` in order, interleaving reference re-measurements.
+
+    Once every trial and reference has run, the drift metrics are added to
+    each successfully measured trial's attempt; the returned trial results
+    carry them too.
+
+    The caller owns the trials behind ``requests`` and leaves them RUNNING
+    for it to commit or abandon. The reference trials were created here, so
+    they are finalized here and none is left RUNNING.
+    """
+    references = [_measure_reference(sup, ledger, reference, 0)]
+    trials: list[BenchScreenResult] = []
+    for index, request in enumerate(requests, start=1):
+        trials.append(
+            run_supervised_bench(sup.supervisor, sup.provider, sup.config, ledger, request)
+        )
+        if index % reference.every == 0 or index == len(requests):
+            references.append(_measure_reference(sup, ledger, reference, len(references)))
+    curve = DriftCurve(
+        tuple(
+            DriftPoint(_midpoint(r), {m.workload_name: m.avg_ts for m in r.result.measurements})
+            for r in references
+            if r.result is not None and r.outcome is None and r.reused_from is None
+        )
+    )
+    corrected: list[BenchScreenResult] = []
+    for result in trials:
+        extra = _normalised(result, curve)
+        if extra:
+            ledger.record_metrics(result.attempt_id, extra)
+        corrected.append(replace(result, metrics={**result.metrics, **extra}))
+    return DriftScreening(tuple(corrected), tuple(references), curve)
@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import json
 import math
-from collections.abc import Mapping
-from typing import TypeIs
+import statistics
+from collections.abc import Mapping, Sequence
+from typing import Final, TypeIs
 
 from llama_optimizer.bench_types import (
     BenchIdentity,
     BenchMeasurement,
     BenchResult,
     BenchSample,
+    DepthPoint,
     MeasurementFailureError,
 )
+from llama_optimizer.profile_manifest import REQUIRED_CONTEXT_SIZE
 
 
 def _is_str_mapping(value: object) -> TypeIs[Mapping[str, object]]:
@@ -83,6 +86,51 @@ def _req_float_list(obj: Mapping[str, object], key: str) -> list[float]:
     return result
 
 
+type _IdentityKey = tuple[str, int, int, int, str, str, int, int, str]
+
+_KEY_FIELDS: Final = (
+    "model",
+    "n_gpu_layers",
+    "n_batch",
+    "n_ubatch",
+    "type_k",
+    "type_v",
+    "n_threads",
+    "flash_attn",
+    "split_mode",
+)
+
+
+def _identity_key(identity: BenchIdentity) -> _IdentityKey:
+    """Return the fields :func:`_check_identity` cross-checks as a hashable key."""
+    return (
+        identity.model_filename,
+        identity.n_gpu_layers,
+        identity.n_batch,
+        identity.n_ubatch,
+        identity.type_k,
+        identity.type_v,
+        identity.n_threads,
+        identity.flash_attn,
+        identity.split_mode,
+    )
+
+
+def _line_key(obj: Mapping[str, object]) -> _IdentityKey:
+    """Return the identity key a JSONL line reports."""
+    return (
+        _req_str(obj, "model"),
+        _req_int(obj, "n_gpu_layers"),
+        _req_int(obj, "n_batch"),
+        _req_int(obj, "n_ubatch"),
+        _req_str(obj, "type_k"),
+        _req_str(obj, "type_v"),
+        _req_int(obj, "n_threads"),
+        _req_int(obj, "flash_attn"),
+        _req_str(obj, "split_mode"),
+    )
+
+
 def _check_identity(obj: Mapping[str, object], expected: BenchIdentity) -> None:
     """Cross-check JSONL identity fields against the requested manifest."""
     checks: list[tuple[str, object, object]] = [
@@ -94,6 +142,7 @@ def _check_identity(obj: Mapping[str, object], expected: BenchIdentity) -> None:
         ("type_v", _req_str(obj, "type_v"), expected.type_v),
         ("n_threads", _req_int(obj, "n_threads"), expected.n_threads),
         ("flash_attn", _req_int(obj, "flash_attn"), expected.flash_attn),
+        ("split_mode", _req_str(obj, "split_mode"), expected.split_mode),
     ]
     for field_name, actual, want in checks:
         if actual != want:
@@ -102,6 +151,18 @@ def _check_identity(obj: Mapping[str, object], expected: BenchIdentity) -> None:
             )
 
 
+def _pool(prior: BenchMeasurement, extra: BenchMeasurement) -> BenchMeasurement:
+    """Merge two measurements of one workload into their pooled samples."""
+    samples = prior.samples + extra.samples
+    rates = [s.ts for s in samples]
+    return BenchMeasurement(
+        workload_name=prior.workload_name,
+        avg_ts=statistics.fmean(rates),
+        stddev_ts=statistics.stdev(rates),
+        samples=samples,
+    )
+
+
 def parse_bench_jsonl(
     raw: str,
     expected: BenchIdentity,
@@ -113,13 +174,18 @@ def parse_bench_jsonl(
     cross-checked against ``expected``. Per-repetition ``samples_ns`` and
     ``samples_ts`` arrays are retained in full. Malformed JSON, missing
     samples, NaN/negative throughput, and identity mismatches all raise
-    :class:`MeasurementFailureError`.
+    :class:`MeasurementFailureError`. Repeated lines for one workload (the
+    rounds of an adaptive screen) pool their samples, with ``avg_ts`` and
+    ``stddev_ts`` recomputed from the pooled ``samples_ts``. Only rows at the
+    pinned context depth become measurements; rows a depth profile produced at
+    other ``n_depth`` values populate ``depth_curve`` instead.
     """
     lines = [ln for ln in raw.splitlines() if ln.strip()]
     if not lines:
         raise MeasurementFailureError(reason="empty JSONL output")
 
-    measurements: list[BenchMeasurement] = []
+    measurements: dict[str, BenchMeasurement] = {}
+    curve: dict[tuple[str, int], float] = {}
     model = ""
     build = 0
     for line in lines:
@@ -144,20 +210,70 @@ def parse_bench_jsonl(
         samples = tuple(
             BenchSample(ns=ns, ts=ts) for ns, ts in zip(samples_ns, samples_ts, strict=True)
         )
-        measurements.append(
-            BenchMeasurement(
-                workload_name=name, avg_ts=avg_ts, stddev_ts=stddev_ts, samples=samples
-            )
+        depth = _req_int(obj, "n_depth") if "n_depth" in obj else REQUIRED_CONTEXT_SIZE
+        curve[name, depth] = avg_ts
+        if depth != REQUIRED_CONTEXT_SIZE:
+            continue
+        measurement = BenchMeasurement(
+            workload_name=name, avg_ts=avg_ts, stddev_ts=stddev_ts, samples=samples
         )
+        prior = measurements.get(name)
+        measurements[name] = measurement if prior is None else _pool(prior, measurement)
 
-    found = {m.workload_name for m in measurements}
-    missing = set(expected_workload_names) - found
+    missing = set(expected_workload_names) - set(measurements)
     if missing:
         raise MeasurementFailureError(reason=f"missing workloads: {sorted(missing)}")
 
+    profiled = any(depth != REQUIRED_CONTEXT_SIZE for _, depth in curve)
     return BenchResult(
         model=model,
         build=build,
-        measurements=tuple(measurements),
+        measurements=tuple(measurements.values()),
         raw_jsonl=raw,
+        depth_curve=tuple(DepthPoint(n, d, ts) for (n, d), ts in sorted(curve.items()))
+        if profiled
+        else (),
     )
+
+
+def demux_bench_jsonl(raw: str, identities: Sequence[BenchIdentity]) -> Mapping[BenchIdentity, str]:
+    """Split one sweep's JSONL into the lines each requested identity produced.
+
+    Every line must be a JSON object carrying the identity fields; a malformed
+    line raises :class:`MeasurementFailureError` for the whole sweep because it
+    cannot be attributed. Lines for cartesian-product combinations nobody
+    requested are dropped. Identities with no lines map to ``""`` so the strict
+    per-trial :func:`parse_bench_jsonl` reports them as missing output.
+    """
+    routes: dict[_IdentityKey, list[BenchIdentity]] = {}
+    for identity in identities:
+        routes.setdefault(_identity_key(identity), []).append(identity)
+    lines: dict[BenchIdentity, list[str]] = {identity: [] for identity in identities}
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        for identity in routes.get(_line_key(_loads_mapping(line)), ()):
+            lines[identity].append(line)
+    return {identity: "".join(f"{ln}\n" for ln in found) for identity, found in lines.items()}
+
+
+def check_bench_line(line: str, identities: Sequence[BenchIdentity]) -> None:
+    """Reject one live JSONL line that no requested config could have produced.
+
+    llama-bench runs the cartesian product of a sweep's lists, so a line may
+    pair any requested value per identity field; a single-identity run must
+    match exactly. Blank lines pass. A malformed line or a field value outside
+    the request raises :class:`MeasurementFailureError`, letting the runner
+    abort the child instead of waiting for it to finish.
+    """
+    if not line.strip():
+        return
+    actual = _line_key(_loads_mapping(line))
+    wanted = [_identity_key(identity) for identity in identities]
+    for index, value in enumerate(actual):
+        allowed = {key[index] for key in wanted}
+        if value not in allowed:
+            expected = ", ".join(sorted(map(repr, allowed)))
+            raise MeasurementFailureError(
+                reason=f"identity mismatch {_KEY_FIELDS[index]}: expected {expected}, got {value!r}"
+            )
@@ -2,32 +2,46 @@
 
 from __future__ import annotations
 
-import hashlib
-import os
-import sys
-from contextlib import contextmanager
+from dataclasses import replace
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from llama_optimizer.bench_command import build_bench_command
-from llama_optimizer.bench_parser import parse_bench_jsonl
+from llama_optimizer.bench_adaptive import supervise_adaptive
+from llama_optimizer.bench_cache import (
+    BENCH_CACHE_ARTIFACT_KIND,
+    lookup_measurement,
+    store_measurement,
+)
+from llama_optimizer.bench_command import build_bench_command, build_sweep_command
+from llama_optimizer.bench_depth import depth_metrics
+from llama_optimizer.bench_parser import demux_bench_jsonl, parse_bench_jsonl
+from llama_optimizer.bench_stats import summarize
+from llama_optimizer.bench_supervision import BenchSupervision, supervise_bench
+from llama_optimizer.bench_sweep import close_unstarted, sweep_progress
 from llama_optimizer.bench_types import (
     BenchResult,
     BenchScreenRequest,
     BenchScreenResult,
+    BenchSweepResult,
+    CacheProvenance,
     MeasurementFailureError,
 )
+from llama_optimizer.breach_predictor import record_breach_prediction
 from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.phase_spans import Phase, SpanRecorder, record_phase_spans
+from llama_optimizer.supervisor import ChildExit, SupervisorResult
+from llama_optimizer.telemetry_series import EMPTY_SERIES
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-    from pathlib import Path
+    from collections.abc import Mapping, Sequence
 
+    from llama_optimizer.bench_cache import CachedMeasurement
+    from llama_optimizer.bench_supervision import SupervisedBench
+    from llama_optimizer.bench_sweep import SweepProgress
+    from llama_optimizer.bench_types import BenchIdentity
     from llama_optimizer.ledger import Ledger
-    from llama_optimizer.supervisor import (
-        ChildExit,
-        ProcessSupervisor,
-        SupervisorConfig,
-    )
+    from llama_optimizer.lifecycle import AttemptId
+    from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
     from llama_optimizer.telemetry import HardChannelProvider
 
 
@@ -52,49 +66,17 @@ def classify_child_exit(
     return NonScoredOutcome.TRANSIENT_FAILURE
 
 
-# --- Stdio capture ----------------------------------------------------------
-
-
-@contextmanager
-def _capture_stdio(stdout_path: Path, stderr_path: Path) -> Generator[None]:
-    """Redirect fd 1 and 2 to files so the supervised child inherits them.
-
-    The supervisor launches the child with ``start_new_session=True`` and no
-    explicit ``stdout=`` / ``stderr=`` redirection, so the child inherits the
-    parent's file descriptors. Redirecting fd 1/2 before calling the supervisor
-    captures the child's output without modifying the supervisor.
-    """
-    _ = sys.stdout.flush()
-    _ = sys.stderr.flush()
-    saved_out = os.dup(1)
-    saved_err = os.dup(2)
-    out_fd = os.open(str(stdout_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
-    err_fd = os.open(str(stderr_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
-    try:
-        _ = os.dup2(out_fd, 1)
-        _ = os.dup2(err_fd, 2)
-        _ = os.close(out_fd)
-        _ = os.close(err_fd)
-        yield
-    finally:
-        _ = sys.stdout.flush()
-        _ = sys.stderr.flush()
-        _ = os.dup2(saved_out, 1)
-        _ = os.dup2(saved_err, 2)
-        _ = os.close(saved_out)
-        _ = os.close(saved_err)
-
-
 # --- Screening orchestrator -------------------------------------------------
 
 
 def _extract_metrics(result: BenchResult) -> dict[str, float]:
-    """Flatten parsed measurements into named metrics for the ledger."""
+    """Flatten measurements, robust sample statistics, and depth summaries into metrics."""
     metrics: dict[str, float] = {}
     for m in result.measurements:
         metrics[f"{m.workload_name}_avg_ts"] = m.avg_ts
         metrics[f"{m.workload_name}_stddev_ts"] = m.stddev_ts
-    return metrics
+        metrics |= summarize([s.ts for s in m.samples]).metrics(m.workload_name, "ts")
+    return metrics | depth_metrics(result)
 
 
 def run_supervised_bench(
@@ -106,67 +88,225 @@ def run_supervised_bench(
 ) -> BenchScreenResult:
     """Run one supervised llama-bench attempt and record everything to the ledger.
 
-    Starts the attempt, builds the command from ``request``, captures stdio,
-    routes the process through the T5 supervisor, classifies the outcome, parses
-    JSONL, records metrics/artifacts/telemetry via T4, and completes the attempt.
+    Starts the attempt, builds the command from ``request``, pipes stdio through
+    the T5 supervisor (cancelling the child as soon as a JSONL line cannot
+    belong to ``request.identity``), classifies the outcome, parses
+    JSONL, records metrics/artifacts/telemetry via T4, completes the attempt, and
+    persists its per-phase timing spans (plus a Chrome trace when
+    ``request.chrome_trace`` is set). With ``request.page_cache`` the model is
+    prewarmed before its first trial and the cold/warm read metrics join a
+    successful attempt's metrics. An adaptive ``bench_config`` runs rounds until
+    its stopping rule fires, recording every round's telemetry against the one
+    attempt. With ``request.cache`` a reusable cached measurement answers the
+    attempt without launching llama-bench, and a fresh success is stored.
     Never converts a failure to throughput zero.
     """
     request.output_dir.mkdir(parents=True, exist_ok=True)
-    command = build_bench_command(request.binary, request.bench_config, request.identity)
     attempt = ledger.start_attempt(request.trial_id)
-    stdout_path = request.output_dir / f"bench-{attempt.attempt_id}.stdout.jsonl"
-    stderr_path = request.output_dir / f"bench-{attempt.attempt_id}.stderr.txt"
+    hit = lookup_measurement(request)
+    if hit is not None:
+        return _reuse_cached(ledger, request, attempt.attempt_id, hit)
+    stem = str(request.output_dir / f"bench-{attempt.attempt_id}")
+    sup = BenchSupervision(supervisor, provider, sup_config)
+    if request.bench_config.adaptive is not None:
+        run = supervise_adaptive(sup, request, stem)
+    else:
+        command = build_bench_command(request.binary, request.bench_config, request.identity)
+        run = supervise_bench(sup, request, command, (request.identity,), stem)
+    screened = _record_attempt(ledger, request, attempt.attempt_id, run, run.raw_jsonl)
+    if screened.result is not None and screened.outcome is None:
+        provenance = CacheProvenance(ledger.run.run_id, attempt.attempt_id, datetime.now(UTC))
+        _ = store_measurement(request, screened.result, provenance, screened.stop_reason)
+    return screened
 
-    with _capture_stdio(stdout_path, stderr_path):
-        sup_result = supervisor.run(command, provider=provider, config=sup_config)
 
-    raw_jsonl = stdout_path.read_text() if stdout_path.exists() else ""
-    raw_stderr = stderr_path.read_text() if stderr_path.exists() else ""
-    outcome: NonScoredOutcome | None = None
-    parsed: BenchResult | None = None
-    metrics: dict[str, float] = {}
+def run_supervised_bench_sweep(
+    supervisor: ProcessSupervisor,
+    provider: HardChannelProvider,
+    sup_config: SupervisorConfig,
+    ledger: Ledger,
+    requests: Sequence[BenchScreenRequest],
+) -> BenchSweepResult:
+    """Screen several trials that share a model load in one llama-bench process.
 
-    if isinstance(sup_result.outcome, NonScoredOutcome):
-        outcome = sup_result.outcome
-    elif sup_result.outcome.returncode != 0:
-        outcome = classify_child_exit(sup_result.outcome, raw_stderr)
-    else:
-        try:
-            parsed = parse_bench_jsonl(
-                raw_jsonl,
-                expected=request.identity,
-                expected_workload_names=tuple(w.name for w in request.bench_config.workloads),
+    The requests must share binary, bench config, output directory, and
+    :func:`sweep_load_key`. Every trial gets its own attempt; the single
+    supervised run's telemetry, host samples, and launch/supervision spans are
+    recorded against each, and its JSONL is demultiplexed so each attempt is
+    parsed, scored, and finalized exactly as :func:`run_supervised_bench` would.
+    When the process fails (a fail-closed supervisor outcome, an aborted live
+    check, or a nonzero exit), configs whose lines had completed are still
+    scored, only the config running at the failure takes the failure, and the
+    configs that never started are closed as transient and returned in
+    ``unstarted`` (see :func:`~llama_optimizer.bench_sweep.sweep_progress`).
+    Sweeps neither consult nor fill the measurement cache.
+    """
+    if not requests:
+        msg = "a bench sweep needs at least one request"
+        raise ValueError(msg)
+    first = requests[0]
+    shared = (first.binary, first.bench_config, first.output_dir)
+    if any((r.binary, r.bench_config, r.output_dir) != shared for r in requests):
+        msg = "a bench sweep cannot mix binaries, bench configs, or output directories"
+        raise ValueError(msg)
+    if first.bench_config.adaptive is not None:
+        msg = "adaptive repetitions stop per config; screen them with run_supervised_bench"
+        raise ValueError(msg)
+    identities = [r.identity for r in requests]
+    command = build_sweep_command(first.binary, first.bench_config, identities)
+    first.output_dir.mkdir(parents=True, exist_ok=True)
+    attempt_ids = [ledger.start_attempt(r.trial_id).attempt_id for r in requests]
+    stem = str(first.output_dir / f"bench-sweep-{attempt_ids[0]}")
+    run = supervise_bench(
+        BenchSupervision(supervisor, provider, sup_config), first, command, identities, stem
+    )
+    names = tuple(w.name for w in first.bench_config.workloads)
+    routed: Mapping[BenchIdentity, str]
+    progress: SweepProgress | None = None
+    try:
+        routed = demux_bench_jsonl(run.raw_jsonl, identities)
+        if _sweep_failed(run):
+            progress = sweep_progress(run.raw_jsonl, identities, names)
+    except MeasurementFailureError:
+        # Unattributable output: hand every trial the whole stream to fail strictly.
+        routed = {}
+    screened: list[BenchScreenResult] = []
+    for request, attempt_id in zip(requests, attempt_ids, strict=True):
+        own = replace(run, spans=SpanRecorder(initial=run.spans.spans))
+        if progress is not None and progress.unstarted(request.identity):
+            screened.append(close_unstarted(ledger, request, attempt_id, run.result))
+            continue
+        if progress is not None and request.identity in progress.finished:
+            # Its lines completed before the failure: score them as a clean exit.
+            own = replace(own, result=replace(run.result, outcome=ChildExit(0)), aborted=None)
+        screened.append(
+            _record_attempt(
+                ledger, request, attempt_id, own, routed.get(request.identity, run.raw_jsonl)
             )
-            metrics = _extract_metrics(parsed)
-        except MeasurementFailureError as exc:
-            outcome = NonScoredOutcome.MEASUREMENT_FAILURE
-            raw_stderr = f"{raw_stderr}\n{exc}"
+        )
+    unstarted = tuple(
+        r for r in requests if progress is not None and progress.unstarted(r.identity)
+    )
+    return BenchSweepResult(tuple(screened), unstarted)
+
 
-    # Record raw artifact (always, even on failure for evidence).
-    content_hash = hashlib.sha256(raw_jsonl.encode()).hexdigest()
+def _sweep_failed(run: SupervisedBench) -> bool:
+    """Return whether the shared sweep process ended in any scored-as-failure way."""
+    outcome = run.result.outcome
+    return (
+        isinstance(outcome, NonScoredOutcome) or run.aborted is not None or outcome.returncode != 0
+    )
+
+
+def _reuse_cached(
+    ledger: Ledger, request: BenchScreenRequest, attempt_id: AttemptId, hit: CachedMeasurement
+) -> BenchScreenResult:
+    """Answer an attempt from the cache, linking the entry and its JSONL as evidence."""
     ledger.record_artifact(
-        attempt_id=attempt.attempt_id,
+        attempt_id=attempt_id,
         kind="bench-jsonl",
-        relative_path=str(stdout_path),
-        content_hash=content_hash,
+        relative_path=str(hit.jsonl),
+        content_hash=hit.jsonl_sha256,
+    )
+    ledger.record_artifact(
+        attempt_id=attempt_id,
+        kind=BENCH_CACHE_ARTIFACT_KIND,
+        relative_path=str(hit.entry),
+        content_hash=hit.entry_sha256,
+    )
+    metrics = _extract_metrics(hit.result)
+    ledger.record_metrics(attempt_id, metrics)
+    ledger.succeed_attempt(attempt_id)
+    now = datetime.now(UTC)
+    return BenchScreenResult(
+        outcome=None,
+        result=hit.result,
+        raw_jsonl=hit.result.raw_jsonl,
+        supervisor_result=SupervisorResult(
+            outcome=ChildExit(0),
+            series=EMPTY_SERIES,
+            diagnostics_series=(),
+            peak_used=None,
+            started_at=now,
+            ended_at=now,
+            launched=False,
+            terminated_group=False,
+        ),
+        trial_id=request.trial_id,
+        attempt_id=attempt_id,
+        metrics=metrics,
+        reused_from=hit.provenance,
     )
-    if metrics:
-        ledger.record_metrics(attempt.attempt_id, metrics)
-    if sup_result.peak_used is not None:
-        breached = outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
-        ledger.record_telemetry(
-            attempt_id=attempt.attempt_id,
-            vram_used_bytes=int(sup_result.peak_used),
-            peak_vram_bytes=int(sup_result.peak_used),
-            breached=breached,
-        )
 
-    if outcome is None:
-        ledger.succeed_attempt(attempt.attempt_id)
-    else:
-        ledger.end_attempt_nonscored(
-            attempt.attempt_id, outcome=outcome, reason=raw_stderr.strip() or outcome.value
+
+def _record_attempt(
+    ledger: Ledger,
+    request: BenchScreenRequest,
+    attempt_id: AttemptId,
+    run: SupervisedBench,
+    raw_jsonl: str,
+) -> BenchScreenResult:
+    """Classify, parse ``raw_jsonl`` (this trial's lines), record, and finalize."""
+    sup_result = run.result
+    with run.spans.span(Phase.RECORDING):
+        raw_stderr = run.raw_stderr
+        outcome: NonScoredOutcome | None = None
+        parsed: BenchResult | None = None
+        metrics: dict[str, float] = {}
+
+        if isinstance(sup_result.outcome, NonScoredOutcome):
+            outcome = sup_result.outcome
+        elif run.aborted is not None:
+            outcome = NonScoredOutcome.MEASUREMENT_FAILURE
+            raw_stderr = f"{raw_stderr}\n{run.aborted}"
+        elif sup_result.outcome.returncode != 0:
+            outcome = classify_child_exit(sup_result.outcome, raw_stderr)
+        else:
+            try:
+                parsed = parse_bench_jsonl(
+                    raw_jsonl,
+                    expected=request.identity,
+                    expected_workload_names=tuple(w.name for w in request.bench_config.workloads),
+                )
+                metrics = _extract_metrics(parsed)
+                if run.prewarm is not None:
+                    metrics |= run.prewarm.metrics()
+            except MeasurementFailureError as exc:
+                outcome = NonScoredOutcome.MEASUREMENT_FAILURE
+                raw_stderr = f"{raw_stderr}\n{exc}"
+
+        # Record raw artifact (always, even on failure for evidence).
+        ledger.record_artifact(
+            attempt_id=attempt_id,
+            kind="bench-jsonl",
+            relative_path=str(run.stdout.path),
+            content_hash=run.stdout.sha256,
         )
+        if metrics:
+            ledger.record_metrics(attempt_id, metrics)
+        predicted = sup_result.predicted_breach
+        if predicted is not None:
+            record_breach_prediction(
+                ledger,
+                attempt_id,
+                predicted,
+                request.output_dir / f"bench-{attempt_id}.breach-prediction.json",
+            )
+            raw_stderr = f"{predicted.describe()}\n{raw_stderr}"
+        for supervised in (*run.earlier, sup_result):
+            ledger.record_telemetry_series(attempt_id, supervised.series.ledger_rows())
+            ledger.record_host_samples(attempt_id, supervised.host_series)
+
+        if outcome is None:
+            ledger.succeed_attempt(attempt_id)
+        else:
+            ledger.end_attempt_nonscored(
+                attempt_id, outcome=outcome, reason=raw_stderr.strip() or outcome.value
+            )
+    trace = request.output_dir / f"bench-{attempt_id}.trace.json"
+    record_phase_spans(
+        ledger, attempt_id, run.spans, trace_path=trace if request.chrome_trace else None
+    )
 
     return BenchScreenResult(
         outcome=outcome,
@@ -174,6 +314,7 @@ def run_supervised_bench(
         raw_jsonl=raw_jsonl,
         supervisor_result=sup_result,
         trial_id=request.trial_id,
-        attempt_id=attempt.attempt_id,
+        attempt_id=attempt_id,
         metrics=metrics,
+        stop_reason=run.stop_reason,
     )
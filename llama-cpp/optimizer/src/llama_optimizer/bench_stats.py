@@ -0,0 +1,195 @@
+"""Robust statistics over per-repetition samples (T6/T11).
+
+llama-bench reports a mean and standard deviation per workload, both of which
+one thermal hiccup or background compaction can drag. This module summarizes
+the raw samples the parser keeps instead:
+
+* the median and the median absolute deviation (MAD, unscaled);
+* outliers by the Iglewicz-Hoaglin modified z-score (``0.6745 * |x - median|
+  / MAD > 3.5``), which are rejected before the remaining estimates;
+* a symmetric trimmed mean of the inliers;
+* a seeded percentile-bootstrap confidence interval of the inliers' median;
+* for an aggregate rate measured once, the median interval of its
+  per-request rates scaled onto the aggregate (:func:`scaled_median_ci`);
+* the Student-t critical value (:func:`t_quantile`) behind every mean or
+  slope interval fitted on a handful of points.
+
+The bootstrap draws every resample index from one stream of
+:mod:`llama_optimizer.seeded_lcg` and slices it into resamples, so a fixed
+seed reproduces the interval bit for bit. The resulting
+figures are recorded as ledger metrics next to llama-bench's own.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.seeded_lcg import lcg_draws
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+#: Modified z-score above which a sample is an outlier (Iglewicz & Hoaglin).
+OUTLIER_Z: Final[float] = 3.5
+_Z_SCALE: Final[float] = 0.6745
+_MAX_TRIM: Final[float] = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class BootstrapConfig:
+    """Resample count, confidence level, RNG seed, and trim proportion per tail."""
+
+    resamples: int = 2000
+    confidence: float = 0.95
+    seed: int = 0
+    trim: float = 0.1
+
+    def __post_init__(self) -> None:
+        """Reject empty resampling, impossible confidence, and over-trimming."""
+        if self.resamples < 1 or not 0 < self.confidence < 1 or not 0 <= self.trim < _MAX_TRIM:
+            msg = f"bootstrap needs resamples >= 1, 0 < confidence < 1, 0 <= trim < 0.5: {self}"
+            raise ValueError(msg)
+
+
+DEFAULT_BOOTSTRAP: Final[BootstrapConfig] = BootstrapConfig()
+
+# Below this many degrees of freedom the Cornish-Fisher t expansion errs by
+# more than 0.1% at 99% confidence, so the exact distribution is inverted.
+_EXACT_DOF: Final[int] = 8
+_BISECTIONS: Final[int] = 60
+
+
+def _t_coverage(theta: float, dof: int) -> float:
+    """Return ``P(|T| <= sqrt(dof) * tan(theta))`` exactly (Abramowitz & Stegun 26.7.3-4)."""
+    cos2 = math.cos(theta) ** 2
+    if dof % 2 == 0:
+        term = total = 1.0
+        for j in range(1, dof // 2):
+            term *= cos2 * (2 * j - 1) / (2 * j)
+            total += term
+        return math.sin(theta) * total
+    term = total = math.cos(theta) if dof > 1 else 0.0
+    for j in range(2, (dof + 1) // 2):
+        term *= cos2 * (2 * j - 2) / (2 * j - 1)
+        total += term
+    return 2 / math.pi * (theta + math.sin(theta) * total)
+
+
+def t_quantile(confidence: float, dof: int) -> float:
+    """Return the two-sided Student-t critical value for ``dof >= 1``.
+
+    Below :data:`_EXACT_DOF` the exact distribution is inverted by bisection,
+    since the Cornish-Fisher expansion runs several percent low there (4.17
+    instead of 4.30 at 95% and dof 2); above it the expansion is used.
+    """
+    if dof < _EXACT_DOF:
+        low, high = 0.0, math.pi / 2
+        for _ in range(_BISECTIONS):
+            mid = (low + high) / 2
+            low, high = (mid, high) if _t_coverage(mid, dof) < confidence else (low, mid)
+        return math.sqrt(dof) * math.tan((low + high) / 2)
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    z2 = z * z
+    return z * (
+        1
+        + (z2 + 1) / (4 * dof)
+        + (5 * z2**2 + 16 * z2 + 3) / (96 * dof**2)
+        + (3 * z2**3 + 19 * z2**2 + 17 * z2 - 15) / (384 * dof**3)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RobustSummary:
+    """Median, MAD, inlier trimmed mean and bootstrap CI, and the outlier count."""
+
+    median: float
+    mad: float
+    trimmed_mean: float
+    ci_low: float
+    ci_high: float
+    outliers: int
+
+    def metrics(self, prefix: str, unit: str) -> dict[str, float]:
+        """Name the figures ``<prefix>_<stat>_<unit>`` (``<prefix>_outliers`` for the count)."""
+        return {
+            f"{prefix}_median_{unit}": self.median,
+            f"{prefix}_mad_{unit}": self.mad,
+            f"{prefix}_trimmed_mean_{unit}": self.trimmed_mean,
+            f"{prefix}_ci_low_{unit}": self.ci_low,
+            f"{prefix}_ci_high_{unit}": self.ci_high,
+            f"{prefix}_outliers": float(self.outliers),
+        }
+
+
+def median_abs_deviation(values: Sequence[float]) -> float:
+    """Return the unscaled median absolute deviation from the median."""
+    center = statistics.median(values)
+    return statistics.median(abs(v - center) for v in values)
+
+
+def outlier_mask(values: Sequence[float]) -> tuple[bool, ...]:
+    """Flag samples whose modified z-score exceeds :data:`OUTLIER_Z`."""
+    mad = median_abs_deviation(values)
+    if mad == 0:
+        return tuple(False for _ in values)
+    center = statistics.median(values)
+    return tuple(_Z_SCALE * abs(v - center) / mad > OUTLIER_Z for v in values)
+
+
+def trimmed_mean(values: Sequence[float], trim: float) -> float:
+    """Return the mean after dropping ``floor(trim * n)`` samples from each tail."""
+    cut = math.floor(trim * len(values))
+    ranked = sorted(values)
+    return statistics.fmean(ranked[cut : len(ranked) - cut])
+
+
+def bootstrap_ci(
+    values: Sequence[float],
+    statistic: Callable[[Sequence[float]], float] = statistics.median,
+    config: BootstrapConfig = DEFAULT_BOOTSTRAP,
+) -> tuple[float, float]:
+    """Return the percentile-bootstrap confidence interval of ``statistic``."""
+    n = len(values)
+    if n == 1:
+        return values[0], values[0]
+    indices = islice(lcg_draws(config.seed), n * config.resamples)
+    draws = [values[i % n] for i in indices]
+    estimates = sorted(statistic(draws[i : i + n]) for i in range(0, len(draws), n))
+    tail = (1 - config.confidence) / 2
+    last = config.resamples - 1
+    return estimates[round(tail * last)], estimates[round((1 - tail) * last)]
+
+
+def scaled_median_ci(
+    value: float, rates: Sequence[float], config: BootstrapConfig = DEFAULT_BOOTSTRAP
+) -> tuple[float, float]:
+    """Scale the bootstrap CI of the median of ``rates`` onto the aggregate ``value``.
+
+    Without a positive median the interval collapses to ``(value, value)``.
+    """
+    center = statistics.median(rates) if rates else 0.0
+    if center <= 0:
+        return value, value
+    low, high = bootstrap_ci(rates, config=config)
+    return value * low / center, value * high / center
+
+
+def summarize(
+    values: Sequence[float], config: BootstrapConfig = DEFAULT_BOOTSTRAP
+) -> RobustSummary:
+    """Summarize non-empty samples, rejecting outliers before the trimmed mean and CI."""
+    mask = outlier_mask(values)
+    inliers = [v for v, out in zip(values, mask, strict=True) if not out]
+    low, high = bootstrap_ci(inliers, config=config)
+    return RobustSummary(
+        median=statistics.median(values),
+        mad=median_abs_deviation(values),
+        trimmed_mean=trimmed_mean(inliers, config.trim),
+        ci_low=low,
+        ci_high=high,
+        outliers=sum(mask),
+    )
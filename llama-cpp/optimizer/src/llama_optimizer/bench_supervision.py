@@ -0,0 +1,123 @@
+"""One supervised llama-bench process with piped, live-checked stdio (T5/T6).
+
+The runner, sweep, and adaptive-repetition paths all launch llama-bench the
+same way: optionally prewarm the model's page cache, pipe stdout/stderr into
+``<stem>.*`` files through the T5 supervisor, and cancel the child as soon as
+a JSONL line names a config nobody requested. :func:`supervise_bench` is that
+shared step; recording the outcome stays with the caller.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.bench_parser import check_bench_line
+from llama_optimizer.bench_types import MeasurementFailureError
+from llama_optimizer.phase_spans import Phase, SpanRecorder
+from llama_optimizer.stdio_capture import PipedCommand, StdioCapture, StdioSink
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.bench_types import BenchIdentity, BenchScreenRequest, StopReason
+    from llama_optimizer.page_cache import PrewarmReport
+    from llama_optimizer.stdio_capture import CapturedStream
+    from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig, SupervisorResult
+    from llama_optimizer.telemetry import HardChannelProvider
+
+
+@dataclass(frozen=True, slots=True)
+class BenchSupervision:
+    """The supervisor, hard channel, and timing knobs of one screening call."""
+
+    supervisor: ProcessSupervisor
+    provider: HardChannelProvider
+    config: SupervisorConfig
+
+
+@dataclass(frozen=True, slots=True)
+class SupervisedBench:
+    """One supervised llama-bench process, its captured output, and phase spans.
+
+    ``aborted`` is the live check's reason when a JSONL line no requested
+    config could have produced cancelled the child early. An adaptive screen
+    folds its rounds into one value: ``earlier`` holds the supervisor results
+    of every round before ``result``, ``raw_jsonl``/``stdout`` the pooled
+    output, and ``stop_reason`` why no further round was launched.
+    """
+
+    result: SupervisorResult
+    raw_jsonl: str
+    raw_stderr: str
+    stdout: CapturedStream
+    spans: SpanRecorder
+    prewarm: PrewarmReport | None = None
+    aborted: str | None = None
+    earlier: tuple[SupervisorResult, ...] = ()
+    stop_reason: StopReason | None = None
+
+
+@final
+class _LiveCheck:
+    """Checks llama-bench JSONL as it streams and cancels the child on a mismatch."""
+
+    def __init__(self, identities: Sequence[BenchIdentity], cancel: threading.Event) -> None:
+        self._identities: Final = identities
+        self._cancel: Final = cancel
+        self.failure: str | None = None
+
+    def __call__(self, line: str) -> None:
+        """Record the first unattributable line and stop the child early."""
+        if self.failure is not None:
+            return
+        try:
+            check_bench_line(line, self._identities)
+        except MeasurementFailureError as exc:
+            self.failure = str(exc)
+            self._cancel.set()
+
+
+def supervise_bench(
+    sup: BenchSupervision,
+    request: BenchScreenRequest,
+    command: list[str],
+    identities: Sequence[BenchIdentity],
+    stem: str,
+) -> SupervisedBench:
+    """Prewarm the model if asked, then run ``command`` piping stdio to ``<stem>.*``.
+
+    Stdout is checked line by line against ``identities`` as it arrives.
+    """
+    cancel = threading.Event()
+    check = _LiveCheck(identities, cancel)
+    capture = StdioCapture(
+        StdioSink(Path(f"{stem}.stdout.jsonl"), on_line=check),
+        StdioSink(Path(f"{stem}.stderr.txt")),
+    )
+    spans = SpanRecorder()
+    prewarm: PrewarmReport | None = None
+    if request.page_cache is not None:
+        # Best effort: an unreadable model is the load's failure to report, not ours.
+        with spans.span(Phase.PREWARM), suppress(OSError):
+            prewarm = request.page_cache.ensure(Path(request.identity.model_filename))
+    result = sup.supervisor.run(
+        PipedCommand(command, capture),
+        provider=sup.provider,
+        config=sup.config,
+        cancel=cancel,
+        spans=spans,
+    )
+    stdout, stderr = capture.close(sup.config.grace)
+    return SupervisedBench(
+        result=result,
+        raw_jsonl=stdout.read_text(),
+        raw_stderr=stderr.read_text(),
+        stdout=stdout,
+        spans=spans,
+        prewarm=prewarm,
+        aborted=check.failure,
+    )
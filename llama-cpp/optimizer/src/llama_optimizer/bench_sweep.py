@@ -0,0 +1,187 @@
+"""Group pending screening trials into single-process llama-bench sweeps (T6).
+
+One llama-bench process per config reloads a 5-9 GB GGUF every trial.
+llama-bench instead accepts comma-separated lists for ``-ngl -b -ub -ctk -ctv
+-t -fa`` and keeps the model loaded while only context parameters change, so
+trials sharing a :func:`~llama_optimizer.bench_command.sweep_load_key` (and a
+binary, bench config, and output directory) can be screened by one
+:func:`~llama_optimizer.bench_runner.run_supervised_bench_sweep` call. Each
+distinct ``-ngl`` value is still one load, so load overhead falls from
+O(configs) to O(models x layer-offload values).
+
+llama-bench runs the *cartesian product* of its lists. :func:`plan_bench_sweeps`
+therefore packs trials greedily (in a stable, dimension-sorted order) and
+starts a new sweep whenever the product would exceed ``1 + max_waste`` times
+the number of distinct requested identities.
+
+When the shared process fails part-way, :func:`sweep_progress` reads its JSONL
+to tell the configs that finished (still scored) from the one that was
+running (blamed) and the ones that never started (handed back for a re-run).
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.bench_command import sweep_load_key
+from llama_optimizer.bench_parser import demux_bench_jsonl, parse_bench_jsonl
+from llama_optimizer.bench_types import BenchScreenResult, MeasurementFailureError
+from llama_optimizer.lifecycle import NonScoredOutcome
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from llama_optimizer.bench_types import BenchIdentity, BenchScreenRequest
+    from llama_optimizer.ledger import Ledger
+    from llama_optimizer.lifecycle import AttemptId
+    from llama_optimizer.supervisor import SupervisorResult
+
+#: Default tolerated extra (unrequested) combinations per requested identity.
+DEFAULT_MAX_WASTE: Final[float] = 1.0
+
+
+def sweep_dimensions(identity: BenchIdentity) -> tuple[int, int, int, str, str, int, int]:
+    """Return the per-config values a sweep turns into comma-joined lists."""
+    return (
+        identity.n_gpu_layers,
+        identity.n_batch,
+        identity.n_ubatch,
+        identity.type_k,
+        identity.type_v,
+        identity.n_threads,
+        identity.flash_attn,
+    )
+
+
+def sweep_size(identities: Sequence[BenchIdentity]) -> int:
+    """Return how many configs llama-bench runs for ``identities`` (the list product)."""
+    columns = zip(*(sweep_dimensions(i) for i in identities), strict=True)
+    return math.prod(len(set(column)) for column in columns) if identities else 0
+
+
+def sweep_order(identities: Sequence[BenchIdentity]) -> tuple[BenchIdentity, ...]:
+    """Return every config llama-bench runs for ``identities``, in run order.
+
+    llama-bench nests its loops ngl, batch, ubatch, K type, V type, flash
+    attention, threads (outermost first) and finishes every depth and workload
+    of one config before it starts the next.
+    """
+    if not identities:
+        return ()
+    product = itertools.product(
+        _distinct(i.n_gpu_layers for i in identities),
+        _distinct(i.n_batch for i in identities),
+        _distinct(i.n_ubatch for i in identities),
+        _distinct(i.type_k for i in identities),
+        _distinct(i.type_v for i in identities),
+        _distinct(i.flash_attn for i in identities),
+        _distinct(i.n_threads for i in identities),
+    )
+    return tuple(
+        replace(
+            identities[0],
+            n_gpu_layers=ngl,
+            n_batch=batch,
+            n_ubatch=ubatch,
+            type_k=type_k,
+            type_v=type_v,
+            flash_attn=flash_attn,
+            n_threads=threads,
+        )
+        for ngl, batch, ubatch, type_k, type_v, flash_attn, threads in product
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SweepProgress:
+    """How far a failed sweep got: the configs that finished and the one running."""
+
+    finished: frozenset[BenchIdentity]
+    running: BenchIdentity | None
+
+    def unstarted(self, identity: BenchIdentity) -> bool:
+        """Return whether the sweep failed before ``identity`` ran at all."""
+        return identity not in self.finished and identity != self.running
+
+
+def sweep_progress(
+    raw_jsonl: str, identities: Sequence[BenchIdentity], workload_names: tuple[str, ...]
+) -> SweepProgress:
+    """Split a failed sweep's configs by what its JSONL shows they reached.
+
+    A config finished when its lines parse as a complete measurement. The
+    first unfinished config in :func:`sweep_order` was running when the
+    process failed (possibly an unrequested product combination); later
+    configs never started. Unattributable output raises
+    :class:`MeasurementFailureError`.
+    """
+    order = sweep_order(identities)
+    routed = demux_bench_jsonl(raw_jsonl, order)
+    finished: set[BenchIdentity] = set()
+    for identity in order:
+        try:
+            _ = parse_bench_jsonl(routed[identity], identity, workload_names)
+        except MeasurementFailureError:
+            break
+        finished.add(identity)
+    running = next((i for i in order if i not in finished), None)
+    return SweepProgress(frozenset(finished), running)
+
+
+def close_unstarted(
+    ledger: Ledger, request: BenchScreenRequest, attempt_id: AttemptId, sup: SupervisorResult
+) -> BenchScreenResult:
+    """End the attempt of a config a failed sweep never reached as retryable."""
+    outcome = NonScoredOutcome.TRANSIENT_FAILURE
+    reason = "the sweep failed before this config started; screen it again"
+    ledger.end_attempt_nonscored(attempt_id, outcome=outcome, reason=reason)
+    return BenchScreenResult(
+        outcome=outcome,
+        result=None,
+        raw_jsonl="",
+        supervisor_result=sup,
+        trial_id=request.trial_id,
+        attempt_id=attempt_id,
+    )
+
+
+def _distinct[T](values: Iterable[T]) -> list[T]:
+    return list(dict.fromkeys(values))
+
+
+def plan_bench_sweeps(
+    requests: Sequence[BenchScreenRequest], *, max_waste: float = DEFAULT_MAX_WASTE
+) -> tuple[tuple[BenchScreenRequest, ...], ...]:
+    """Partition ``requests`` into sweeps that each share one model load.
+
+    Load groups keep the order of their first request; every request lands in
+    exactly one sweep, and a multi-trial sweep never runs more than
+    ``1 + max_waste`` configs per distinct requested identity.
+    """
+    if max_waste < 0:
+        msg = f"max_waste must be >= 0, got {max_waste}"
+        raise ValueError(msg)
+    groups: dict[object, list[BenchScreenRequest]] = {}
+    for request in requests:
+        key = (
+            request.binary,
+            request.bench_config,
+            request.output_dir,
+            sweep_load_key(request.identity),
+        )
+        groups.setdefault(key, []).append(request)
+    sweeps: list[tuple[BenchScreenRequest, ...]] = []
+    for group in groups.values():
+        batch: list[BenchScreenRequest] = []
+        for request in sorted(group, key=lambda r: sweep_dimensions(r.identity)):
+            candidate = [*batch, request]
+            identities = [r.identity for r in candidate]
+            if batch and sweep_size(identities) > (1 + max_waste) * len(set(identities)):
+                sweeps.append(tuple(batch))
+                candidate = [request]
+            batch = candidate
+        sweeps.append(tuple(batch))
+    return tuple(sweeps)
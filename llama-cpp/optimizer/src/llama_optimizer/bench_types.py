@@ -8,15 +8,19 @@ parser and runner depend on a stable, lightweight contract.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, override
+from enum import StrEnum
+from typing import TYPE_CHECKING, Final, override
 
 from llama_optimizer.profile_manifest import REQUIRED_CONTEXT_SIZE
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
+    from datetime import datetime, timedelta
     from pathlib import Path
 
     from llama_optimizer.lifecycle import AttemptId, NonScoredOutcome, TrialId
+    from llama_optimizer.models import LlamaCppBuild, Sha256Hex
+    from llama_optimizer.page_cache import PageCacheWarmer
     from llama_optimizer.supervisor import SupervisorResult
 
 
@@ -44,13 +48,57 @@ PP512: BenchWorkload = BenchWorkload(name="pp512", n_prompt=512, n_gen=0)
 TG128: BenchWorkload = BenchWorkload(name="tg128", n_prompt=0, n_gen=128)
 
 
+#: Fewest samples with a usable t critical value (two degrees of freedom).
+MIN_CI_SAMPLES: Final[int] = 3
+
+
+class StopReason(StrEnum):
+    """Why an adaptive screen launched no further round."""
+
+    CONVERGED = "converged"
+    DOMINATED = "dominated"
+    CAPPED = "capped"
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveRepetitions:
+    """Round size, confidence level, and target relative CI half-width.
+
+    No stopping decision is taken below ``min_samples`` samples per workload,
+    which may not go under :data:`MIN_CI_SAMPLES`.
+    """
+
+    batch: int = 1
+    min_samples: int = 3
+    target_rel_ci: float = 0.01
+    confidence: float = 0.95
+
+    def __post_init__(self) -> None:
+        """Reject empty rounds, too few samples, and out-of-range targets."""
+        if self.batch < 1 or self.min_samples < MIN_CI_SAMPLES:
+            msg = f"adaptive repetitions need batch >= 1 and min_samples >= 3, got {self}"
+            raise ValueError(msg)
+        if self.target_rel_ci <= 0 or not 0 < self.confidence < 1:
+            msg = f"adaptive repetitions need target_rel_ci > 0 and 0 < confidence < 1, got {self}"
+            raise ValueError(msg)
+
+
 @dataclass(frozen=True, slots=True)
 class BenchConfig:
-    """Bounded bench configuration (context enforced at 32768, warmup always on)."""
+    """Bounded bench configuration (context enforced at 32768, warmup always on).
+
+    With ``adaptive`` set, ``repetitions`` is the hard cap of an early-stopping
+    screen run in rounds (:mod:`llama_optimizer.bench_adaptive`). A non-empty
+    ``depth_profile`` measures every workload at each listed KV depth in the
+    same launch (:mod:`llama_optimizer.bench_depth`); it must include the
+    context size, whose rows stay the comparable measurements.
+    """
 
     repetitions: int
     delay_seconds: int
     workloads: tuple[BenchWorkload, ...]
+    adaptive: AdaptiveRepetitions | None = None
+    depth_profile: tuple[int, ...] = ()
 
     def __post_init__(self) -> None:
         """Validate repetitions, delay, and workloads."""
@@ -63,6 +111,16 @@ class BenchConfig:
         if not self.workloads:
             msg = "at least one workload is required"
             raise ValueError(msg)
+        if self.depth_profile and (
+            self.context_size not in self.depth_profile
+            or min(self.depth_profile) < 0
+            or self.adaptive is not None
+        ):
+            msg = (
+                "a depth profile needs non-negative depths including "
+                + f"{self.context_size} and no adaptive repetitions, got {self.depth_profile}"
+            )
+            raise ValueError(msg)
 
     @property
     def context_size(self) -> int:
@@ -93,6 +151,8 @@ class BenchIdentity:
     n_threads: int
     flash_attn: int
     use_mmap: bool
+    split_mode: str = "layer"
+    tensor_split: str = ""
 
 
 @dataclass(frozen=True, slots=True)
@@ -113,30 +173,99 @@ class BenchMeasurement:
     samples: tuple[BenchSample, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class DepthPoint:
+    """Throughput of one workload at one KV depth of a depth profile."""
+
+    workload_name: str
+    n_depth: int
+    avg_ts: float
+
+
 @dataclass(frozen=True, slots=True)
 class BenchResult:
-    """Parsed bench result for one config across all workloads."""
+    """Parsed bench result for one config across all workloads.
+
+    ``depth_curve`` holds every (workload, depth) row, sorted, when the output
+    covered more than the context depth; it is empty otherwise.
+    """
 
     model: str
     build: int
     measurements: tuple[BenchMeasurement, ...]
     raw_jsonl: str
+    depth_curve: tuple[DepthPoint, ...] = ()
+
+
+class CachePolicy(StrEnum):
+    """Whether a screen may answer from the cross-run measurement cache."""
+
+    REUSE = "reuse"
+    REUSE_IF_FRESH = "reuse-if-fresh"
+    REMEASURE = "remeasure"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchCacheLookup:
+    """Cache root, the measurement identity beyond the request, and the reuse policy.
+
+    The cache key also covers the request's ``identity`` and ``bench_config``
+    (:mod:`llama_optimizer.bench_cache`). ``max_age`` bounds ``reuse-if-fresh``;
+    ``remeasure`` always runs llama-bench and refreshes the entry.
+    """
+
+    root: Path
+    build: LlamaCppBuild
+    model_sha256: Sha256Hex
+    backend: str
+    policy: CachePolicy = CachePolicy.REUSE
+    max_age: timedelta | None = None
+
+    def __post_init__(self) -> None:
+        """Require a freshness bound for ``reuse-if-fresh``."""
+        if self.policy is CachePolicy.REUSE_IF_FRESH and self.max_age is None:
+            msg = "cache policy reuse-if-fresh needs max_age"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheProvenance:
+    """The run and attempt that originally measured a reused result."""
+
+    run_id: str
+    attempt_id: str
+    recorded_at: datetime
 
 
 @dataclass(frozen=True, slots=True)
 class BenchScreenRequest:
-    """Bundle of inputs for one supervised bench screening attempt."""
+    """Bundle of inputs for one supervised bench screening attempt.
+
+    ``page_cache`` is the run-scoped warmer shared by every request of a run;
+    it prewarms each model file only before that candidate's first trial.
+    ``incumbent`` maps workload names to the current best ``avg_ts`` so an
+    adaptive screen can stop once this config is confidently worse. ``cache``
+    lets the screen reuse (and fills) the cross-run measurement cache.
+    """
 
     trial_id: TrialId
     bench_config: BenchConfig
     identity: BenchIdentity
     binary: str
     output_dir: Path
+    chrome_trace: bool = False
+    page_cache: PageCacheWarmer | None = None
+    incumbent: Mapping[str, float] | None = None
+    cache: BenchCacheLookup | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class BenchScreenResult:
-    """Typed outcome of one supervised bench attempt."""
+    """Typed outcome of one supervised bench attempt (``stop_reason`` if adaptive).
+
+    A result answered from the cache has ``reused_from`` set and a
+    never-launched ``supervisor_result``.
+    """
 
     outcome: NonScoredOutcome | None
     result: BenchResult | None
@@ -145,3 +274,18 @@ class BenchScreenResult:
     trial_id: TrialId
     attempt_id: AttemptId
     metrics: Mapping[str, float] = field(default_factory=dict[str, float])
+    stop_reason: StopReason | None = None
+    reused_from: CacheProvenance | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchSweepResult:
+    """Per-request results of one sweep plus the requests it never reached.
+
+    ``screened`` follows the request order. Each ``unstarted`` request's
+    attempt was closed as a transient failure because the shared process
+    failed before its config ran, so it can be screened again.
+    """
+
+    screened: tuple[BenchScreenResult, ...]
+    unstarted: tuple[BenchScreenRequest, ...] = ()
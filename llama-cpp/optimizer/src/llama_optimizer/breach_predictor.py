@@ -0,0 +1,197 @@
+"""Predictive VRAM breach detection from the startup allocation trend (T5).
+
+:func:`~llama_optimizer.telemetry.is_breach` only fires once total used VRAM
+reaches the ceiling, so a config visibly climbing toward 13 GiB during model
+load still pays for most of the load before it is killed. During the startup
+window the supervisor can feed hard-channel readings into a
+:class:`BreachPredictor`, which fits an ordinary least-squares slope over the
+most recent readings and projects ``horizon`` ahead using the *lower*
+one-sided Student-t confidence bound of that slope (``n - 2`` degrees of
+freedom for ``n`` fitted points). Only when even the pessimistic-for-abort
+projection reaches the ceiling is the trial stopped, still as
+``resource-infeasible`` but with the distinct :data:`PREDICTED_BREACH_REASON`.
+
+The saving is deliberately small. A firing projection needs ``lower *
+horizon >= ceiling - used`` and the point slope is at least its lower bound,
+so the breach it pre-empts was at most ``horizon`` away: under one second by
+default (0.69 s and 0.75 s on the bundled load traces). Projecting further,
+e.g. over the rest of the startup window, would extrapolate a model-load ramp
+past the plateau it reaches once the weights are resident and abort feasible
+configs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.bench_stats import t_quantile
+from llama_optimizer.telemetry import VRAM_CEILING_BYTES, Bytes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from llama_optimizer.ledger import Ledger
+    from llama_optimizer.lifecycle import AttemptId
+
+#: Termination reason prefix distinguishing a predicted from a sampled breach.
+PREDICTED_BREACH_REASON: Final[str] = "predicted-vram-breach"
+#: Ledger artifact kind holding the prediction evidence and estimated time saved.
+PREDICTION_ARTIFACT_KIND: Final[str] = "breach-prediction"
+
+_MIN_FIT_POINTS: Final[int] = 3
+_MIN_CONFIDENCE: Final[float] = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class BreachPredictorConfig:
+    """Knobs for the startup-trend predictor; validated on construction.
+
+    ``horizon`` bounds both how far the trend is trusted and the time an abort
+    can save (see the module docstring).
+    """
+
+    window: int = 8
+    min_samples: int = 4
+    horizon: timedelta = timedelta(seconds=1)
+    confidence: float = 0.95
+    startup: timedelta = timedelta(seconds=120)
+
+    def __post_init__(self) -> None:
+        """Reject windows/confidences that make the fit meaningless."""
+        if self.min_samples < _MIN_FIT_POINTS or self.window < self.min_samples:
+            msg = f"need window >= min_samples >= {_MIN_FIT_POINTS}"
+            raise ValueError(msg)
+        if not _MIN_CONFIDENCE <= self.confidence < 1.0:
+            msg = f"confidence must be in [{_MIN_CONFIDENCE}, 1), got {self.confidence}"
+            raise ValueError(msg)
+        if self.horizon <= timedelta(0) or self.startup <= timedelta(0):
+            msg = "horizon and startup must be positive"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class BreachPrediction:
+    """Evidence for one predicted breach, recorded with the aborted attempt."""
+
+    used: Bytes
+    projected_peak: Bytes
+    slope_bytes_per_second: float
+    slope_lower_bound: float
+    confidence: float
+    estimated_saved: timedelta
+
+    def describe(self) -> str:
+        """Render the ledger termination reason for this prediction."""
+        return (
+            f"{PREDICTED_BREACH_REASON}: used={int(self.used)} "
+            + f"projected_peak={int(self.projected_peak)} "
+            + f"slope_lb={self.slope_lower_bound:.0f}B/s "
+            + f"confidence={self.confidence} "
+            + f"saved_s={self.estimated_saved.total_seconds():.3f}"
+        )
+
+    def to_json(self) -> str:
+        """Canonical JSON evidence for the ledger artifact."""
+        return json.dumps(
+            {
+                "reason": PREDICTED_BREACH_REASON,
+                "used_bytes": int(self.used),
+                "projected_peak_bytes": int(self.projected_peak),
+                "slope_bytes_per_second": self.slope_bytes_per_second,
+                "slope_lower_bound": self.slope_lower_bound,
+                "confidence": self.confidence,
+                "estimated_saved_seconds": self.estimated_saved.total_seconds(),
+            },
+            sort_keys=True,
+        )
+
+
+@final
+class BreachPredictor:
+    """Rolling OLS slope over recent ``(seconds, used)`` readings."""
+
+    def __init__(
+        self, config: BreachPredictorConfig, *, ceiling: Bytes = VRAM_CEILING_BYTES
+    ) -> None:
+        self._config: Final = config
+        self._ceiling: Final[int] = int(ceiling)
+        self._t: Final[dict[int, float]] = {}
+        self._points: Final[deque[tuple[float, int]]] = deque(maxlen=config.window)
+
+    @property
+    def config(self) -> BreachPredictorConfig:
+        """The predictor's immutable configuration."""
+        return self._config
+
+    def observe(self, elapsed: timedelta, used: Bytes) -> BreachPrediction | None:
+        """Add one reading; return a prediction once a breach is confidently projected."""
+        if elapsed > self._config.startup:
+            return None
+        self._points.append((elapsed.total_seconds(), int(used)))
+        if len(self._points) < self._config.min_samples:
+            return None
+        fit = _fit(list(self._points))
+        if fit is None:
+            return None
+        slope, slope_se = fit
+        lower = slope - self._critical(len(self._points)) * slope_se
+        if lower <= 0:
+            return None
+        horizon = self._config.horizon.total_seconds()
+        projected = int(used) + lower * horizon
+        if projected < self._ceiling:
+            return None
+        saved = max(self._ceiling - int(used), 0) / slope
+        return BreachPrediction(
+            used=used,
+            projected_peak=Bytes(int(projected)),
+            slope_bytes_per_second=slope,
+            slope_lower_bound=lower,
+            confidence=self._config.confidence,
+            estimated_saved=timedelta(seconds=saved),
+        )
+
+    def _critical(self, n: int) -> float:
+        """Return the one-sided Student-t critical value for a slope fitted on ``n`` points."""
+        if n not in self._t:
+            self._t[n] = t_quantile(2 * self._config.confidence - 1, n - 2)
+        return self._t[n]
+
+
+def _fit(points: list[tuple[float, int]]) -> tuple[float, float] | None:
+    """Return the OLS slope and its standard error, or ``None`` if degenerate."""
+    n = len(points)
+    mean_t = sum(t for t, _ in points) / n
+    mean_u = sum(u for _, u in points) / n
+    sxx = sum((t - mean_t) ** 2 for t, _ in points)
+    if sxx <= 0:
+        return None
+    slope = sum((t - mean_t) * (u - mean_u) for t, u in points) / sxx
+    intercept = mean_u - slope * mean_t
+    sse = sum((u - (intercept + slope * t)) ** 2 for t, u in points)
+    slope_se = math.sqrt(sse / (n - 2) / sxx)
+    return slope, slope_se
+
+
+def record_breach_prediction(
+    ledger: Ledger,
+    attempt_id: AttemptId,
+    prediction: BreachPrediction,
+    path: Path,
+    kind: str = PREDICTION_ARTIFACT_KIND,
+) -> None:
+    """Write the prediction evidence to ``path`` and link it to the attempt as ``kind``."""
+    payload = prediction.to_json()
+    _ = path.write_text(payload + "\n")
+    ledger.record_artifact(
+        attempt_id=attempt_id,
+        kind=kind,
+        relative_path=str(path),
+        content_hash=hashlib.sha256(path.read_bytes()).hexdigest(),
+    )
@@ -6,10 +6,13 @@ documented help tree. Task 2 wires ``profile validate`` to real behavior
 (parse the immutable TOML profile and emit canonical deterministic JSON);
 the remaining six groups still fail fast with a typed
 ``CommandNotScaffoldedError`` translated into a clean nonzero exit.
+``overhead`` benchmarks the process supervisor itself and emits JSON.
 """
 
 from __future__ import annotations
 
+from datetime import timedelta
+from pathlib import Path
 from typing import Annotated, Final, NoReturn, final
 
 import typer
@@ -22,6 +25,7 @@ from llama_optimizer.profiles import (
     parse_profile,
 )
 from llama_optimizer.search_space import SearchSpaceError
+from llama_optimizer.supervisor_overhead import DEFAULT_INTERVALS, run_overhead_suite
 
 app = typer.Typer(
     name="llama-cpp-opt",
@@ -116,6 +120,31 @@ def agent() -> None:
     _fail_not_scaffolded("agent")
 
 
+@app.command()
+def overhead(
+    *,
+    interval_ms: Annotated[
+        list[int] | None,
+        typer.Option(help="Sampling interval to measure (repeatable; default 50/100/250/500)."),
+    ] = None,
+    repeats: Annotated[int, typer.Option(min=1, help="Supervised runs per scenario.")] = 3,
+    output: Annotated[
+        str | None, typer.Option(help="Write the JSON report here instead of stdout.")
+    ] = None,
+) -> None:
+    """Measure supervisor spawn, jitter, detection, and teardown overhead as JSON."""
+    intervals = (
+        tuple(timedelta(milliseconds=ms) for ms in interval_ms)
+        if interval_ms
+        else DEFAULT_INTERVALS
+    )
+    report_json = run_overhead_suite(intervals, repeats=repeats).to_json()
+    if output is None:
+        typer.echo(report_json, nl=False)
+        return
+    _ = Path(output).write_text(report_json)
+
+
 def main() -> None:
     """Console-script entry point for ``llama-cpp-opt``."""
     app()
@@ -0,0 +1,334 @@
+"""Concurrent supervision of several trial children under one VRAM budget (T5).
+
+:class:`~llama_optimizer.supervisor.ProcessSupervisor` owns exactly one child
+per call, so small or CPU-only screening configs that could share the GPU run
+back to back. :class:`ConcurrentSupervisor` admits several children at once on
+an asyncio loop:
+
+* an :class:`AdmissionController` reserves each child's estimated VRAM share
+  against the single ceiling, on top of the preflight baseline (desktop and
+  other tenants), and holds further children until a share is released;
+* one shared sampler task reads the hard channel for the whole group and
+  records every reading into each running child's series;
+* an aggregate breach or any hard-telemetry loss terminates *every* running
+  group fail-closed (SIGTERM, bounded grace, SIGKILL, reap, group-gone check).
+
+An aggregate breach cannot be attributed to one co-scheduled child, so with
+more than one child running each is returned as ``resource-infeasible`` with
+``group_breach`` set (re-run it solo to classify it); a lone child is
+``resource-infeasible`` exactly as in the sequential supervisor. A child that
+had already exited when the group aborted keeps its own exit status. Children
+still waiting for admission when the group aborts are returned unlaunched as
+``cancelled``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import signal
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.process_wait import wait_group_gone
+from llama_optimizer.supervisor import ChildExit, SupervisorResult
+from llama_optimizer.telemetry import (
+    VRAM_CEILING_BYTES,
+    Bytes,
+    HardChannel,
+    TelemetryLossError,
+    is_breach,
+    is_stale,
+)
+from llama_optimizer.telemetry_series import EMPTY_SERIES, TelemetryRecorder
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.supervisor import SupervisorConfig
+    from llama_optimizer.telemetry import HardChannelProvider
+
+__all__ = ("AdmissionController", "ConcurrentSupervisor", "TrialLaunch")
+
+_CLEANUP_TIMEOUT: Final[timedelta] = timedelta(seconds=2)
+
+
+@dataclass(frozen=True, slots=True)
+class TrialLaunch:
+    """One child to admit: its argv and the VRAM share it is expected to add."""
+
+    command: tuple[str, ...]
+    estimated_vram: Bytes
+
+
+@final
+class AdmissionController:
+    """Reserves estimated VRAM shares against one ceiling (``>=`` blocks, as in breach)."""
+
+    def __init__(self, *, ceiling: Bytes, baseline: Bytes) -> None:
+        self._ceiling: Final[int] = int(ceiling)
+        self._baseline: Final[int] = int(baseline)
+        self._reserved: int = 0
+
+    @property
+    def reserved(self) -> Bytes:
+        """Sum of the shares currently reserved by admitted children."""
+        return Bytes(self._reserved)
+
+    def feasible(self, estimate: Bytes) -> bool:
+        """Whether ``estimate`` could ever be admitted, even with nothing else running."""
+        return self._baseline + int(estimate) < self._ceiling
+
+    def try_reserve(self, estimate: Bytes) -> bool:
+        """Reserve ``estimate`` if it fits beside current reservations."""
+        if self._baseline + self._reserved + int(estimate) >= self._ceiling:
+            return False
+        self._reserved += int(estimate)
+        return True
+
+    def release(self, estimate: Bytes) -> None:
+        """Return a previously reserved share to the budget."""
+        self._reserved -= int(estimate)
+
+
+@dataclass(eq=False)
+class _Child:
+    """One admitted, running child and its per-trial telemetry recorder."""
+
+    proc: asyncio.subprocess.Process
+    recorder: TelemetryRecorder
+    outcome: NonScoredOutcome | None = None
+
+
+@dataclass
+class _Group:
+    """Shared mutable state for one concurrent batch (single-use per call)."""
+
+    admission: AdmissionController
+    slots: int
+    admitted: int = 0
+    running: set[_Child] = field(default_factory=set[_Child])
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    aborted: asyncio.Event = field(default_factory=asyncio.Event)
+    group_breach: bool = False
+
+    def abort(self, outcome: NonScoredOutcome) -> None:
+        """Stamp every still-running child with ``outcome`` and wake all waiters.
+
+        A breach with several children running is flagged as ``group_breach``.
+        """
+        for child in self.running:
+            if child.proc.returncode is None:
+                child.outcome = outcome
+        breach = outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        self.group_breach = breach and len(self.running) > 1
+        self.aborted.set()
+
+
+@final
+class ConcurrentSupervisor:
+    """Runs several trial children at once under a shared, fail-closed VRAM budget."""
+
+    def __init__(self, *, max_concurrency: int, ceiling: Bytes = VRAM_CEILING_BYTES) -> None:
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be >= 1, got {max_concurrency}"
+            raise ValueError(msg)
+        self._slots: Final[int] = max_concurrency
+        self._ceiling: Final[Bytes] = ceiling
+
+    def run(
+        self,
+        launches: Sequence[TrialLaunch],
+        *,
+        provider: HardChannelProvider,
+        config: SupervisorConfig,
+    ) -> tuple[SupervisorResult, ...]:
+        """Supervise every launch to completion; results follow ``launches`` order."""
+        return asyncio.run(self.run_async(launches, provider=provider, config=config))
+
+    async def run_async(
+        self,
+        launches: Sequence[TrialLaunch],
+        *,
+        provider: HardChannelProvider,
+        config: SupervisorConfig,
+    ) -> tuple[SupervisorResult, ...]:
+        """Async form of :meth:`run` for callers already on an event loop."""
+        started_at = datetime.now(UTC)
+        try:
+            preflight = await asyncio.to_thread(provider.sample)
+        except TelemetryLossError:
+            return tuple(_unlaunched(NonScoredOutcome.TELEMETRY_LOSS, started_at) for _ in launches)
+        if is_breach(preflight, ceiling=self._ceiling, ceilings=config.device_ceilings):
+            blocked = NonScoredOutcome.RESOURCE_INFEASIBLE
+            return tuple(_unlaunched(blocked, started_at) for _ in launches)
+        if is_stale(preflight, now=datetime.now(UTC), max_staleness=config.max_staleness):
+            return tuple(_unlaunched(NonScoredOutcome.TELEMETRY_LOSS, started_at) for _ in launches)
+        group = _Group(
+            admission=AdmissionController(ceiling=self._ceiling, baseline=preflight.used),
+            slots=self._slots,
+        )
+        sampler = asyncio.create_task(self._sample(provider, config, group))
+        try:
+            results = await asyncio.gather(*(self._trial(t, config, group) for t in launches))
+        finally:
+            _ = sampler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sampler
+        return tuple(results)
+
+    async def _sample(
+        self, provider: HardChannelProvider, config: SupervisorConfig, group: _Group
+    ) -> None:
+        """Read the hard channel for the whole group until every trial finishes."""
+        timeout = config.provider_timeout.total_seconds()
+        while not group.aborted.is_set():
+            await asyncio.sleep(config.interval.total_seconds())
+            try:
+                sample = await asyncio.wait_for(asyncio.to_thread(provider.sample), timeout)
+            except (TelemetryLossError, TimeoutError):
+                group.abort(NonScoredOutcome.TELEMETRY_LOSS)
+                return
+            verdict = self._judge(sample, config, group)
+            if verdict is not None:
+                group.abort(verdict)
+                return
+
+    def _judge(
+        self, sample: HardChannel, config: SupervisorConfig, group: _Group
+    ) -> NonScoredOutcome | None:
+        """Record one shared reading; return the group-wide fail-closed outcome, if any."""
+        stale = is_stale(sample, now=datetime.now(UTC), max_staleness=config.max_staleness)
+        for child in group.running:
+            child.recorder.append(sample, stale=stale, interval=config.interval)
+        if is_breach(sample, ceiling=self._ceiling, ceilings=config.device_ceilings):
+            return NonScoredOutcome.RESOURCE_INFEASIBLE
+        if stale:
+            return NonScoredOutcome.TELEMETRY_LOSS
+        return None
+
+    async def _trial(
+        self, launch: TrialLaunch, config: SupervisorConfig, group: _Group
+    ) -> SupervisorResult:
+        """Admit, launch, watch, and clean up one child."""
+        started_at = datetime.now(UTC)
+        if not group.admission.feasible(launch.estimated_vram):
+            return _unlaunched(NonScoredOutcome.RESOURCE_INFEASIBLE, started_at)
+        if not await self._admit(launch, group):
+            return _unlaunched(NonScoredOutcome.CANCELLED, started_at)
+        recorder = TelemetryRecorder(
+            downsample_window=config.telemetry_downsample_window,
+            ceiling=self._ceiling,
+            ceilings=config.device_ceilings,
+        )
+        try:
+            proc = await asyncio.create_subprocess_exec(*launch.command, start_new_session=True)
+        except BaseException:
+            await self._release(launch, group)
+            raise
+        child = _Child(proc=proc, recorder=recorder)
+        group.running.add(child)
+        terminated = escalated = False
+        try:
+            outcome = await self._watch(child, config, group)
+        finally:
+            if proc.returncode is None:
+                terminated = True
+                escalated = await _terminate_group(proc, config.grace)
+            group.running.discard(child)
+            await self._release(launch, group)
+        if not await asyncio.to_thread(wait_group_gone, proc.pid, _CLEANUP_TIMEOUT.total_seconds()):
+            outcome = NonScoredOutcome.CLEANUP_FAILURE
+        series = recorder.finish()
+        return SupervisorResult(
+            outcome=outcome,
+            series=series,
+            diagnostics_series=(),
+            peak_used=series.peak_used,
+            started_at=started_at,
+            ended_at=datetime.now(UTC),
+            launched=True,
+            terminated_group=terminated,
+            process_group_pid=proc.pid,
+            escalated_to_sigkill=escalated,
+            group_breach=group.group_breach and outcome is NonScoredOutcome.RESOURCE_INFEASIBLE,
+        )
+
+    @staticmethod
+    async def _admit(launch: TrialLaunch, group: _Group) -> bool:
+        """Wait for a slot and a VRAM share; ``False`` if the group aborted first."""
+        async with group.changed:
+            while not group.aborted.is_set():
+                if group.admitted < group.slots and group.admission.try_reserve(
+                    launch.estimated_vram
+                ):
+                    group.admitted += 1
+                    return True
+                _ = await group.changed.wait()
+        return False
+
+    @staticmethod
+    async def _release(launch: TrialLaunch, group: _Group) -> None:
+        async with group.changed:
+            group.admission.release(launch.estimated_vram)
+            group.admitted -= 1
+            group.changed.notify_all()
+
+    @staticmethod
+    async def _watch(
+        child: _Child, config: SupervisorConfig, group: _Group
+    ) -> NonScoredOutcome | ChildExit:
+        """Wait for exit, a group abort, or the per-trial deadline, whichever is first."""
+        exited = asyncio.ensure_future(child.proc.wait())
+        aborted = asyncio.ensure_future(group.aborted.wait())
+        try:
+            _ = await asyncio.wait(
+                {exited, aborted},
+                timeout=config.deadline.total_seconds(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            _ = exited.cancel()
+            _ = aborted.cancel()
+        if child.proc.returncode is not None:
+            return ChildExit(child.proc.returncode)
+        if child.outcome is not None:
+            return child.outcome
+        # Cancelled if admitted while the group was aborting, before it was stamped.
+        return NonScoredOutcome.CANCELLED if group.aborted.is_set() else NonScoredOutcome.HANG
+
+
+async def _terminate_group(proc: asyncio.subprocess.Process, grace: timedelta) -> bool:
+    """SIGTERM the child's group; SIGKILL after ``grace``; return whether SIGKILL was needed."""
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        _ = await proc.wait()
+        return False
+    try:
+        _ = await asyncio.wait_for(proc.wait(), grace.total_seconds())
+    except TimeoutError:
+        sigkill_needed = True
+    else:
+        sigkill_needed = False
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+    _ = await proc.wait()
+    return sigkill_needed
+
+
+def _unlaunched(outcome: NonScoredOutcome, started_at: datetime) -> SupervisorResult:
+    """Typed result for a trial that never got a child process."""
+    return SupervisorResult(
+        outcome=outcome,
+        series=EMPTY_SERIES,
+        diagnostics_series=(),
+        peak_used=None,
+        started_at=started_at,
+        ended_at=datetime.now(UTC),
+        launched=False,
+        terminated_group=False,
+    )
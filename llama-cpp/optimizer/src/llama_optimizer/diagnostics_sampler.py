@@ -0,0 +1,116 @@
+"""Background best-effort diagnostics sampling for supervised trials (T5).
+
+Diagnostics (temperature/power/use/clocks/PCIe) are never a hard gate, but the
+rocm-smi path forks a second, slow command with its own timeout. Sampling them
+inline would stretch the gap between hard-channel VRAM reads, so the
+supervisor runs them on a daemon thread at an independent cadence into a
+bounded ring buffer. After the run the buffer is aligned to the hard samples:
+each hard sample is paired with the most recent snapshot taken at or before
+it, or an empty snapshot when none was available yet.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.telemetry import Diagnostics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.telemetry import HardChannel, HardChannelProvider
+
+#: Empty snapshot for hard samples taken before the first diagnostics read.
+EMPTY_DIAGNOSTICS: Final[Diagnostics] = Diagnostics(
+    temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TimedDiagnostics:
+    """One diagnostics snapshot stamped when its read began."""
+
+    collected_at: datetime
+    diagnostics: Diagnostics
+
+
+def align_diagnostics(
+    samples: Sequence[HardChannel], snapshots: Sequence[TimedDiagnostics]
+) -> tuple[Diagnostics, ...]:
+    """Pair every hard sample with the latest snapshot at or before its timestamp."""
+    ordered = sorted(snapshots, key=lambda snap: snap.collected_at)
+    aligned: list[Diagnostics] = []
+    idx = 0
+    current = EMPTY_DIAGNOSTICS
+    for sample in sorted(samples, key=lambda s: s.collected_at):
+        while idx < len(ordered) and ordered[idx].collected_at <= sample.collected_at:
+            current = ordered[idx].diagnostics
+            idx += 1
+        aligned.append(current)
+    return tuple(aligned)
+
+
+@final
+class DiagnosticsSampler:
+    """Daemon thread reading ``provider.diagnostics()`` into a bounded ring buffer.
+
+    ``stop`` never waits longer than ``join_timeout``: a diagnostics read still
+    in flight is abandoned (its thread is a daemon) rather than delaying the
+    supervised result.
+    """
+
+    def __init__(
+        self,
+        provider: HardChannelProvider,
+        *,
+        interval: timedelta,
+        capacity: int,
+        join_timeout: timedelta,
+    ) -> None:
+        if capacity < 1:
+            msg = f"diagnostics capacity must be positive, got {capacity}"
+            raise ValueError(msg)
+        self._provider: Final = provider
+        self._interval: Final[float] = interval.total_seconds()
+        self._join_timeout: Final[float] = join_timeout.total_seconds()
+        self._buffer: Final[deque[TimedDiagnostics]] = deque(maxlen=capacity)
+        self._lock: Final = threading.Lock()
+        self._stop: Final = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling immediately and then every ``interval``."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="diagnostics-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> tuple[TimedDiagnostics, ...]:
+        """Signal the thread, wait at most ``join_timeout``, and return the buffer."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self._join_timeout)
+        return self.snapshots()
+
+    def snapshots(self) -> tuple[TimedDiagnostics, ...]:
+        """Return the buffered snapshots, oldest first."""
+        with self._lock:
+            return tuple(self._buffer)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            collected_at = datetime.now(UTC)
+            # Providers promise diagnostics() never raises; an I/O or parse slip
+            # must still not kill the sampler or reach the hard-channel loop.
+            try:
+                diagnostics = self._provider.diagnostics()
+            except (OSError, ValueError):
+                diagnostics = EMPTY_DIAGNOSTICS
+            with self._lock:
+                self._buffer.append(TimedDiagnostics(collected_at, diagnostics))
+            if self._stop.wait(self._interval):
+                return
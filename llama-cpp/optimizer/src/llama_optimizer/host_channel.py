@@ -0,0 +1,236 @@
+"""Soft host-side CPU/RAM/IO channel for trial children (T5).
+
+The hard channel only watches VRAM, but ``threads`` and ``use_mmap`` move host
+CPU saturation, resident memory, and page-fault behaviour. With a
+:class:`HostChannelConfig` on the supervisor, a :class:`HostSampler` thread
+reads cumulative counters for the trial's processes alongside the hard
+channel:
+
+* from a per-trial cgroup v2 created under ``cgroup_parent`` when that parent
+  is a delegated subtree with the ``memory`` controller enabled (the child is
+  moved in right after ``Popen``; llama.cpp children do not fork first);
+* otherwise by aggregating ``/proc/<pid>/{stat,io}`` over every process still
+  in the child's process group (exited members' counters are lost).
+
+Like diagnostics, the host channel is never a gate: an unreadable counter is
+recorded as zero and a vanished group simply stops producing readings.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Protocol, final
+
+from llama_optimizer.ledger_records import HostSampleRow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+SOURCE_CGROUP: Final[str] = "cgroup"
+SOURCE_PROC: Final[str] = "proc"
+_PROC_ROOT: Final[Path] = Path("/proc")
+_NS_PER_US: Final[int] = 1_000
+_NS_PER_S: Final[int] = 1_000_000_000
+# Zero-based field offsets after the ``(comm)`` field of /proc/<pid>/stat.
+_PGRP, _MAJFLT, _CMAJFLT, _UTIME, _STIME, _CUTIME, _CSTIME, _RSS = 2, 9, 10, 11, 12, 13, 14, 21
+
+
+@dataclass(frozen=True, slots=True)
+class HostChannelConfig:
+    """Cadence, ring size, and optional delegated cgroup v2 parent for host sampling."""
+
+    interval: timedelta = timedelta(seconds=1)
+    capacity: int = 1024
+    cgroup_parent: Path | None = None
+
+    def __post_init__(self) -> None:
+        """Reject non-positive cadence and capacity."""
+        if self.interval <= timedelta(0) or self.capacity < 1:
+            msg = f"host channel needs interval > 0 and capacity >= 1, got {self}"
+            raise ValueError(msg)
+
+
+class HostProbe(Protocol):
+    """Reads cumulative host counters for one trial's processes."""
+
+    def read(self) -> HostSampleRow | None:
+        """Return one reading, or ``None`` once nothing is left to observe."""
+        ...
+
+    def close(self) -> None:
+        """Release any per-trial resources."""
+        ...
+
+
+@final
+class ProcGroupProbe:
+    """Sums ``/proc`` counters over every live member of a process group."""
+
+    def __init__(self, pgid: int, *, proc_root: Path = _PROC_ROOT) -> None:
+        self._pgid: Final = pgid
+        self._root: Final = proc_root
+        self._tick_ns: Final[int] = _NS_PER_S // os.sysconf("SC_CLK_TCK")
+        self._page: Final[int] = os.sysconf("SC_PAGE_SIZE")
+
+    def read(self) -> HostSampleRow | None:
+        """Aggregate stat/io over the group; ``None`` when no member is left."""
+        totals = [0, 0, 0, 0, 0]
+        members = 0
+        for entry in self._root.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                fields = (entry / "stat").read_text().rpartition(")")[2].split()
+            except OSError:
+                continue
+            if len(fields) <= _RSS or int(fields[_PGRP]) != self._pgid:
+                continue
+            members += 1
+            ticks = sum(int(fields[i]) for i in (_UTIME, _STIME, _CUTIME, _CSTIME))
+            io = _read_keyed(entry / "io", ":")
+            for index, value in enumerate(
+                (
+                    ticks * self._tick_ns,
+                    int(fields[_RSS]) * self._page,
+                    int(fields[_MAJFLT]) + int(fields[_CMAJFLT]),
+                    io.get("read_bytes", 0),
+                    io.get("write_bytes", 0),
+                )
+            ):
+                totals[index] += value
+        return _row(SOURCE_PROC, totals) if members else None
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+@final
+class CgroupProbe:
+    """Reads a per-trial cgroup v2's counters; removes the cgroup on close."""
+
+    def __init__(self, path: Path) -> None:
+        self.path: Final = path
+
+    def read(self) -> HostSampleRow | None:
+        """Read cpu.stat, memory.stat, and io.stat; counters survive member exit."""
+        cpu = _read_keyed(self.path / "cpu.stat", " ")
+        memory = _read_keyed(self.path / "memory.stat", " ")
+        read_bytes = write_bytes = 0
+        for line in _read_lines(self.path / "io.stat"):
+            for part in line.split()[1:]:
+                key, _, value = part.partition("=")
+                read_bytes += int(value) if key == "rbytes" else 0
+                write_bytes += int(value) if key == "wbytes" else 0
+        return _row(
+            SOURCE_CGROUP,
+            (
+                cpu.get("usage_usec", 0) * _NS_PER_US,
+                memory.get("anon", 0) + memory.get("file_mapped", 0),
+                memory.get("pgmajfault", 0),
+                read_bytes,
+                write_bytes,
+            ),
+        )
+
+    def close(self) -> None:
+        """Remove the (by now empty) per-trial cgroup, best effort."""
+        with contextlib.suppress(OSError):
+            self.path.rmdir()
+
+
+def open_host_probe(pid: int, config: HostChannelConfig) -> HostProbe:
+    """Move ``pid`` into a fresh per-trial cgroup when possible, else watch its group."""
+    parent = config.cgroup_parent
+    if parent is None or "memory" not in " ".join(_read_lines(parent / "cgroup.subtree_control")):
+        return ProcGroupProbe(pid)
+    path = parent / f"llama-opt-{pid}"
+    try:
+        path.mkdir()
+        _ = (path / "cgroup.procs").write_text(str(pid))
+    except OSError:
+        CgroupProbe(path).close()
+        return ProcGroupProbe(pid)
+    return CgroupProbe(path)
+
+
+@final
+class HostSampler:
+    """Daemon thread reading a :class:`HostProbe` into a bounded ring buffer."""
+
+    def __init__(self, probe: HostProbe, config: HostChannelConfig) -> None:
+        self._probe: Final = probe
+        self._interval: Final[float] = config.interval.total_seconds()
+        self._buffer: Final[deque[HostSampleRow]] = deque(maxlen=config.capacity)
+        self._lock: Final = threading.Lock()
+        self._stop: Final = threading.Event()
+        self._thread: Final = threading.Thread(target=self._run, name="host-sampler", daemon=True)
+
+    @classmethod
+    def launch(cls, pid: int, config: HostChannelConfig | None) -> HostSampler | None:
+        """Open a probe for ``pid`` and start sampling; ``None`` when not configured."""
+        if config is None:
+            return None
+        sampler = cls(open_host_probe(pid, config), config)
+        sampler._thread.start()
+        return sampler
+
+    def stop(self) -> tuple[HostSampleRow, ...]:
+        """Stop sampling, take a final reading, release the probe, and return the buffer."""
+        self._stop.set()
+        self._thread.join(self._interval)
+        self._sample()
+        self._probe.close()
+        with self._lock:
+            return tuple(self._buffer)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._sample()
+            if self._stop.wait(self._interval):
+                return
+
+    def _sample(self) -> None:
+        try:
+            row = self._probe.read()
+        except (OSError, ValueError):
+            row = None
+        if row is not None:
+            with self._lock:
+                self._buffer.append(row)
+
+
+def _row(source: str, counters: Sequence[int]) -> HostSampleRow:
+    """Stamp ``(cpu_ns, rss, major_faults, read, write)`` counters as a ledger row."""
+    cpu, rss, faults, read, write = counters
+    return HostSampleRow(
+        sampled_at=datetime.now(UTC).isoformat(),
+        source=source,
+        cpu_time_ns=cpu,
+        rss_bytes=rss,
+        major_faults=faults,
+        read_bytes=read,
+        write_bytes=write,
+    )
+
+
+def _read_lines(path: Path) -> Iterable[str]:
+    try:
+        return path.read_text().splitlines()
+    except OSError:
+        return ()
+
+
+def _read_keyed(path: Path, sep: str) -> Mapping[str, int]:
+    """Parse ``key<sep>value`` counter lines; missing files or odd lines are skipped."""
+    values: dict[str, int] = {}
+    for line in _read_lines(path):
+        key, _, value = line.partition(sep)
+        if value.strip().isdigit():
+            values[key.strip()] = int(value)
+    return values
@@ -19,6 +19,7 @@ from dataclasses import replace
 from typing import TYPE_CHECKING, Self, final
 
 from llama_optimizer import ledger_dump, ledger_ids, ledger_io
+from llama_optimizer import ledger_evidence as evidence
 from llama_optimizer import ledger_ops as ops
 from llama_optimizer import ledger_resume as resume_ops
 from llama_optimizer import ledger_store as store
@@ -31,6 +32,7 @@ from llama_optimizer.ledger_records import (
 from llama_optimizer.ledger_schema import (
     assert_schema_compatible,
     initialize_schema,
+    migrate_schema,
     schema_version,
 )
 from llama_optimizer.lifecycle import (
@@ -43,10 +45,17 @@ from llama_optimizer.lifecycle import (
 
 if TYPE_CHECKING:
     import sqlite3
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
 
     from llama_optimizer.artifacts import RunArtifactRoot
-    from llama_optimizer.ledger_records import AttemptRecord, ResumeResult, TrialRecord
+    from llama_optimizer.ledger_records import (
+        AttemptRecord,
+        HostSampleRow,
+        PhaseSpanRow,
+        ResumeResult,
+        TelemetryRow,
+        TrialRecord,
+    )
     from llama_optimizer.lifecycle import Generation, ResumeMode, TrialId
     from llama_optimizer.resume import OptimizerVersions
 
@@ -97,13 +106,7 @@ class Ledger:
     def create_run(cls, root: RunArtifactRoot, identity: RunIdentity) -> Ledger:
         """Create a fresh INITIALIZED run, bootstrap the schema, acquire the lock."""
         run_id = root.path.name
-        lock_fd = ledger_io.acquire_lock(root.resolve_artifact("run.lock"))
-        try:
-            conn = ledger_io.connect(root.resolve_artifact("study.sqlite3"))
-        except BaseException:
-            ledger_io.release_lock(lock_fd)
-            raise
-        assert_schema_compatible(conn)
+        conn, lock_fd = _connect_locked(root)
         if schema_version(conn) is None:
             initialize_schema(conn, applied_at=ledger_ids.utc_now_iso())
         now = ledger_ids.utc_now_iso()
@@ -116,13 +119,7 @@ class Ledger:
     def open(cls, root: RunArtifactRoot) -> Ledger:
         """Open an existing run, acquire the lock, and recover orphaned attempts."""
         run_id = root.path.name
-        lock_fd = ledger_io.acquire_lock(root.resolve_artifact("run.lock"))
-        try:
-            conn = ledger_io.connect(root.resolve_artifact("study.sqlite3"))
-        except BaseException:
-            ledger_io.release_lock(lock_fd)
-            raise
-        assert_schema_compatible(conn)
+        conn, lock_fd = _connect_locked(root)
         run = store.select_run(conn, run_id)
         ledger = cls(root, conn, lock_fd, run)
         ledger.recovery = ledger._recover_orphans()
@@ -240,6 +237,26 @@ class Ledger:
             breached=breached,
         )
 
+    def record_telemetry_series(self, attempt_id: AttemptId, rows: Sequence[TelemetryRow]) -> None:
+        """Append a supervised run's telemetry points atomically."""
+        ops.record_telemetry_series(self._conn, attempt_id, rows)
+
+    def record_phase_spans(self, attempt_id: AttemptId, rows: Sequence[PhaseSpanRow]) -> None:
+        """Append an attempt's per-phase timing spans atomically."""
+        ops.record_phase_spans(self._conn, attempt_id, rows)
+
+    def phase_spans(self, attempt_id: AttemptId) -> tuple[PhaseSpanRow, ...]:
+        """Return an attempt's recorded phase spans in start order."""
+        return evidence.select_phase_spans(self._conn, attempt_id)
+
+    def record_host_samples(self, attempt_id: AttemptId, rows: Sequence[HostSampleRow]) -> None:
+        """Append an attempt's soft host-channel readings atomically."""
+        ops.record_host_samples(self._conn, attempt_id, rows)
+
+    def host_samples(self, attempt_id: AttemptId) -> tuple[HostSampleRow, ...]:
+        """Return an attempt's host-channel readings in recording order."""
+        return evidence.select_host_samples(self._conn, attempt_id)
+
     def record_artifact(
         self,
         attempt_id: AttemptId,
@@ -281,3 +298,21 @@ class Ledger:
     def dump(self) -> ledger_dump.LedgerDump:
         """Return a normalized, JSON-serializable snapshot of the whole ledger."""
         return ledger_dump.dump(self._conn, self._run_id)
+
+
+def _connect_locked(root: RunArtifactRoot) -> tuple[sqlite3.Connection, int]:
+    """Lock the run, connect, and migrate, releasing both if any step fails."""
+    lock_fd = ledger_io.acquire_lock(root.resolve_artifact("run.lock"))
+    try:
+        conn = ledger_io.connect(root.resolve_artifact("study.sqlite3"))
+    except BaseException:
+        ledger_io.release_lock(lock_fd)
+        raise
+    try:
+        migrate_schema(conn)
+        assert_schema_compatible(conn)
+    except BaseException:
+        conn.close()
+        ledger_io.release_lock(lock_fd)
+        raise
+    return conn, lock_fd
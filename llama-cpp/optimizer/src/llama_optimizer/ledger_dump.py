@@ -28,8 +28,9 @@ if TYPE_CHECKING:
 
 
 class TelemetrySample(TypedDict):
-    """One telemetry sample in a dump."""
+    """One card's telemetry sample in a dump."""
 
+    device: str
     vram_used_bytes: int
     peak_vram_bytes: int
     breached: bool
@@ -209,13 +210,14 @@ def _telemetry(conn: sqlite3.Connection, attempt_id: str) -> list[TelemetrySampl
     rows = fetch_rows(
         conn,
         """
-        SELECT vram_used_bytes, peak_vram_bytes, breached, sampled_at
-        FROM telemetry WHERE attempt_id = ? ORDER BY sampled_at
+        SELECT device, vram_used_bytes, peak_vram_bytes, breached, sampled_at
+        FROM telemetry WHERE attempt_id = ? ORDER BY sampled_at, sample_id
         """,
         (attempt_id,),
     )
     return [
         {
+            "device": row_str(r, "device"),
             "vram_used_bytes": row_int(r, "vram_used_bytes"),
             "peak_vram_bytes": row_int(r, "peak_vram_bytes"),
             "breached": bool(row_int(r, "breached")),
@@ -1,6 +1,7 @@
 """Evidence row CRUD for the durable trial ledger (T4).
 
-Metrics, telemetry samples, raw artifact references, and sampler checkpoints.
+Metrics, telemetry samples, per-phase timing spans, host-channel samples, raw
+artifact references, and sampler checkpoints.
 Checkpoints are inserted as ``PENDING`` by the publication protocol and flipped
 to ``COMMITTED`` only after the atomic file publish + generation commit pair.
 Queries use ``?``-bound parameters only; row materialization lives in
@@ -12,10 +13,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from llama_optimizer.ledger_ids import utc_now_iso
-from llama_optimizer.ledger_io import fetch_row
-from llama_optimizer.ledger_materialize import row_to_checkpoint
+from llama_optimizer.ledger_io import fetch_row, fetch_rows
+from llama_optimizer.ledger_materialize import row_int, row_str, row_to_checkpoint
 from llama_optimizer.ledger_records import (
     CheckpointRecord,
+    HostSampleRow,
+    PhaseSpanRow,
     exec_write,
 )
 from llama_optimizer.lifecycle import CheckpointStatus
@@ -23,6 +26,7 @@ from llama_optimizer.lifecycle import CheckpointStatus
 if TYPE_CHECKING:
     import sqlite3
 
+    from llama_optimizer.ledger_records import TelemetryRow
     from llama_optimizer.lifecycle import AttemptId, Generation
 
 
@@ -54,6 +58,100 @@ def insert_telemetry(
     )
 
 
+def insert_telemetry_row(
+    conn: sqlite3.Connection, attempt_id: AttemptId, row: TelemetryRow
+) -> None:
+    """Append one card's telemetry point with its own sample timestamp and interval."""
+    exec_write(
+        conn,
+        """INSERT INTO telemetry(attempt_id, vram_used_bytes, peak_vram_bytes, breached,
+               sampled_at, interval_ns, device) VALUES (?,?,?,?,?,?,?)""",
+        (
+            attempt_id,
+            row.vram_used_bytes,
+            row.peak_vram_bytes,
+            1 if row.breached else 0,
+            row.sampled_at,
+            row.interval_ns,
+            row.device,
+        ),
+    )
+
+
+def insert_phase_span(conn: sqlite3.Connection, attempt_id: AttemptId, row: PhaseSpanRow) -> None:
+    """Append one timed phase span for an attempt."""
+    exec_write(
+        conn,
+        """INSERT INTO phase_spans(attempt_id, phase, thread, start_ns, end_ns)
+           VALUES (?,?,?,?,?)""",
+        (attempt_id, row.phase, row.thread, row.start_ns, row.end_ns),
+    )
+
+
+def select_phase_spans(conn: sqlite3.Connection, attempt_id: AttemptId) -> tuple[PhaseSpanRow, ...]:
+    """Return an attempt's phase spans in start order."""
+    rows = fetch_rows(
+        conn,
+        """SELECT phase, thread, start_ns, end_ns FROM phase_spans
+           WHERE attempt_id = ? ORDER BY start_ns, span_id""",
+        (attempt_id,),
+    )
+    return tuple(
+        PhaseSpanRow(
+            phase=row_str(r, "phase"),
+            thread=row_int(r, "thread"),
+            start_ns=row_int(r, "start_ns"),
+            end_ns=row_int(r, "end_ns"),
+        )
+        for r in rows
+    )
+
+
+def insert_host_sample(conn: sqlite3.Connection, attempt_id: AttemptId, row: HostSampleRow) -> None:
+    """Append one host-channel reading for an attempt."""
+    exec_write(
+        conn,
+        """INSERT INTO host_samples(attempt_id, sampled_at, source, cpu_time_ns,
+               rss_bytes, major_faults, read_bytes, write_bytes)
+           VALUES (?,?,?,?,?,?,?,?)""",
+        (
+            attempt_id,
+            row.sampled_at,
+            row.source,
+            row.cpu_time_ns,
+            row.rss_bytes,
+            row.major_faults,
+            row.read_bytes,
+            row.write_bytes,
+        ),
+    )
+
+
+def select_host_samples(
+    conn: sqlite3.Connection, attempt_id: AttemptId
+) -> tuple[HostSampleRow, ...]:
+    """Return an attempt's host-channel readings in recording order."""
+    rows = fetch_rows(
+        conn,
+        """SELECT sampled_at, source, cpu_time_ns, rss_bytes, major_faults,
+                  read_bytes, write_bytes
+           FROM host_samples WHERE attempt_id = ? ORDER BY sample_id""",
+        (attempt_id,),
+    )
+    return tuple(
+        HostSampleRow(
+            sampled_at=row_str(r, "sampled_at"),
+            source=row_str(r, "source"),
+            cpu_time_ns=row_int(r, "cpu_time_ns"),
+            rss_bytes=row_int(r, "rss_bytes"),
+            major_faults=row_int(r, "major_faults"),
+            read_bytes=row_int(r, "read_bytes"),
+            write_bytes=row_int(r, "write_bytes"),
+        )
+        for r in rows
+    )
+
+
 def upsert_artifact(
     conn: sqlite3.Connection,
     attempt_id: AttemptId,
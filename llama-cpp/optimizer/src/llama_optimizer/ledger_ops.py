@@ -39,7 +39,9 @@ from llama_optimizer.lifecycle import (
 
 if TYPE_CHECKING:
     import sqlite3
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
+
+    from llama_optimizer.ledger_records import HostSampleRow, PhaseSpanRow, TelemetryRow
 
 
 def create_trial(
@@ -251,6 +253,39 @@ def record_telemetry(
         )
 
 
+def record_telemetry_series(
+    conn: sqlite3.Connection,
+    attempt_id: AttemptId,
+    rows: Sequence[TelemetryRow],
+) -> None:
+    """Append a supervised run's telemetry points in one transaction."""
+    with ledger_io.transaction(conn):
+        for row in rows:
+            evidence.insert_telemetry_row(conn, attempt_id, row)
+
+
+def record_phase_spans(
+    conn: sqlite3.Connection,
+    attempt_id: AttemptId,
+    rows: Sequence[PhaseSpanRow],
+) -> None:
+    """Append an attempt's phase spans in one transaction."""
+    with ledger_io.transaction(conn):
+        for row in rows:
+            evidence.insert_phase_span(conn, attempt_id, row)
+
+
+def record_host_samples(
+    conn: sqlite3.Connection,
+    attempt_id: AttemptId,
+    rows: Sequence[HostSampleRow],
+) -> None:
+    """Append an attempt's host-channel readings in one transaction."""
+    with ledger_io.transaction(conn):
+        for row in rows:
+            evidence.insert_host_sample(conn, attempt_id, row)
+
+
 def record_artifact(
     conn: sqlite3.Connection,
     attempt_id: AttemptId,
@@ -24,6 +24,7 @@ from llama_optimizer.lifecycle import (
     TrialId,
     TrialPhase,
 )
+from llama_optimizer.telemetry import DEVICE_KEY
 
 if TYPE_CHECKING:
     import sqlite3
@@ -213,6 +214,46 @@ class CheckpointRecord:
     published_at: str
 
 
+@dataclass(frozen=True, slots=True)
+class TelemetryRow:
+    """One hard-channel telemetry point to append for an attempt.
+
+    ``interval_ns`` is the wait the sampler chose after this reading (``0``
+    when it was not recorded). The bytes, running peak, and breach flag all
+    belong to ``device``; a multi-GPU reading is one row per card.
+    """
+
+    vram_used_bytes: int
+    peak_vram_bytes: int
+    breached: bool
+    sampled_at: str
+    interval_ns: int = 0
+    device: str = DEVICE_KEY
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseSpanRow:
+    """One timed attempt phase (monotonic nanoseconds) on a recording thread."""
+
+    phase: str
+    thread: int
+    start_ns: int
+    end_ns: int
+
+
+@dataclass(frozen=True, slots=True)
+class HostSampleRow:
+    """One soft host-channel reading: cumulative counters for a trial's processes."""
+
+    sampled_at: str
+    source: str
+    cpu_time_ns: int
+    rss_bytes: int
+    major_faults: int
+    read_bytes: int
+    write_bytes: int
+
+
 # --- Result types -----------------------------------------------------------
 @dataclass(frozen=True, slots=True)
 class RecoveryReport:
@@ -3,24 +3,77 @@
 The schema is explicit (no ORM, no Alembic, no implicit migration): the DDL is
 a module constant, the schema version is a pinned integer stored in
 ``schema_meta``, and an unknown/incompatible version fails closed rather than
-auto-upgrading. Foreign keys are enabled on every connection. The schema owns
-runs, trials, attempts, metrics, telemetry samples, artifacts, and checkpoints.
+auto-upgrading; the only upgrades are the explicit, literal steps in
+``_MIGRATIONS``. Foreign keys are enabled on every connection. The schema owns
+runs, trials, attempts, metrics, telemetry samples, per-phase timing spans,
+host-channel samples, artifacts, and checkpoints.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final
+import sqlite3
+from typing import Final
 
 from llama_optimizer.ledger_io import fetch_row
 from llama_optimizer.ledger_materialize import row_index_int
 from llama_optimizer.ledger_records import SchemaMismatchError, exec_write
 
-if TYPE_CHECKING:
-    import sqlite3
+# Pinned ledger schema version. Bump only with an explicit migration: an older
+# on-disk version is upgraded on open by the literal ``_MIGRATIONS`` steps, and
+# any other value that differs from this is a hard error.
+SCHEMA_VERSION: Final[int] = 5
+
+# v2: monotonic-ns per-phase timing spans for supervised attempts.
+_PHASE_SPANS_DDL: Final[str] = """
+CREATE TABLE IF NOT EXISTS phase_spans (
+    span_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    attempt_id TEXT NOT NULL REFERENCES attempts(attempt_id),
+    phase      TEXT NOT NULL,
+    thread     INTEGER NOT NULL,
+    start_ns   INTEGER NOT NULL,
+    end_ns     INTEGER NOT NULL CHECK(end_ns >= start_ns)
+);
+"""
+
+# v3: soft host-channel (CPU/RSS/faults/IO) readings for a trial's process group.
+_HOST_SAMPLES_DDL: Final[str] = """
+CREATE TABLE IF NOT EXISTS host_samples (
+    sample_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    attempt_id   TEXT NOT NULL REFERENCES attempts(attempt_id),
+    sampled_at   TEXT NOT NULL,
+    source       TEXT NOT NULL CHECK(source IN ('cgroup', 'proc')),
+    cpu_time_ns  INTEGER NOT NULL CHECK(cpu_time_ns >= 0),
+    rss_bytes    INTEGER NOT NULL CHECK(rss_bytes >= 0),
+    major_faults INTEGER NOT NULL CHECK(major_faults >= 0),
+    read_bytes   INTEGER NOT NULL CHECK(read_bytes >= 0),
+    write_bytes  INTEGER NOT NULL CHECK(write_bytes >= 0)
+);
+"""
+
+# v4: the sampling interval chosen after each telemetry reading (0 when unknown).
+_TELEMETRY_INTERVAL_DDL: Final[str] = """
+ALTER TABLE telemetry ADD COLUMN interval_ns INTEGER NOT NULL DEFAULT 0 CHECK(interval_ns >= 0);
+"""
 
-# Pinned ledger schema version. Bump only with an explicit migration; an
-# on-disk value that differs from this is a hard error, never auto-upgraded.
-SCHEMA_VERSION: Final[int] = 1
+# v5: the card each telemetry row reads; multi-GPU points store one row per card.
+_TELEMETRY_DEVICE_DDL: Final[str] = """
+ALTER TABLE telemetry ADD COLUMN device TEXT NOT NULL DEFAULT 'card0';
+"""
+
+# Explicit upgrade steps keyed by the version they upgrade *from*.
+_MIGRATIONS: Final[dict[int, str]] = {
+    1: _PHASE_SPANS_DDL,
+    2: _HOST_SAMPLES_DDL,
+    3: _TELEMETRY_INTERVAL_DDL,
+    4: _TELEMETRY_DEVICE_DDL,
+}
+
+# Steps that only add one ``(table, column)``; a file that already has the column
+# (an ALTER that landed before its version bump) skips the ALTER and is stamped.
+_ADDED_COLUMNS: Final[dict[int, tuple[str, str]]] = {
+    3: ("telemetry", "interval_ns"),
+    4: ("telemetry", "device"),
+}
 
 
 # DDL is a fixed, literal string (no interpolation of any kind).
@@ -97,7 +150,9 @@ CREATE TABLE IF NOT EXISTS telemetry (
     vram_used_bytes INTEGER NOT NULL,
     peak_vram_bytes INTEGER NOT NULL,
     breached        INTEGER NOT NULL CHECK(breached IN (0, 1)),
-    sampled_at      TEXT NOT NULL
+    sampled_at      TEXT NOT NULL,
+    interval_ns     INTEGER NOT NULL DEFAULT 0 CHECK(interval_ns >= 0),
+    device          TEXT NOT NULL DEFAULT 'card0'
 );
 
 CREATE TABLE IF NOT EXISTS artifacts (
@@ -147,7 +202,7 @@ def initialize_schema(conn: sqlite3.Connection, *, applied_at: str) -> None:
     Assumes ``schema_meta`` does not yet exist; the caller asserts compatibility
     first so an existing incompatible schema is never silently overwritten.
     """
-    _ = conn.executescript(_DDL)
+    _ = conn.executescript(_DDL + _PHASE_SPANS_DDL + _HOST_SAMPLES_DDL)
     exec_write(
         conn,
         "INSERT INTO schema_meta(schema_version, applied_at) VALUES (?, ?)",
@@ -166,3 +221,34 @@ def assert_schema_compatible(conn: sqlite3.Connection) -> None:
     version = schema_version(conn)
     if version is not None and version != SCHEMA_VERSION:
         raise SchemaMismatchError(expected=SCHEMA_VERSION, actual=version)
+
+
+def migrate_schema(conn: sqlite3.Connection) -> None:
+    """Apply the explicit ``_MIGRATIONS`` steps to an older known on-disk version.
+
+    Fresh files and the current version are untouched; unknown versions are
+    left for :func:`assert_schema_compatible` to reject. Each step and its
+    version bump run in one transaction, so a crash leaves the file at either
+    the old or the new version, never a half-applied step.
+    """
+    version = schema_version(conn)
+    while version is not None and version in _MIGRATIONS:
+        script = _MIGRATIONS[version]
+        added = _ADDED_COLUMNS.get(version)
+        if added is not None and _has_column(conn, *added):
+            script = ""
+        try:
+            _ = conn.executescript("BEGIN IMMEDIATE;" + script)
+            version += 1
+            exec_write(conn, "UPDATE schema_meta SET schema_version = ?", (version,))
+            exec_write(conn, "COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                exec_write(conn, "ROLLBACK")
+            raise
+
+
+def _has_column(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """Return whether ``table`` already has ``column``."""
+    row = fetch_row(conn, "SELECT 1 FROM pragma_table_info(?) WHERE name = ?", (table, column))
+    return row is not None
@@ -64,6 +64,14 @@ class KvCacheType(StrEnum):
     Q4_0 = "q4_0"
 
 
+class SplitMode(StrEnum):
+    """How llama.cpp splits a model across GPUs (``-sm``); ``none`` pins one card."""
+
+    NONE = "none"
+    LAYER = "layer"
+    ROW = "row"
+
+
 class CandidateRole(StrEnum):
     """A candidate is searched; a reference is an optional high-precision source only."""
 
@@ -210,11 +218,16 @@ class LlamaCppBuild:
 
 @dataclass(frozen=True, slots=True)
 class HardwareSnapshot:
-    """Hardware/driver placeholders (T5 binds live driver snapshot)."""
+    """Hardware/driver placeholders (T5 binds live driver snapshot).
+
+    ``device_vram_limits`` lists ``(card, ceiling)`` pairs for multi-GPU
+    nodes; empty means the single ``card0`` at the profile ceiling.
+    """
 
     gpu: str
     rocm_driver_label: str
     vram_total_bytes: VramBytes
+    device_vram_limits: tuple[tuple[str, VramBytes], ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,196 @@
+"""Page-cache prewarming and residency checks for GGUF candidates (T6).
+
+Model load time dominates short screening trials and swings with whether the
+GGUF is still in the page cache from an earlier trial, which biases
+throughput comparisons across quants. A :class:`PageCacheWarmer` runs once per
+model file, before that candidate's first trial:
+
+1. residency before the stage is read with ``mincore(2)`` over a read-only
+   ``mmap`` of the file;
+2. with ``measure_cold`` the file is first evicted (``POSIX_FADV_DONTNEED``)
+   and a timed sequential read measures the cold, disk-bound load;
+3. otherwise it is prewarmed with ``POSIX_FADV_WILLNEED`` (then polled until
+   resident) or a sequential read touch;
+4. residency is verified again and a second timed read measures the warm,
+   page-cache-bound load.
+
+The result is exposed as ledger metrics (``model_cold_read_s``,
+``model_warm_read_s``, residency fractions). llama-bench reports no load time
+of its own, so the cold/warm figures are the file-read component of a load.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import mmap
+import os
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING, Final, final
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_READ_CHUNK: Final[int] = 8 << 20
+_POLL: Final[float] = 0.05
+_MAP_FAILED: Final[int | None] = ctypes.c_void_p(-1).value
+
+_LIBC: Final = ctypes.CDLL(None, use_errno=True)
+_MMAP: Final = _LIBC.mmap
+_MMAP.restype = ctypes.c_void_p
+_MMAP.argtypes = (
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_long,
+)
+_MUNMAP: Final = _LIBC.munmap
+_MUNMAP.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+_MINCORE: Final = _LIBC.mincore
+_MINCORE.restype = ctypes.c_int
+_MINCORE.argtypes = (ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_ubyte))
+
+
+class PrewarmMethod(StrEnum):
+    """How a model file is pulled into the page cache."""
+
+    FADVISE = "fadvise"
+    TOUCH = "touch"
+
+
+@dataclass(frozen=True, slots=True)
+class Residency:
+    """Page-cache residency of one file at one instant."""
+
+    resident_pages: int
+    total_pages: int
+
+    @property
+    def fraction(self) -> float:
+        """Resident share of the file's pages (an empty file counts as resident)."""
+        return self.resident_pages / self.total_pages if self.total_pages else 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class PrewarmConfig:
+    """Prewarm strategy; ``measure_cold`` evicts first to time a cold read."""
+
+    method: PrewarmMethod = PrewarmMethod.FADVISE
+    measure_cold: bool = False
+    timeout: timedelta = timedelta(seconds=120)
+
+
+@dataclass(frozen=True, slots=True)
+class PrewarmReport:
+    """Residency before/after the stage plus cold and warm read times."""
+
+    before: Residency
+    after: Residency
+    prewarm_s: float
+    warm_read_s: float
+    cold_read_s: float | None = None
+
+    def metrics(self) -> dict[str, float]:
+        """Flatten into ledger metric names."""
+        metrics = {
+            "model_resident_before": self.before.fraction,
+            "model_resident_after": self.after.fraction,
+            "model_prewarm_s": self.prewarm_s,
+            "model_warm_read_s": self.warm_read_s,
+        }
+        if self.cold_read_s is not None:
+            metrics["model_cold_read_s"] = self.cold_read_s
+        return metrics
+
+
+def residency(path: Path) -> Residency:
+    """Count the file's page-cache-resident pages with ``mincore(2)``."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        pages = -(-size // mmap.PAGESIZE)
+        if size == 0:
+            return Residency(resident_pages=0, total_pages=0)
+        addr: object = _MMAP(None, size, mmap.PROT_READ, mmap.MAP_SHARED, fd, 0)  # pyright: ignore[reportAny]
+        if not isinstance(addr, int) or addr == _MAP_FAILED:
+            raise OSError(ctypes.get_errno(), f"mmap failed for {path}")
+        try:
+            vec = (ctypes.c_ubyte * pages)()
+            rc: object = _MINCORE(addr, size, vec)  # pyright: ignore[reportAny]
+            if rc != 0:
+                raise OSError(ctypes.get_errno(), f"mincore failed for {path}")
+            resident = sum(byte & 1 for byte in bytes(vec))
+        finally:
+            _ = _MUNMAP(addr, size)  # pyright: ignore[reportAny]
+    finally:
+        os.close(fd)
+    return Residency(resident_pages=resident, total_pages=pages)
+
+
+def evict(path: Path) -> None:
+    """Ask the kernel to drop the file's clean cached pages (``POSIX_FADV_DONTNEED``)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def timed_read(path: Path) -> float:
+    """Read the whole file sequentially and return the elapsed seconds."""
+    buffer = bytearray(_READ_CHUNK)
+    started = time.monotonic()
+    with path.open("rb", buffering=0) as handle:
+        while handle.readinto(buffer):
+            pass
+    return time.monotonic() - started
+
+
+def prewarm(path: Path, config: PrewarmConfig) -> float:
+    """Pull ``path`` into the page cache; return the seconds it took."""
+    started = time.monotonic()
+    if config.method is PrewarmMethod.TOUCH:
+        _ = timed_read(path)
+        return time.monotonic() - started
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+    deadline = started + config.timeout.total_seconds()
+    while residency(path).fraction < 1.0 and time.monotonic() < deadline:
+        time.sleep(_POLL)
+    return time.monotonic() - started
+
+
+@final
+class PageCacheWarmer:
+    """Prewarms each model file once per run and reports how warm it was."""
+
+    def __init__(self, config: PrewarmConfig | None = None) -> None:
+        self._config: Final = config or PrewarmConfig()
+        self._seen: Final[set[Path]] = set()
+
+    def ensure(self, path: Path) -> PrewarmReport | None:
+        """Run the prewarm stage for ``path``'s first trial; ``None`` afterwards."""
+        key = path.resolve()
+        if key in self._seen:
+            return None
+        self._seen.add(key)
+        before = residency(path)
+        cold = None
+        if self._config.measure_cold:
+            evict(path)
+            cold = timed_read(path)
+        prewarm_s = prewarm(path, self._config)
+        return PrewarmReport(
+            before=before,
+            after=residency(path),
+            prewarm_s=prewarm_s,
+            warm_read_s=timed_read(path),
+            cold_read_s=cold,
+        )
@@ -0,0 +1,143 @@
+"""Per-phase wall-time spans for supervised attempts (T5).
+
+:class:`SupervisorResult` only carries ``started_at``/``ended_at``, which
+cannot say whether a slow trial spent its time in preflight, model load,
+measurement, or teardown. A :class:`SpanRecorder` is threaded through
+:class:`~llama_optimizer.supervisor.ProcessSupervisor`,
+:func:`~llama_optimizer.bench_runner.run_supervised_bench`, and
+:func:`~llama_optimizer.server_lifecycle.run_long_lived_server`; each phase is
+a ``with recorder.span(Phase.X):`` block stamped with monotonic nanoseconds and
+the recording thread (the server's supervisor runs on its own thread, so its
+spans overlap the runner's readiness/measurement spans by design).
+
+Spans are persisted to the ledger's ``phase_spans`` table and can be exported
+per attempt as Chrome trace-event JSON (``chrome://tracing`` / Perfetto).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.ledger_records import PhaseSpanRow
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+    from pathlib import Path
+
+    from llama_optimizer.ledger import Ledger
+    from llama_optimizer.lifecycle import AttemptId
+
+#: Ledger artifact kind for an exported per-attempt Chrome trace.
+PHASE_TRACE_ARTIFACT_KIND: Final[str] = "phase-trace"
+
+_NS_PER_US: Final[int] = 1_000
+
+
+class Phase(StrEnum):
+    """Closed vocabulary of timed attempt phases."""
+
+    PREWARM = "prewarm"
+    PREFLIGHT = "preflight"
+    LAUNCH = "launch"
+    SUPERVISED = "supervised"
+    LOAD = "load"
+    DELAY = "delay"
+    MEASUREMENT = "measurement"
+    COOLDOWN = "cooldown"
+    TERMINATION = "termination"
+    RECORDING = "recording"
+
+
+@final
+class SpanRecorder:
+    """Thread-safe append-only recorder of :class:`PhaseSpanRow` spans.
+
+    ``initial`` seeds spans shared with other attempts (one sweep process
+    timed once, recorded against every trial it screened).
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], int] = time.monotonic_ns,
+        initial: Sequence[PhaseSpanRow] = (),
+    ) -> None:
+        self._clock: Final = clock
+        self._lock: Final = threading.Lock()
+        self._spans: Final[list[PhaseSpanRow]] = list(initial)
+
+    @property
+    def spans(self) -> tuple[PhaseSpanRow, ...]:
+        """Completed spans in start order."""
+        with self._lock:
+            return tuple(sorted(self._spans, key=lambda s: s.start_ns))
+
+    @contextmanager
+    def span(self, phase: Phase) -> Generator[None]:
+        """Time the enclosed block as ``phase``; the span is kept even if it raises."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            row = PhaseSpanRow(
+                phase=phase.value,
+                thread=threading.get_ident(),
+                start_ns=start,
+                end_ns=self._clock(),
+            )
+            with self._lock:
+                self._spans.append(row)
+
+
+def chrome_trace_json(spans: Sequence[PhaseSpanRow], *, name: str) -> str:
+    """Render spans as Chrome trace-event JSON (complete ``X`` events, µs from first start).
+
+    Recording threads are renumbered ``1..n`` in order of first appearance so
+    the trace is stable across runs.
+    """
+    origin = min((s.start_ns for s in spans), default=0)
+    tids: dict[int, int] = {}
+    events: list[dict[str, object]] = [
+        {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": name}}
+    ]
+    for span in sorted(spans, key=lambda s: s.start_ns):
+        tid = tids.setdefault(span.thread, len(tids) + 1)
+        events.append(
+            {
+                "name": span.phase,
+                "cat": "attempt",
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": (span.start_ns - origin) / _NS_PER_US,
+                "dur": (span.end_ns - span.start_ns) / _NS_PER_US,
+            }
+        )
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, sort_keys=True) + "\n"
+
+
+def record_phase_spans(
+    ledger: Ledger,
+    attempt_id: AttemptId,
+    recorder: SpanRecorder,
+    *,
+    trace_path: Path | None = None,
+) -> None:
+    """Persist the recorder's spans; optionally export and link a Chrome trace."""
+    spans = recorder.spans
+    ledger.record_phase_spans(attempt_id, spans)
+    if trace_path is None:
+        return
+    _ = trace_path.write_text(chrome_trace_json(spans, name=str(attempt_id)))
+    ledger.record_artifact(
+        attempt_id=attempt_id,
+        kind=PHASE_TRACE_ARTIFACT_KIND,
+        relative_path=str(trace_path),
+        content_hash=hashlib.sha256(trace_path.read_bytes()).hexdigest(),
+    )
@@ -0,0 +1,180 @@
+"""Event-driven waits for supervised child exit and process-group teardown (T5).
+
+Polling ``proc.poll()`` between fixed sleeps adds up to one full interval of
+latency to every trial, and again to every SIGTERM grace and group-cleanup
+check. On Linux a pidfd becomes readable the moment its process exits, so
+these waits block in ``selectors`` and wake immediately on exit or on the
+deadline, whichever comes first. Where ``os.pidfd_open`` is unavailable
+(non-Linux, kernels before 5.3, or a seccomp profile that denies it) the
+helpers fall back to the short bounded polling they replace.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import selectors
+import signal
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self, final
+
+if TYPE_CHECKING:
+    import subprocess
+    from types import TracebackType
+
+_FALLBACK_POLL: Final[float] = 0.02
+_PROC_ROOT: Final[Path] = Path("/proc")
+# Index of ``pgrp`` among the /proc/<pid>/stat fields after the ``(comm)`` field.
+_PGRP_FIELD: Final[int] = 2
+
+
+def _pidfd_open(pid: int) -> int | None:
+    """Return a pidfd for ``pid``, or ``None`` if pidfds are unsupported/denied."""
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _wait_fds(fds: list[int], timeout: float) -> bool:
+    """Block until every pidfd is readable or ``timeout`` elapses; True if all exited."""
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as sel:
+        for fd in fds:
+            _ = sel.register(fd, selectors.EVENT_READ)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            for key, _events in sel.select(remaining):
+                _ = sel.unregister(key.fileobj)
+    return True
+
+
+@final
+class ChildWaiter:
+    """Wakes on a Popen child's exit via its pidfd, without reaping it.
+
+    The child stays a zombie until the caller reaps it through ``Popen``, so
+    ``returncode`` bookkeeping remains with :mod:`subprocess`.
+    """
+
+    def __init__(self, proc: subprocess.Popen[bytes]) -> None:
+        self._proc: Final = proc
+        self._fd: int | None = _pidfd_open(proc.pid)
+
+    @property
+    def event_driven(self) -> bool:
+        """Whether waits block on a pidfd rather than falling back to polling."""
+        return self._fd is not None
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for exit; return whether the child exited."""
+        if self._proc.poll() is not None:
+            return True
+        if self._fd is not None:
+            _ = _wait_fds([self._fd], max(timeout, 0.0))
+            return self._proc.poll() is not None
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(min(_FALLBACK_POLL, max(deadline - time.monotonic(), 0.0)))
+            if self._proc.poll() is not None:
+                return True
+        return self._proc.poll() is not None
+
+    def close(self) -> None:
+        """Release the pidfd. Idempotent."""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def __enter__(self) -> Self:
+        """Return the waiter for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the pidfd on context exit."""
+        self.close()
+
+
+def terminate_group(proc: subprocess.Popen[bytes], waiter: ChildWaiter, grace: float) -> bool:
+    """SIGTERM ``proc``'s group, SIGKILL it after ``grace`` seconds, and reap ``proc``.
+
+    Returns whether SIGKILL was needed (the child outlived the grace period).
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        _ = proc.wait()
+        return False
+    _ = waiter.wait(grace)
+    sigkill_needed = proc.poll() is None
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+    _ = proc.wait()
+    return sigkill_needed
+
+
+def _group_members(pgid: int) -> list[int]:
+    """List live pids whose process group is ``pgid`` (best-effort /proc scan)."""
+    members: list[int] = []
+    with contextlib.suppress(OSError):
+        for entry in _PROC_ROOT.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                stat = (entry / "stat").read_text()
+            except OSError:
+                continue
+            fields = stat.rsplit(")", 1)[-1].split()
+            if len(fields) > _PGRP_FIELD and fields[_PGRP_FIELD] == str(pgid):
+                members.append(int(entry.name))
+    return members
+
+
+def _group_present(pgid: int) -> bool | None:
+    """Report group presence: True/False, or ``None`` if we may not signal it."""
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return None
+    return True
+
+
+def wait_group_gone(pgid: int, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for every member of ``pgid`` to disappear.
+
+    Returns ``True`` once ``killpg(pgid, 0)`` reports no such group. A group we
+    are not permitted to signal is treated as not gone, matching the
+    fail-closed cleanup contract.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        present = _group_present(pgid)
+        if present is not True:
+            return present is False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        fds = [fd for fd in map(_pidfd_open, _group_members(pgid)) if fd is not None]
+        try:
+            if fds:
+                _ = _wait_fds(fds, remaining)
+            # Exited members can linger as zombies until their new parent reaps
+            # them; re-check after a short pause instead of spinning.
+            time.sleep(min(_FALLBACK_POLL, max(deadline - time.monotonic(), 0.0)))
+        finally:
+            for fd in fds:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
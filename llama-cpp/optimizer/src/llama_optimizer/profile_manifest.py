@@ -4,7 +4,8 @@
 ``Manifest`` is the serializable normalized form bound from a profile. The
 canonical JSON emitter is byte-deterministic (sorted keys). Required project
 invariants (context ``32768``, VRAM ceiling ``13_958_643_712``) live here so
-every module agrees on the exact pinned constants.
+every module agrees on the exact pinned constants. Multi-GPU profiles add a
+per-card ceiling map whose ``card0`` entry is that same pinned ceiling.
 """
 
 from __future__ import annotations
@@ -102,6 +103,28 @@ def build_manifest(profile: Profile) -> Manifest:
     )
 
 
+def device_vram_limits(profile: Profile | Manifest) -> dict[str, VramBytes]:
+    """Per-card VRAM ceilings, defaulting to ``card0`` at the profile ceiling."""
+    if profile.hardware.device_vram_limits:
+        return dict(profile.hardware.device_vram_limits)
+    return {"card0": profile.vram_limit_bytes}
+
+
+def _hardware_to_dict(hardware: HardwareSnapshot) -> dict[str, object]:
+    """Serialize hardware; per-card limits appear only on multi-GPU profiles.
+
+    Omitting the empty mapping keeps single-card manifest hashes unchanged.
+    """
+    data: dict[str, object] = {
+        "gpu": hardware.gpu,
+        "rocm_driver_label": hardware.rocm_driver_label,
+        "vram_total_bytes": int(hardware.vram_total_bytes),
+    }
+    if hardware.device_vram_limits:
+        data["vram_limits"] = {d: int(limit) for d, limit in hardware.device_vram_limits}
+    return data
+
+
 def manifest_to_dict(manifest: Manifest) -> dict[str, object]:
     """Serialize a manifest into JSON-compatible primitives in canonical keys."""
     return {
@@ -118,11 +141,7 @@ def manifest_to_dict(manifest: Manifest) -> dict[str, object]:
             "build_label": manifest.llama_cpp_build.build_label,
             "fork_ref": manifest.llama_cpp_build.fork_ref,
         },
-        "hardware": {
-            "gpu": manifest.hardware.gpu,
-            "rocm_driver_label": manifest.hardware.rocm_driver_label,
-            "vram_total_bytes": int(manifest.hardware.vram_total_bytes),
-        },
+        "hardware": _hardware_to_dict(manifest.hardware),
         "template": {
             "name": str(manifest.template.name),
             "sha256": str(manifest.template.sha256),
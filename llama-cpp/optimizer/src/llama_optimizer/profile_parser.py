@@ -150,6 +150,7 @@ def _build_profile(table: Mapping[str, object]) -> Profile:
             gpu=_required_str(hardware_section, "gpu"),
             rocm_driver_label=_required_str(hardware_section, "rocm_driver_label"),
             vram_total_bytes=VramBytes(_required_int(hardware_section, "vram_total_bytes")),
+            device_vram_limits=_parse_device_limits(hardware_section.get("vram_limits")),
         ),
         template=template,
         candidates=candidates,
@@ -182,6 +183,30 @@ def _required_str(section: Mapping[str, object], key: str) -> str:
     return raw
 
 
+def _parse_device_limits(raw: object) -> tuple[tuple[str, VramBytes], ...]:
+    """Parse optional ``[hardware.vram_limits]`` per-card ceilings.
+
+    ``card0`` stays pinned to the exact profile ceiling; additional cards carry
+    their own positive ceilings so feasibility is judged per card.
+    """
+    if raw is None:
+        return ()
+    if not _is_str_mapping(raw) or not all(_is_device_key(key) for key in raw):
+        raise ProfileParseError(reason="[hardware.vram_limits] must map cardN keys to bytes")
+    limits = {device: _required_int(raw, device) for device in raw}
+    if limits.get("card0") != int(REQUIRED_VRAM_LIMIT_BYTES) or min(limits.values()) <= 0:
+        raise ProfileVramError(
+            actual=limits.get("card0", 0),
+            reason=f"vram_limits.card0 must be {int(REQUIRED_VRAM_LIMIT_BYTES)}, others positive",
+        )
+    ordered = sorted(limits.items(), key=lambda item: int(item[0].removeprefix("card")))
+    return tuple((device, VramBytes(limit)) for device, limit in ordered)
+
+
+def _is_device_key(key: str) -> bool:
+    return key.startswith("card") and key.removeprefix("card").isdigit()
+
+
 def _parse_template(section: Mapping[str, object]) -> TemplateIdentity:
     return TemplateIdentity(
         name=TemplateName(_required_str(section, "name")),
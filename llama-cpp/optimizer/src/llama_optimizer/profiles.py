@@ -25,6 +25,7 @@ from llama_optimizer.profile_manifest import (
     Profile,
     build_manifest,
     canonical_manifest_json,
+    device_vram_limits,
     manifest_to_dict,
 )
 from llama_optimizer.profile_parser import parse_profile, parse_profile_bytes
@@ -44,6 +45,7 @@ __all__ = [
     "ProfileVramError",
     "build_manifest",
     "canonical_manifest_json",
+    "device_vram_limits",
     "manifest_to_dict",
     "parse_profile",
     "parse_profile_bytes",
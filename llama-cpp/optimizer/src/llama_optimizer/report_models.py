@@ -87,12 +87,17 @@ class MetricContribution:
 
 @dataclass(frozen=True, slots=True)
 class ReportCandidate:
-    """One Pareto-frontier candidate with reproducible balanced scoring."""
+    """One Pareto-frontier candidate with reproducible balanced scoring.
+
+    ``best_parallel`` is the ``--parallel`` slot count its metrics were
+    measured at when the finalist ran a slot sweep.
+    """
 
     config: CandidateConfig
     metrics: tuple[tuple[str, float], ...]
     contributions: tuple[MetricContribution, ...]
     score: float
+    best_parallel: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,7 +28,7 @@ def _config(config: CandidateConfig) -> dict[str, object]:
 
 
 def _candidate(candidate: ReportCandidate) -> dict[str, object]:
-    return {
+    rendered: dict[str, object] = {
         "config": _config(candidate.config),
         "contributions": [
             {
@@ -46,6 +46,9 @@ def _candidate(candidate: ReportCandidate) -> dict[str, object]:
         "metrics": dict(candidate.metrics),
         "score": candidate.score,
     }
+    if candidate.best_parallel is not None:
+        rendered["best_parallel"] = candidate.best_parallel
+    return rendered
 
 
 def _ledger(ledger: LedgerDump) -> LedgerDump:
@@ -61,7 +64,7 @@ def _ledger(ledger: LedgerDump) -> LedgerDump:
 
 
 def _metric_lines(candidate: ReportCandidate) -> list[str]:
-    return [
+    lines = [
         "- "
         + f"{item.name}: value={item.value:.12g}, direction={item.direction.value}, "
         + f"min={item.minimum:.12g}, max={item.maximum:.12g}, "
@@ -69,6 +72,9 @@ def _metric_lines(candidate: ReportCandidate) -> list[str]:
         + f"contribution={item.contribution:.12g}"
         for item in candidate.contributions
     ]
+    if candidate.best_parallel is not None:
+        lines.insert(0, f"- best_parallel: {candidate.best_parallel} slots")
+    return lines
 
 
 def markdown(
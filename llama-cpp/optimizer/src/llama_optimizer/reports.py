@@ -5,6 +5,17 @@ Public API re-exported for the report contract: the typed value objects live in
 :mod:`llama_optimizer.report_render`. This module owns weight validation, the
 feasible-only candidate filter, Pareto domination, and the transparent balanced
 score whose per-metric contributions reproduce the selected winner.
+
+Domination is point-value Pareto dominance with one confidence-interval
+rule on top: a candidate must be no worse on every metric's point value, and
+at least one strict improvement must also clear the intervals. When an
+attempt recorded ``<metric>_ci_low``/``<metric>_ci_high`` next to a metric,
+an improvement on it counts only if the intervals do not overlap, so a
+noise-level difference never removes a candidate from the frontier. Metrics
+without an interval compare by their point value.
+
+A finalist that ran a ``--parallel`` slot sweep was scored on its best slot
+count's launch; the candidate exposes that ``best_parallel`` count.
 """
 
 from __future__ import annotations
@@ -61,7 +72,8 @@ _KEYS: Final[dict[str, str]] = {
     "vram_headroom": "vram_headroom",
 }
 
-type _Scored = tuple[CandidateConfig, dict[str, float]]
+type _Bounds = dict[str, tuple[float, float]]
+type _Scored = tuple[CandidateConfig, dict[str, float], _Bounds, int | None]
 
 
 def _normalized_specs(specs: tuple[MetricSpec, ...]) -> tuple[MetricSpec, ...]:
@@ -105,21 +117,42 @@ def _candidate_values(
     return {item.name: attempt["metrics"][_KEYS[item.name]] for item in specs}
 
 
-def _dominates(
-    left: dict[str, float], right: dict[str, float], specs: tuple[MetricSpec, ...]
+def _bounds(attempt: AttemptDump, values: dict[str, float]) -> _Bounds:
+    bounds: _Bounds = {}
+    for name, value in values.items():
+        low = attempt["metrics"].get(f"{_KEYS[name]}_ci_low", value)
+        high = attempt["metrics"].get(f"{_KEYS[name]}_ci_high", value)
+        bounds[name] = (min(low, value), max(high, value))
+    return bounds
+
+
+def _better(
+    left: tuple[float, float], right: tuple[float, float], direction: MetricDirection
 ) -> bool:
-    weak: list[bool] = []
-    strict: list[bool] = []
-    for item in specs:
-        match item.direction:
-            case MetricDirection.BENEFIT:
-                weak.append(left[item.name] >= right[item.name])
-                strict.append(left[item.name] > right[item.name])
-            case MetricDirection.COST:
-                weak.append(left[item.name] <= right[item.name])
-                strict.append(left[item.name] < right[item.name])
-            case unreachable:
-                assert_never(unreachable)
+    match direction:
+        case MetricDirection.BENEFIT:
+            return left[0] > right[1]
+        case MetricDirection.COST:
+            return left[1] < right[0]
+        case unreachable:
+            assert_never(unreachable)
+
+
+def _point(value: float) -> tuple[float, float]:
+    return value, value
+
+
+def _dominates(left: _Scored, right: _Scored, specs: tuple[MetricSpec, ...]) -> bool:
+    """Point-value Pareto dominance whose strict gain must also clear both intervals.
+
+    The intervals only ever withhold a domination, so the relation stays a
+    sub-relation of plain Pareto dominance: acyclic, with a non-empty frontier.
+    """
+    weak = [
+        not _better(_point(right[1][item.name]), _point(left[1][item.name]), item.direction)
+        for item in specs
+    ]
+    strict = [_better(left[2][item.name], right[2][item.name], item.direction) for item in specs]
     return all(weak) and any(strict)
 
 
@@ -162,6 +195,7 @@ def _score(
         metrics=tuple((item.name, candidate[1][item.name]) for item in specs),
         contributions=tuple(contributions),
         score=round(sum(item.contribution for item in contributions), 12),
+        best_parallel=candidate[3],
     )
 
 
@@ -182,7 +216,9 @@ def _feasible(
         if values is None:
             incomplete.append(config.config_id)
         else:
-            complete.append((config, values))
+            best = attempt["metrics"].get("best_parallel")
+            slots = None if best is None else round(best)
+            complete.append((config, values, _bounds(attempt, values), slots))
     return complete, incomplete
 
 
@@ -194,8 +230,7 @@ def generate_report(request: ReportRequest) -> ReportResult:
         candidate
         for candidate in complete
         if not any(
-            other[0].config_id != candidate[0].config_id
-            and _dominates(other[1], candidate[1], specs)
+            other[0].config_id != candidate[0].config_id and _dominates(other, candidate, specs)
             for other in complete
         )
     )
@@ -4,7 +4,10 @@ Every dimension owns a finite, bounded domain with a stable cardinality. The
 native Cartesian screening product must stay under ``max_native_combinations``
 or it is rejected before any process launches. ``ubatch <= batch`` and the
 remaining applicability rules are enforced so a generated config can never
-violate the profile contract.
+violate the profile contract. On multi-GPU nodes ``split_mode`` (one of
+``none``/``layer``/``row``) and ``tensor_split`` (``/``-separated per-card
+proportions) are ordinary searchable dimensions; their VRAM feasibility is
+judged per card by the supervisor.
 """
 
 from __future__ import annotations
@@ -16,6 +19,7 @@ from typing import TYPE_CHECKING, TypeIs
 from llama_optimizer.models import (
     DimensionId,
     MaxNativeCombinations,
+    SplitMode,
 )
 
 if TYPE_CHECKING:
@@ -211,7 +215,11 @@ def validate_applicability(space: SearchSpace, config: Mapping[str, object]) ->
         raise UbatchExceedsBatchError(
             reason="ubatch must not exceed batch", batch=batch, ubatch=ubatch
         )
-    return []
+    notes: list[str] = []
+    tensor_split = config.get("tensor_split")
+    if config.get("split_mode") == SplitMode.NONE and tensor_split:
+        notes.append("tensor_split is ignored when split_mode is none")
+    return notes
 
 
 # --- Boundary parser ------------------------------------------------------
@@ -234,11 +242,43 @@ def parse_search_space(table: Mapping[str, object]) -> SearchSpace:
         if parsed is not None:
             dimensions.append(parsed)
 
+    for dimension in dimensions:
+        _check_split_values(dimension)
     space = SearchSpace(dimensions=tuple(dimensions), max_native_combinations=cap)
     space.enforce_combination_cap()
     return space
 
 
+def _check_split_values(dimension: Dimension) -> None:
+    """Reject unknown split modes and malformed tensor-split proportions."""
+    if dimension.dimension_id == "split_mode":
+        allowed = {mode.value for mode in SplitMode}
+        for value in dimension_values(dimension):
+            if value not in allowed:
+                raise InvalidRangeError(
+                    dimension_id=dimension.dimension_id,
+                    reason=f"split_mode {value!r} must be one of {sorted(allowed)}",
+                )
+    if dimension.dimension_id == "tensor_split":
+        for value in dimension_values(dimension):
+            if not isinstance(value, str) or not _is_tensor_split(value):
+                raise InvalidRangeError(
+                    dimension_id=dimension.dimension_id,
+                    reason=f"tensor_split {value!r} must be '/'-separated proportions",
+                )
+
+
+def _is_tensor_split(value: str) -> bool:
+    """Return whether ``value`` is empty or ``/``-separated non-negative numbers."""
+    if not value:
+        return True
+    try:
+        parts = [float(part) for part in value.split("/")]
+    except ValueError:
+        return False
+    return all(part >= 0 for part in parts) and any(part > 0 for part in parts)
+
+
 def _parse_dimension(dimension_id: DimensionId, raw: object) -> Dimension | None:
     """Classify one raw entry as a bounded range or a discrete dimension."""
     if _is_str_mapping(raw):
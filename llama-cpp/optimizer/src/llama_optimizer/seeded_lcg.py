@@ -0,0 +1,55 @@
+"""Seeded 64-bit linear congruential generator shared by reproducible draws (T9).
+
+Finalist order (:mod:`server_schedule`), corpus prompt order, open-loop
+arrival gaps, bootstrap resamples, and the simulator's noise all draw from
+this one generator instead of :mod:`random`, so no cryptographic-suitability
+concern (Ruff S311) applies and a seed reproduces every draw bit for bit on
+any platform. Each step keeps the top 31 bits of the 64-bit state as the draw.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+#: Exclusive upper bound of :func:`lcg_draw`.
+LCG_RANGE: Final[int] = 1 << 31
+_MULTIPLIER: Final[int] = 6364136223846793005
+_INCREMENT: Final[int] = 1442695040888963407
+_MASK: Final[int] = 0xFFFFFFFFFFFFFFFF
+_SHIFT: Final[int] = 33
+
+
+def lcg_next(state: int) -> int:
+    """Advance a 64-bit LCG state by one step."""
+    return (state * _MULTIPLIER + _INCREMENT) & _MASK
+
+
+def lcg_draw(state: int) -> int:
+    """Return the draw in ``[0, LCG_RANGE)`` carried by ``state``."""
+    return (state & _MASK) >> _SHIFT
+
+
+def lcg_unit(state: int) -> float:
+    """Map ``state`` onto ``[0, 1)``."""
+    return lcg_draw(state) / LCG_RANGE
+
+
+def lcg_draws(seed: int) -> Iterator[int]:
+    """Yield the endless stream of draws seeded by ``seed``."""
+    state = seed & _MASK
+    while True:
+        state = lcg_next(state)
+        yield lcg_draw(state)
+
+
+def seeded_shuffle[T](items: Sequence[T], seed: int) -> list[T]:
+    """Return a Fisher-Yates shuffle of ``items`` driven by the LCG seeded by ``seed``."""
+    shuffled = list(items)
+    draws = lcg_draws(seed)
+    for i in range(len(shuffled) - 1, 0, -1):
+        j = next(draws) % (i + 1)
+        shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+    return shuffled
@@ -3,15 +3,17 @@
 Re-exports the split responsibility modules so callers can import from
 ``llama_optimizer.server``. Finalists are started through the T5 supervisor
 with ``--ctx-size 32768`` and a matching model/backend/runtime identity.
-Readiness, versioned coding/tool-use/concurrency/latency workloads, raw
-metrics/responses, and synchronized telemetry are captured per finalist.
+Readiness, versioned coding/tool-use/concurrency/latency workloads (spec
+names, corpus samples, or replayed traces), raw metrics/responses, and
+synchronized telemetry are captured per finalist.
 """
 
 from __future__ import annotations
 
 from llama_optimizer.server_classify import classify_server_exit
 from llama_optimizer.server_command import build_server_command
-from llama_optimizer.server_http import WorkloadRecord
+from llama_optimizer.server_http import KeepAlivePool, WorkloadRecord
+from llama_optimizer.server_load import LoadStep, LoadSweepResult
 from llama_optimizer.server_parser import (
     ParsedResponse,
     ReadinessResult,
@@ -19,6 +21,7 @@ from llama_optimizer.server_parser import (
     parse_responses,
     parse_server_metrics,
 )
+from llama_optimizer.server_payloads import Payload, TraceEntry, build_payloads
 from llama_optimizer.server_runner import ValidationPlan, run_supervised_server, validate_finalists
 from llama_optimizer.server_schedule import (
     ScheduledRequest,
@@ -26,6 +29,7 @@ from llama_optimizer.server_schedule import (
     schedule_finalists,
     total_request_count,
 )
+from llama_optimizer.server_stream import StreamTiming
 from llama_optimizer.server_types import (
     CODING_SPEC,
     CONCURRENCY_SPEC,
@@ -37,7 +41,9 @@ from llama_optimizer.server_types import (
     FinalistRequest,
     FinalistResult,
     LifecycleRecord,
+    LoadSweepConfig,
     MetricsParseError,
+    PayloadSourceError,
     ReadinessTimeoutError,
     RequestKind,
     RequestSpec,
@@ -59,9 +65,15 @@ __all__ = [
     "FinalistEntry",
     "FinalistRequest",
     "FinalistResult",
+    "KeepAlivePool",
     "LifecycleRecord",
+    "LoadStep",
+    "LoadSweepConfig",
+    "LoadSweepResult",
     "MetricsParseError",
     "ParsedResponse",
+    "Payload",
+    "PayloadSourceError",
     "ReadinessResult",
     "ReadinessTimeoutError",
     "RequestKind",
@@ -73,8 +85,11 @@ __all__ = [
     "ServerIdentity",
     "ServerIdentityMismatchError",
     "ServerMetrics",
+    "StreamTiming",
+    "TraceEntry",
     "ValidationPlan",
     "WorkloadRecord",
+    "build_payloads",
     "build_server_command",
     "classify_server_exit",
     "interleave_requests",
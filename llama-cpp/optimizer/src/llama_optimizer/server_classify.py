@@ -10,14 +10,30 @@ distinct non-scored outcome.
 When the lifecycle dispatched HTTP workloads, classification is artifact-based
 (readiness, metrics, responses, quality). When it did not, the exit code or
 readiness state determines the failure.
+
+A streamed finalist (``ServerConfig.stream``) must have timed at least one
+token on every request; its measured (non-warmup) client timings replace the
+server-reported TTFT and latency in the ledger metrics, so ranking uses what
+a client observes. The server's own figures are kept under ``server_*``.
+Every scored finalist also records ``aggregate_generation_ts``: tokens
+generated across the measured requests over their wall span, the figure a
+``--parallel`` slot sweep compares.
+
+The server reports one aggregate prompt and generation throughput, so their
+intervals come from the per-request rates: the bootstrap interval of the
+median per-request rate (``1000 / ttft_ms`` for prompt processing, generated
+tokens over request time for generation), scaled onto the aggregate. The
+report then treats a throughput gap inside that spread as noise.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, TypeIs
 
+from llama_optimizer.bench_stats import bootstrap_ci, scaled_median_ci
 from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.server_json import loads_mapping
 from llama_optimizer.server_parser import (
     parse_readiness,
     parse_responses,
@@ -32,14 +48,17 @@ from llama_optimizer.server_types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
     from pathlib import Path
 
     from llama_optimizer.server_http import WorkloadRecord
     from llama_optimizer.server_schedule import ScheduledRequest
+    from llama_optimizer.server_stream import StreamTiming
     from llama_optimizer.server_types import FinalistRequest, LifecycleRecord
     from llama_optimizer.supervisor import ChildExit, SupervisorResult
 
 _STDERR_FILENAME = "server.stderr.txt"
+_MS_PER_SECOND = 1000.0
 
 
 def classify_server_exit(exit_code: ChildExit, stderr: str) -> NonScoredOutcome:
@@ -67,17 +86,101 @@ def percentile(values: tuple[float, ...], pct: int) -> float:
     return ranked[idx]
 
 
-def extract_metrics_map(metrics: ServerMetrics) -> dict[str, float]:
-    """Flatten parsed server metrics into named metrics for the ledger."""
+def _p95(values: Sequence[float]) -> float:
+    return percentile(tuple(values), 95)
+
+
+def _p95_interval(name: str, values: tuple[float, ...]) -> dict[str, float]:
+    """Bootstrap a CI for a p95 so report domination can ignore noise-level gaps."""
+    if not values:
+        return {}
+    low, high = bootstrap_ci(values, _p95)
+    return {f"{name}_ci_low": low, f"{name}_ci_high": high}
+
+
+def _latency(name: str, values: tuple[float, ...]) -> dict[str, float]:
+    """Return the p50, p95, and p95 interval of one latency distribution."""
     return {
-        "prompt_throughput": metrics.prompt_throughput,
-        "generation_throughput": metrics.generation_throughput,
-        "ttft_ms_p50": percentile(metrics.ttft_ms, 50),
-        "ttft_ms_p95": percentile(metrics.ttft_ms, 95),
-        "request_latency_ms_p50": percentile(metrics.request_latency_ms, 50),
-        "request_latency_ms_p95": percentile(metrics.request_latency_ms, 95),
+        **_p95_interval(f"{name}_p95", values),
+        f"{name}_p50": percentile(values, 50),
+        f"{name}_p95": percentile(values, 95),
+    }
+
+
+def _throughput(name: str, value: float, rates: tuple[float, ...]) -> dict[str, float]:
+    """Return an aggregate rate bounded by its per-request rates' scaled median interval."""
+    low, high = scaled_median_ci(value, rates)
+    return {name: value, f"{name}_ci_low": low, f"{name}_ci_high": high}
+
+
+def extract_metrics_map(
+    metrics: ServerMetrics,
+    streamed: tuple[StreamTiming, ...] = (),
+    generation_ts: tuple[float, ...] = (),
+) -> dict[str, float]:
+    """Flatten parsed server metrics (with bootstrap intervals) into ledger metrics.
+
+    With client ``streamed`` timings, TTFT and request latency come from them
+    (the server's figures move to ``server_*``) and ITL and decode-rate
+    percentiles are added (left out when no request streamed a second token,
+    rather than reading as zero). ``generation_ts`` holds each measured request's
+    generation rate, which bounds the aggregate generation throughput.
+    """
+    server = {
+        **_latency("ttft_ms", metrics.ttft_ms),
+        **_latency("request_latency_ms", metrics.request_latency_ms),
+    }
+    prefill = tuple(_MS_PER_SECOND / ttft for ttft in metrics.ttft_ms if ttft > 0)
+    flat = {
+        **_throughput("prompt_throughput", metrics.prompt_throughput, prefill),
+        **_throughput("generation_throughput", metrics.generation_throughput, generation_ts),
         "slots": float(metrics.slots),
     }
+    if not streamed:
+        return {**server, **flat}
+    gaps = tuple(gap for t in streamed for gap in t.itl_ms)
+    decode = tuple(d for t in streamed if (d := t.decode_ts) is not None)
+    return {
+        **{f"server_{key}": value for key, value in server.items()},
+        **flat,
+        **_latency("ttft_ms", tuple(t.ttft_ms for t in streamed)),
+        **_latency("request_latency_ms", tuple(t.total_ms for t in streamed)),
+        **(_latency("itl_ms", gaps) if gaps else {}),
+        **({"decode_ts_p50": percentile(decode, 50)} if decode else {}),
+    }
+
+
+def _is_str_mapping(value: object) -> TypeIs[Mapping[str, object]]:
+    return isinstance(value, dict)
+
+
+def _completion_tokens(rec: WorkloadRecord) -> int:
+    """Return a request's generated tokens: timed if streamed, else ``usage``."""
+    if rec.timing is not None:
+        return rec.timing.tokens
+    try:
+        usage = loads_mapping(rec.response_body, error=MetricsParseError).get("usage")
+    except MetricsParseError:
+        return 0
+    count = usage.get("completion_tokens") if _is_str_mapping(usage) else None
+    return count if isinstance(count, int) else 0
+
+
+def aggregate_generation_ts(records: Sequence[WorkloadRecord]) -> float:
+    """Return tokens per second generated by the measured requests over their wall span."""
+    measured = [r for r in records if not r.is_warmup]
+    if not measured:
+        return 0.0
+    start = min(r.offset_ms for r in measured)
+    end = max(r.offset_ms + r.queued_ms + r.connect_ms + r.elapsed_ms for r in measured)
+    tokens = sum(_completion_tokens(r) for r in measured)
+    return tokens / (end - start) * _MS_PER_SECOND if end > start else 0.0
+
+
+def request_generation_ts(records: Sequence[WorkloadRecord]) -> tuple[float, ...]:
+    """Return each measured request's generated tokens per second of request time."""
+    rates = ((_completion_tokens(r), r.elapsed_ms) for r in records if not r.is_warmup)
+    return tuple(tokens / ms * _MS_PER_SECOND for tokens, ms in rates if tokens and ms > 0)
 
 
 @dataclass(frozen=True, slots=True)
@@ -90,6 +193,9 @@ class ClassifiedOutcome:
     raw_readiness: str
     raw_metrics: str
     raw_responses: str
+    streamed: tuple[StreamTiming, ...] = ()
+    aggregate_generation_ts: float = 0.0
+    generation_ts: tuple[float, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -188,7 +294,13 @@ def _classify_dispatched(
     responses = parse_responses(raw.responses)
     if not metrics.quality_pass or any(not r.quality_pass for r in responses):
         return _outcome(raw, NonScoredOutcome.QUALITY_FAILURE, None, "response quality regression")
-    return _outcome(raw, None, metrics, "all gates passed")
+    streamed = tuple(r.timing for r in dispatch_records if r.timing and not r.is_warmup)
+    return replace(
+        _outcome(raw, None, metrics, "all gates passed"),
+        streamed=streamed,
+        aggregate_generation_ts=aggregate_generation_ts(dispatch_records),
+        generation_ts=request_generation_ts(dispatch_records),
+    )
 
 
 def _measurement_failure(
@@ -206,6 +318,8 @@ def _measurement_failure(
         return _outcome(raw, NonScoredOutcome.MEASUREMENT_FAILURE, None, reason)
     for index, rec in enumerate(dispatch_records):
         reason = _validate_record(rec, expected_seq[index], index)
+        if reason is None and request.config.stream and rec.timing is None:
+            reason = f"no streamed tokens on request {index}"
         if reason is not None:
             return _outcome(raw, NonScoredOutcome.MEASUREMENT_FAILURE, None, reason)
     try:
@@ -229,7 +343,9 @@ def classify_attempt(
     """Classify the full outcome from supervisor result, lifecycle, and artifacts."""
     raw = _read_raw(request.output_dir)
     if isinstance(sup_result.outcome, NonScoredOutcome):
-        return _outcome(raw, sup_result.outcome, None, sup_result.outcome.value)
+        predicted = sup_result.predicted_breach
+        reason = predicted.describe() if predicted is not None else sup_result.outcome.value
+        return _outcome(raw, sup_result.outcome, None, reason)
     if sup_result.escalated_to_sigkill:
         return _outcome(raw, NonScoredOutcome.HANG, None, "SIGTERM ignored; SIGKILL required")
     if lifecycle.dispatched:
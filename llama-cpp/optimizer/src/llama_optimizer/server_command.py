@@ -2,9 +2,10 @@
 
 Forces ``--ctx-size 32768`` (the exact, immutable project context), warmup
 enabled (``--warmup`` is always passed), backend/model/runtime flags from the
-identity, profile parallelism, and enabled metrics/slots. All values are
-separate argv elements; no shell interpolation is used. A non-32768 context is
-rejected before the command is constructed.
+identity (including the multi-GPU split mode and tensor split), profile
+parallelism, and enabled metrics/slots. All values are separate argv elements;
+no shell interpolation is used. A non-32768 context is rejected before the
+command is constructed.
 """
 
 from __future__ import annotations
@@ -36,6 +37,8 @@ def build_server_command(
 
     fa_val = "on" if identity.flash_attn == 1 else "off"
     mmp_val = "1" if identity.use_mmap else "0"
+    # llama-server takes comma-separated proportions; identities use llama-bench's "/".
+    split = ["-ts", identity.tensor_split.replace("/", ",")] if identity.tensor_split else []
     return [
         binary,
         "-m",
@@ -56,6 +59,9 @@ def build_server_command(
         fa_val,
         "-mmp",
         mmp_val,
+        "-sm",
+        identity.split_mode,
+        *split,
         "--ctx-size",
         str(config.context_size),
         "--parallel",
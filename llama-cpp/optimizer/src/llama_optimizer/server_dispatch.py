@@ -20,6 +20,7 @@ _ARTIFACT_NAMES: Final[tuple[str, ...]] = (
     "readiness.json",
     "metrics.json",
     "responses.jsonl",
+    "load_sweep.json",
     "port.txt",
     "dispatch_log.jsonl",
 )
@@ -77,6 +78,12 @@ def write_dispatch_log(output_dir: Path, records: tuple[WorkloadRecord, ...]) ->
                 "status": r.status,
                 "response_body": r.response_body,
                 "elapsed_ms": r.elapsed_ms,
+                "offset_ms": r.offset_ms,
+                "queued_ms": r.queued_ms,
+                "connect_ms": r.connect_ms,
+                "ttft_ms": r.timing.ttft_ms if r.timing else None,
+                "itl_ms": list(r.timing.itl_ms) if r.timing else None,
+                "decode_ts": r.timing.decode_ts if r.timing else None,
                 "error": r.error,
             }
         )
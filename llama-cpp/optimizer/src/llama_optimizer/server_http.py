@@ -4,32 +4,59 @@ Sends POST /v1/chat/completions requests to a running llama-server instance
 using stdlib :mod:`http.client`. Each dispatch records the HTTP status, raw
 response body, elapsed time, and any transport error so the runner observes
 whether the live server is functional and retains full request provenance.
+
+Requests go through a :class:`KeepAlivePool`: every dispatch worker keeps one
+persistent HTTP/1.1 connection for the whole interleaved sequence, so TCP
+setup and teardown stay out of the timings and sockets do not churn through
+``TIME_WAIT`` at higher ``parallel``. Connection setup is recorded separately
+as ``connect_ms``; ``elapsed_ms`` covers only the request itself.
+
+With ``stream`` set the pool requests SSE output and times every token as it
+arrives (see :mod:`llama_optimizer.server_stream`); the resulting
+:class:`~llama_optimizer.server_stream.StreamTiming` rides on each record.
+Request bodies are serialised ahead of the timed loop by
+:mod:`llama_optimizer.server_payloads`; the pool only sends bytes.
 """
 
 from __future__ import annotations
 
 import http.client
-import json
+import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final, final
 
+from llama_optimizer.server_payloads import build_payloads
 from llama_optimizer.server_schedule import ScheduledRequest, interleave_requests
+from llama_optimizer.server_stream import StreamTiming, read_sse_stream
 
 if TYPE_CHECKING:
     from threading import Thread
 
+    from llama_optimizer.server_payloads import Payload
     from llama_optimizer.server_types import FinalistRequest
 
 _CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
 _DEFAULT_HOST = "127.0.0.1"
 _DEFAULT_TIMEOUT_SECONDS = 5.0
+_HTTP_OK = 200
+# A reused keep-alive socket the server already closed fails with one of these
+# before the request reaches it, so one retry on a fresh connection is safe.
+_STALE_ERRORS: Final = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
 
 
 @dataclass(frozen=True, slots=True)
 class WorkloadRecord:
-    """One HTTP workload dispatch result with full request provenance."""
+    """One HTTP workload dispatch result with full request provenance.
+
+    ``elapsed_ms`` times the request on an open connection; ``connect_ms`` is
+    the TCP connect that preceded it (``0.0`` on a reused connection).
+    ``timing`` holds the client-observed token timing of a streamed request.
+    ``offset_ms`` is when the dispatcher released the request, from the
+    sequence start, and ``queued_ms`` how long it then waited for a free
+    worker before being sent.
+    """
 
     sequence_index: int
     spec_name: str
@@ -40,6 +67,10 @@ class WorkloadRecord:
     response_body: str
     elapsed_ms: float
     error: str
+    connect_ms: float = 0.0
+    timing: StreamTiming | None = None
+    offset_ms: float = 0.0
+    queued_ms: float = 0.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,56 +81,137 @@ class _RawHttp:
     body: str
     elapsed_ms: float
     error: str
+    connect_ms: float = 0.0
+    timing: StreamTiming | None = None
 
 
-def _build_body(spec_name: str) -> bytes:
-    """Build a minimal chat-completion request body for one workload spec."""
-    body: dict[str, object] = {
-        "messages": [{"role": "user", "content": spec_name}],
-        "max_tokens": 100,
-    }
-    return json.dumps(body).encode()
+def _ms_since(start: float) -> float:
+    return (time.monotonic() - start) * 1000.0
 
 
-def _send_raw(
-    port: int,
-    spec_name: str,
-    *,
-    host: str = _DEFAULT_HOST,
-    timeout: float = _DEFAULT_TIMEOUT_SECONDS,
-) -> _RawHttp:
-    """Send one POST /v1/chat/completions and return raw HTTP data. Never raises."""
-    conn = http.client.HTTPConnection(host, port, timeout=timeout)
-    start = time.monotonic()
-    try:
+@final
+class KeepAlivePool:
+    """Per-worker persistent HTTP/1.1 connections to one live server.
+
+    Each worker thread owns one connection, opened on first use and reused
+    for every later request. A connection the server asks to close is
+    dropped, and a reused connection that turns out to be stale is re-opened
+    once; any other transport failure is returned as an error, never raised.
+    With ``stream`` every response is read as SSE and timed per token; the
+    bodies sent must then ask for a stream.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        *,
+        host: str = _DEFAULT_HOST,
+        timeout: float = _DEFAULT_TIMEOUT_SECONDS,
+        stream: bool = False,
+    ) -> None:
+        self._port: int = port
+        self._host: str = host
+        self._timeout: float = timeout
+        self._stream: bool = stream
+        self._lock: threading.Lock = threading.Lock()
+        self._connections: dict[int, http.client.HTTPConnection] = {}
+
+    def send(self, body: bytes) -> _RawHttp:
+        """Send one pre-serialised POST /v1/chat/completions on the worker's connection."""
+        key = threading.get_ident()
+        with self._lock:
+            conn = self._connections.pop(key, None)
+        start = time.monotonic()
+        if conn is not None:
+            try:
+                return self._exchange(key, conn, body, 0.0)
+            except _STALE_ERRORS:
+                conn.close()
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                return _RawHttp(status=0, body="", elapsed_ms=_ms_since(start), error=str(exc))
+        conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+        start = time.monotonic()
+        connect_ms = 0.0
+        try:
+            conn.connect()
+            connect_ms = _ms_since(start)
+            return self._exchange(key, conn, body, connect_ms)
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            return _RawHttp(
+                status=0,
+                body="",
+                elapsed_ms=_ms_since(start) - connect_ms,
+                error=str(exc),
+                connect_ms=connect_ms,
+            )
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+    def _exchange(
+        self, key: int, conn: http.client.HTTPConnection, body: bytes, connect_ms: float
+    ) -> _RawHttp:
+        """POST on an open ``conn`` and return it to the pool unless the server closes it."""
+        start = time.monotonic()
+        started_ns = time.monotonic_ns()
         conn.request(
             "POST",
             _CHAT_COMPLETIONS_PATH,
-            _build_body(spec_name),
+            body,
             {"Content-Type": "application/json"},
         )
         resp = conn.getresponse()
-        body = resp.read().decode(errors="replace")
-        elapsed = (time.monotonic() - start) * 1000.0
-        return _RawHttp(status=resp.status, body=body, elapsed_ms=elapsed, error="")
-    except (http.client.HTTPException, OSError) as exc:
-        elapsed = (time.monotonic() - start) * 1000.0
-        return _RawHttp(status=0, body="", elapsed_ms=elapsed, error=str(exc))
-    finally:
-        conn.close()
+        timing: StreamTiming | None = None
+        if self._stream and resp.status == _HTTP_OK:
+            text, timing = read_sse_stream(resp, started_ns)
+        else:
+            text = resp.read().decode(errors="replace")
+        elapsed = _ms_since(start)
+        if resp.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                self._connections[key] = conn
+        return _RawHttp(
+            status=resp.status,
+            body=text,
+            elapsed_ms=elapsed,
+            error="",
+            connect_ms=connect_ms,
+            timing=timing,
+        )
 
 
 def dispatch_sequence(
     request: FinalistRequest,
     port: int,
     thread: Thread,
+    payloads: tuple[Payload, ...] | None = None,
 ) -> tuple[WorkloadRecord, ...]:
-    """Send interleaved HTTP requests concurrently, bounded by parallel, while thread is alive."""
+    """Send interleaved HTTP requests concurrently, bounded by parallel, while thread is alive.
+
+    ``payloads`` holds one pre-serialised body per scheduled request (built
+    here when omitted); a payload's trace gap is waited out before it is
+    released.
+    """
     sequence = interleave_requests(request.config)
+    if payloads is None:
+        payloads = build_payloads(sequence, stream=request.config.stream)
     records: list[WorkloadRecord | None] = [None] * len(sequence)
 
-    def _task(index: int, scheduled: ScheduledRequest) -> WorkloadRecord:
-        raw = _send_raw(port, scheduled.spec.name)
+    pool = KeepAlivePool(port, stream=request.config.stream)
+    sequence_start = time.monotonic()
+
+    def _task(index: int, scheduled: ScheduledRequest, released: float) -> WorkloadRecord:
+        queued_ms = _ms_since(released)
+        raw = pool.send(payloads[index].body)
         return WorkloadRecord(
             sequence_index=index,
             spec_name=scheduled.spec.name,
@@ -110,14 +222,22 @@ def dispatch_sequence(
             response_body=raw.body,
             elapsed_ms=raw.elapsed_ms,
             error=raw.error,
+            connect_ms=raw.connect_ms,
+            timing=raw.timing,
+            offset_ms=(released - sequence_start) * 1000.0,
+            queued_ms=queued_ms,
         )
 
     with ThreadPoolExecutor(max_workers=request.config.parallel) as executor:
         futures: dict[Future[WorkloadRecord], int] = {}
+        released_at: dict[int, float] = {}
         for index, scheduled in enumerate(sequence):
+            if payloads[index].gap_seconds > 0:
+                time.sleep(payloads[index].gap_seconds)
             if not thread.is_alive():
                 break
-            fut = executor.submit(_task, index, scheduled)
+            released_at[index] = time.monotonic()
+            fut = executor.submit(_task, index, scheduled, released_at[index])
             futures[fut] = index
         for fut, idx in futures.items():
             exc = fut.exception()
@@ -133,8 +253,10 @@ def dispatch_sequence(
                     response_body="",
                     elapsed_ms=0.0,
                     error=str(exc),
+                    offset_ms=(released_at[idx] - sequence_start) * 1000.0,
                 )
             else:
                 records[idx] = fut.result()
+    pool.close()
     valid_records = [r for r in records if r is not None]
     return tuple(valid_records)
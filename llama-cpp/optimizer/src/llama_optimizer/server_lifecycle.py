@@ -2,7 +2,8 @@
 
 Runs the T5 supervisor in a background thread (process-group + telemetry
 management) while the main thread actively probes readiness, applies the
-configured delay/cooldown, and dispatches HTTP workloads. After dispatch (or
+configured delay/cooldown, and dispatches HTTP workloads (then, when
+configured, the open-loop load sweep of :mod:`server_load`). After dispatch (or
 on readiness/port failure) the server is explicitly cancelled via a shared
 :class:`threading.Event` so the supervisor reaps the process group through its
 SIGTERM -> bounded grace -> SIGKILL -> wait sequence.
@@ -13,16 +14,14 @@ this module never relies on fake self-exit or the overall supervisor deadline.
 
 from __future__ import annotations
 
-import os
-import sys
 import threading
 import time
-from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Final
 
 from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.phase_spans import Phase, SpanRecorder
 from llama_optimizer.server_command import build_server_command
 from llama_optimizer.server_dispatch import (
     apply_sleep,
@@ -31,12 +30,16 @@ from llama_optimizer.server_dispatch import (
     write_dispatch_log,
 )
 from llama_optimizer.server_http import dispatch_sequence
+from llama_optimizer.server_load import measured_bodies, run_load_sweep, write_load_sweep
+from llama_optimizer.server_payloads import build_payloads
+from llama_optimizer.server_schedule import interleave_requests
 from llama_optimizer.server_types import LifecycleRecord
+from llama_optimizer.stdio_capture import PipedCommand, StdioCapture, StdioSink
 from llama_optimizer.supervisor import SupervisorResult
 from llama_optimizer.telemetry import Bytes
+from llama_optimizer.telemetry_series import EMPTY_SERIES
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
     from pathlib import Path
 
     from llama_optimizer.server_http import WorkloadRecord
@@ -48,30 +51,6 @@ _POST_DISPATCH_SETTLE_SECONDS: Final[float] = 0.15
 _JOIN_EXTRA_SECONDS: Final[float] = 5.0
 
 
-@contextmanager
-def _capture_stdio(stdout_path: Path, stderr_path: Path) -> Generator[None]:
-    """Redirect fd 1 and 2 to files so the supervised child inherits them."""
-    _ = sys.stdout.flush()
-    _ = sys.stderr.flush()
-    saved_out = os.dup(1)
-    saved_err = os.dup(2)
-    out_fd = os.open(str(stdout_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
-    err_fd = os.open(str(stderr_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
-    try:
-        _ = os.dup2(out_fd, 1)
-        _ = os.dup2(err_fd, 2)
-        _ = os.close(out_fd)
-        _ = os.close(err_fd)
-        yield
-    finally:
-        _ = sys.stdout.flush()
-        _ = sys.stderr.flush()
-        _ = os.dup2(saved_out, 1)
-        _ = os.dup2(saved_err, 2)
-        _ = os.close(saved_out)
-        _ = os.close(saved_err)
-
-
 @dataclass(frozen=True, slots=True)
 class SupervisorJob:
     """Bundles the supervisor, telemetry provider, and config for one finalist."""
@@ -83,14 +62,15 @@ class SupervisorJob:
 
 def _run_supervisor_thread(
     job: SupervisorJob,
-    command: list[str],
+    command: PipedCommand,
     cancel: threading.Event,
     holder: list[object],
+    spans: SpanRecorder | None,
 ) -> None:
     """Target for the background supervisor thread."""
     try:
         result = job.supervisor.run(
-            command, provider=job.provider, config=job.config, cancel=cancel
+            command, provider=job.provider, config=job.config, cancel=cancel, spans=spans
         )
     except OSError as exc:
         holder.append(exc)
@@ -103,7 +83,7 @@ def _hang_result() -> SupervisorResult:
     now = datetime.now(UTC)
     return SupervisorResult(
         outcome=NonScoredOutcome.HANG,
-        samples=(),
+        series=EMPTY_SERIES,
         diagnostics_series=(),
         peak_used=Bytes(0),
         started_at=now,
@@ -130,49 +110,74 @@ def run_long_lived_server(
     request: FinalistRequest,
     stdout_path: Path,
     stderr_path: Path,
+    spans: SpanRecorder | None = None,
 ) -> tuple[LifecycleRecord, SupervisorResult, tuple[WorkloadRecord, ...]]:
     """Run one long-lived server lifecycle: probe, dispatch, cancel, reap.
 
     Returns a :class:`LifecycleRecord` trace, the :class:`SupervisorResult`,
     and the raw HTTP dispatch records. The server is explicitly cancelled via
     ``cancel`` after dispatch (or on readiness/port failure) so the supervisor
-    reaps the process group promptly.
+    reaps the process group promptly. Request payloads are serialised before
+    launch, so a missing corpus or trace raises
+    :class:`~llama_optimizer.server_types.PayloadSourceError` without starting
+    a server. ``spans`` receives the load, delay, measurement, and cooldown
+    phases from this thread and the supervisor's phases from its own.
     """
-    command = build_server_command(request.binary, request.config, request.identity)
+    if spans is None:
+        spans = SpanRecorder()
+    sequence = interleave_requests(request.config)
+    payloads = build_payloads(sequence, stream=request.config.stream)
+    load_bodies = measured_bodies(sequence, payloads)
+    command = PipedCommand(
+        build_server_command(request.binary, request.config, request.identity),
+        StdioCapture(StdioSink(stdout_path), StdioSink(stderr_path)),
+    )
     cancel = threading.Event()
     holder: list[object] = []
     thread = threading.Thread(
         target=_run_supervisor_thread,
-        args=(SupervisorJob(job.supervisor, job.provider, job.config), command, cancel, holder),
+        args=(
+            SupervisorJob(job.supervisor, job.provider, job.config),
+            command,
+            cancel,
+            holder,
+            spans,
+        ),
         daemon=True,
     )
     delay_applied = False
     cooldown_applied = False
     dispatch_records: tuple[WorkloadRecord, ...] = ()
 
-    with _capture_stdio(stdout_path, stderr_path):
-        thread.start()
+    thread.start()
+    with spans.span(Phase.LOAD):
         ready = wait_for_readiness(
             request.output_dir, thread, request.config.readiness_timeout_seconds
         )
-        port: int | None = None
-        if ready and thread.is_alive():
-            port = read_port(request.output_dir)
-            if port is not None:
+    port: int | None = None
+    if ready and thread.is_alive():
+        port = read_port(request.output_dir)
+        if port is not None:
+            with spans.span(Phase.DELAY):
                 delay_applied = apply_sleep(request.config.delay_seconds)
-                dispatch_records = dispatch_sequence(request, port, thread)
+            with spans.span(Phase.MEASUREMENT):
+                dispatch_records = dispatch_sequence(request, port, thread, payloads)
+                if request.config.load is not None:
+                    sweep = run_load_sweep(request, port, thread, load_bodies)
+                    write_load_sweep(request.output_dir, sweep)
+            with spans.span(Phase.COOLDOWN):
                 cooldown_applied = apply_sleep(request.config.cooldown_seconds)
-                time.sleep(_POST_DISPATCH_SETTLE_SECONDS)
-                cancel.set()
-            else:
-                cancel.set()
+            time.sleep(_POST_DISPATCH_SETTLE_SECONDS)
+            cancel.set()
         else:
             cancel.set()
-        thread.join(
-            timeout=job.config.deadline.total_seconds()
-            + job.config.grace.total_seconds()
-            + _JOIN_EXTRA_SECONDS
-        )
+    else:
+        cancel.set()
+    thread.join(
+        timeout=job.config.deadline.total_seconds()
+        + job.config.grace.total_seconds()
+        + _JOIN_EXTRA_SECONDS
+    )
 
     sup_result = _extract_result(holder)
     failure = ""
@@ -0,0 +1,218 @@
+"""Open-loop load sweep finding a finalist's max request rate at a TTFT SLO (T9).
+
+The measured dispatch sequence is closed-loop: at most ``parallel`` requests
+are in flight, so a slow server simply receives requests more slowly and
+never shows its queueing behavior. A load step here is open-loop instead:
+requests are released at precomputed arrival times (seeded Poisson, or a
+recorded inter-arrival trace rescaled to the target rate) regardless of how
+many are still outstanding, each on its own worker.
+
+Latency is measured from each request's *scheduled* arrival, not from when
+it was actually sent, so a late release (coordinated omission) counts
+against the server rather than hiding its backlog. Requests are streamed
+(:mod:`llama_optimizer.server_stream`) to observe TTFT; a request that fails
+or streams no token is an error.
+
+:func:`find_max_qps` probes both rate bounds and then bisects the knee where
+p95 TTFT first exceeds the configured SLO. The steps and the resulting
+``max_qps_at_slo`` are written to ``load_sweep.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.seeded_lcg import LCG_RANGE, lcg_draws
+from llama_optimizer.server_classify import percentile
+from llama_optimizer.server_http import KeepAlivePool
+from llama_optimizer.server_json import loads_mapping
+from llama_optimizer.server_payloads import build_payloads
+from llama_optimizer.server_schedule import interleave_requests
+from llama_optimizer.server_types import MetricsParseError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+    from threading import Thread
+
+    from llama_optimizer.server_payloads import Payload
+    from llama_optimizer.server_schedule import ScheduledRequest
+    from llama_optimizer.server_types import FinalistRequest, LoadSweepConfig
+
+LOAD_SWEEP_FILENAME: Final[str] = "load_sweep.json"
+_HTTP_OK: Final[int] = 200
+_MS_PER_SECOND: Final[float] = 1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class LoadStep:
+    """Client-observed latency percentiles (ms) and error rate at one offered rate."""
+
+    qps: float
+    requests: int
+    error_rate: float
+    ttft_ms_p50: float
+    ttft_ms_p95: float
+    ttft_ms_p99: float
+    latency_ms_p50: float
+    latency_ms_p95: float
+    latency_ms_p99: float
+    meets_slo: bool
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSweepResult:
+    """Every step in the order it ran and the highest rate that met the SLO."""
+
+    max_qps_at_slo: float
+    steps: tuple[LoadStep, ...]
+
+
+def arrival_offsets(
+    qps: float, count: int, seed: int, trace: tuple[float, ...] = ()
+) -> list[float]:
+    """Return ``count`` arrival times (seconds from step start) at mean rate ``qps``.
+
+    Without ``trace`` the gaps are exponential (a Poisson process) drawn from a
+    seeded LCG; with it the trace gaps are cycled and rescaled so their mean
+    is ``1 / qps``.
+    """
+    if trace:
+        scale = len(trace) / (sum(trace) * qps)
+        gaps = [trace[i % len(trace)] * scale for i in range(count)]
+    else:
+        draws = islice(lcg_draws(seed), count)
+        gaps = [-math.log((draw + 0.5) / LCG_RANGE) / qps for draw in draws]
+    offsets: list[float] = []
+    elapsed = 0.0
+    for gap in gaps:
+        elapsed += gap
+        offsets.append(elapsed)
+    return offsets
+
+
+def summarize_step(
+    qps: float, samples: Sequence[tuple[float, float] | None], config: LoadSweepConfig
+) -> LoadStep:
+    """Reduce per-request ``(ttft_ms, latency_ms)`` samples (``None`` = error) to a step."""
+    ok = [s for s in samples if s is not None]
+    ttft = tuple(s[0] for s in ok)
+    latency = tuple(s[1] for s in ok)
+    error_rate = (len(samples) - len(ok)) / len(samples) if samples else 1.0
+    p95 = percentile(ttft, 95)
+    return LoadStep(
+        qps=qps,
+        requests=len(samples),
+        error_rate=error_rate,
+        ttft_ms_p50=percentile(ttft, 50),
+        ttft_ms_p95=p95,
+        ttft_ms_p99=percentile(ttft, 99),
+        latency_ms_p50=percentile(latency, 50),
+        latency_ms_p95=percentile(latency, 95),
+        latency_ms_p99=percentile(latency, 99),
+        meets_slo=bool(ok)
+        and error_rate <= config.max_error_rate
+        and p95 <= config.slo_ttft_ms_p95,
+    )
+
+
+def find_max_qps(step: Callable[[float], LoadStep], config: LoadSweepConfig) -> LoadSweepResult:
+    """Probe both bounds, then bisect the highest rate whose step meets the SLO.
+
+    Returns ``0.0`` when even ``min_qps`` misses the SLO and ``max_qps`` when
+    the server keeps up across the whole range.
+    """
+    steps = [step(config.min_qps)]
+    if not steps[-1].meets_slo:
+        return LoadSweepResult(0.0, tuple(steps))
+    steps.append(step(config.max_qps))
+    if steps[-1].meets_slo:
+        return LoadSweepResult(config.max_qps, tuple(steps))
+    low, high = config.min_qps, config.max_qps
+    for _ in range(config.search_steps):
+        middle = (low + high) / 2
+        steps.append(step(middle))
+        if steps[-1].meets_slo:
+            low = middle
+        else:
+            high = middle
+    return LoadSweepResult(low, tuple(steps))
+
+
+def _timed(pool: KeepAlivePool, body: bytes, scheduled: float) -> tuple[float, float] | None:
+    """Send one streamed request; time it from its scheduled arrival."""
+    lag_ms = (time.monotonic() - scheduled) * _MS_PER_SECOND
+    raw = pool.send(body)
+    if raw.status != _HTTP_OK or raw.error or raw.timing is None:
+        return None
+    return lag_ms + raw.timing.ttft_ms, lag_ms + raw.timing.total_ms
+
+
+def measured_bodies(
+    sequence: Sequence[ScheduledRequest], payloads: Sequence[Payload]
+) -> tuple[bytes, ...]:
+    """Return the bodies of the measured (non-warmup) requests, in sequence order."""
+    return tuple(p.body for p, s in zip(payloads, sequence, strict=True) if not s.is_warmup)
+
+
+def run_load_sweep(
+    request: FinalistRequest,
+    port: int,
+    thread: Thread,
+    bodies: Sequence[bytes] | None = None,
+) -> LoadSweepResult:
+    """Run the configured open-loop sweep against a live server on ``port``.
+
+    Requests cycle through the pre-serialised streamed ``bodies`` (by default
+    the measured sequence's payloads). Stops releasing requests once the
+    supervised server ``thread`` has ended.
+    """
+    config = request.config.load
+    if config is None:
+        return LoadSweepResult(0.0, ())
+    if bodies is None:
+        sequence = interleave_requests(request.config)
+        bodies = measured_bodies(sequence, build_payloads(sequence, stream=True))
+    seeds = iter(range(config.seed, config.seed + 2 + config.search_steps))
+
+    def step(qps: float) -> LoadStep:
+        offsets = arrival_offsets(qps, config.step_requests, next(seeds), config.trace_gaps)
+        pool = KeepAlivePool(port, stream=True)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=config.step_requests) as executor:
+            futures: list[Future[tuple[float, float] | None]] = []
+            for index, offset in enumerate(offsets):
+                if not thread.is_alive():
+                    break
+                time.sleep(max(0.0, start + offset - time.monotonic()))
+                body = bodies[index % len(bodies)]
+                futures.append(executor.submit(_timed, pool, body, start + offset))
+            samples = [future.result() for future in futures]
+        pool.close()
+        return summarize_step(qps, samples, config)
+
+    return find_max_qps(step, config)
+
+
+def write_load_sweep(output_dir: Path, result: LoadSweepResult) -> None:
+    """Write the sweep steps and ``max_qps_at_slo`` as ``load_sweep.json``."""
+    payload = {
+        "max_qps_at_slo": result.max_qps_at_slo,
+        "steps": [asdict(step) for step in result.steps],
+    }
+    _ = (output_dir / LOAD_SWEEP_FILENAME).write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def read_max_qps_at_slo(output_dir: Path) -> float | None:
+    """Return ``max_qps_at_slo`` from ``load_sweep.json`` (``None`` if no sweep ran)."""
+    path = output_dir / LOAD_SWEEP_FILENAME
+    if not path.exists():
+        return None
+    value = loads_mapping(path.read_text(), error=MetricsParseError).get("max_qps_at_slo")
+    return float(value) if isinstance(value, int | float) else None
@@ -0,0 +1,149 @@
+"""Pre-serialised chat-completion payloads for finalist dispatch (T9).
+
+Each :class:`~llama_optimizer.server_types.RequestSpec` names where its
+prompts come from:
+
+* no source: the spec name itself is the prompt (the original smoke payload);
+* ``corpus``: a versioned corpus JSONL (``optimizer/corpora``) whose ``prompt``
+  fields are shuffled once from ``seed``
+  (:func:`~llama_optimizer.seeded_lcg.seeded_shuffle`); measured repetition
+  ``r`` sends the ``r``-th prompt, cycling, and the warmup sends the last one
+  so it never primes the prompt cache for the first measured request;
+* ``trace``: a captured JSONL trace replayed in order, one entry per
+  repetition. Each line carries ``max_tokens``, ``offset_ms`` (arrival time
+  since the capture started) and either the original ``prompt`` or just its
+  length as ``prompt_tokens``, filled with a fixed word. Offset differences
+  become gaps the dispatcher waits out before releasing the request.
+
+:func:`build_payloads` serialises every body once, before the server is
+launched, and shares one ``bytes`` object between identical payloads, so
+reading and encoding never enter a request's timing.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.seeded_lcg import seeded_shuffle
+from llama_optimizer.server_json import loads_mapping
+from llama_optimizer.server_types import PayloadSourceError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.server_schedule import ScheduledRequest
+    from llama_optimizer.server_types import RequestSpec
+
+_FILLER_WORD: Final[str] = "lorem"
+_MS_PER_SECOND: Final[float] = 1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEntry:
+    """One request to send: prompt, completion cap, and arrival offset (s)."""
+
+    prompt: str
+    max_tokens: int
+    offset_seconds: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class Payload:
+    """A serialised request body and the gap (s) to wait before releasing it."""
+
+    body: bytes
+    gap_seconds: float = 0.0
+
+
+def request_body(prompt: str, max_tokens: int, *, stream: bool = False) -> bytes:
+    """Serialise one single-turn chat-completion request."""
+    body: dict[str, object] = {
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+    }
+    if stream:
+        body["stream"] = True
+    return json.dumps(body).encode()
+
+
+def _jsonl(path: Path) -> list[tuple[int, dict[str, object]]]:
+    if not path.is_file():
+        raise PayloadSourceError(reason=f"payload source not found: {path}")
+    lines = [(n, line) for n, line in enumerate(path.read_text().splitlines(), 1) if line.strip()]
+    if not lines:
+        raise PayloadSourceError(reason=f"payload source is empty: {path}")
+    return [
+        (n, dict(loads_mapping(line, error=PayloadSourceError, malformed_reason=f"{path}:{n}")))
+        for n, line in lines
+    ]
+
+
+def read_corpus(path: Path) -> tuple[str, ...]:
+    """Return every line's ``prompt`` from a corpus JSONL, in file order."""
+    prompts: list[str] = []
+    for number, row in _jsonl(path):
+        prompt = row.get("prompt")
+        if not isinstance(prompt, str) or not prompt:
+            raise PayloadSourceError(reason=f"{path}:{number}: missing prompt")
+        prompts.append(prompt)
+    return tuple(prompts)
+
+
+def read_trace(path: Path) -> tuple[TraceEntry, ...]:
+    """Return a captured trace's entries, in file order."""
+    entries: list[TraceEntry] = []
+    for number, row in _jsonl(path):
+        prompt, length = row.get("prompt"), row.get("prompt_tokens")
+        max_tokens, offset = row.get("max_tokens"), row.get("offset_ms", 0.0)
+        if not isinstance(prompt, str):
+            if not isinstance(length, int) or isinstance(length, bool) or length < 1:
+                raise PayloadSourceError(reason=f"{path}:{number}: needs prompt or prompt_tokens")
+            prompt = " ".join([_FILLER_WORD] * length)
+        if not isinstance(max_tokens, int) or isinstance(max_tokens, bool) or max_tokens < 1:
+            raise PayloadSourceError(reason=f"{path}:{number}: max_tokens must be an int >= 1")
+        if not isinstance(offset, int | float) or isinstance(offset, bool):
+            raise PayloadSourceError(reason=f"{path}:{number}: offset_ms must be a number")
+        entries.append(TraceEntry(prompt, max_tokens, float(offset) / _MS_PER_SECOND))
+    if any(b.offset_seconds < a.offset_seconds for a, b in pairwise(entries)):
+        raise PayloadSourceError(reason=f"{path}: offset_ms must not decrease")
+    return tuple(entries)
+
+
+def spec_entries(spec: RequestSpec) -> tuple[TraceEntry, ...]:
+    """Return the entries a spec cycles through across its repetitions."""
+    if spec.trace:
+        return read_trace(Path(spec.trace))
+    if spec.corpus:
+        prompts = seeded_shuffle(read_corpus(Path(spec.corpus)), spec.seed)
+        return tuple(TraceEntry(prompt, spec.max_tokens) for prompt in prompts)
+    return (TraceEntry(spec.name, spec.max_tokens),)
+
+
+def build_payloads(
+    sequence: Sequence[ScheduledRequest], *, stream: bool = False
+) -> tuple[Payload, ...]:
+    """Serialise one payload per scheduled request, reading each source once.
+
+    Raises :class:`~llama_optimizer.server_types.PayloadSourceError` when a
+    corpus or trace is missing or malformed.
+    """
+    entries: dict[RequestSpec, tuple[TraceEntry, ...]] = {}
+    bodies: dict[tuple[str, int], bytes] = {}
+    payloads: list[Payload] = []
+    for scheduled in sequence:
+        spec = scheduled.spec
+        if spec not in entries:
+            entries[spec] = spec_entries(spec)
+        source = entries[spec]
+        index = -1 if scheduled.is_warmup else (scheduled.repetition - 1) % len(source)
+        entry = source[index]
+        key = (entry.prompt, entry.max_tokens)
+        if key not in bodies:
+            bodies[key] = request_body(entry.prompt, entry.max_tokens, stream=stream)
+        gap = entry.offset_seconds - source[index - 1].offset_seconds if index > 0 else 0.0
+        payloads.append(Payload(bodies[key], gap))
+    return tuple(payloads)
@@ -1,30 +1,44 @@
 """Ledger recording for supervised llama-server finalist attempts (T9).
 
-Records raw artifacts (readiness, metrics, responses, dispatch log), parsed
-metrics, telemetry, and finalizes the attempt in the T4 ledger. Failed
-attempts never receive metrics, a numeric score, winner eligibility, or
-successful metric-ledger rows.
+Records raw artifacts (readiness, metrics, responses, dispatch log, load
+and slot sweeps), parsed metrics (plus the aggregate generation rate, and
+``max_qps_at_slo`` when a load sweep ran), telemetry, and finalizes the
+attempt in the T4 ledger. A slot sweep's unscored launches record their
+artifacts and telemetry against the same attempt. Failed attempts never receive metrics, a numeric
+score, winner eligibility, or successful metric-ledger rows.
 """
 
 from __future__ import annotations
 
 import hashlib
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
-from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.breach_predictor import PREDICTION_ARTIFACT_KIND, record_breach_prediction
 from llama_optimizer.server_classify import ClassifiedOutcome, extract_metrics_map
+from llama_optimizer.server_load import LOAD_SWEEP_FILENAME, read_max_qps_at_slo
+from llama_optimizer.server_slots import SLOT_SWEEP_FILENAME
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from llama_optimizer.ledger import Ledger
     from llama_optimizer.lifecycle import AttemptId
+    from llama_optimizer.server_slots import SlotSweepResult
     from llama_optimizer.server_types import FinalistRequest
     from llama_optimizer.supervisor import SupervisorResult
 _READINESS_KIND = "server-readiness"
 _METRICS_KIND = "server-metrics"
 _RESPONSES_KIND = "server-responses"
 _DISPATCH_KIND = "server-dispatch"
+_LOAD_SWEEP_KIND = "server-load-sweep"
+_SLOT_SWEEP_KIND = "server-slot-sweep"
+_LAUNCH_ARTIFACTS: Final = (
+    (_READINESS_KIND, "readiness.json"),
+    (_METRICS_KIND, "metrics.json"),
+    (_RESPONSES_KIND, "responses.jsonl"),
+    (_DISPATCH_KIND, "dispatch_log.jsonl"),
+    (_LOAD_SWEEP_KIND, LOAD_SWEEP_FILENAME),
+)
 
 
 def _record_artifact(ledger: Ledger, attempt_id: AttemptId, kind: str, path: Path) -> None:
@@ -38,6 +52,38 @@ def _record_artifact(ledger: Ledger, attempt_id: AttemptId, kind: str, path: Pat
         )
 
 
+def _labelled(kind: str, label: str) -> str:
+    return f"{kind}-{label}" if label else kind
+
+
+def record_launch_evidence(
+    ledger: Ledger,
+    attempt_id: AttemptId,
+    request: FinalistRequest,
+    sup_result: SupervisorResult,
+    label: str = "",
+) -> None:
+    """Record one server launch's raw artifacts, breach prediction, and telemetry.
+
+    Every launch is evidence: a slot sweep records each unscored slot count's
+    launch here too, with its artifact kinds suffixed by ``label`` (one
+    artifact per kind per attempt), including a launch that breached.
+    """
+    out = request.output_dir
+    for kind, filename in _LAUNCH_ARTIFACTS:
+        _record_artifact(ledger, attempt_id, _labelled(kind, label), out / filename)
+    if sup_result.predicted_breach is not None:
+        record_breach_prediction(
+            ledger,
+            attempt_id,
+            sup_result.predicted_breach,
+            out / "breach-prediction.json",
+            _labelled(PREDICTION_ARTIFACT_KIND, label),
+        )
+    ledger.record_telemetry_series(attempt_id, sup_result.series.ledger_rows())
+    ledger.record_host_samples(attempt_id, sup_result.host_series)
+
+
 def record_finalist_attempt(
     ledger: Ledger,
     attempt_id: AttemptId,
@@ -45,30 +91,25 @@ def record_finalist_attempt(
     classified: ClassifiedOutcome,
     sup_result: SupervisorResult,
 ) -> dict[str, float]:
-    """Record artifacts, metrics, telemetry, and finalize the attempt.
+    """Record the launch's evidence and metrics, and finalize the attempt.
 
     Returns the metrics map (empty for failed attempts). Failed attempts never
     receive metrics or winner eligibility.
     """
-    out = request.output_dir
-    _record_artifact(ledger, attempt_id, _READINESS_KIND, out / "readiness.json")
-    _record_artifact(ledger, attempt_id, _METRICS_KIND, out / "metrics.json")
-    _record_artifact(ledger, attempt_id, _RESPONSES_KIND, out / "responses.jsonl")
-    _record_artifact(ledger, attempt_id, _DISPATCH_KIND, out / "dispatch_log.jsonl")
-
-    metrics_map = extract_metrics_map(classified.metrics) if classified.metrics else {}
+    record_launch_evidence(ledger, attempt_id, request, sup_result)
+    metrics_map = (
+        extract_metrics_map(classified.metrics, classified.streamed, classified.generation_ts)
+        if classified.metrics
+        else {}
+    )
+    if classified.metrics:
+        metrics_map["aggregate_generation_ts"] = classified.aggregate_generation_ts
+    max_qps = read_max_qps_at_slo(request.output_dir) if classified.metrics else None
+    if max_qps is not None:
+        metrics_map["max_qps_at_slo"] = max_qps
     if classified.metrics:
         ledger.record_metrics(attempt_id, metrics_map)
 
-    if sup_result.peak_used is not None:
-        breached = classified.outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
-        ledger.record_telemetry(
-            attempt_id=attempt_id,
-            vram_used_bytes=int(sup_result.peak_used),
-            peak_vram_bytes=int(sup_result.peak_used),
-            breached=breached,
-        )
-
     if classified.outcome is None:
         ledger.succeed_attempt(attempt_id)
     else:
@@ -78,3 +119,17 @@ def record_finalist_attempt(
             reason=classified.reason.strip() or classified.outcome.value,
         )
     return metrics_map
+
+
+def record_slot_sweep(
+    ledger: Ledger, attempt_id: AttemptId, output_dir: Path, sweep: SlotSweepResult
+) -> dict[str, float]:
+    """Record the slot sweep artifact and, when a slot count scored, its metrics.
+
+    Returns the recorded metrics (empty when no slot count scored).
+    """
+    _record_artifact(ledger, attempt_id, _SLOT_SWEEP_KIND, output_dir / SLOT_SWEEP_FILENAME)
+    metrics = sweep.metrics()
+    if metrics:
+        ledger.record_metrics(attempt_id, metrics)
+    return metrics
@@ -9,29 +9,43 @@ no single file exceeds the 250-pure-LOC responsibility ceiling.
 
 from __future__ import annotations
 
-import os
-import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from llama_optimizer.phase_spans import Phase, SpanRecorder, record_phase_spans
+from llama_optimizer.process_wait import wait_group_gone
 from llama_optimizer.server_classify import classify_attempt
 from llama_optimizer.server_dispatch import clean_stale_artifacts
 from llama_optimizer.server_lifecycle import SupervisorJob, run_long_lived_server
-from llama_optimizer.server_recorder import record_finalist_attempt
+from llama_optimizer.server_recorder import (
+    record_finalist_attempt,
+    record_launch_evidence,
+    record_slot_sweep,
+)
 from llama_optimizer.server_schedule import schedule_finalists
+from llama_optimizer.server_slots import (
+    SlotSweepResult,
+    best_slot_count,
+    slot_request,
+    slot_run,
+    write_slot_sweep,
+)
 from llama_optimizer.server_types import EligibilityStatus, FinalistRequest, FinalistResult
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from llama_optimizer.ledger import Ledger
-    from llama_optimizer.server_types import FinalistEntry, ServerConfig
-    from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+    from llama_optimizer.server_classify import ClassifiedOutcome
+    from llama_optimizer.server_types import FinalistEntry, LifecycleRecord, ServerConfig
+    from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig, SupervisorResult
     from llama_optimizer.telemetry import HardChannelProvider
 
 _STDERR_FILENAME = "server.stderr.txt"
 _STDOUT_FILENAME = "server.stdout.log"
 _DISPATCH_FILENAME = "dispatch_log.jsonl"
+_TRACE_FILENAME = "phase-trace.json"
+_CLEANUP_TIMEOUT_SECONDS = 2.0
 
 
 def _read_dispatch(output_dir: Path) -> str:
@@ -40,6 +54,59 @@ def _read_dispatch(output_dir: Path) -> str:
     return path.read_text() if path.exists() else ""
 
 
+@dataclass(frozen=True, slots=True)
+class _Launch:
+    """One server launch: its request, phase spans, and classified outcome."""
+
+    request: FinalistRequest
+    spans: SpanRecorder
+    lifecycle: LifecycleRecord
+    sup_result: SupervisorResult
+    classified: ClassifiedOutcome
+
+
+def _launch(job: SupervisorJob, request: FinalistRequest) -> _Launch:
+    """Clean stale artifacts, run one server lifecycle, and classify it."""
+    request.output_dir.mkdir(parents=True, exist_ok=True)
+    clean_stale_artifacts(request.output_dir)
+    spans = SpanRecorder()
+    lifecycle, sup_result, dispatch = run_long_lived_server(
+        job,
+        request,
+        request.output_dir / _STDOUT_FILENAME,
+        request.output_dir / _STDERR_FILENAME,
+        spans,
+    )
+    with spans.span(Phase.RECORDING):
+        classified = classify_attempt(request, sup_result, lifecycle, dispatch)
+    return _Launch(request, spans, lifecycle, sup_result, classified)
+
+
+def _sweep_slots(
+    job: SupervisorJob, request: FinalistRequest
+) -> tuple[_Launch, tuple[_Launch, ...], SlotSweepResult]:
+    """Launch once per slot count; return the best slot count's launch and the others.
+
+    Each launch's process group is gone before the next starts. Without a
+    scored slot count the last launch is chosen so its failure is recorded.
+    """
+    launches: list[_Launch] = []
+    for parallel in request.config.slot_sweep:
+        launched = _launch(job, slot_request(request, parallel))
+        pgid = launched.sup_result.process_group_pid
+        if pgid is not None:
+            _ = wait_group_gone(pgid, _CLEANUP_TIMEOUT_SECONDS)
+        launches.append(launched)
+    runs = tuple(slot_run(la.request.config.parallel, la.classified) for la in launches)
+    sweep = SlotSweepResult(runs, best_slot_count(runs))
+    write_slot_sweep(request.output_dir, sweep)
+    chosen = next(
+        (la for la in launches if la.request.config.parallel == sweep.best_parallel),
+        launches[-1],
+    )
+    return chosen, tuple(la for la in launches if la is not chosen), sweep
+
+
 def run_supervised_server(
     supervisor: ProcessSupervisor,
     provider: HardChannelProvider,
@@ -51,37 +118,50 @@ def run_supervised_server(
 
     Builds the command with exact 32768 context, cleans stale artifacts, runs
     the long-lived server lifecycle (probe, dispatch, explicit cancel, reap),
-    classifies the outcome, records raw artifacts/metrics/telemetry via T4, and
-    completes the attempt.
+    classifies the outcome, records raw artifacts/metrics/telemetry via T4,
+    completes the attempt, and persists its per-phase timing spans (plus a
+    Chrome trace when ``request.chrome_trace`` is set).
+
+    With ``request.config.slot_sweep`` set, the one attempt launches the
+    server per slot count (:mod:`server_slots`) and scores the best slot
+    count's launch together with the sweep's metrics; every other launch's
+    artifacts, telemetry, and spans are recorded against the attempt too.
     """
     request.output_dir.mkdir(parents=True, exist_ok=True)
-    clean_stale_artifacts(request.output_dir)
     attempt = ledger.start_attempt(request.trial_id)
-    stdout_path = request.output_dir / _STDOUT_FILENAME
-    stderr_path = request.output_dir / _STDERR_FILENAME
-
-    lifecycle, sup_result, _dispatch = run_long_lived_server(
-        SupervisorJob(supervisor, provider, sup_config),
-        request,
-        stdout_path,
-        stderr_path,
-    )
-    classified = classify_attempt(request, sup_result, lifecycle, _dispatch)
-    metrics_map = record_finalist_attempt(
-        ledger, attempt.attempt_id, request, classified, sup_result
-    )
+    job = SupervisorJob(supervisor, provider, sup_config)
+    sweep_metrics: dict[str, float] = {}
+    others: tuple[_Launch, ...] = ()
+    if request.config.slot_sweep:
+        launched, others, sweep = _sweep_slots(job, request)
+        sweep_metrics = record_slot_sweep(ledger, attempt.attempt_id, request.output_dir, sweep)
+    else:
+        launched = _launch(job, request)
+    classified = launched.classified
+    with launched.spans.span(Phase.RECORDING):
+        for other in others:
+            label = other.request.output_dir.name
+            record_launch_evidence(
+                ledger, attempt.attempt_id, other.request, other.sup_result, label
+            )
+        metrics_map = record_finalist_attempt(
+            ledger, attempt.attempt_id, launched.request, classified, launched.sup_result
+        )
+    spans = SpanRecorder(initial=[row for la in (*others, launched) for row in la.spans.spans])
+    trace = request.output_dir / _TRACE_FILENAME if request.chrome_trace else None
+    record_phase_spans(ledger, attempt.attempt_id, spans, trace_path=trace)
     return FinalistResult(
         outcome=classified.outcome,
         metrics=classified.metrics,
         raw_readiness=classified.raw_readiness,
         raw_metrics=classified.raw_metrics,
         raw_responses=classified.raw_responses,
-        raw_dispatch=_read_dispatch(request.output_dir),
-        supervisor_result=sup_result,
-        lifecycle=lifecycle,
+        raw_dispatch=_read_dispatch(launched.request.output_dir),
+        supervisor_result=launched.sup_result,
+        lifecycle=launched.lifecycle,
         trial_id=request.trial_id,
         attempt_id=attempt.attempt_id,
-        metrics_map=metrics_map,
+        metrics_map={**metrics_map, **sweep_metrics},
         reason=classified.reason,
     )
 
@@ -122,13 +202,5 @@ def validate_finalists(
         results.append(result)
         pgid = result.supervisor_result.process_group_pid
         if pgid is not None:
-            cleanup_deadline = time.monotonic() + 2.0
-            while time.monotonic() < cleanup_deadline:
-                try:
-                    os.killpg(pgid, 0)
-                except ProcessLookupError:
-                    break
-                except PermissionError:
-                    break
-                time.sleep(0.05)
+            _ = wait_group_gone(pgid, _CLEANUP_TIMEOUT_SECONDS)
     return tuple(results)
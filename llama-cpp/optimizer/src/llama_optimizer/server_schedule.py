@@ -7,26 +7,21 @@ with warmup always first. The schedule is fully deterministic from the seed
 and the input order, so two runs with the same seed and finalists produce the
 same interleaved sequence.
 
-A deterministic LCG (linear congruential generator) drives the Fisher-Yates
-shuffle instead of :mod:`random` so no cryptographic-suitability concern
-(Ruff S311) applies while remaining fully reproducible.
+The shared seeded LCG of :mod:`llama_optimizer.seeded_lcg` drives the
+Fisher-Yates shuffle instead of :mod:`random`, so it stays fully reproducible.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING
 
+from llama_optimizer.seeded_lcg import seeded_shuffle
 from llama_optimizer.server_types import ScheduledFinalist
 
 if TYPE_CHECKING:
     from llama_optimizer.server_types import FinalistEntry, RequestSpec, ServerConfig
 
-_LCG_MULTIPLIER: Final[int] = 6364136223846793005
-_LCG_INCREMENT: Final[int] = 1442695040888963407
-_LCG_MASK: Final[int] = 0xFFFFFFFFFFFFFFFF
-_LCG_SHIFT: Final[int] = 33
-
 
 @dataclass(frozen=True, slots=True)
 class ScheduledRequest:
@@ -37,17 +32,6 @@ class ScheduledRequest:
     repetition: int
 
 
-def _deterministic_shuffle(finalists: list[FinalistEntry], seed: int) -> list[FinalistEntry]:
-    """Fisher-Yates shuffle driven by a seed-seeded LCG (not ``random.Random``)."""
-    shuffled = list(finalists)
-    state = seed & _LCG_MASK
-    for i in range(len(shuffled) - 1, 0, -1):
-        state = (state * _LCG_MULTIPLIER + _LCG_INCREMENT) & _LCG_MASK
-        j = (state >> _LCG_SHIFT) % (i + 1)
-        shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
-    return shuffled
-
-
 def schedule_finalists(
     finalists: tuple[FinalistEntry, ...],
     seed: int,
@@ -60,7 +44,7 @@ def schedule_finalists(
     """
     if not finalists:
         return ()
-    shuffled = _deterministic_shuffle(list(finalists), seed)
+    shuffled = seeded_shuffle(finalists, seed)
     return tuple(ScheduledFinalist(position=i, finalist=f) for i, f in enumerate(shuffled))
 
 
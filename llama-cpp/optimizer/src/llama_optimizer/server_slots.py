@@ -0,0 +1,112 @@
+"""``--parallel`` slot-count sub-sweep for llama-server finalists (T9).
+
+More slots let llama-server batch more concurrent requests, raising
+aggregate generation throughput, but every slot shares the same 32768-token
+context (each gets ``32768 / parallel``) and the batched decode slows each
+individual request. With
+:attr:`~llama_optimizer.server_types.ServerConfig.slot_sweep` set, one
+finalist attempt relaunches the server once per listed slot count, with the
+dispatcher's concurrency equal to the slot count, and keeps each launch's
+artifacts under ``slots-<n>``.
+
+The best slot count is the fewest slots whose aggregate throughput reaches
+:data:`KNEE_FRACTION` of the sweep's peak: beyond that knee extra slots buy
+little throughput for more per-request latency. The attempt is scored on
+the best slot count's launch and also records ``best_parallel`` plus each
+slot count's aggregate throughput and latency; ``slot_sweep.json`` keeps the
+whole sweep.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.server_classify import extract_metrics_map
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from llama_optimizer.server_classify import ClassifiedOutcome
+    from llama_optimizer.server_types import FinalistRequest
+
+KNEE_FRACTION: Final[float] = 0.95
+SLOT_SWEEP_FILENAME: Final[str] = "slot_sweep.json"
+
+
+@dataclass(frozen=True, slots=True)
+class SlotRun:
+    """Aggregate throughput and per-request latency of one slot count.
+
+    ``scored`` is false when the launch failed; its figures are then zero.
+    """
+
+    parallel: int
+    scored: bool
+    aggregate_generation_ts: float
+    request_latency_ms_p50: float
+    request_latency_ms_p95: float
+
+
+@dataclass(frozen=True, slots=True)
+class SlotSweepResult:
+    """Every slot count's run in sweep order and the chosen slot count."""
+
+    runs: tuple[SlotRun, ...]
+    best_parallel: int | None
+
+    def metrics(self) -> dict[str, float]:
+        """Return ``best_parallel`` and each scored slot count's figures as ledger metrics."""
+        if self.best_parallel is None:
+            return {}
+        flat = {"best_parallel": float(self.best_parallel)}
+        for run in self.runs:
+            if run.scored:
+                flat[f"slots{run.parallel}_aggregate_generation_ts"] = run.aggregate_generation_ts
+                flat[f"slots{run.parallel}_request_latency_ms_p95"] = run.request_latency_ms_p95
+        return flat
+
+
+def slot_request(request: FinalistRequest, parallel: int) -> FinalistRequest:
+    """Return ``request`` at one slot count, writing under ``slots-<parallel>``."""
+    config = replace(request.config, parallel=parallel, slot_sweep=())
+    return replace(request, config=config, output_dir=request.output_dir / f"slots-{parallel}")
+
+
+def slot_run(parallel: int, classified: ClassifiedOutcome) -> SlotRun:
+    """Summarize one slot count's classified launch."""
+    if classified.outcome is not None or classified.metrics is None:
+        return SlotRun(
+            parallel,
+            scored=False,
+            aggregate_generation_ts=0.0,
+            request_latency_ms_p50=0.0,
+            request_latency_ms_p95=0.0,
+        )
+    flat = extract_metrics_map(classified.metrics, classified.streamed)
+    return SlotRun(
+        parallel=parallel,
+        scored=True,
+        aggregate_generation_ts=classified.aggregate_generation_ts,
+        request_latency_ms_p50=flat["request_latency_ms_p50"],
+        request_latency_ms_p95=flat["request_latency_ms_p95"],
+    )
+
+
+def best_slot_count(runs: Sequence[SlotRun]) -> int | None:
+    """Return the fewest slots within :data:`KNEE_FRACTION` of the peak throughput."""
+    scored = [run for run in runs if run.scored and run.aggregate_generation_ts > 0]
+    if not scored:
+        return None
+    peak = max(run.aggregate_generation_ts for run in scored)
+    return min(
+        run.parallel for run in scored if run.aggregate_generation_ts >= KNEE_FRACTION * peak
+    )
+
+
+def write_slot_sweep(output_dir: Path, sweep: SlotSweepResult) -> None:
+    """Write every slot count's run and ``best_parallel`` as ``slot_sweep.json``."""
+    payload = {"best_parallel": sweep.best_parallel, "runs": [asdict(r) for r in sweep.runs]}
+    _ = (output_dir / SLOT_SWEEP_FILENAME).write_text(json.dumps(payload, indent=2) + "\n")
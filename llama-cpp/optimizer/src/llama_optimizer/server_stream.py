@@ -0,0 +1,129 @@
+"""Incremental SSE parsing and client-observed token timing (T9).
+
+With :attr:`~llama_optimizer.server_types.ServerConfig.stream` set, dispatch
+asks llama-server for ``"stream": true`` and reads the ``text/event-stream``
+body line by line as it arrives instead of buffering the whole response.
+Every ``data:`` event carrying non-empty ``choices[0].delta.content`` is one
+token, stamped with :func:`time.monotonic_ns` on arrival; ``data: [DONE]``
+(or the end of the body) ends the stream, and any trailer is drained so a
+keep-alive connection stays reusable.
+
+The first stamp, measured from the moment the request was sent, is the
+client-observed TTFT; the gaps between consecutive stamps are the
+inter-token latencies (ITL); and the decode rate is the tokens after the
+first over the span from first to last token. Unlike the server-reported
+aggregates these include queueing, HTTP framing, and detokenization — what a
+client actually waits for.
+"""
+
+from __future__ import annotations
+
+import http.client
+import itertools
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, Protocol, TypeIs
+
+from llama_optimizer.server_json import loads_mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_DATA_PREFIX: Final[str] = "data:"
+_DONE: Final[str] = "[DONE]"
+_NS_PER_MS: Final[float] = 1_000_000.0
+_MS_PER_SECOND: Final[float] = 1000.0
+
+
+class _LineReader(Protocol):
+    """The incremental read surface of :class:`http.client.HTTPResponse`."""
+
+    def readline(self, limit: int = -1, /) -> bytes:
+        """Return the next line of the body (``b""`` at its end)."""
+        ...
+
+    def read(self, amt: int | None = None, /) -> bytes:
+        """Return the rest of the body."""
+        ...
+
+
+class _MalformedEventError(http.client.HTTPException):
+    """A ``data:`` event whose payload is not a JSON object."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+
+
+@dataclass(frozen=True, slots=True)
+class StreamTiming:
+    """Client-observed token timing of one streamed completion (milliseconds).
+
+    ``ttft_ms`` is request send to first token, ``itl_ms`` the gap before each
+    later token, and ``total_ms`` request send to end of stream.
+    """
+
+    ttft_ms: float
+    itl_ms: tuple[float, ...]
+    total_ms: float
+
+    @property
+    def tokens(self) -> int:
+        """Number of streamed tokens."""
+        return len(self.itl_ms) + 1
+
+    @property
+    def decode_ts(self) -> float | None:
+        """Tokens per second after the first token (``None`` below two tokens)."""
+        span_ms = sum(self.itl_ms)
+        return len(self.itl_ms) / span_ms * _MS_PER_SECOND if span_ms > 0 else None
+
+
+def _is_object_list(value: object) -> TypeIs[list[object]]:
+    return isinstance(value, list)
+
+
+def _is_str_mapping(value: object) -> TypeIs[Mapping[str, object]]:
+    return isinstance(value, dict)
+
+
+def _delta_content(event: Mapping[str, object]) -> str:
+    """Return ``choices[0].delta.content`` of one chunk (``""`` when absent)."""
+    choices = event.get("choices")
+    if not _is_object_list(choices) or not choices or not _is_str_mapping(choices[0]):
+        return ""
+    delta = choices[0].get("delta")
+    content = delta.get("content") if _is_str_mapping(delta) else None
+    return content if isinstance(content, str) else ""
+
+
+def read_sse_stream(resp: _LineReader, started_ns: int) -> tuple[str, StreamTiming | None]:
+    """Consume one SSE body, returning its raw text and token timing.
+
+    ``started_ns`` is the :func:`time.monotonic_ns` stamp taken when the
+    request was sent. The timing is ``None`` when no token arrived. Raises
+    :class:`http.client.HTTPException` on a ``data:`` event that is not JSON.
+    """
+    lines: list[str] = []
+    stamps: list[int] = []
+    while raw := resp.readline():
+        arrived = time.monotonic_ns()
+        line = raw.decode(errors="replace")
+        lines.append(line)
+        if not line.startswith(_DATA_PREFIX):
+            continue
+        data = line.removeprefix(_DATA_PREFIX).strip()
+        if data == _DONE:
+            break
+        if data and _delta_content(loads_mapping(data, error=_MalformedEventError)):
+            stamps.append(arrived)
+    ended = time.monotonic_ns()
+    # Drain the trailer so a keep-alive connection is left ready for reuse.
+    lines.append(resp.read().decode(errors="replace"))
+    body = "".join(lines)
+    if not stamps:
+        return body, None
+    return body, StreamTiming(
+        ttft_ms=round((stamps[0] - started_ns) / _NS_PER_MS, 3),
+        itl_ms=tuple(round((b - a) / _NS_PER_MS, 3) for a, b in itertools.pairwise(stamps)),
+        total_ms=round((ended - started_ns) / _NS_PER_MS, 3),
+    )
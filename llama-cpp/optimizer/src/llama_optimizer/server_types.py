@@ -43,10 +43,31 @@ class EligibilityStatus(StrEnum):
 
 @dataclass(frozen=True, slots=True)
 class RequestSpec:
-    """One versioned workload request specification."""
+    """One versioned workload request specification.
+
+    Without a source the spec name itself is the prompt. ``corpus`` names a
+    versioned corpus JSONL whose prompts are sampled deterministically from
+    ``seed``; ``trace`` names a captured JSONL trace replayed in order with
+    its own prompt lengths, ``max_tokens`` and inter-arrival gaps (see
+    :mod:`llama_optimizer.server_payloads`). ``max_tokens`` caps every
+    non-trace completion.
+    """
 
     name: str
     kind: RequestKind
+    corpus: str = ""
+    trace: str = ""
+    max_tokens: int = 100
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the prompt source and completion cap."""
+        if self.corpus and self.trace:
+            msg = f"request spec {self.name!r} may name a corpus or a trace, not both"
+            raise ValueError(msg)
+        if self.max_tokens < 1:
+            msg = f"max_tokens must be >= 1, got {self.max_tokens}"
+            raise ValueError(msg)
 
 
 @dataclass(frozen=True, slots=True)
@@ -68,11 +89,59 @@ class ServerIdentity:
     n_threads: int
     flash_attn: int
     use_mmap: bool
+    split_mode: str = "layer"
+    tensor_split: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSweepConfig:
+    """Open-loop arrival-rate sweep searching the knee of a TTFT SLO.
+
+    Each step sends ``step_requests`` requests at seeded Poisson arrivals (or
+    at ``trace_gaps`` inter-arrival gaps rescaled to the step's rate). After
+    probing both rate bounds, ``search_steps`` bisections narrow the highest
+    rate whose client p95 TTFT stays within ``slo_ttft_ms_p95`` and whose
+    error rate stays within ``max_error_rate``.
+    """
+
+    slo_ttft_ms_p95: float
+    min_qps: float = 0.5
+    max_qps: float = 8.0
+    step_requests: int = 20
+    search_steps: int = 4
+    max_error_rate: float = 0.0
+    seed: int = 0
+    trace_gaps: tuple[float, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Validate the SLO, rate bounds, step size, and trace gaps."""
+        if self.slo_ttft_ms_p95 <= 0:
+            msg = f"slo_ttft_ms_p95 must be > 0, got {self.slo_ttft_ms_p95}"
+            raise ValueError(msg)
+        if not 0 < self.min_qps < self.max_qps:
+            msg = f"need 0 < min_qps < max_qps, got {self.min_qps} and {self.max_qps}"
+            raise ValueError(msg)
+        if self.step_requests < 1 or self.search_steps < 0:
+            msg = "step_requests must be >= 1 and search_steps >= 0"
+            raise ValueError(msg)
+        if any(gap < 0 for gap in self.trace_gaps) or (
+            self.trace_gaps and sum(self.trace_gaps) == 0
+        ):
+            msg = "trace_gaps must be non-negative with a positive total"
+            raise ValueError(msg)
 
 
 @dataclass(frozen=True, slots=True)
 class ServerConfig:
-    """Bounded finalist configuration (context enforced at 32768, warmup on)."""
+    """Bounded finalist configuration (context enforced at 32768, warmup on).
+
+    ``stream`` dispatches every request as an SSE stream so finalists rank on
+    client-observed TTFT and inter-token latency rather than server aggregates.
+    ``load`` adds an open-loop rate sweep after the measured sequence; it
+    needs ``stream`` to observe TTFT. A non-empty ``slot_sweep`` relaunches
+    each finalist once per listed ``--parallel`` slot count (overriding
+    ``parallel``) with the total context still pinned at 32768.
+    """
 
     repetitions: int
     delay_seconds: int
@@ -80,6 +149,9 @@ class ServerConfig:
     readiness_timeout_seconds: int
     cooldown_seconds: int
     request_specs: tuple[RequestSpec, ...]
+    stream: bool = False
+    load: LoadSweepConfig | None = None
+    slot_sweep: tuple[int, ...] = ()
 
     def __post_init__(self) -> None:
         """Validate repetitions, delay, parallel, readiness, cooldown, specs."""
@@ -101,6 +173,12 @@ class ServerConfig:
         if not self.request_specs:
             msg = "at least one request spec is required"
             raise ValueError(msg)
+        if any(n < 1 for n in self.slot_sweep) or len(set(self.slot_sweep)) != len(self.slot_sweep):
+            msg = f"slot_sweep must list distinct counts >= 1, got {self.slot_sweep}"
+            raise ValueError(msg)
+        if self.load is not None and not self.stream:
+            msg = "a load sweep requires stream=True to observe TTFT"
+            raise ValueError(msg)
 
     @property
     def context_size(self) -> int:
@@ -169,6 +247,7 @@ class FinalistRequest:
     config: ServerConfig
     binary: str
     output_dir: Path
+    chrome_trace: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -226,6 +305,11 @@ class MetricsParseError(ServerError):
     """Server metrics artifact was missing or malformed."""
 
 
+@dataclass
+class PayloadSourceError(ServerError):
+    """A request spec's corpus or trace file was missing or malformed."""
+
+
 @dataclass
 class ServerIdentityMismatchError(ServerError):
     """Server metrics identity fields did not match the requested identity."""
@@ -0,0 +1,170 @@
+"""Simulated ``llama-bench`` executable driven by :mod:`llama_optimizer.sim_model` (T6).
+
+Accepts the argv :func:`~llama_optimizer.bench_command.build_sweep_command`
+builds (comma-separated per-config lists, ``-d`` depth lists, ``-p``/``-n``
+workload pairs) and prints one JSONL line per (config, depth, workload) in the
+schema :func:`~llama_optimizer.bench_parser.parse_bench_jsonl` expects, with
+``-r`` seeded samples per line. A config the model cannot load (out of VRAM at
+the deepest requested depth, or an injected crash) fails the whole process
+with exit status 1 and a message on stderr, as the real binary does.
+
+Run it as ``llama-sim-bench`` (or ``python -m llama_optimizer.sim_bench``)
+with :data:`~llama_optimizer.sim_model.SIM_CONTROL_ENV` naming the control
+file; ``time_scale`` > 0 makes it sleep for the simulated duration.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING, Final
+
+from llama_optimizer.bench_types import BenchIdentity
+from llama_optimizer.sim_model import load_sim_control, next_launch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.sim_model import SimModel
+
+_NS_PER_SECOND: Final[int] = 1_000_000_000
+_SWEEP_FLAGS: Final[tuple[str, ...]] = ("-ngl", "-b", "-ub", "-ctk", "-ctv", "-t", "-fa")
+_DEFAULTS: Final[dict[str, str]] = {
+    "-r": "5",
+    "-d": "0",
+    "-m": "model.gguf",
+    "-ngl": "99",
+    "-b": "2048",
+    "-ub": "512",
+    "-ctk": "f16",
+    "-ctv": "f16",
+    "-t": "16",
+    "-fa": "off",
+    "-mmp": "1",
+    "-sm": "layer",
+    "-ts": "",
+    "-p": "512",
+    "-n": "128",
+}
+
+
+def _flags(argv: Sequence[str]) -> dict[str, str]:
+    """Return every known flag's value from ``argv``, falling back to the defaults."""
+    values = dict(_DEFAULTS)
+    for flag, value in itertools.pairwise(argv):
+        if flag in values:
+            values[flag] = value
+    return values
+
+
+def _identities(flags: dict[str, str]) -> list[BenchIdentity]:
+    """Expand the per-config flag lists into their cartesian product."""
+    lists = [flags[f].split(",") for f in _SWEEP_FLAGS]
+    return [
+        BenchIdentity(
+            model_filename=flags["-m"],
+            n_gpu_layers=int(ngl),
+            n_batch=int(batch),
+            n_ubatch=int(ubatch),
+            type_k=type_k,
+            type_v=type_v,
+            n_threads=int(threads),
+            flash_attn=1 if fa in {"on", "1"} else 0,
+            use_mmap=flags["-mmp"] == "1",
+            split_mode=flags["-sm"],
+            tensor_split=flags["-ts"],
+        )
+        for ngl, batch, ubatch, type_k, type_v, threads, fa in itertools.product(*lists)
+    ]
+
+
+def _workloads(flags: dict[str, str]) -> list[tuple[str, int, int]]:
+    """Return ``(name, n_prompt, n_gen)`` for each prompt-only and generation-only test."""
+    prompts = [int(p) for p in flags["-p"].split(",") if int(p) > 0]
+    gens = [int(n) for n in flags["-n"].split(",") if int(n) > 0]
+    return [(f"pp{p}", p, 0) for p in prompts] + [(f"tg{n}", 0, n) for n in gens]
+
+
+def bench_lines(
+    model: SimModel, flags: dict[str, str], launch: int
+) -> tuple[list[str], float, str | None]:
+    """Return the JSONL lines, simulated seconds, and any load failure of one run."""
+    depths = [int(d) for d in flags["-d"].split(",")]
+    repetitions = int(flags["-r"])
+    lines: list[str] = []
+    seconds = 0.0
+    for identity in _identities(flags):
+        reason = model.failure(identity, max(depths), launch)
+        if reason is not None:
+            return lines, seconds, reason
+        for depth, (name, n_prompt, n_gen) in itertools.product(depths, _workloads(flags)):
+            rate = (model.pp_ts if n_gen == 0 else model.tg_ts)(identity, depth, launch)
+            stream = model.stream(identity, launch, f"{name}@{depth}")
+            samples_ts = model.noisy(rate, repetitions, stream)
+            seconds += sum((n_prompt + n_gen) / ts for ts in samples_ts)
+            lines.append(_line(model, identity, (name, n_prompt, n_gen, depth), samples_ts))
+        seconds += model.load_seconds
+    return lines, seconds, None
+
+
+def _line(
+    model: SimModel,
+    identity: BenchIdentity,
+    test: tuple[str, int, int, int],
+    samples_ts: list[float],
+) -> str:
+    """Render one llama-bench JSONL record."""
+    name, n_prompt, n_gen, depth = test
+    tokens = n_prompt + n_gen
+    samples_ns = [round(tokens / ts * _NS_PER_SECOND) for ts in samples_ts]
+    spread = len(samples_ts) > 1
+    return json.dumps(
+        {
+            "build": model.build,
+            "model": identity.model_filename,
+            "name": name,
+            "n_gpu_layers": identity.n_gpu_layers,
+            "n_batch": identity.n_batch,
+            "n_ubatch": identity.n_ubatch,
+            "type_k": identity.type_k,
+            "type_v": identity.type_v,
+            "n_threads": identity.n_threads,
+            "flash_attn": identity.flash_attn,
+            "use_mmap": identity.use_mmap,
+            "split_mode": identity.split_mode,
+            "tensor_split": identity.tensor_split,
+            "n_prompt": n_prompt,
+            "n_gen": n_gen,
+            "n_depth": depth,
+            "avg_ts": statistics.fmean(samples_ts),
+            "stddev_ts": statistics.stdev(samples_ts) if spread else 0.0,
+            "avg_ns": round(statistics.fmean(samples_ns)),
+            "stddev_ns": round(statistics.stdev(samples_ns)) if spread else 0,
+            "samples_ns": samples_ns,
+            "samples_ts": samples_ts,
+        }
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run one simulated llama-bench process and return its exit status."""
+    control = load_sim_control()
+    launch = next_launch(control.state_path)
+    lines, seconds, reason = bench_lines(
+        control.model, _flags(sys.argv[1:] if argv is None else argv), launch
+    )
+    if control.time_scale > 0:
+        time.sleep(seconds * control.time_scale)
+    if lines:
+        _ = sys.stdout.write("".join(line + "\n" for line in lines))
+    if reason is not None:
+        _ = sys.stderr.write(f"error: {reason}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
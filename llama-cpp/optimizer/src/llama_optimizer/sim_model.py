@@ -0,0 +1,268 @@
+"""Parametric llama.cpp performance and VRAM model for offline simulation (T6/T9).
+
+The simulated ``llama-bench`` (:mod:`llama_optimizer.sim_bench`) and
+``llama-server`` (:mod:`llama_optimizer.sim_server`) executables and the
+in-process search harness (:mod:`llama_optimizer.sim_search`) all score a
+config through this one model, so the search strategy can be benchmarked
+without a GPU. The model is deliberately coarse but keeps the trade-offs the
+optimizer has to find:
+
+* VRAM is the offloaded share of the weights and of the KV cache at the
+  measured depth (K and V scaled by their cache type), plus a compute buffer
+  that grows with ``n_ubatch`` and halves with flash attention. A config that
+  does not fit fails to load, as llama.cpp does.
+* Prompt processing saturates with ``n_ubatch`` (capped by ``n_batch``), gains
+  from flash attention, and slows with depth. Token generation is bound by the
+  bytes read per token (weights plus KV cache), so quantized KV trades quality
+  for speed at depth. Layers left on the CPU cost ``cpu_slowdown`` GPU layers
+  each, scaled by the thread count.
+* Every launch advances a persisted launch counter; throughput decays by
+  ``drift_per_launch`` per launch (thermal drift), samples carry seeded
+  ``noise_rel`` noise, and ``crash_rate`` injects load failures.
+
+Noise and failures are drawn from :mod:`llama_optimizer.seeded_lcg`, seeded
+from the model seed, the config, and the launch number, so a given launch
+sequence reproduces bit for bit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from itertools import islice
+from pathlib import Path
+from typing import Final, Protocol, TypeIs
+
+from llama_optimizer.seeded_lcg import LCG_RANGE, lcg_draws, lcg_unit
+from llama_optimizer.server_json import loads_mapping
+
+#: Environment variable naming the simulator's JSON control file.
+SIM_CONTROL_ENV: Final[str] = "LLAMA_SIM_CONTROL"
+_INT_PARAMS: Final = frozenset(
+    {"seed", "build", "n_layers", "weights_bytes", "kv_bytes_per_token", "vram_total"}
+)
+_KV_SCALE: Final[Mapping[str, float]] = {"f16": 1.0, "q8_0": 0.53125, "q4_0": 0.28125}
+_UBATCH_KNEE: Final[int] = 128
+_REFERENCE_UBATCH: Final[int] = 512
+_REFERENCE_THREADS: Final[int] = 16
+_FA_PP_GAIN: Final[float] = 1.08
+_FA_TG_GAIN: Final[float] = 1.03
+_COMPUTE_BYTES_PER_UBATCH: Final[int] = 1_000_000
+_FIXED_OVERHEAD_BYTES: Final[int] = 300_000_000
+
+
+class RuntimeKnobs(Protocol):
+    """The runtime fields :class:`BenchIdentity` and :class:`ServerIdentity` share."""
+
+    @property
+    def model_filename(self) -> str:
+        """Model file the config loads."""
+        ...
+
+    @property
+    def n_gpu_layers(self) -> int:
+        """Layers offloaded to the GPU."""
+        ...
+
+    @property
+    def n_batch(self) -> int:
+        """Logical batch size."""
+        ...
+
+    @property
+    def n_ubatch(self) -> int:
+        """Physical micro-batch size."""
+        ...
+
+    @property
+    def type_k(self) -> str:
+        """K cache type."""
+        ...
+
+    @property
+    def type_v(self) -> str:
+        """V cache type."""
+        ...
+
+    @property
+    def n_threads(self) -> int:
+        """CPU threads."""
+        ...
+
+    @property
+    def flash_attn(self) -> int:
+        """Flash attention flag (1 on, 0 off)."""
+        ...
+
+
+@dataclass
+class SimControlError(ValueError):
+    """The simulator control file is missing, malformed, or mistyped."""
+
+    reason: str
+
+    def __post_init__(self) -> None:
+        """Populate the base ``ValueError`` message so ``str()`` is never empty."""
+        Exception.__init__(self, self.reason)
+
+
+@dataclass(frozen=True, slots=True)
+class SimModel:
+    """Parameters of the simulated model and card (defaults: a 9B Q4_K_M on 16 GiB)."""
+
+    seed: int = 0
+    build: int = 4000
+    n_layers: int = 40
+    weights_bytes: int = 5_700_000_000
+    kv_bytes_per_token: int = 131_072
+    vram_total: int = 17_163_091_968
+    pp_peak_ts: float = 2600.0
+    tg_peak_ts: float = 48.0
+    cpu_slowdown: float = 12.0
+    noise_rel: float = 0.01
+    drift_per_launch: float = 0.0
+    crash_rate: float = 0.0
+    load_seconds: float = 3.0
+
+    def vram_bytes(self, knobs: RuntimeKnobs, depth: int) -> int:
+        """Return the VRAM a config needs with ``depth`` tokens of KV cache."""
+        kv_scale = (_kv_scale(knobs.type_k) + _kv_scale(knobs.type_v)) / 2
+        kv = self.kv_bytes_per_token * kv_scale * depth
+        compute = knobs.n_ubatch * _COMPUTE_BYTES_PER_UBATCH / (2 if knobs.flash_attn else 1)
+        offloaded = (self.weights_bytes + kv) * self._offload(knobs)
+        return round(offloaded + compute + _FIXED_OVERHEAD_BYTES)
+
+    def pp_ts(self, knobs: RuntimeKnobs, depth: int, launch: int = 0) -> float:
+        """Return the noise-free prompt-processing rate at ``depth``."""
+        ubatch = min(knobs.n_ubatch, knobs.n_batch)
+        saturation = ubatch / (ubatch + _UBATCH_KNEE) * (1 + _UBATCH_KNEE / _REFERENCE_UBATCH)
+        fa = _FA_PP_GAIN if knobs.flash_attn else 1.0
+        attention = 1 + depth / (2 * self._depth_scale(knobs))
+        rate = self.pp_peak_ts * saturation * fa / attention
+        return rate * self._speed(knobs) * self._drift(launch)
+
+    def tg_ts(self, knobs: RuntimeKnobs, depth: int, launch: int = 0) -> float:
+        """Return the noise-free token-generation rate at ``depth``."""
+        kv_scale = (_kv_scale(knobs.type_k) + _kv_scale(knobs.type_v)) / 2
+        read = self.weights_bytes + self.kv_bytes_per_token * kv_scale * depth
+        fa = _FA_TG_GAIN if knobs.flash_attn else 1.0
+        rate = self.tg_peak_ts * self.weights_bytes / read * fa
+        return rate * self._speed(knobs) * self._drift(launch)
+
+    def failure(self, knobs: RuntimeKnobs, depth: int, launch: int) -> str | None:
+        """Return why this launch fails to load (out of memory or injected), or ``None``."""
+        need = self.vram_bytes(knobs, depth)
+        if need > self.vram_total:
+            return f"out of memory: need {need} bytes, card has {self.vram_total}"
+        if self.crash_rate > 0 and lcg_unit(self.stream(knobs, launch, "crash")) < self.crash_rate:
+            return "injected crash while loading the model"
+        return None
+
+    def noisy(self, mean: float, count: int, stream: int) -> list[float]:
+        """Return ``count`` samples of ``mean`` with seeded relative noise."""
+        draws = islice(lcg_draws(stream), count)
+        return [mean * (1 + self.noise_rel * (2 * draw / LCG_RANGE - 1)) for draw in draws]
+
+    def stream(self, knobs: RuntimeKnobs, launch: int, label: str) -> int:
+        """Return the LCG seed for one labelled draw of one config in one launch."""
+        key = f"{self.seed}|{_knob_key(knobs)}|{launch}|{label}"
+        return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+    def _offload(self, knobs: RuntimeKnobs) -> float:
+        return min(knobs.n_gpu_layers, self.n_layers) / self.n_layers
+
+    def _speed(self, knobs: RuntimeKnobs) -> float:
+        cpu_share = 1 - self._offload(knobs)
+        threads = _REFERENCE_THREADS / max(knobs.n_threads, 1)
+        return 1 / (1 - cpu_share + cpu_share * self.cpu_slowdown * threads)
+
+    def _depth_scale(self, knobs: RuntimeKnobs) -> int:
+        return 32768 if knobs.flash_attn else 16384
+
+    def _drift(self, launch: int) -> float:
+        return (1 - self.drift_per_launch) ** launch
+
+
+@dataclass(frozen=True, slots=True)
+class SimControl:
+    """Everything a simulated executable reads from its control file.
+
+    ``state_path`` persists the launch counter across processes (no drift or
+    per-launch noise without it). The server writes its artifacts under
+    ``output_dirs[<model file name>]`` when present, else ``output_dir``, with
+    any ``{parallel}`` replaced by the launch's slot count;
+    ``time_scale`` multiplies simulated seconds into real sleeps.
+    """
+
+    model: SimModel
+    state_path: Path | None = None
+    output_dir: Path = Path()
+    output_dirs: Mapping[str, str] | None = None
+    backend: str = "rocm"
+    time_scale: float = 0.0
+
+
+def load_sim_control() -> SimControl:
+    """Load :class:`SimControl` from the file named by :data:`SIM_CONTROL_ENV`."""
+    path = os.environ.get(SIM_CONTROL_ENV)
+    if not path:
+        return SimControl(SimModel())
+    raw = loads_mapping(Path(path).read_text(), error=SimControlError)
+    model = raw.get("model", {})
+    dirs = raw.get("output_dirs")
+    state = raw.get("state_path")
+    return SimControl(
+        model=sim_model_from(model) if _is_mapping(model) else SimModel(),
+        state_path=Path(state) if isinstance(state, str) else None,
+        output_dir=Path(str(raw.get("output_dir", "."))),
+        output_dirs={str(k): str(v) for k, v in dirs.items()} if _is_mapping(dirs) else None,
+        backend=str(raw.get("backend", "rocm")),
+        time_scale=float(str(raw.get("time_scale", 0.0))),
+    )
+
+
+def sim_model_from(raw: Mapping[str, object]) -> SimModel:
+    """Build a :class:`SimModel`, overriding the defaults with ``raw``."""
+    names = {f.name for f in fields(SimModel)}
+    changes: dict[str, int | float] = {}
+    for name, value in raw.items():
+        if name not in names or isinstance(value, bool) or not isinstance(value, int | float):
+            raise SimControlError(reason=f"unknown or non-numeric simulator parameter {name!r}")
+        changes[name] = int(value) if name in _INT_PARAMS else float(value)
+    return replace(SimModel(), **changes)
+
+
+def next_launch(state_path: Path | None) -> int:
+    """Return this process's launch number and advance the persisted counter."""
+    if state_path is None:
+        return 0
+    launch = int(state_path.read_text() or "0") if state_path.exists() else 0
+    _ = state_path.write_text(str(launch + 1))
+    return launch
+
+
+def _is_mapping(value: object) -> TypeIs[Mapping[str, object]]:
+    """Narrow ``object`` to a fully-typed string-keyed mapping."""
+    return isinstance(value, Mapping)
+
+
+def _kv_scale(cache_type: str) -> float:
+    return _KV_SCALE.get(cache_type, 1.0)
+
+
+def _knob_key(knobs: RuntimeKnobs) -> str:
+    return "|".join(
+        str(v)
+        for v in (
+            knobs.model_filename,
+            knobs.n_gpu_layers,
+            knobs.n_batch,
+            knobs.n_ubatch,
+            knobs.type_k,
+            knobs.type_v,
+            knobs.n_threads,
+            knobs.flash_attn,
+        )
+    )
@@ -0,0 +1,185 @@
+"""In-process simulated search for benchmarking optimizer strategies offline (T7).
+
+:func:`simulate_search` drives an Optuna study over a real
+:class:`~llama_optimizer.search_space.SearchSpace` with any sampler (and
+optionally a pruner), scoring each suggested config with
+:class:`~llama_optimizer.sim_model.SimModel` instead of launching
+llama-bench, so thousands of trials take seconds. Every trial charges the
+simulated wall time a real screen would cost: the model load plus, for each
+repetition of each workload, the prefill to the context depth and the timed
+test itself (and the inter-repetition delay). Configs that do not fit in VRAM
+fail after the load; configs breaking ``ubatch <= batch`` fail for free.
+
+With a pruner each tracked-workload repetition is reported as an intermediate
+value, and a pruned trial stops charging time at that repetition. The result
+records the best-so-far trajectory against the noise-free optimum of the
+whole space (found by enumeration), so strategies compare on
+:meth:`SimSearchResult.time_to_best`.
+
+Search dimensions map onto the model by id (``gpu_layers``, ``batch``,
+``ubatch``, ``kv_cache_types``, ``threads``, ``flash_attention``); any other
+dimension is suggested but does not affect the simulated performance.
+"""
+
+from __future__ import annotations
+
+import itertools
+import statistics
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import optuna
+
+from llama_optimizer.bench_types import DEFAULT_BENCH_CONFIG, TG128, BenchIdentity
+from llama_optimizer.search_space import (
+    UbatchExceedsBatchError,
+    dimension_values,
+    suggest_dimension,
+    validate_applicability,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from llama_optimizer.bench_types import BenchConfig, BenchWorkload
+    from llama_optimizer.search_space import DiscreteValue, SearchSpace
+    from llama_optimizer.sim_model import SimModel
+
+
+@dataclass(frozen=True, slots=True)
+class SimTrial:
+    """One simulated trial: its config, score (``None`` if it failed or was pruned), and clock."""
+
+    number: int
+    config: Mapping[str, DiscreteValue]
+    value: float | None
+    elapsed_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class SimSearchResult:
+    """Every simulated trial in order and the noise-free optimum of the space."""
+
+    trials: tuple[SimTrial, ...]
+    optimum: float
+
+    def time_to_best(self, tolerance: float = 0.01) -> float | None:
+        """Return the simulated seconds until a trial scored within ``tolerance`` of the optimum."""
+        target = self.optimum * (1 - tolerance)
+        for trial in self.trials:
+            if trial.value is not None and trial.value >= target:
+                return trial.elapsed_seconds
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class SimSearchPlan:
+    """Trial budget, screening config, scored workload, and the simulated model file."""
+
+    trials: int
+    bench_config: BenchConfig = DEFAULT_BENCH_CONFIG
+    workload: BenchWorkload = TG128
+    model_filename: str = "model.gguf"
+
+
+def identity_for(config: Mapping[str, DiscreteValue], model_filename: str) -> BenchIdentity:
+    """Map a suggested search config onto the bench identity the model scores."""
+
+    def pick(key: str, default: int) -> int:
+        value = config.get(key, default)
+        return int(value) if isinstance(value, int) else default
+
+    kv = str(config.get("kv_cache_types", "f16"))
+    return BenchIdentity(
+        model_filename=model_filename,
+        n_gpu_layers=pick("gpu_layers", 99),
+        n_batch=pick("batch", 2048),
+        n_ubatch=pick("ubatch", 512),
+        type_k=kv,
+        type_v=kv,
+        n_threads=pick("threads", 16),
+        flash_attn=1 if config.get("flash_attention", True) else 0,
+        use_mmap=True,
+    )
+
+
+def _rate(model: SimModel, identity: BenchIdentity, workload: BenchWorkload, launch: int) -> float:
+    depth = DEFAULT_BENCH_CONFIG.context_size
+    rate = model.tg_ts if workload.n_gen else model.pp_ts
+    return rate(identity, depth, launch)
+
+
+def _trial_seconds(model: SimModel, identity: BenchIdentity, config: BenchConfig) -> float:
+    """Return the wall time of one repetition of every workload, prefill included."""
+    prefill = config.context_size / model.pp_ts(identity, 0)
+    tests = sum((w.n_prompt + w.n_gen) / _rate(model, identity, w, 0) for w in config.workloads)
+    return len(config.workloads) * (prefill + config.delay_seconds) + tests
+
+
+def simulated_optimum(space: SearchSpace, model: SimModel, plan: SimSearchPlan) -> float:
+    """Return the best noise-free score of any loadable, applicable config in ``space``."""
+    ids = [str(d.dimension_id) for d in space.dimensions]
+    best = 0.0
+    for values in itertools.product(*(dimension_values(d) for d in space.dimensions)):
+        config = dict(zip(ids, values, strict=True))
+        identity = identity_for(config, plan.model_filename)
+        if identity.n_ubatch > identity.n_batch:
+            continue
+        if model.vram_bytes(identity, plan.bench_config.context_size) <= model.vram_total:
+            best = max(best, _rate(model, identity, plan.workload, 0))
+    return best
+
+
+def simulate_search(
+    space: SearchSpace,
+    model: SimModel,
+    plan: SimSearchPlan,
+    sampler: optuna.samplers.BaseSampler,
+    pruner: optuna.pruners.BasePruner | None = None,
+) -> SimSearchResult:
+    """Run ``plan.trials`` simulated screening trials and return their trajectory."""
+    study = optuna.create_study(direction="maximize", sampler=sampler, pruner=pruner)
+    elapsed = 0.0
+    trials: list[SimTrial] = []
+    for launch in range(plan.trials):
+        trial = study.ask()
+        config = {str(d.dimension_id): suggest_dimension(trial, d) for d in space.dimensions}
+        identity = identity_for(config, plan.model_filename)
+        value: float | None = None
+        try:
+            _ = validate_applicability(space, config)
+        except UbatchExceedsBatchError:
+            _ = study.tell(trial, state=optuna.trial.TrialState.FAIL)
+            trials.append(SimTrial(launch, config, None, elapsed))
+            continue
+        elapsed += model.load_seconds
+        if model.failure(identity, plan.bench_config.context_size, launch) is not None:
+            _ = study.tell(trial, state=optuna.trial.TrialState.FAIL)
+        else:
+            value, seconds = _screen(model, identity, plan, (trial, launch))
+            elapsed += seconds
+            if value is None:
+                _ = study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+            else:
+                _ = study.tell(trial, value)
+        trials.append(SimTrial(launch, config, value, elapsed))
+    return SimSearchResult(tuple(trials), simulated_optimum(space, model, plan))
+
+
+def _screen(
+    model: SimModel,
+    identity: BenchIdentity,
+    plan: SimSearchPlan,
+    trial_launch: tuple[optuna.Trial, int],
+) -> tuple[float | None, float]:
+    """Charge repetitions one by one; return the mean score (``None`` if pruned) and time."""
+    trial, launch = trial_launch
+    mean = _rate(model, identity, plan.workload, launch)
+    stream = model.stream(identity, launch, plan.workload.name)
+    samples = model.noisy(mean, plan.bench_config.repetitions, stream)
+    per_repetition = _trial_seconds(model, identity, plan.bench_config)
+    for step in range(len(samples)):
+        trial.report(statistics.fmean(samples[: step + 1]), step)
+        if trial.should_prune():
+            return None, per_repetition * (step + 1)
+    return statistics.fmean(samples), per_repetition * len(samples)
@@ -0,0 +1,304 @@
+"""Simulated ``llama-server`` executable driven by :mod:`llama_optimizer.sim_model` (T9).
+
+Accepts the argv :func:`~llama_optimizer.server_command.build_server_command`
+builds and follows the finalist artifact contract the T9 runner and
+:mod:`llama_optimizer.server_parser` read from the control file's output
+directory: ``port.txt`` once bound, ``readiness.json`` after the simulated
+load, and ``responses.jsonl`` plus ``metrics.json`` rewritten (atomically)
+after every served ``POST /v1/chat/completions``. It serves until the
+supervisor terminates its process group.
+
+Each request's TTFT is its prompt (the serialized messages at roughly four
+characters per token, plus a fixed chat-template overhead) at the model's
+prompt rate; its latency adds ``max_tokens`` at the generation rate, both at
+the full 32768-token context depth and with seeded per-request noise. A
+config the model cannot load exits 1 before binding, as the real binary does.
+
+A request with ``"stream": true`` is answered as a chunked SSE stream of
+``max_tokens`` delta events (paced by ``time_scale``) followed by
+``data: [DONE]``, like llama-server's OpenAI-compatible streaming. Requests
+beyond ``--parallel`` wait for a free slot, as llama-server queues them, so
+open-loop load shows the TTFT knee. Requests decoding together share a
+batch: each decodes more slowly, but the aggregate rate still grows
+sublinearly with the number in flight.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Final, override
+
+from llama_optimizer.ledger_io import atomic_publish
+from llama_optimizer.profile_manifest import REQUIRED_CONTEXT_SIZE
+from llama_optimizer.server_json import loads_mapping
+from llama_optimizer.server_types import ServerIdentity
+from llama_optimizer.sim_model import SimControlError, load_sim_control, next_launch
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from llama_optimizer.sim_model import SimControl
+
+_CHARS_PER_TOKEN: Final[int] = 4
+_TEMPLATE_TOKENS: Final[int] = 32
+_DEFAULT_MAX_TOKENS: Final[int] = 100
+_MS_PER_SECOND: Final[float] = 1000.0
+# Aggregate decode rate grows as (concurrent requests) ** _BATCH_SCALING.
+_BATCH_SCALING: Final[float] = 0.6
+_RESPONSE_TEXT: Final[str] = "def solve():\n    return 42"
+_DEFAULTS: Final[dict[str, str]] = {
+    "-m": "model.gguf",
+    "-ngl": "99",
+    "-b": "2048",
+    "-ub": "512",
+    "-ctk": "f16",
+    "-ctv": "f16",
+    "-t": "16",
+    "-fa": "off",
+    "-mmp": "1",
+    "-sm": "layer",
+    "-ts": "",
+    "--parallel": "1",
+    "--port": "0",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Completion:
+    """One simulated completion: its request, token counts, and timings (ms)."""
+
+    request: Mapping[str, object]
+    n_prompt: int
+    n_gen: int
+    ttft_ms: float
+    latency_ms: float
+
+    @property
+    def stream(self) -> bool:
+        """Whether the client asked for an SSE stream."""
+        return self.request.get("stream") is True
+
+    def payload(self) -> bytes:
+        """Return the non-streaming chat-completion response body."""
+        message = {"role": "assistant", "content": _RESPONSE_TEXT}
+        usage = {"prompt_tokens": self.n_prompt, "completion_tokens": self.n_gen}
+        return json.dumps({"choices": [{"message": message}], "usage": usage}).encode()
+
+
+def _identity(argv: Sequence[str], backend: str) -> tuple[ServerIdentity, int, int]:
+    """Return the served identity, slot count, and requested port from ``argv``."""
+    flags = dict(_DEFAULTS)
+    for index, flag in enumerate(argv[:-1]):
+        if flag in flags:
+            flags[flag] = argv[index + 1]
+    identity = ServerIdentity(
+        model_filename=Path(flags["-m"]).name,
+        backend=backend,
+        build_label="sim",
+        n_gpu_layers=int(flags["-ngl"]),
+        n_batch=int(flags["-b"]),
+        n_ubatch=int(flags["-ub"]),
+        type_k=flags["-ctk"],
+        type_v=flags["-ctv"],
+        n_threads=int(flags["-t"]),
+        flash_attn=1 if flags["-fa"] in {"on", "1"} else 0,
+        use_mmap=flags["-mmp"] == "1",
+        split_mode=flags["-sm"],
+        tensor_split=flags["-ts"].replace(",", "/"),
+    )
+    return identity, int(flags["--parallel"]), int(flags["--port"])
+
+
+class _SimHttpServer(ThreadingHTTPServer):
+    """HTTP server holding the simulated identity and the served-request log."""
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        control: SimControl,
+        identity: ServerIdentity,
+        launch_slots: tuple[int, int],
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.control: SimControl = control
+        self.identity: ServerIdentity = identity
+        self.launch: int = launch_slots[0]
+        self.slots: int = launch_slots[1]
+        self.output_dir: Path = _output_dir(control, identity.model_filename, self.slots)
+        self.lock: threading.Lock = threading.Lock()
+        self.responses: list[dict[str, object]] = []
+        self.active: int = 0
+        self.started: int = 0
+        self.slot_gate: threading.Semaphore = threading.Semaphore(max(1, self.slots))
+        self.max_concurrent: int = 0
+
+    def begin(self, body: bytes) -> _Completion:
+        """Simulate one completion's timing and mark it in flight."""
+        request = loads_mapping(body.decode(errors="replace"), error=SimControlError)
+        max_tokens = request.get("max_tokens", _DEFAULT_MAX_TOKENS)
+        n_gen = max_tokens if isinstance(max_tokens, int) else _DEFAULT_MAX_TOKENS
+        n_prompt = len(json.dumps(request.get("messages", []))) // _CHARS_PER_TOKEN
+        model, depth = self.control.model, int(REQUIRED_CONTEXT_SIZE)
+        with self.lock:
+            index = self.started
+            self.started += 1
+            self.active += 1
+            self.max_concurrent = max(self.max_concurrent, self.active)
+            batched = self.active
+        stream = model.stream(self.identity, self.launch, f"request{index}")
+        noise = model.noisy(1.0, 2, stream)
+        pp = model.pp_ts(self.identity, depth, self.launch) * noise[0]
+        tg = model.tg_ts(self.identity, depth, self.launch) * noise[1]
+        tg *= math.pow(batched, _BATCH_SCALING - 1)
+        ttft = (n_prompt + _TEMPLATE_TOKENS) / pp * _MS_PER_SECOND
+        latency = ttft + n_gen / tg * _MS_PER_SECOND
+        return _Completion(request, n_prompt + _TEMPLATE_TOKENS, n_gen, ttft, latency)
+
+    def pause(self, ms: float) -> None:
+        """Sleep for ``ms`` simulated milliseconds scaled by ``time_scale``."""
+        if self.control.time_scale > 0:
+            time.sleep(ms / _MS_PER_SECOND * self.control.time_scale)
+
+    def finish(self, completion: _Completion) -> None:
+        """Record a served completion and republish the artifacts."""
+        with self.lock:
+            self.active -= 1
+            self.responses.append(
+                {
+                    "index": len(self.responses),
+                    "response": _RESPONSE_TEXT,
+                    "ttft_ms": completion.ttft_ms,
+                    "latency_ms": completion.latency_ms,
+                    "quality_pass": True,
+                    "request_body": completion.request,
+                }
+            )
+            self._publish()
+
+    def _publish(self) -> None:
+        """Rewrite ``responses.jsonl`` and the aggregate ``metrics.json`` (lock held)."""
+        lines = "".join(json.dumps(r) + "\n" for r in self.responses)
+        atomic_publish(self.output_dir / "responses.jsonl", lines.encode())
+        ttft = [_number(r["ttft_ms"]) for r in self.responses]
+        latency = [_number(r["latency_ms"]) for r in self.responses]
+        depth = int(REQUIRED_CONTEXT_SIZE)
+        metrics = {
+            "model": self.identity.model_filename,
+            "backend": self.identity.backend,
+            "slots": self.slots,
+            "prompt_throughput": self.control.model.pp_ts(self.identity, depth, self.launch),
+            "generation_throughput": self.control.model.tg_ts(self.identity, depth, self.launch),
+            "ttft_ms": ttft,
+            "request_latency_ms": latency,
+            "errors": 0,
+            "quality_pass": True,
+            "max_concurrent": self.max_concurrent,
+            "parallel": self.slots,
+        }
+        atomic_publish(self.output_dir / "metrics.json", json.dumps(metrics).encode())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Chat-completion handler timed by :meth:`_SimHttpServer.begin`."""
+
+    protocol_version: str = "HTTP/1.1"
+    # Send each SSE event as written rather than coalescing small writes.
+    disable_nagle_algorithm: ClassVar[bool] = True
+
+    def do_POST(self) -> None:
+        """Serve one simulated completion."""
+        server = self.server
+        if not isinstance(server, _SimHttpServer):
+            self.send_error(500)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with server.slot_gate:
+            self._serve(server, body)
+
+    def _serve(self, server: _SimHttpServer, body: bytes) -> None:
+        """Answer one request while holding a server slot."""
+        try:
+            completion = server.begin(body)
+        except SimControlError:
+            self.send_error(400)
+            return
+        if completion.stream:
+            self._stream(server, completion)
+            return
+        server.pause(completion.latency_ms)
+        server.finish(completion)
+        payload = completion.payload()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        _ = self.wfile.write(payload)
+
+    def _stream(self, server: _SimHttpServer, completion: _Completion) -> None:
+        """Write ``n_gen`` SSE delta events, paced like the simulated decode."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        server.pause(completion.ttft_ms)
+        gap_ms = (completion.latency_ms - completion.ttft_ms) / max(completion.n_gen, 1)
+        for token in range(completion.n_gen):
+            if token:
+                server.pause(gap_ms)
+            delta = {"choices": [{"index": 0, "delta": {"content": f"t{token} "}}]}
+            self._chunk(f"data: {json.dumps(delta)}\n\n")
+        server.finish(completion)
+        self._chunk("data: [DONE]\n\n")
+        _ = self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, text: str) -> None:
+        data = text.encode()
+        _ = self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep the per-request access log off stderr."""
+
+
+def _output_dir(control: SimControl, model_filename: str, slots: int) -> Path:
+    if control.output_dirs is not None and model_filename in control.output_dirs:
+        directory = control.output_dirs[model_filename]
+    else:
+        directory = str(control.output_dir)
+    return Path(directory.replace("{parallel}", str(slots)))
+
+
+def _number(value: object) -> float:
+    return float(value) if isinstance(value, int | float) else 0.0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run one simulated llama-server until the process is terminated."""
+    control = load_sim_control()
+    launch = next_launch(control.state_path)
+    identity, slots, port = _identity(sys.argv[1:] if argv is None else argv, control.backend)
+    reason = control.model.failure(identity, int(REQUIRED_CONTEXT_SIZE), launch)
+    if reason is not None:
+        _ = sys.stderr.write(f"error: failed to load model: {reason}\n")
+        return 1
+    httpd = _SimHttpServer(("127.0.0.1", port), control, identity, (launch, slots))
+    httpd.output_dir.mkdir(parents=True, exist_ok=True)
+    _ = (httpd.output_dir / "port.txt").write_text(str(httpd.server_address[1]))
+    time.sleep(control.model.load_seconds * control.time_scale)
+    ready_ms = round(control.model.load_seconds * _MS_PER_SECOND)
+    readiness = {"ready": True, "ready_at_ms": ready_ms, "slots": slots}
+    _ = (httpd.output_dir / "readiness.json").write_text(json.dumps(readiness))
+    httpd.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Pipe-based stdio capture for supervised children (T5).
+
+Redirecting the optimizer's own fd 1/2 for a child's lifetime hides the
+parent's logs and rules out supervising two children at once. A
+:class:`StdioCapture` instead launches the child's process group with stdout
+and stderr on pipes. One reader thread per stream copies every chunk into its
+:class:`StdioSink` file, hashes it incrementally (SHA-256), and hands each
+complete line to the sink's optional ``on_line`` callback as it arrives, so a
+caller can parse output live and cancel a child already known to be wrong.
+
+A reader stops once every writer in the group has closed its end of the pipe;
+the supervisor joins the readers only after the group has been reaped. A
+reader still running when its join times out (a descendant that left the
+group still holds the pipe) yields a stream marked incomplete, whose hash and
+size cover only what had arrived.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Final, final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+    from pathlib import Path
+
+__all__ = ("CapturedStream", "PipedCommand", "StdioCapture", "StdioSink", "spawn_group")
+
+_CHUNK: Final[int] = 64 << 10
+
+
+@dataclass(frozen=True, slots=True)
+class StdioSink:
+    """Destination file and optional live line callback for one child stream.
+
+    ``on_line`` runs on the reader thread with each decoded line (without its
+    newline, plus a final unterminated line) and must not raise.
+    """
+
+    path: Path
+    on_line: Callable[[str], None] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedStream:
+    """Where one stream landed, with its SHA-256 and byte count.
+
+    ``complete`` is False when the reader had not reached end-of-stream by the
+    join deadline, so ``sha256`` and ``size`` describe a truncated capture.
+    """
+
+    path: Path
+    sha256: str
+    size: int
+    complete: bool = True
+
+    def read_text(self) -> str:
+        """Return the captured text, or ``""`` when the child never launched."""
+        return self.path.read_text() if self.path.exists() else ""
+
+
+@final
+class _PipeDrain:
+    """Reader thread copying one pipe into a sink file while hashing it."""
+
+    def __init__(self, pipe: IO[bytes], sink: StdioSink) -> None:
+        self._pipe: Final = pipe
+        self._sink: Final = sink
+        self._digest: Final = hashlib.sha256()
+        self._size = 0
+        self._thread: Final = threading.Thread(
+            target=self._run, name=f"stdio-{sink.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def join(self, timeout: float) -> CapturedStream:
+        """Wait for end-of-stream and return what was captured, flagged if it never came."""
+        self._thread.join(timeout)
+        complete = not self._thread.is_alive()
+        return CapturedStream(self._sink.path, self._digest.hexdigest(), self._size, complete)
+
+    def _run(self) -> None:
+        pending = b""
+        fd = self._pipe.fileno()
+        with self._pipe, self._sink.path.open("wb") as out:
+            while chunk := os.read(fd, _CHUNK):
+                _ = out.write(chunk)
+                self._digest.update(chunk)
+                self._size += len(chunk)
+                if self._sink.on_line is not None:
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for line in lines:
+                        self._sink.on_line(line.decode(errors="replace"))
+            if pending and self._sink.on_line is not None:
+                self._sink.on_line(pending.decode(errors="replace"))
+
+
+@final
+class StdioCapture:
+    """Captures one child's stdout and stderr through pipes into sink files."""
+
+    def __init__(self, stdout: StdioSink, stderr: StdioSink) -> None:
+        self.stdout: Final = stdout
+        self.stderr: Final = stderr
+        self._drains: tuple[_PipeDrain, _PipeDrain] | None = None
+        self._streams: tuple[CapturedStream, CapturedStream] | None = None
+
+    def spawn(self, command: list[str]) -> subprocess.Popen[bytes]:
+        """Launch ``command`` in a new session with both streams piped to readers."""
+        proc = subprocess.Popen(
+            command, start_new_session=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        if proc.stdout is None or proc.stderr is None:
+            msg = "piped child is missing a stdio pipe"
+            raise OSError(msg)
+        self._drains = (_PipeDrain(proc.stdout, self.stdout), _PipeDrain(proc.stderr, self.stderr))
+        return proc
+
+    def close(self, timeout: timedelta) -> tuple[CapturedStream, CapturedStream]:
+        """Join the readers (once) and return the captured stdout and stderr."""
+        if self._streams is None:
+            if self._drains is None:
+                empty = hashlib.sha256().hexdigest()
+                self._streams = (
+                    CapturedStream(self.stdout.path, empty, 0),
+                    CapturedStream(self.stderr.path, empty, 0),
+                )
+            else:
+                seconds = timeout.total_seconds()
+                out, err = self._drains
+                self._streams = (out.join(seconds), err.join(seconds))
+        return self._streams
+
+
+@dataclass(frozen=True, slots=True)
+class PipedCommand:
+    """A child command whose stdout/stderr go through ``stdio`` rather than fd 1/2."""
+
+    argv: list[str]
+    stdio: StdioCapture
+
+
+def spawn_group(command: list[str] | PipedCommand) -> subprocess.Popen[bytes]:
+    """Launch ``command`` in a new session; a bare argv inherits the parent's fds."""
+    if isinstance(command, PipedCommand):
+        return command.stdio.spawn(command.argv)
+    return subprocess.Popen(command, start_new_session=True)
@@ -2,14 +2,17 @@
 
 Every child is launched in a dedicated process session/group. The hard
 channel is sampled at the configured interval through startup, measurement,
-cooldown, and shutdown. On a sampled breach, missing/malformed/stale hard
-telemetry, deadline expiry, parent interruption, or a child crash, the whole
-group is terminated (SIGTERM), escalated to SIGKILL after a bounded grace,
-reaped, and a typed result is returned only after cleanup.
+cooldown, and shutdown; best-effort diagnostics run on a separate sampler
+thread so the loop only ever pays for the hard-channel read. On a sampled
+breach, missing/malformed/stale hard telemetry, deadline expiry, parent
+interruption, or a child crash, the whole group is terminated (SIGTERM),
+escalated to SIGKILL after a bounded grace, reaped, and a typed result is
+returned only after cleanup. Child exit, the SIGTERM grace, and group
+teardown are awaited on pidfds (:mod:`process_wait`) rather than fixed sleeps.
 
 Outcome vocabulary (exact T4 lifecycle terms):
 
-* breach (preflight or sampled)          -> ``resource-infeasible``
+* breach on any card (preflight/sampled) -> ``resource-infeasible``
 * missing/malformed/stale hard telemetry -> ``telemetry-loss``
 * deadline expiry                        -> ``hang``
 * parent interruption (SIGINT)           -> ``cancelled``
@@ -22,75 +25,60 @@ and independent sentinel sessions are untouched.
 
 from __future__ import annotations
 
-import contextlib
-import os
-import signal
-import subprocess
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Final, final
 
+from llama_optimizer.adaptive_interval import AdaptivePacer
+from llama_optimizer.breach_predictor import BreachPrediction, BreachPredictor
+from llama_optimizer.diagnostics_sampler import DiagnosticsSampler, align_diagnostics
+from llama_optimizer.host_channel import HostSampler
 from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.phase_spans import Phase, SpanRecorder
+from llama_optimizer.process_wait import ChildWaiter, terminate_group, wait_group_gone
+from llama_optimizer.stdio_capture import PipedCommand, spawn_group
+from llama_optimizer.supervisor_types import ChildExit, SupervisorConfig, SupervisorResult
 from llama_optimizer.telemetry import (
-    Bytes,
     Diagnostics,
     HardChannel,
     HardChannelProvider,
     TelemetryLossError,
     is_breach,
     is_stale,
+    tightest_used,
 )
+from llama_optimizer.telemetry_series import TelemetryRecorder
 
 if TYPE_CHECKING:
+    import subprocess
     import threading
-__all__ = ("ChildExit", "ProcessSupervisor", "SupervisorConfig", "SupervisorResult")
-
-_TERMINATE_POLL: Final[timedelta] = timedelta(milliseconds=20)
-
-
-@dataclass(frozen=True, slots=True)
-class ChildExit:
-    """Raw child termination status; the caller classifies nonzero as transient/deterministic."""
-
-    returncode: int
 
+    from llama_optimizer.stdio_capture import StdioCapture
 
-@dataclass(frozen=True, slots=True)
-class SupervisorConfig:
-    """Bounded timing knobs for supervision."""
-
-    interval: timedelta
-    deadline: timedelta
-    grace: timedelta
-    provider_timeout: timedelta
-    max_staleness: timedelta
+__all__ = ("ChildExit", "ProcessSupervisor", "SupervisorConfig", "SupervisorResult")
 
+_CLEANUP_TIMEOUT: Final[timedelta] = timedelta(seconds=2)
 
-@dataclass(frozen=True, slots=True)
-class SupervisorResult:
-    """Typed outcome of one supervised run, available only after cleanup."""
 
-    outcome: NonScoredOutcome | ChildExit
-    samples: tuple[HardChannel, ...]
-    diagnostics_series: tuple[Diagnostics, ...]
-    peak_used: Bytes | None
-    started_at: datetime
-    ended_at: datetime
-    launched: bool
-    terminated_group: bool
-    process_group_pid: int | None = None
-    escalated_to_sigkill: bool = False
+type _Verdict = NonScoredOutcome | ChildExit
 
 
 @dataclass
 class _RunState:
     """Mutable accumulator for one supervised run (single-use per call)."""
 
-    samples: list[HardChannel] = field(default_factory=list)
-    diagnostics: list[Diagnostics] = field(default_factory=list)
+    recorder: TelemetryRecorder = field(default_factory=TelemetryRecorder)
+    sampler: DiagnosticsSampler | None = None
+    host: HostSampler | None = None
+    stdio: StdioCapture | None = None
     started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     proc: subprocess.Popen[bytes] | None = None
+    waiter: ChildWaiter | None = None
+    predictor: BreachPredictor | None = None
+    pacer: AdaptivePacer | None = None
+    interval: timedelta = timedelta(0)
+    predicted_breach: BreachPrediction | None = None
     terminated_group: bool = False
     escalated_to_sigkill: bool = False
 
@@ -101,51 +89,96 @@ class ProcessSupervisor:
 
     def run(
         self,
-        command: list[str],
+        command: list[str] | PipedCommand,
         *,
         provider: HardChannelProvider,
         config: SupervisorConfig,
         cancel: threading.Event | None = None,
+        spans: SpanRecorder | None = None,
     ) -> SupervisorResult:
         """Supervise ``command`` against the hard channel; never leaves an orphan.
 
         When ``cancel`` is provided and set by the caller, the supervisor terminates
         the process group (SIGTERM -> bounded grace -> SIGKILL -> reap) and returns
         a :class:`ChildExit` with the signal exit code, letting a long-lived server
-        be explicitly stopped after successful workloads.
+        be explicitly stopped after successful workloads. ``spans`` receives the
+        preflight, launch, supervised, and termination phase timings. A
+        :class:`PipedCommand` pipes the child's streams to its sinks instead of
+        sharing this process's fd 1/2; the readers are joined before returning.
         """
-        state = _RunState()
-        outcome: NonScoredOutcome | ChildExit
+        state = _RunState(
+            recorder=TelemetryRecorder(
+                downsample_window=config.telemetry_downsample_window,
+                ceilings=config.device_ceilings,
+            ),
+            stdio=command.stdio if isinstance(command, PipedCommand) else None,
+        )
+        spans = spans or SpanRecorder()
         try:
-            block = self._preflight(provider, config)
+            with spans.span(Phase.PREFLIGHT):
+                block = self._preflight(provider, config)
             if block is not None:
                 return self._finish(block, state)
-            state.proc = subprocess.Popen(command, start_new_session=True)
-            outcome = self._loop(state.proc, provider, config, state, cancel)
+            with spans.span(Phase.LAUNCH):
+                proc = self._launch(command, provider, config, state)
+            with spans.span(Phase.SUPERVISED):
+                outcome = self._loop(proc, provider, config, state, cancel)
         except KeyboardInterrupt:
             outcome = NonScoredOutcome.CANCELLED
 
         if state.proc is not None:
-            if state.proc.poll() is None:
-                state.escalated_to_sigkill = self._terminate_group(state.proc, config.grace)
-                state.terminated_group = True
-            else:
-                self._reap(state.proc)
-            pgid = state.proc.pid
-            group_gone = False
-            cleanup_deadline = time.monotonic() + 2.0
-            while time.monotonic() < cleanup_deadline:
-                try:
-                    os.killpg(pgid, 0)
-                except ProcessLookupError:
-                    group_gone = True
-                    break
-                except PermissionError:
-                    break
-                time.sleep(0.05)
-            if not group_gone:
-                outcome = NonScoredOutcome.CLEANUP_FAILURE
-        return self._finish(outcome, state)
+            with spans.span(Phase.TERMINATION):
+                outcome = self._cleanup(state, state.proc, config.grace, outcome)
+        return self._finish(outcome or NonScoredOutcome.CANCELLED, state)
+
+    def _launch(
+        self,
+        command: list[str] | PipedCommand,
+        provider: HardChannelProvider,
+        config: SupervisorConfig,
+        state: _RunState,
+    ) -> subprocess.Popen[bytes]:
+        """Spawn the child group, then start the diagnostics sampler and per-run helpers.
+
+        Spawning first means a launch that raises leaves no sampler thread behind.
+        """
+        state.proc = spawn_group(command)
+        state.sampler = DiagnosticsSampler(
+            provider,
+            interval=config.diagnostics_interval,
+            capacity=config.diagnostics_capacity,
+            join_timeout=config.interval,
+        )
+        state.sampler.start()
+        if config.breach_predictor is not None:
+            state.predictor = BreachPredictor(config.breach_predictor)
+        state.interval = config.interval
+        if config.adaptive_interval is not None:
+            state.pacer = AdaptivePacer(
+                config.adaptive_interval,
+                initial=config.interval,
+                max_staleness=config.max_staleness,
+            )
+        state.host = HostSampler.launch(state.proc.pid, config.host_channel)
+        return state.proc
+
+    def _cleanup(
+        self,
+        state: _RunState,
+        proc: subprocess.Popen[bytes],
+        grace: timedelta,
+        outcome: _Verdict | None,
+    ) -> _Verdict:
+        """Terminate (or reap) the group; ``None`` (cancel) becomes the signal exit."""
+        if proc.poll() is None:
+            waiter = self._waiter(state, proc)
+            state.escalated_to_sigkill = terminate_group(proc, waiter, grace.total_seconds())
+            state.terminated_group = True
+        else:
+            _ = proc.wait()
+        if not wait_group_gone(proc.pid, _CLEANUP_TIMEOUT.total_seconds()):
+            return NonScoredOutcome.CLEANUP_FAILURE
+        return ChildExit(proc.returncode) if outcome is None else outcome
 
     def _preflight(
         self, provider: HardChannelProvider, config: SupervisorConfig
@@ -155,7 +188,7 @@ class ProcessSupervisor:
             sample = provider.sample()
         except TelemetryLossError:
             return NonScoredOutcome.TELEMETRY_LOSS
-        if is_breach(sample):
+        if is_breach(sample, ceilings=config.device_ceilings):
             return NonScoredOutcome.RESOURCE_INFEASIBLE
         if is_stale(sample, now=datetime.now(UTC), max_staleness=config.max_staleness):
             return NonScoredOutcome.TELEMETRY_LOSS
@@ -168,73 +201,79 @@ class ProcessSupervisor:
         config: SupervisorConfig,
         state: _RunState,
         cancel: threading.Event | None = None,
-    ) -> NonScoredOutcome | ChildExit:
-        """Sample until the child exits, a fail-closed condition fires, or cancel is set."""
-        deadline = time.monotonic() + config.deadline.total_seconds()
+    ) -> _Verdict | None:
+        """Sample until the child exits or a fail-closed condition fires; ``None`` on cancel."""
+        launched_at = time.monotonic()
+        deadline = launched_at + config.deadline.total_seconds()
         while True:
             if cancel is not None and cancel.is_set():
-                state.escalated_to_sigkill = self._terminate_group(proc, config.grace)
-                state.terminated_group = True
-                return ChildExit(proc.returncode)
+                return None
             try:
                 sample = provider.sample()
             except TelemetryLossError:
                 return NonScoredOutcome.TELEMETRY_LOSS
-            if is_breach(sample):
-                state.samples.append(sample)
-                state.diagnostics.append(provider.diagnostics())
-                return NonScoredOutcome.RESOURCE_INFEASIBLE
-            if is_stale(sample, now=datetime.now(UTC), max_staleness=config.max_staleness):
-                state.samples.append(sample)
-                state.diagnostics.append(provider.diagnostics())
-                return NonScoredOutcome.TELEMETRY_LOSS
-            state.samples.append(sample)
-            state.diagnostics.append(provider.diagnostics())
+            verdict = self._judge(sample, config, state, launched_at)
+            if verdict is not None:
+                return verdict
             if proc.poll() is not None:
                 return ChildExit(proc.returncode)
-            if time.monotonic() >= deadline:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return NonScoredOutcome.HANG
-            time.sleep(config.interval.total_seconds())
+            # Wake at the next sampling tick, or immediately if the child exits.
+            _ = self._waiter(state, proc).wait(min(state.interval.total_seconds(), remaining))
 
-    def _terminate_group(self, proc: subprocess.Popen[bytes], grace: timedelta) -> bool:
-        """SIGTERM the group; escalate to SIGKILL after ``grace`` if still alive."""
-        pgid = proc.pid
-        try:
-            os.killpg(pgid, signal.SIGTERM)
-        except ProcessLookupError:
-            self._reap(proc)
-            return False
-        deadline = time.monotonic() + grace.total_seconds()
-        while time.monotonic() < deadline:
-            if proc.poll() is not None:
-                break
-            time.sleep(_TERMINATE_POLL.total_seconds())
-        sigkill_needed = proc.poll() is None
-        with contextlib.suppress(ProcessLookupError):
-            os.killpg(pgid, signal.SIGKILL)
-        self._reap(proc)
-        return sigkill_needed
+    @staticmethod
+    def _judge(
+        sample: HardChannel, config: SupervisorConfig, state: _RunState, launched_at: float
+    ) -> NonScoredOutcome | None:
+        """Record one reading; return the fail-closed outcome it triggers, if any."""
+        stale = is_stale(sample, now=datetime.now(UTC), max_staleness=config.max_staleness)
+        elapsed = timedelta(seconds=time.monotonic() - launched_at)
+        used = tightest_used(sample, ceilings=config.device_ceilings)
+        if state.pacer is not None:
+            state.interval = state.pacer.next_interval(elapsed, used)
+        state.recorder.append(sample, stale=stale, interval=state.interval)
+        if is_breach(sample, ceilings=config.device_ceilings):
+            return NonScoredOutcome.RESOURCE_INFEASIBLE
+        if stale:
+            return NonScoredOutcome.TELEMETRY_LOSS
+        if state.predictor is not None:
+            state.predicted_breach = state.predictor.observe(elapsed, used)
+            if state.predicted_breach is not None:
+                return NonScoredOutcome.RESOURCE_INFEASIBLE
+        return None
 
     @staticmethod
-    def _reap(proc: subprocess.Popen[bytes]) -> None:
-        """Block until the child is reaped (it is already dead)."""
-        _ = proc.wait()
-
-    def _finish(self, outcome: NonScoredOutcome | ChildExit, state: _RunState) -> SupervisorResult:
-        """Build the immutable typed result after cleanup."""
-        peak: Bytes | None = None
-        if state.samples:
-            peak = Bytes(max(int(s.used) for s in state.samples))
-        launched = state.proc is not None
+    def _waiter(state: _RunState, proc: subprocess.Popen[bytes]) -> ChildWaiter:
+        """Return the run's pidfd-backed exit waiter, opening it on first use."""
+        if state.waiter is None:
+            state.waiter = ChildWaiter(proc)
+        return state.waiter
+
+    def _finish(self, outcome: _Verdict, state: _RunState) -> SupervisorResult:
+        """Build the immutable typed result after cleanup; a truncated capture fails it."""
+        if state.waiter is not None:
+            state.waiter.close()
+        if state.stdio is not None and not all(
+            stream.complete for stream in state.stdio.close(_CLEANUP_TIMEOUT)
+        ):
+            outcome = NonScoredOutcome.CLEANUP_FAILURE
+        series = state.recorder.finish()
+        diagnostics: tuple[Diagnostics, ...] = ()
+        if state.sampler is not None:
+            diagnostics = align_diagnostics(series.samples(), state.sampler.stop())
         return SupervisorResult(
             outcome=outcome,
-            samples=tuple(state.samples),
-            diagnostics_series=tuple(state.diagnostics),
-            peak_used=peak,
+            series=series,
+            diagnostics_series=diagnostics,
+            peak_used=series.peak_used,
             started_at=state.started_at,
             ended_at=datetime.now(UTC),
-            launched=launched,
-            terminated_group=state.terminated_group if launched else False,
+            launched=state.proc is not None,
+            terminated_group=state.terminated_group,
             escalated_to_sigkill=state.escalated_to_sigkill,
+            predicted_breach=state.predicted_breach,
             process_group_pid=state.proc.pid if state.proc is not None else None,
+            host_series=state.host.stop() if state.host is not None else (),
         )
@@ -0,0 +1,213 @@
+"""Wall-clock overhead of the supervision machinery itself (T5).
+
+Runs :class:`~llama_optimizer.supervisor.ProcessSupervisor` against trivial
+Python children, with the hard channel served by a
+:class:`~llama_optimizer.telemetry_replay.ReplayProvider`, at several sampling
+intervals. Every ``sample()`` call is timestamped so the suite can report:
+
+* ``spawn_ms`` - preflight read to the first supervised read (sampler start
+  plus ``Popen``);
+* ``sample_jitter_ms`` - absolute deviation of each loop gap from the interval;
+* ``exit_detect_ms`` - child's last instruction to ``run()`` returning;
+* ``breach_detect_ms`` / ``stale_detect_ms`` - a replayed breach (or stale)
+  reading becoming current to the read that observed it;
+* ``terminate_ms`` - that observing read to ``run()`` returning (SIGTERM, reap,
+  group-gone check).
+
+:meth:`OverheadReport.to_json` is the machine-readable artifact compared across
+commits to catch overhead regressions.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.supervisor import ChildExit, ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import VRAM_CEILING_BYTES, Bytes, HardChannel
+from llama_optimizer.telemetry_replay import ReplayProvider, TracePoint
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from llama_optimizer.telemetry import Diagnostics
+
+__all__ = (
+    "DEFAULT_INTERVALS",
+    "OVERHEAD_SCHEMA",
+    "IntervalOverhead",
+    "OverheadReport",
+    "run_overhead_suite",
+)
+
+OVERHEAD_SCHEMA: Final[str] = "supervisor-overhead/1"
+DEFAULT_INTERVALS: Final[tuple[timedelta, ...]] = tuple(
+    timedelta(milliseconds=ms) for ms in (50, 100, 250, 500)
+)
+_IDLE_USED: Final[Bytes] = Bytes(1 << 30)
+_STALE_AGE: Final[timedelta] = timedelta(seconds=30)
+_MAX_STALENESS: Final[timedelta] = timedelta(seconds=5)
+_TICKS_BEFORE_EVENT: Final[int] = 4
+
+
+@dataclass(frozen=True, slots=True)
+class OverheadStat:
+    """Median and worst case of one metric over every repeat, in milliseconds."""
+
+    median_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalOverhead:
+    """Every metric measured at one sampling interval."""
+
+    interval: timedelta
+    repeats: int
+    metrics: tuple[tuple[str, OverheadStat], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class OverheadReport:
+    """Suite result across intervals; serialize with :meth:`to_json`."""
+
+    intervals: tuple[IntervalOverhead, ...]
+
+    def to_json(self) -> str:
+        """Canonical JSON keyed by interval in milliseconds."""
+        body = {
+            "schema": OVERHEAD_SCHEMA,
+            "intervals": [
+                {
+                    "interval_ms": entry.interval.total_seconds() * 1000,
+                    "repeats": entry.repeats,
+                    "metrics": {
+                        name: {"median_ms": stat.median_ms, "max_ms": stat.max_ms}
+                        for name, stat in entry.metrics
+                    },
+                }
+                for entry in self.intervals
+            ],
+        }
+        return json.dumps(body, sort_keys=True, indent=2) + "\n"
+
+
+@final
+class _TimedProvider:
+    """Delegates to a replay provider, stamping each ``sample()`` call time."""
+
+    def __init__(self, inner: ReplayProvider) -> None:
+        self.inner: Final = inner
+        self.calls: list[float] = []
+
+    def sample(self) -> HardChannel:
+        self.calls.append(time.monotonic())
+        return self.inner.sample()
+
+    def diagnostics(self) -> Diagnostics:
+        return self.inner.diagnostics()
+
+
+def run_overhead_suite(
+    intervals: Sequence[timedelta] = DEFAULT_INTERVALS, *, repeats: int = 3
+) -> OverheadReport:
+    """Measure supervision overhead ``repeats`` times at every interval."""
+    if repeats < 1 or not intervals:
+        msg = f"need at least one interval and repeats >= 1, got {len(intervals)}/{repeats}"
+        raise ValueError(msg)
+    return OverheadReport(intervals=tuple(_measure(i, repeats) for i in intervals))
+
+
+def _measure(interval: timedelta, repeats: int) -> IntervalOverhead:
+    samples: dict[str, list[float]] = {}
+    for _ in range(repeats):
+        for name, values in (
+            *_exit_run(interval),
+            *_event_run(interval, stale=False),
+            *_event_run(interval, stale=True),
+        ):
+            samples.setdefault(name, []).extend(values)
+    metrics = tuple(
+        (name, OverheadStat(median_ms=statistics.median(values), max_ms=max(values)))
+        for name, values in sorted(samples.items())
+        if values
+    )
+    return IntervalOverhead(interval=interval, repeats=repeats, metrics=metrics)
+
+
+def _config(interval: timedelta) -> SupervisorConfig:
+    return SupervisorConfig(
+        interval=interval,
+        deadline=timedelta(seconds=60),
+        grace=timedelta(seconds=2),
+        provider_timeout=timedelta(seconds=2),
+        max_staleness=_MAX_STALENESS,
+    )
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def _ms(seconds: float) -> float:
+    return max(seconds, 0.0) * 1000
+
+
+def _exit_run(interval: timedelta) -> tuple[tuple[str, list[float]], ...]:
+    """Child sleeps a few ticks, stamps its monotonic clock, and exits 0."""
+    provider = _TimedProvider(ReplayProvider([TracePoint(offset=timedelta(0), used=_IDLE_USED)]))
+    sleep_s = interval.total_seconds() * _TICKS_BEFORE_EVENT
+    with tempfile.TemporaryDirectory(prefix="llama-opt-overhead-") as tmp:
+        stamp = Path(tmp) / "exit"
+        code = (
+            f"import time; time.sleep({sleep_s}); "
+            + f"open({str(stamp)!r}, 'w').write(str(time.monotonic()))"
+        )
+        result = ProcessSupervisor().run(_python(code), provider=provider, config=_config(interval))
+        returned = time.monotonic()
+        if result.outcome != ChildExit(0):
+            msg = f"overhead exit probe failed: {result.outcome}"
+            raise RuntimeError(msg)
+        exited = float(stamp.read_text())
+    calls = provider.calls
+    # The last read is woken early by the child's exit, so it is not a tick.
+    gaps = [later - earlier for earlier, later in itertools.pairwise(calls[1:-1])]
+    return (
+        ("spawn_ms", [_ms(calls[1] - calls[0])] if len(calls) > 1 else []),
+        ("sample_jitter_ms", [_ms(abs(gap - interval.total_seconds())) for gap in gaps]),
+        ("exit_detect_ms", [_ms(returned - exited)]),
+    )
+
+
+def _event_run(interval: timedelta, *, stale: bool) -> tuple[tuple[str, list[float]], ...]:
+    """Replay a breach (or stale) reading a few ticks in; the child would sleep 60 s."""
+    event = (
+        TracePoint(offset=interval * _TICKS_BEFORE_EVENT, used=_IDLE_USED, age=_STALE_AGE)
+        if stale
+        else TracePoint(offset=interval * _TICKS_BEFORE_EVENT, used=VRAM_CEILING_BYTES)
+    )
+    replay = ReplayProvider([TracePoint(offset=timedelta(0), used=_IDLE_USED), event])
+    provider = _TimedProvider(replay)
+    result = ProcessSupervisor().run(
+        _python("import time; time.sleep(60)"), provider=provider, config=_config(interval)
+    )
+    returned = time.monotonic()
+    expected = NonScoredOutcome.TELEMETRY_LOSS if stale else NonScoredOutcome.RESOURCE_INFEASIBLE
+    if result.outcome is not expected:
+        msg = f"overhead {'stale' if stale else 'breach'} probe failed: {result.outcome}"
+        raise RuntimeError(msg)
+    observed = provider.calls[-1]
+    name = "stale_detect_ms" if stale else "breach_detect_ms"
+    return (
+        (name, [_ms(observed - replay.due_at(event))]),
+        ("terminate_ms", [_ms(returned - observed)]),
+    )
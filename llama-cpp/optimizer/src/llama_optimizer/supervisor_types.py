@@ -0,0 +1,97 @@
+"""Typed configuration and results of fail-closed process supervision (T5).
+
+:mod:`llama_optimizer.supervisor` and
+:mod:`llama_optimizer.concurrent_supervisor` both consume
+:class:`SupervisorConfig` and return :class:`SupervisorResult`; keeping the
+value types here leaves each supervisor module to its process handling.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from llama_optimizer.adaptive_interval import AdaptiveIntervalConfig
+    from llama_optimizer.breach_predictor import BreachPrediction, BreachPredictorConfig
+    from llama_optimizer.host_channel import HostChannelConfig
+    from llama_optimizer.ledger_records import HostSampleRow
+    from llama_optimizer.lifecycle import NonScoredOutcome
+    from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel
+    from llama_optimizer.telemetry_series import TelemetrySeries
+
+
+@dataclass(frozen=True, slots=True)
+class ChildExit:
+    """Raw child termination status; the caller classifies nonzero as transient/deterministic."""
+
+    returncode: int
+
+
+@dataclass(frozen=True, slots=True)
+class SupervisorConfig:
+    """Bounded timing knobs for supervision.
+
+    ``interval`` paces only the cheap hard-channel read; best-effort diagnostics
+    run on their own thread every ``diagnostics_interval`` into a ring buffer of
+    ``diagnostics_capacity`` snapshots. ``telemetry_downsample_window`` (0 = off)
+    collapses each window of hard readings to its min/max points. An optional
+    ``breach_predictor`` aborts startup early on a confidently projected breach.
+    ``device_ceilings`` maps card keys to per-card ceilings on multi-GPU nodes;
+    feasibility is judged per card and unmapped cards use the 13 GiB default.
+    With ``adaptive_interval`` set, ``interval`` is only the starting wait: the
+    pacer shortens it near the ceiling or on a fast rise and backs off when
+    headroom is large, never beyond ``max_staleness``. ``host_channel`` adds a
+    soft CPU/RSS/fault/IO sampler for the child's processes (never a gate).
+    """
+
+    interval: timedelta
+    deadline: timedelta
+    grace: timedelta
+    provider_timeout: timedelta
+    max_staleness: timedelta
+    diagnostics_interval: timedelta = timedelta(seconds=1)
+    diagnostics_capacity: int = 256
+    telemetry_downsample_window: int = 0
+    breach_predictor: BreachPredictorConfig | None = None
+    device_ceilings: Mapping[str, Bytes] | None = None
+    adaptive_interval: AdaptiveIntervalConfig | None = None
+    host_channel: HostChannelConfig | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SupervisorResult:
+    """Typed outcome of one supervised run, available only after cleanup.
+
+    ``group_breach`` marks a ``resource-infeasible`` child of a concurrent
+    batch whose aggregate breach cannot be attributed to it alone: re-run it
+    solo to classify it.
+    """
+
+    outcome: NonScoredOutcome | ChildExit
+    series: TelemetrySeries
+    diagnostics_series: tuple[Diagnostics, ...]
+    peak_used: Bytes | None
+    started_at: datetime
+    ended_at: datetime
+    launched: bool
+    terminated_group: bool
+    process_group_pid: int | None = None
+    escalated_to_sigkill: bool = False
+    predicted_breach: BreachPrediction | None = None
+    host_series: tuple[HostSampleRow, ...] = ()
+    group_breach: bool = False
+
+    @property
+    def samples(self) -> tuple[HardChannel, ...]:
+        """Retained hard-channel readings materialized from the columnar series."""
+        return self.series.samples()
+
+    @property
+    def device_peaks(self) -> Mapping[str, Bytes]:
+        """Exact per-card peak used bytes over every reading."""
+        return self.series.device_peaks
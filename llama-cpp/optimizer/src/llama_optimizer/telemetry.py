@@ -6,10 +6,14 @@ shape::
     {"card0":{"VRAM Total Memory (B)":"17163091968",
               "VRAM Total Used Memory (B)":"807677952"}}
 
-Values are string-encoded bytes; the device key is ``card0``. Total used VRAM
-is parsed strictly at the boundary and compared against exactly
-``13,958,643,712`` bytes (13 GiB). Anything missing, malformed, or untyped
-fails closed as :class:`TelemetryLossError`. Diagnostics
+Values are string-encoded bytes; the primary device key is ``card0``. On
+multi-GPU nodes one call returns every card: each *expected* device is parsed
+strictly and any other well-formed card is carried alongside, so a single
+:class:`HardChannel` holds one :class:`DeviceReading` per card. Total used
+VRAM is compared per device against its own ceiling (exactly
+``13,958,643,712`` bytes, 13 GiB, unless the profile maps another). Anything
+missing, malformed, or untyped on an expected device fails closed as
+:class:`TelemetryLossError`. Diagnostics
 (temperature/power/use/clocks/PCIe) are best-effort and never a hard gate.
 AMD-SMI is an interface seam only; the v1 concrete provider is rocm-smi.
 """
@@ -20,7 +24,10 @@ import re
 import subprocess
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Final, NewType, Protocol, final
+from typing import TYPE_CHECKING, Final, NewType, Protocol, final
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 # --- Semantic primitives ----------------------------------------------------
 # Bytes is distinct from a bare int so the compiler refuses to mix a VRAM
@@ -38,27 +45,46 @@ _DIAG_TIMEOUT: Final[timedelta] = timedelta(seconds=5)
 
 # Staged regex checks give field-specific failure reasons without json.loads
 # (which returns bare Any and would trigger reportAny under strict mode).
-_HAS_CARD0: Final[re.Pattern[str]] = re.compile(r'"card0"\s*:')
 _HAS_TOTAL_FIELD: Final[re.Pattern[str]] = re.compile(r'"VRAM Total Memory \(B\)"\s*:')
 _HAS_USED_FIELD: Final[re.Pattern[str]] = re.compile(r'"VRAM Total Used Memory \(B\)"\s*:')
 _HAS_TOTAL_STRING: Final[re.Pattern[str]] = re.compile(r'"VRAM Total Memory \(B\)"\s*:\s*"')
 _HAS_USED_STRING: Final[re.Pattern[str]] = re.compile(r'"VRAM Total Used Memory \(B\)"\s*:\s*"')
-_HARD_CHANNEL_RE: Final[re.Pattern[str]] = re.compile(
-    r'"card0"\s*:\s*\{\s*'
-    + r'"VRAM Total Memory \(B\)"\s*:\s*"(\d+)"\s*,\s*'
+_DEVICE_BLOCK_RE: Final[re.Pattern[str]] = re.compile(r'"(card\d+)"\s*:\s*\{([^{}]*)\}')
+_DEVICE_FIELDS_RE: Final[re.Pattern[str]] = re.compile(
+    r'\s*"VRAM Total Memory \(B\)"\s*:\s*"(\d+)"\s*,\s*'
     + r'"VRAM Total Used Memory \(B\)"\s*:\s*"(\d+)"\s*'
-    + r"\}"
 )
 
 
+@dataclass(frozen=True, slots=True)
+class DeviceReading:
+    """One card's strict total-device VRAM reading."""
+
+    device: str
+    total: Bytes
+    used: Bytes
+
+
 @dataclass(frozen=True, slots=True)
 class HardChannel:
-    """One strict total-device VRAM reading from the hard channel."""
+    """One strict hard-channel reading.
+
+    ``total``/``used`` are the primary device's bytes (never summed across
+    cards); ``devices`` carries every card read in the same call. An empty
+    ``devices`` means a single-card reading of :data:`DEVICE_KEY`.
+    """
 
     total: Bytes
     used: Bytes
     collected_at: datetime
     raw: str
+    devices: tuple[DeviceReading, ...] = ()
+
+    def readings(self) -> tuple[DeviceReading, ...]:
+        """Return one reading per card, synthesizing ``card0`` for single-card samples."""
+        if self.devices:
+            return self.devices
+        return (DeviceReading(device=DEVICE_KEY, total=self.total, used=self.used),)
 
 
 @dataclass(frozen=True, slots=True)
@@ -105,43 +131,122 @@ class HardChannelProvider(Protocol):
 # --- Strict boundary parse --------------------------------------------------
 
 
-def parse_hard_channel(raw: str, *, collected_at: datetime) -> HardChannel:
+def parse_hard_channel(
+    raw: str, *, collected_at: datetime, devices: tuple[str, ...] = (DEVICE_KEY,)
+) -> HardChannel:
     """Parse the verified rocm-smi hard-channel JSON strictly.
 
-    Empty, non-JSON, missing ``card0``, missing fields, non-string bytes, or
-    negative values all fail closed as :class:`TelemetryLossError` with a
-    field-specific reason.
+    Every device in ``devices`` must be present and well-formed; empty,
+    non-JSON, missing devices, missing fields, non-string bytes, or negative
+    values fail closed as :class:`TelemetryLossError` with a field-specific
+    reason. Other cards are kept when well-formed and otherwise ignored. The
+    first entry of ``devices`` is the primary device.
     """
     stripped = raw.strip()
     if not stripped:
         raise TelemetryLossError(reason="empty hard-channel output", raw=raw)
-    if not _HAS_CARD0.search(stripped):
-        raise TelemetryLossError(reason=f"malformed: missing {DEVICE_KEY} device", raw=raw)
-    if not _HAS_TOTAL_FIELD.search(stripped):
+    blocks = {m.group(1): m.group(2) for m in _DEVICE_BLOCK_RE.finditer(stripped)}
+    readings: dict[str, DeviceReading] = {}
+    for device in devices:
+        block = blocks.get(device)
+        if block is None:
+            raise TelemetryLossError(reason=f"malformed: missing {device} device", raw=raw)
+        readings[device] = _parse_device(device, block, raw)
+    for device, block in blocks.items():
+        match = _DEVICE_FIELDS_RE.fullmatch(block)
+        if device not in readings and match is not None:
+            readings[device] = _device_reading(device, match)
+    primary = readings[devices[0]]
+    return HardChannel(
+        total=primary.total,
+        used=primary.used,
+        collected_at=collected_at,
+        raw=raw,
+        devices=tuple(sorted(readings.values(), key=lambda r: _device_order(r.device))),
+    )
+
+
+def _parse_device(device: str, block: str, raw: str) -> DeviceReading:
+    """Strictly parse one expected device's field block, with staged reasons."""
+    if not _HAS_TOTAL_FIELD.search(block):
         raise TelemetryLossError(reason=f"malformed: missing {TOTAL_FIELD} field", raw=raw)
-    if not _HAS_TOTAL_STRING.search(stripped):
+    if not _HAS_TOTAL_STRING.search(block):
         raise TelemetryLossError(reason=f"malformed: {TOTAL_FIELD} must be a string", raw=raw)
-    if not _HAS_USED_FIELD.search(stripped):
+    if not _HAS_USED_FIELD.search(block):
         raise TelemetryLossError(reason=f"malformed: missing {USED_FIELD} field", raw=raw)
-    if not _HAS_USED_STRING.search(stripped):
+    if not _HAS_USED_STRING.search(block):
         raise TelemetryLossError(reason=f"malformed: {USED_FIELD} must be a string", raw=raw)
-    match = _HARD_CHANNEL_RE.search(stripped)
+    match = _DEVICE_FIELDS_RE.fullmatch(block)
     if match is None:
         raise TelemetryLossError(
-            reason="malformed: hard-channel byte values are non-numeric", raw=raw
+            reason=f"malformed: {device} hard-channel byte values are non-numeric", raw=raw
         )
+    return _device_reading(device, match)
+
+
+def _device_reading(device: str, match: re.Match[str]) -> DeviceReading:
     total_str, used_str = match.groups()
-    return HardChannel(
-        total=Bytes(int(total_str)),
-        used=Bytes(int(used_str)),
-        collected_at=collected_at,
-        raw=raw,
+    return DeviceReading(device=device, total=Bytes(int(total_str)), used=Bytes(int(used_str)))
+
+
+def _device_order(device: str) -> int:
+    """Sort ``cardN`` keys numerically so ``card10`` follows ``card9``."""
+    return int(device.removeprefix("card"))
+
+
+def device_ceiling(
+    device: str, *, ceiling: Bytes = VRAM_CEILING_BYTES, ceilings: Mapping[str, Bytes] | None = None
+) -> Bytes:
+    """Return ``device``'s ceiling from ``ceilings``, defaulting to ``ceiling``."""
+    if ceilings is None:
+        return ceiling
+    return ceilings.get(device, ceiling)
+
+
+def breached_devices(
+    sample: HardChannel,
+    *,
+    ceiling: Bytes = VRAM_CEILING_BYTES,
+    ceilings: Mapping[str, Bytes] | None = None,
+) -> tuple[str, ...]:
+    """Return the cards whose used VRAM is at or over their own ceiling."""
+    return tuple(
+        r.device
+        for r in sample.readings()
+        if r.used >= device_ceiling(r.device, ceiling=ceiling, ceilings=ceilings)
     )
 
 
-def is_breach(sample: HardChannel, *, ceiling: Bytes = VRAM_CEILING_BYTES) -> bool:
-    """Return whether total used VRAM is at or over the ceiling (>= blocks)."""
-    return sample.used >= ceiling
+def is_breach(
+    sample: HardChannel,
+    *,
+    ceiling: Bytes = VRAM_CEILING_BYTES,
+    ceilings: Mapping[str, Bytes] | None = None,
+) -> bool:
+    """Return whether any card's used VRAM is at or over its ceiling (>= blocks).
+
+    ``ceilings`` maps device keys to per-card ceilings; unmapped cards use
+    ``ceiling``.
+    """
+    return bool(breached_devices(sample, ceiling=ceiling, ceilings=ceilings))
+
+
+def tightest_used(
+    sample: HardChannel,
+    *,
+    ceiling: Bytes = VRAM_CEILING_BYTES,
+    ceilings: Mapping[str, Bytes] | None = None,
+) -> Bytes:
+    """Return used bytes on the card with least headroom, rebased onto ``ceiling``.
+
+    Lets single-ceiling consumers (the breach predictor) track whichever card
+    is closest to its own limit; equals ``sample.used`` for single-card readings.
+    """
+    headroom = min(
+        int(device_ceiling(r.device, ceiling=ceiling, ceilings=ceilings)) - int(r.used)
+        for r in sample.readings()
+    )
+    return Bytes(int(ceiling) - headroom)
 
 
 def is_stale(sample: HardChannel, *, now: datetime, max_staleness: timedelta) -> bool:
@@ -181,9 +286,16 @@ def parse_diagnostics(raw: str) -> Diagnostics:
 
 @final
 class RocmSmiProvider:
-    """Concrete v1 provider over ``rocm-smi`` for the hard channel + diagnostics."""
+    """Concrete v1 provider over ``rocm-smi`` for the hard channel + diagnostics.
+
+    One ``rocm-smi`` call reads every card; ``devices`` lists the cards that
+    must be present (the first is primary).
+    """
 
-    def __init__(self, binary: str, *, timeout: timedelta) -> None:
+    def __init__(
+        self, binary: str, *, timeout: timedelta, devices: tuple[str, ...] = (DEVICE_KEY,)
+    ) -> None:
+        self._devices: Final[tuple[str, ...]] = devices
         self._hard_argv: Final[list[str]] = [binary, "--showmeminfo", "vram", "--json"]
         self._diag_argv: Final[list[str]] = [
             binary,
@@ -199,7 +311,7 @@ class RocmSmiProvider:
         """Run the hard-channel command and parse it strictly."""
         collected_at = datetime.now(UTC)
         completed = self._run(self._hard_argv, self._timeout)
-        return parse_hard_channel(completed, collected_at=collected_at)
+        return parse_hard_channel(completed, collected_at=collected_at, devices=self._devices)
 
     def diagnostics(self) -> Diagnostics:
         """Run the diagnostics command and parse it best-effort. Never a hard gate."""
@@ -0,0 +1,177 @@
+"""Recorded-trace hard-channel replay for offline supervision runs (T5).
+
+A trace is JSONL, one recorded reading per line, keyed by its offset from the
+start of the recording:
+
+* ``{"t_ms": 250, "used": 1334509930}`` (``total`` optional) for compact
+  sysfs-style readings;
+* ``{"t_ms": 250, "raw": "<rocm-smi --json payload>"}`` for verbatim rocm-smi
+  output, parsed strictly through
+  :func:`~llama_optimizer.telemetry.parse_hard_channel`;
+* ``{"t_ms": 250, "loss": "reason"}`` for a recorded hard-channel failure.
+
+An optional ``age_ms`` back-dates a reading's ``collected_at`` so stale
+telemetry can be replayed. :class:`ReplayProvider` serves whichever point is
+current at ``speed`` times wall-clock since its first ``sample()`` call, so
+the supervisor sees the recorded shape with real or accelerated timing.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.server_json import loads_mapping
+from llama_optimizer.telemetry import (
+    Bytes,
+    Diagnostics,
+    HardChannel,
+    TelemetryLossError,
+    parse_diagnostics,
+    parse_hard_channel,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+#: Total bytes assumed for compact trace lines that omit ``total``.
+DEFAULT_TRACE_TOTAL: Final[Bytes] = Bytes(17_163_091_968)
+_NO_BYTES: Final[Bytes] = Bytes(0)
+
+
+@dataclass
+class TraceFormatError(ValueError):
+    """A trace line was not one of the documented replay shapes."""
+
+    reason: str
+
+    def __post_init__(self) -> None:
+        """Populate the base ``ValueError`` message so ``str()`` is never empty."""
+        Exception.__init__(self, self.reason)
+
+
+@dataclass(frozen=True, slots=True)
+class TracePoint:
+    """One recorded reading (or recorded loss when ``loss`` is set)."""
+
+    offset: timedelta
+    used: Bytes = _NO_BYTES
+    total: Bytes = DEFAULT_TRACE_TOTAL
+    raw: str = ""
+    loss: str | None = None
+    age: timedelta = timedelta(0)
+
+
+def _int_field(line: Mapping[str, object], key: str, default: int | None = None) -> int:
+    value = line.get(key, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        msg = f"trace field {key!r} must be a non-negative integer"
+        raise TraceFormatError(msg)
+    return value
+
+
+def parse_trace_line(raw_line: str) -> TracePoint:
+    """Parse one JSONL trace line into a :class:`TracePoint`."""
+    line = loads_mapping(raw_line, error=TraceFormatError)
+    offset = timedelta(milliseconds=_int_field(line, "t_ms"))
+    age = timedelta(milliseconds=_int_field(line, "age_ms", 0))
+    loss = line.get("loss")
+    if isinstance(loss, str):
+        return TracePoint(offset=offset, loss=loss, age=age)
+    raw = line.get("raw")
+    if isinstance(raw, str):
+        # Validate once at load so a bad recording fails before any child launches.
+        parsed = parse_hard_channel(raw, collected_at=datetime.now(UTC))
+        return TracePoint(offset=offset, used=parsed.used, total=parsed.total, raw=raw, age=age)
+    return TracePoint(
+        offset=offset,
+        used=Bytes(_int_field(line, "used")),
+        total=Bytes(_int_field(line, "total", int(DEFAULT_TRACE_TOTAL))),
+        age=age,
+    )
+
+
+def load_trace(path: str | Path) -> tuple[TracePoint, ...]:
+    """Load a JSONL trace, sorted by offset; empty traces are rejected."""
+    points = [
+        parse_trace_line(line) for line in Path(path).read_text().splitlines() if line.strip()
+    ]
+    if not points:
+        msg = f"trace {path} has no readings"
+        raise TraceFormatError(msg)
+    return tuple(sorted(points, key=lambda p: p.offset))
+
+
+@final
+class ReplayProvider:
+    """Plays a recorded trace back as a :class:`HardChannelProvider`.
+
+    The clock starts on the first :meth:`sample` call (the supervisor's
+    preflight). ``speed`` of ``2.0`` replays twice as fast as recorded; past the
+    last point the final reading is held.
+    """
+
+    def __init__(
+        self,
+        points: Sequence[TracePoint],
+        *,
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        diagnostics_raw: str = "",
+    ) -> None:
+        if not points:
+            msg = "replay needs at least one trace point"
+            raise TraceFormatError(msg)
+        if speed <= 0:
+            msg = f"speed must be positive, got {speed}"
+            raise TraceFormatError(msg)
+        self._points: Final[tuple[TracePoint, ...]] = tuple(points)
+        self._speed: Final[float] = speed
+        self._clock: Final = clock
+        self._diagnostics: Final[Diagnostics] = parse_diagnostics(diagnostics_raw)
+        self._started: float | None = None
+
+    @property
+    def started_at(self) -> float | None:
+        """Clock value of the first ``sample()`` call, or ``None`` before it."""
+        return self._started
+
+    def due_at(self, point: TracePoint) -> float:
+        """Clock value at which ``point`` becomes current (after the replay starts)."""
+        start = self._started if self._started is not None else self._clock()
+        return start + point.offset.total_seconds() / self._speed
+
+    def current(self) -> TracePoint:
+        """Return the point that is current now, starting the replay clock if needed."""
+        now = self._clock()
+        if self._started is None:
+            self._started = now
+        elapsed = timedelta(seconds=(now - self._started) * self._speed)
+        current = self._points[0]
+        for point in self._points:
+            if point.offset > elapsed:
+                break
+            current = point
+        return current
+
+    def sample(self) -> HardChannel:
+        """Serve the current recorded reading, or raise its recorded loss."""
+        point = self.current()
+        if point.loss is not None:
+            raise TelemetryLossError(reason=point.loss, raw=point.raw)
+        collected_at = datetime.now(UTC) - point.age
+        if point.raw:
+            return parse_hard_channel(point.raw, collected_at=collected_at)
+        return HardChannel(
+            total=point.total,
+            used=point.used,
+            collected_at=collected_at,
+            raw=point.raw,
+        )
+
+    def diagnostics(self) -> Diagnostics:
+        """Return the fixed best-effort diagnostics snapshot."""
+        return self._diagnostics
@@ -0,0 +1,306 @@
+"""Compact columnar hard-channel time series for supervised runs (T5).
+
+A long-lived llama-server finalist is supervised for hours; keeping one
+frozen :class:`HardChannel` plus its full raw rocm-smi payload per tick grows
+without bound. :class:`TelemetryRecorder` instead appends each reading into
+``array('q')`` columns (used/total bytes, monotonic and wall-clock
+nanoseconds, and the sampling interval chosen after the reading) with a
+one-byte flag column, so every retained point costs a fixed 41 bytes. Raw
+provider text is kept only for the first, breaching, and stale readings. A
+multi-GPU reading also fills one used/total column pair per card (16 bytes
+per card, ``-1`` where a card was not read) and remembers which cards
+breached, so a breach is flagged when any card reaches its own ceiling and
+the ledger rows still say which card it was and what it read. An optional
+min/max window collapses each run of ``downsample_window`` readings to its
+minimum and maximum (plus any flagged reading), so the breach evidence and
+the true peak always survive.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Final, final
+
+from llama_optimizer.ledger_records import TelemetryRow
+from llama_optimizer.telemetry import (
+    DEVICE_KEY,
+    VRAM_CEILING_BYTES,
+    Bytes,
+    DeviceReading,
+    HardChannel,
+    breached_devices,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+#: Point flags; any set flag pins the point through downsampling and keeps its raw text.
+FLAG_FIRST: Final[int] = 1
+FLAG_BREACH: Final[int] = 2
+FLAG_STALE: Final[int] = 4
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1, tzinfo=UTC)
+_NS_PER_US: Final[int] = 1_000
+
+
+def _to_epoch_ns(moment: datetime) -> int:
+    """Exact integer nanoseconds since the Unix epoch (microsecond resolution)."""
+    return (moment - _EPOCH) // timedelta(microseconds=1) * _NS_PER_US
+
+
+def _duration_ns(delta: timedelta) -> int:
+    return delta // timedelta(microseconds=1) * _NS_PER_US
+
+
+def _from_epoch_ns(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ns // _NS_PER_US)
+
+
+@dataclass(frozen=True, slots=True)
+class _Point:
+    """One pending reading inside an open downsampling window."""
+
+    used: int
+    total: int
+    monotonic_ns: int
+    collected_ns: int
+    interval_ns: int
+    flags: int
+    raw: str | None
+    devices: tuple[DeviceReading, ...]
+    breached: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetrySeries:
+    """Immutable columnar view of the retained hard-channel points.
+
+    ``device_used``/``device_total`` are per-card columns aligned with the
+    points (empty for single-card series); ``breached_devices`` maps a
+    multi-card breach point's index to the cards at their ceiling.
+    """
+
+    used: array[int] = field(default_factory=lambda: array("q"))
+    total: array[int] = field(default_factory=lambda: array("q"))
+    monotonic_ns: array[int] = field(default_factory=lambda: array("q"))
+    collected_ns: array[int] = field(default_factory=lambda: array("q"))
+    interval_ns: array[int] = field(default_factory=lambda: array("q"))
+    flags: array[int] = field(default_factory=lambda: array("b"))
+    raw: Mapping[int, str] = field(default_factory=dict[int, str])
+    sample_count: int = 0
+    peak_used: Bytes | None = None
+    device_peaks: Mapping[str, Bytes] = field(default_factory=dict[str, Bytes])
+    device_used: Mapping[str, array[int]] = field(default_factory=dict[str, array[int]])
+    device_total: Mapping[str, array[int]] = field(default_factory=dict[str, array[int]])
+    breached_devices: Mapping[int, tuple[str, ...]] = field(
+        default_factory=dict[int, tuple[str, ...]]
+    )
+
+    def __len__(self) -> int:
+        """Return the retained point count (``<= sample_count`` when downsampled)."""
+        return len(self.used)
+
+    def intervals(self) -> tuple[timedelta, ...]:
+        """Wait chosen after each retained reading (zero when not recorded)."""
+        return tuple(timedelta(microseconds=ns // _NS_PER_US) for ns in self.interval_ns)
+
+    def samples(self) -> tuple[HardChannel, ...]:
+        """Materialize retained points as :class:`HardChannel` readings."""
+        return tuple(
+            HardChannel(
+                total=Bytes(self.total[i]),
+                used=Bytes(self.used[i]),
+                collected_at=_from_epoch_ns(self.collected_ns[i]),
+                raw=self.raw.get(i, ""),
+                devices=self.devices_at(i),
+            )
+            for i in range(len(self.used))
+        )
+
+    def devices_at(self, index: int) -> tuple[DeviceReading, ...]:
+        """Return the per-card readings of point ``index`` (empty for single-card points)."""
+        return tuple(
+            DeviceReading(
+                device=device,
+                total=Bytes(self.device_total[device][index]),
+                used=Bytes(used[index]),
+            )
+            for device, used in self.device_used.items()
+            if used[index] >= 0
+        )
+
+    def ledger_rows(self) -> tuple[TelemetryRow, ...]:
+        """Per-card ledger rows with a running peak, breach flag, and sampling interval."""
+        rows: list[TelemetryRow] = []
+        peaks: dict[str, int] = {}
+        for i, used in enumerate(self.used):
+            primary = DeviceReading(device=DEVICE_KEY, total=Bytes(self.total[i]), used=Bytes(used))
+            readings = self.devices_at(i) or (primary,)
+            for reading in readings:
+                peaks[reading.device] = max(peaks.get(reading.device, 0), reading.used)
+                breached = (
+                    reading.device in self.breached_devices.get(i, ())
+                    if len(readings) > 1
+                    else bool(self.flags[i] & FLAG_BREACH)
+                )
+                rows.append(
+                    TelemetryRow(
+                        vram_used_bytes=reading.used,
+                        peak_vram_bytes=peaks[reading.device],
+                        breached=breached,
+                        sampled_at=_from_epoch_ns(self.collected_ns[i]).isoformat(),
+                        interval_ns=self.interval_ns[i],
+                        device=reading.device,
+                    )
+                )
+        return tuple(rows)
+
+
+#: Shared empty series for results that never sampled.
+EMPTY_SERIES: Final[TelemetrySeries] = TelemetrySeries()
+
+
+@final
+class TelemetryRecorder:
+    """Append-only columnar recorder with optional min/max window downsampling.
+
+    ``downsample_window`` of ``0`` retains every reading; ``N >= 2`` flushes
+    each completed window of ``N`` readings as its min/max (and flagged)
+    points in time order.
+    """
+
+    def __init__(
+        self,
+        *,
+        downsample_window: int = 0,
+        ceiling: Bytes = VRAM_CEILING_BYTES,
+        ceilings: Mapping[str, Bytes] | None = None,
+    ) -> None:
+        if downsample_window < 0 or downsample_window == 1:
+            msg = f"downsample_window must be 0 or >= 2, got {downsample_window}"
+            raise ValueError(msg)
+        self._window: Final[int] = downsample_window
+        self._ceiling: Final[Bytes] = ceiling
+        self._ceilings: Final[Mapping[str, Bytes] | None] = ceilings
+        self._device_peaks: Final[dict[str, Bytes]] = {}
+        self._used: Final[array[int]] = array("q")
+        self._total: Final[array[int]] = array("q")
+        self._mono: Final[array[int]] = array("q")
+        self._wall: Final[array[int]] = array("q")
+        self._interval: Final[array[int]] = array("q")
+        self._flags: Final[array[int]] = array("b")
+        self._raw: Final[dict[int, str]] = {}
+        self._device_used: Final[dict[str, array[int]]] = {}
+        self._device_total: Final[dict[str, array[int]]] = {}
+        self._breached: Final[dict[int, tuple[str, ...]]] = {}
+        self._pending: Final[list[_Point]] = []
+        self._count: int = 0
+        self._peak: int | None = None
+
+    @property
+    def sample_count(self) -> int:
+        """Total readings appended, before downsampling."""
+        return self._count
+
+    @property
+    def peak_used(self) -> Bytes | None:
+        """Exact peak used bytes over every appended reading."""
+        return Bytes(self._peak) if self._peak is not None else None
+
+    @property
+    def device_peaks(self) -> dict[str, Bytes]:
+        """Exact per-card peak used bytes over every appended reading."""
+        return dict(self._device_peaks)
+
+    def append(
+        self, sample: HardChannel, *, stale: bool = False, interval: timedelta | None = None
+    ) -> None:
+        """Record one reading; raw text is kept only for first/breach/stale points.
+
+        ``interval`` is the wait the sampler chose before its next read.
+        """
+        flags = 0
+        if self._count == 0:
+            flags |= FLAG_FIRST
+        for reading in sample.readings():
+            peak = self._device_peaks.get(reading.device)
+            if peak is None or reading.used > peak:
+                self._device_peaks[reading.device] = reading.used
+        breached = breached_devices(sample, ceiling=self._ceiling, ceilings=self._ceilings)
+        if breached:
+            flags |= FLAG_BREACH
+        if stale:
+            flags |= FLAG_STALE
+        point = _Point(
+            used=int(sample.used),
+            total=int(sample.total),
+            monotonic_ns=time.monotonic_ns(),
+            collected_ns=_to_epoch_ns(sample.collected_at),
+            interval_ns=0 if interval is None else _duration_ns(interval),
+            flags=flags,
+            raw=sample.raw if flags else None,
+            devices=sample.devices,
+            breached=breached if sample.devices else (),
+        )
+        self._count += 1
+        self._peak = point.used if self._peak is None else max(self._peak, point.used)
+        if self._window == 0:
+            self._emit(point)
+            return
+        self._pending.append(point)
+        if len(self._pending) >= self._window:
+            self._flush()
+
+    def finish(self) -> TelemetrySeries:
+        """Flush any partial window and return an immutable snapshot."""
+        self._flush()
+        return TelemetrySeries(
+            used=array("q", self._used),
+            total=array("q", self._total),
+            monotonic_ns=array("q", self._mono),
+            collected_ns=array("q", self._wall),
+            interval_ns=array("q", self._interval),
+            flags=array("b", self._flags),
+            raw=dict(self._raw),
+            sample_count=self._count,
+            peak_used=self.peak_used,
+            device_peaks=self.device_peaks,
+            device_used={d: array("q", c) for d, c in self._device_used.items()},
+            device_total={d: array("q", c) for d, c in self._device_total.items()},
+            breached_devices=dict(self._breached),
+        )
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        lo = min(range(len(self._pending)), key=lambda i: self._pending[i].used)
+        hi = max(range(len(self._pending)), key=lambda i: self._pending[i].used)
+        for i, point in enumerate(self._pending):
+            if i in {lo, hi} or point.flags:
+                self._emit(point)
+        self._pending.clear()
+
+    def _emit(self, point: _Point) -> None:
+        index = len(self._used)
+        if point.raw is not None:
+            self._raw[index] = point.raw
+        if point.breached:
+            self._breached[index] = point.breached
+        for reading in point.devices:
+            if reading.device not in self._device_used:
+                self._device_used[reading.device] = array("q", [-1] * index)
+                self._device_total[reading.device] = array("q", [-1] * index)
+        by_device = {r.device: r for r in point.devices}
+        for device, used in self._device_used.items():
+            reading = by_device.get(device)
+            used.append(-1 if reading is None else int(reading.used))
+            self._device_total[device].append(-1 if reading is None else int(reading.total))
+        self._used.append(point.used)
+        self._total.append(point.total)
+        self._mono.append(point.monotonic_ns)
+        self._wall.append(point.collected_ns)
+        self._interval.append(point.interval_ns)
+        self._flags.append(point.flags)
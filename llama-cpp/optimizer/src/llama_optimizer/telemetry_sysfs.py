@@ -0,0 +1,185 @@
+"""Sysfs-backed hard-channel provider for total-VRAM telemetry (T5).
+
+The amdgpu driver exposes total-device VRAM as decimal byte counts under
+``/sys/class/drm/<card>/device/``::
+
+    mem_info_vram_total -> 17163091968
+    mem_info_vram_used  -> 807677952
+
+Unlike :class:`~llama_optimizer.telemetry.RocmSmiProvider`, which forks the
+Python-heavy ``rocm-smi`` on every tick, this provider opens each attribute
+once and re-reads it with ``os.pread`` at offset zero (sysfs regenerates the
+value on every read). Missing, unreadable, empty, or non-numeric attributes
+fail closed as :class:`TelemetryLossError` exactly like the rocm-smi path, and
+every reading is stamped before the read for staleness checks. Diagnostics
+are best-effort sysfs/hwmon reads and never a hard gate.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self, final
+
+from llama_optimizer.telemetry import (
+    DEVICE_KEY,
+    Bytes,
+    Diagnostics,
+    HardChannel,
+    TelemetryLossError,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+#: Default sysfs DRM class root; tests point this at a fake tree.
+SYSFS_DRM_ROOT: Final[Path] = Path("/sys/class/drm")
+
+TOTAL_ATTR: Final[str] = "mem_info_vram_total"
+USED_ATTR: Final[str] = "mem_info_vram_used"
+
+# A sysfs byte counter is a single decimal line; anything larger is not one.
+_READ_SIZE: Final[int] = 64
+_DECIMAL_RE: Final[re.Pattern[str]] = re.compile(r"\d+")
+_ACTIVE_SCLK_RE: Final[re.Pattern[str]] = re.compile(r"^\d+:\s*(\S+)\s*\*\s*$", re.MULTILINE)
+
+
+def parse_sysfs_bytes(raw: str, *, attr: str) -> Bytes:
+    """Parse one sysfs byte counter strictly or raise :class:`TelemetryLossError`."""
+    stripped = raw.strip()
+    if not stripped:
+        raise TelemetryLossError(reason=f"empty sysfs attribute {attr}", raw=raw)
+    if _DECIMAL_RE.fullmatch(stripped) is None:
+        raise TelemetryLossError(reason=f"malformed: {attr} is non-numeric", raw=raw)
+    return Bytes(int(stripped))
+
+
+def _read_optional(path: Path) -> str | None:
+    """Best-effort one-shot read of a diagnostic attribute. Never raises."""
+    try:
+        text = path.read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return text or None
+
+
+def _scaled(raw: str | None, divisor: int, unit: str) -> str | None:
+    """Render an integer hwmon reading in display units, or ``None``."""
+    if raw is None or _DECIMAL_RE.fullmatch(raw) is None:
+        return None
+    return f"{int(raw) / divisor:.1f}{unit}"
+
+
+@final
+class SysfsVramProvider:
+    """Hard-channel provider reading amdgpu VRAM counters with reused fds.
+
+    File descriptors are opened lazily on the first sample so construction
+    never touches the device; call :meth:`close` (or use the provider as a
+    context manager) to release them.
+    """
+
+    def __init__(self, card: str = DEVICE_KEY, *, root: Path = SYSFS_DRM_ROOT) -> None:
+        self._device_dir: Final[Path] = root / card / "device"
+        self._fds: dict[str, int] = {}
+
+    @property
+    def device_dir(self) -> Path:
+        """The ``<root>/<card>/device`` directory this provider reads."""
+        return self._device_dir
+
+    @property
+    def open_descriptors(self) -> dict[str, int]:
+        """Snapshot of the cached attribute-name to fd mapping (empty when closed)."""
+        return dict(self._fds)
+
+    def sample(self) -> HardChannel:
+        """Read total and used VRAM and parse both strictly."""
+        collected_at = datetime.now(UTC)
+        total_raw = self._pread(TOTAL_ATTR)
+        used_raw = self._pread(USED_ATTR)
+        raw = f"{TOTAL_ATTR}={total_raw.strip()}\n{USED_ATTR}={used_raw.strip()}"
+        return HardChannel(
+            total=parse_sysfs_bytes(total_raw, attr=TOTAL_ATTR),
+            used=parse_sysfs_bytes(used_raw, attr=USED_ATTR),
+            collected_at=collected_at,
+            raw=raw,
+        )
+
+    def diagnostics(self) -> Diagnostics:
+        """Read busy %, active sclk, PCIe link, and hwmon temp/power. Never raises."""
+        device = self._device_dir
+        sclk_table = _read_optional(device / "pp_dpm_sclk")
+        active = _ACTIVE_SCLK_RE.search(sclk_table) if sclk_table is not None else None
+        speed = _read_optional(device / "current_link_speed")
+        width = _read_optional(device / "current_link_width")
+        hwmon = next(iter(sorted((device / "hwmon").glob("hwmon*"))), None)
+        temp = _read_optional(hwmon / "temp1_input") if hwmon is not None else None
+        power = _read_optional(hwmon / "power1_average") if hwmon is not None else None
+        busy = _read_optional(device / "gpu_busy_percent")
+        fields = {
+            "temperature": _scaled(temp, 1000, "c"),
+            "power": _scaled(power, 1_000_000, "W"),
+            "gpu_use": f"{busy}%" if busy is not None else None,
+            "clocks": active.group(1) if active is not None else None,
+            "pcie": f"{speed} x{width}" if speed is not None and width is not None else None,
+        }
+        raw = "\n".join(f"{key}: {value}" for key, value in fields.items() if value is not None)
+        return Diagnostics(
+            temperature=fields["temperature"],
+            power=fields["power"],
+            gpu_use=fields["gpu_use"],
+            clocks=fields["clocks"],
+            pcie=fields["pcie"],
+            raw=raw,
+        )
+
+    def close(self) -> None:
+        """Release every cached attribute file descriptor. Idempotent."""
+        fds = list(self._fds.values())
+        self._fds.clear()
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                continue
+
+    def __enter__(self) -> Self:
+        """Return the provider; descriptors are still opened lazily."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release descriptors on context exit."""
+        self.close()
+
+    def _pread(self, attr: str) -> str:
+        fd = self._fds.get(attr)
+        path = self._device_dir / attr
+        try:
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+                self._fds[attr] = fd
+            data = os.pread(fd, _READ_SIZE, 0)
+        except FileNotFoundError as exc:
+            self.close()
+            raise TelemetryLossError(
+                reason=f"missing sysfs attribute {attr}", raw=str(path)
+            ) from exc
+        except OSError as exc:
+            self.close()
+            raise TelemetryLossError(
+                reason=f"unreadable sysfs attribute {attr}", raw=str(path)
+            ) from exc
+        try:
+            return data.decode("ascii")
+        except UnicodeDecodeError as exc:
+            raise TelemetryLossError(
+                reason=f"malformed: {attr} is not ascii", raw=repr(data)
+            ) from exc
@@ -0,0 +1,161 @@
+"""Behavior tests for headroom-driven adaptive sampling (T5).
+
+The pacer must back off toward ``max_interval`` while headroom is large and
+stable, drop to ``min_interval`` within the margin or on a fast rise, never
+sleep past ``max_staleness``, and the supervisor must record the interval it
+chose beside every reading.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.adaptive_interval import AdaptiveIntervalConfig, AdaptivePacer
+from llama_optimizer.supervisor import ChildExit, ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import (
+    VRAM_CEILING_BYTES,
+    Bytes,
+    Diagnostics,
+    HardChannel,
+    HardChannelProvider,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_CEILING = int(VRAM_CEILING_BYTES)
+_GIB = 1 << 30
+_MS = timedelta(milliseconds=1)
+
+
+def _pacer(max_staleness_ms: int = 30_000) -> AdaptivePacer:
+    config = AdaptiveIntervalConfig(
+        min_interval=50 * _MS, max_interval=800 * _MS, margin=Bytes(_GIB), backoff=2.0
+    )
+    return AdaptivePacer(config, initial=100 * _MS, max_staleness=max_staleness_ms * _MS)
+
+
+def _walk(pacer: AdaptivePacer, used: list[int], step: timedelta) -> list[timedelta]:
+    return [pacer.next_interval(step * i, Bytes(u)) for i, u in enumerate(used)]
+
+
+class TestPacer:
+    def test_large_stable_headroom_backs_off_to_the_maximum(self) -> None:
+        # Given an idle config far below the ceiling.
+        pacer = _pacer()
+        # When readings stay flat.
+        intervals = _walk(pacer, [2 * _GIB] * 5, timedelta(seconds=1))
+        # Then the wait doubles up to the configured maximum.
+        assert intervals == [200 * _MS, 400 * _MS, 800 * _MS, 800 * _MS, 800 * _MS]
+
+    def test_within_margin_samples_at_the_minimum(self) -> None:
+        pacer = _pacer()
+        _ = _walk(pacer, [2 * _GIB] * 3, timedelta(seconds=1))
+        assert pacer.next_interval(timedelta(seconds=3), Bytes(_CEILING - _GIB)) == 50 * _MS
+
+    def test_fast_rise_samples_at_the_minimum(self) -> None:
+        # Given a reading 1 GiB higher only 100 ms later (10 GiB/s).
+        pacer = _pacer()
+        _ = pacer.next_interval(timedelta(0), Bytes(_GIB))
+        # Then the rise alone forces the minimum despite large headroom.
+        assert pacer.next_interval(100 * _MS, Bytes(2 * _GIB)) == 50 * _MS
+
+    def test_slow_rise_never_sleeps_past_half_the_time_to_ceiling(self) -> None:
+        # Given a long maximum and a 200 MiB/s climb starting 3 GiB below the ceiling.
+        config = AdaptiveIntervalConfig(max_interval=timedelta(seconds=10), margin=Bytes(_GIB))
+        pacer = AdaptivePacer(config, initial=100 * _MS, max_staleness=timedelta(seconds=30))
+        rate = 200 << 20
+        used = [_CEILING - 3 * _GIB + rate * i for i in range(8)]
+        # When backing off.
+        intervals = _walk(pacer, used, timedelta(seconds=1))
+        # Then no wait outlasts half the projected time to the ceiling.
+        for interval, reading in zip(intervals[1:], used[1:], strict=True):
+            assert interval.total_seconds() <= (_CEILING - reading) / rate / 2
+        assert max(intervals) < timedelta(seconds=10)
+
+    def test_never_exceeds_max_staleness(self) -> None:
+        pacer = _pacer(max_staleness_ms=300)
+        intervals = _walk(pacer, [2 * _GIB] * 5, timedelta(seconds=1))
+        assert max(intervals) == 300 * _MS
+
+    @pytest.mark.parametrize(
+        ("build", "match"),
+        [
+            (lambda: AdaptiveIntervalConfig(min_interval=timedelta(0)), "min_interval"),
+            (lambda: AdaptiveIntervalConfig(max_interval=_MS), "min_interval"),
+            (lambda: AdaptiveIntervalConfig(rise_rate=0.0), "rise_rate"),
+            (lambda: AdaptiveIntervalConfig(backoff=1.0), "backoff"),
+        ],
+    )
+    def test_rejects_invalid_config(
+        self, build: Callable[[], AdaptiveIntervalConfig], match: str
+    ) -> None:
+        with pytest.raises(ValueError, match=match):
+            _ = build()
+
+
+@dataclass
+class _StepProvider(HardChannelProvider):
+    """Idle for ``idle_calls`` reads, then jumps to within the margin."""
+
+    idle_calls: int = 4
+    _calls: int = field(default=0, init=False)
+
+    @override
+    def sample(self) -> HardChannel:
+        self._calls += 1
+        used = 2 * _GIB if self._calls <= self.idle_calls else _CEILING - _GIB // 2
+        return HardChannel(
+            total=Bytes(17_163_091_968), used=Bytes(used), collected_at=datetime.now(UTC), raw=""
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+class TestSupervisorIntegration:
+    def test_records_the_chosen_interval_per_sample(self) -> None:
+        # Given adaptive pacing and a load that moves close to the ceiling.
+        config = SupervisorConfig(
+            interval=20 * _MS,
+            deadline=timedelta(seconds=30),
+            grace=timedelta(milliseconds=400),
+            provider_timeout=timedelta(seconds=2),
+            max_staleness=timedelta(seconds=5),
+            adaptive_interval=AdaptiveIntervalConfig(
+                min_interval=10 * _MS, max_interval=80 * _MS, margin=Bytes(_GIB)
+            ),
+        )
+        # When supervising a short child.
+        result = ProcessSupervisor().run(
+            [sys.executable, "-c", "import time; time.sleep(0.6)"],
+            provider=_StepProvider(),
+            config=config,
+        )
+        # Then the series holds the backed-off and the near-ceiling intervals.
+        assert result.outcome == ChildExit(0)
+        intervals = result.series.intervals()
+        assert len(intervals) == len(result.series)
+        assert intervals[:3] == (40 * _MS, 80 * _MS, 80 * _MS)
+        assert intervals[-1] == 10 * _MS
+
+    def test_fixed_mode_records_the_configured_interval(self) -> None:
+        config = SupervisorConfig(
+            interval=20 * _MS,
+            deadline=timedelta(seconds=30),
+            grace=timedelta(milliseconds=400),
+            provider_timeout=timedelta(seconds=2),
+            max_staleness=timedelta(seconds=5),
+        )
+        result = ProcessSupervisor().run(
+            [sys.executable, "-c", "pass"], provider=_StepProvider(), config=config
+        )
+        assert set(result.series.intervals()) == {20 * _MS}
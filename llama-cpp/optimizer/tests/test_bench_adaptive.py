@@ -0,0 +1,270 @@
+"""Behavior tests for sequential early stopping of llama-bench repetitions (T6).
+
+The Student-t interval must match tabulated critical values, the stopping rule
+must converge on tight samples, stop on confident domination by the incumbent,
+and honour the hard cap, and an adaptive screen must run llama-bench in rounds
+while keeping every round's samples in the recorded evidence.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    AdaptiveRepetitions,
+    BenchConfig,
+    BenchIdentity,
+    BenchMeasurement,
+    BenchResult,
+    BenchSample,
+    BenchScreenRequest,
+    StopReason,
+    run_supervised_bench,
+    run_supervised_bench_sweep,
+)
+from llama_optimizer.bench_adaptive import mean_ci, stop_reason
+from llama_optimizer.bench_stats import t_quantile
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping, Sequence
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+_RULE = AdaptiveRepetitions(target_rel_ci=0.05)
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _result(**rates: Sequence[float]) -> BenchResult:
+    return BenchResult(
+        model="m.gguf",
+        build=1,
+        measurements=tuple(
+            BenchMeasurement(
+                workload_name=name,
+                avg_ts=sum(ts) / len(ts),
+                stddev_ts=0.0,
+                samples=tuple(BenchSample(ns=1, ts=t) for t in ts),
+            )
+            for name, ts in rates.items()
+        ),
+        raw_jsonl="",
+    )
+
+
+class TestStatistics:
+    @pytest.mark.parametrize(("dof", "table"), [(2, 4.303), (4, 2.776), (10, 2.228), (30, 2.042)])
+    def test_t_quantile_matches_tabulated_values(self, dof: int, table: float) -> None:
+        assert t_quantile(0.95, dof) == pytest.approx(table, rel=0.04)
+
+    @pytest.mark.parametrize(
+        ("confidence", "dof", "table"),
+        [(0.95, 1, 12.706), (0.95, 2, 4.303), (0.99, 2, 9.925), (0.99, 3, 5.841)],
+    )
+    def test_small_dof_t_quantile_is_exact(self, confidence: float, dof: int, table: float) -> None:
+        # Small samples are where the adaptive screen decides first; a value
+        # from the asymptotic expansion would narrow the interval there.
+        assert t_quantile(confidence, dof) == pytest.approx(table, abs=5e-4)
+
+    def test_interval_is_unbounded_below_three_samples(self) -> None:
+        assert mean_ci([1.0, 2.0], 0.95) == (1.5, math.inf)
+
+    def test_rule_rejects_too_few_samples(self) -> None:
+        with pytest.raises(ValueError, match="min_samples"):
+            _ = AdaptiveRepetitions(min_samples=2)
+
+
+class TestStopReason:
+    def test_tight_samples_converge(self) -> None:
+        result = _result(pp512=[250.0, 250.1, 249.9], tg128=[42.5, 42.4, 42.6])
+        assert stop_reason(result, _RULE, cap=10) is StopReason.CONVERGED
+
+    def test_noisy_samples_continue_until_the_cap(self) -> None:
+        noisy = _result(pp512=[100.0, 200.0, 300.0])
+        assert stop_reason(noisy, _RULE, cap=10) is None
+        assert stop_reason(noisy, _RULE, cap=3) is StopReason.CAPPED
+
+    def test_confidently_worse_config_is_dominated(self) -> None:
+        # Given noisy samples whose upper bound still trails the incumbent.
+        result = _result(pp512=[100.0, 110.0, 120.0], tg128=[40.0, 45.0, 50.0])
+        incumbent: Mapping[str, float] = {"pp512": 300.0, "tg128": 80.0}
+        # Then the screen stops; a workload where it might win keeps it going.
+        assert stop_reason(result, _RULE, cap=10, incumbent=incumbent) is StopReason.DOMINATED
+        close = {"pp512": 300.0, "tg128": 50.0}
+        assert stop_reason(result, _RULE, cap=10, incumbent=close) is None
+
+
+@pytest.fixture
+def ledger(run_root_base: Path) -> Generator[Ledger]:
+    """Create a RUNNING ledger for adaptive screening."""
+    led = Ledger.create_run(
+        RunArtifactRoot.for_run("adaptive-1", base=run_root_base),
+        RunIdentity(
+            manifest_hash="sha256:manifest",
+            config_hash="sha256:config",
+            optimizer_version="0.1.0",
+            optuna_version="4.9.0",
+            checkpoint_format="pickle.v1",
+            max_retries=2,
+            seed=42,
+            process_group_pid=os.getpid(),
+        ),
+    )
+    led.start_run()
+    try:
+        yield led
+    finally:
+        led.close()
+
+
+class TestAdaptiveScreen:
+    def _screen(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pp: list[float]
+    ) -> BenchScreenRequest:
+        ctrl = tmp_path / "control.json"
+        control = {
+            "mode": "happy",
+            "model": "ornith-1.0-9b-Q4_K_M.gguf",
+            "pp_samples_ts": pp,
+            "tg_samples_ts": [42.4, 42.5, 42.6],
+        }
+        _ = ctrl.write_text(json.dumps(control))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_LAUNCHES", str(tmp_path / "launches.txt"))
+        trial = ledger.create_trial(
+            TrialConfig(
+                config_id="cfg-1",
+                config_hash="hash-1",
+                candidate_id="ornith-1.0-9b-q4_k_m",
+                backend="rocm",
+                quant="Q4_K_M",
+            )
+        )
+        _ = ledger.start_trial(trial.trial_id)
+        return BenchScreenRequest(
+            trial_id=trial.trial_id,
+            bench_config=BenchConfig(
+                repetitions=9,
+                delay_seconds=0,
+                workloads=DEFAULT_BENCH_CONFIG.workloads,
+                adaptive=_RULE,
+            ),
+            identity=BenchIdentity(
+                model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+                n_gpu_layers=99,
+                n_batch=2048,
+                n_ubatch=512,
+                type_k="f16",
+                type_v="f16",
+                n_threads=16,
+                flash_attn=1,
+                use_mmap=True,
+            ),
+            binary=str(_BENCH_FIXTURE),
+            output_dir=tmp_path / "output",
+        )
+
+    def test_stable_config_stops_after_one_round(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        request = self._screen(ledger, tmp_path, monkeypatch, [248.0, 250.0, 252.0])
+        result = run_supervised_bench(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, request
+        )
+        assert result.outcome is None
+        assert result.stop_reason is StopReason.CONVERGED
+        assert (tmp_path / "launches.txt").read_text() == "1"
+
+    def test_noisy_config_runs_rounds_to_the_cap_and_keeps_every_sample(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a config whose prompt throughput scatters widely.
+        request = self._screen(ledger, tmp_path, monkeypatch, [100.0, 200.0, 300.0])
+        # When screening it adaptively with a cap of nine repetitions.
+        result = run_supervised_bench(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, request
+        )
+        # Then three rounds ran and all nine samples were pooled and recorded.
+        assert result.stop_reason is StopReason.CAPPED
+        assert (tmp_path / "launches.txt").read_text() == "3"
+        assert result.result is not None
+        assert len(result.result.measurements[0].samples) == 9
+        assert result.metrics["pp512_avg_ts"] == pytest.approx(200.0)
+        attempt = ledger.dump()["trials"][0]["attempts"][0]
+        artifact = Path(attempt["artifacts"][0]["relative_path"])
+        assert len(artifact.read_text().splitlines()) == 6
+        assert len(attempt["telemetry"]) >= 3
+
+    def test_round_that_adds_no_samples_ends_the_screen_unscored(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a noisy config whose second launch exits cleanly with no JSONL.
+        request = self._screen(ledger, tmp_path, monkeypatch, [100.0, 200.0, 300.0])
+        ctrl = tmp_path / "control.json"
+        control = json.loads(ctrl.read_text())  # pyright: ignore[reportAny]
+        _ = ctrl.write_text(json.dumps({**control, "silent_after_launches": 1}))
+        # When screening it adaptively.
+        result = run_supervised_bench(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, request
+        )
+        # Then the stalled round stops the loop and the screen does not score.
+        assert (tmp_path / "launches.txt").read_text() == "2"
+        assert result.outcome is NonScoredOutcome.MEASUREMENT_FAILURE
+        assert result.stop_reason is None
+
+    def test_dominated_config_stops_early(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        request = self._screen(ledger, tmp_path, monkeypatch, [100.0, 200.0, 300.0])
+        request = replace(request, incumbent={"pp512": 1000.0, "tg128": 100.0})
+        result = run_supervised_bench(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, request
+        )
+        assert result.stop_reason is StopReason.DOMINATED
+        assert (tmp_path / "launches.txt").read_text() == "1"
+
+    def test_sweeps_refuse_adaptive_configs(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        request = self._screen(ledger, tmp_path, monkeypatch, [250.0])
+        with pytest.raises(ValueError, match="adaptive"):
+            _ = run_supervised_bench_sweep(
+                ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, [request]
+            )
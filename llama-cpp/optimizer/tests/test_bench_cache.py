@@ -0,0 +1,227 @@
+"""Behavior tests for the cross-run llama-bench measurement cache (T6).
+
+A successful screen must be stored under a canonical key hash and answer a
+later run's identical screen without launching llama-bench, linking the
+original run as provenance in the new ledger. Freshness and re-measure
+policies, key sensitivity, and corrupted entries must all fall back to a real
+measurement.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    BenchCacheLookup,
+    BenchIdentity,
+    BenchScreenRequest,
+    CachePolicy,
+    run_supervised_bench,
+)
+from llama_optimizer.bench_cache import BENCH_CACHE_ARTIFACT_KIND, MeasurementKey
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.models import LlamaCppBuild, Sha256Hex
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from llama_optimizer.bench import BenchScreenResult
+    from llama_optimizer.ledger_dump import AttemptDump
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+_MODEL_SHA = Sha256Hex("ab" * 32)
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _identity() -> BenchIdentity:
+    return BenchIdentity(
+        model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+        n_gpu_layers=99,
+        n_batch=2048,
+        n_ubatch=512,
+        type_k="f16",
+        type_v="f16",
+        n_threads=16,
+        flash_attn=1,
+        use_mmap=True,
+    )
+
+
+def _lookup(
+    root: Path, policy: CachePolicy = CachePolicy.REUSE, max_age: timedelta | None = None
+) -> BenchCacheLookup:
+    return BenchCacheLookup(
+        root=root,
+        build=LlamaCppBuild(build_label="b4000", fork_ref="main"),
+        model_sha256=_MODEL_SHA,
+        backend="rocm",
+        policy=policy,
+        max_age=max_age,
+    )
+
+
+@pytest.fixture
+def fake_bench(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the fake llama-bench at a happy control file; return its launch counter."""
+    ctrl = tmp_path / "control.json"
+    _ = ctrl.write_text(json.dumps({"mode": "happy", "model": "ornith-1.0-9b-Q4_K_M.gguf"}))
+    monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+    launches = tmp_path / "launches.txt"
+    monkeypatch.setenv("LLAMA_BENCH_FAKE_LAUNCHES", str(launches))
+    return launches
+
+
+def _screen(
+    base: Path, run_id: str, lookup: BenchCacheLookup
+) -> tuple[BenchScreenResult, AttemptDump]:
+    """Screen one trial in a fresh run and return the result and its attempt dump."""
+    ledger = Ledger.create_run(
+        RunArtifactRoot.for_run(run_id, base=base),
+        RunIdentity(
+            manifest_hash="sha256:manifest",
+            config_hash="sha256:config",
+            optimizer_version="0.1.0",
+            optuna_version="4.9.0",
+            checkpoint_format="pickle.v1",
+            max_retries=2,
+            seed=42,
+            process_group_pid=os.getpid(),
+        ),
+    )
+    with ledger:
+        ledger.start_run()
+        trial = ledger.create_trial(
+            TrialConfig(
+                config_id="cfg-1",
+                config_hash="hash-1",
+                candidate_id="ornith-1.0-9b-q4_k_m",
+                backend="rocm",
+                quant="Q4_K_M",
+            )
+        )
+        _ = ledger.start_trial(trial.trial_id)
+        request = BenchScreenRequest(
+            trial_id=trial.trial_id,
+            bench_config=DEFAULT_BENCH_CONFIG,
+            identity=_identity(),
+            binary=str(_BENCH_FIXTURE),
+            output_dir=base / run_id / "output",
+            cache=lookup,
+        )
+        result = run_supervised_bench(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, request
+        )
+        return result, ledger.dump()["trials"][0]["attempts"][0]
+
+
+class TestMeasurementKey:
+    def test_digest_is_stable_and_sensitive_to_every_field(self) -> None:
+        key = MeasurementKey(
+            LlamaCppBuild("b4000", "main"), _MODEL_SHA, "rocm", _identity(), DEFAULT_BENCH_CONFIG
+        )
+        assert key.digest() == replace(key).digest()
+        variants = [
+            replace(key, backend="vulkan"),
+            replace(key, build=LlamaCppBuild("b4001", "main")),
+            replace(key, identity=replace(_identity(), n_ubatch=256)),
+            replace(key, bench_config=replace(DEFAULT_BENCH_CONFIG, repetitions=5)),
+        ]
+        assert len({k.digest() for k in (key, *variants)}) == 5
+
+    def test_fresh_policy_requires_a_max_age(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_age"):
+            _ = _lookup(tmp_path, CachePolicy.REUSE_IF_FRESH)
+
+
+class TestCachedScreening:
+    def test_second_run_reuses_the_first_measurement_with_provenance(
+        self, run_root_base: Path, tmp_path: Path, fake_bench: Path
+    ) -> None:
+        # Given a first run that measured and cached the config.
+        cache = tmp_path / "cache"
+        first, _ = _screen(run_root_base, "cache-1", _lookup(cache))
+        assert first.reused_from is None
+        # When a second run screens the identical config.
+        second, attempt = _screen(run_root_base, "cache-2", _lookup(cache))
+        # Then llama-bench was not launched again and the evidence points at run one.
+        assert fake_bench.read_text() == "1"
+        assert second.outcome is None
+        assert second.reused_from is not None
+        assert (second.reused_from.run_id, second.reused_from.attempt_id) == (
+            "cache-1",
+            first.attempt_id,
+        )
+        assert not second.supervisor_result.launched
+        assert second.metrics == first.metrics
+        kinds = {a["kind"]: a for a in attempt["artifacts"]}
+        entry_path = Path(kinds[BENCH_CACHE_ARTIFACT_KIND]["relative_path"])
+        entry: dict[str, object] = json.loads(entry_path.read_text())  # pyright: ignore[reportAny]
+        assert entry["run_id"] == "cache-1"
+        assert first.result is not None
+        assert entry["samples"] == {
+            m.workload_name: [[s.ns, s.ts] for s in m.samples] for m in first.result.measurements
+        }
+        assert attempt["outcome"] is None
+
+    @pytest.mark.parametrize(
+        ("policy", "max_age"),
+        [(CachePolicy.REMEASURE, None), (CachePolicy.REUSE_IF_FRESH, timedelta(0))],
+    )
+    def test_policy_can_force_a_new_measurement(
+        self,
+        run_root_base: Path,
+        tmp_path: Path,
+        fake_bench: Path,
+        policy: CachePolicy,
+        max_age: timedelta | None,
+    ) -> None:
+        cache = tmp_path / "cache"
+        _ = _screen(run_root_base, "cache-1", _lookup(cache))
+        second, _ = _screen(run_root_base, "cache-2", _lookup(cache, policy, max_age))
+        assert fake_bench.read_text() == "2"
+        assert second.reused_from is None
+
+    def test_corrupted_entry_is_remeasured(
+        self, run_root_base: Path, tmp_path: Path, fake_bench: Path
+    ) -> None:
+        cache = tmp_path / "cache"
+        _ = _screen(run_root_base, "cache-1", _lookup(cache))
+        (jsonl,) = cache.glob("*/bench.jsonl")
+        _ = jsonl.write_text(jsonl.read_text().replace("248", "999"))
+        second, _ = _screen(run_root_base, "cache-2", _lookup(cache))
+        assert fake_bench.read_text() == "2"
+        assert second.reused_from is None
@@ -0,0 +1,229 @@
+"""Behavior tests for depth-profile llama-bench screening (T6).
+
+A depth profile must ask one llama-bench launch for every listed KV depth,
+keep the 32768 rows as the comparable measurements, collect the rest into a
+throughput-vs-depth curve, and record its slope and normalised area as
+metrics.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    DEFAULT_DEPTH_PROFILE,
+    AdaptiveRepetitions,
+    BenchIdentity,
+    BenchResult,
+    BenchScreenRequest,
+    DepthPoint,
+    build_bench_command,
+    depth_metrics,
+    parse_bench_jsonl,
+    run_supervised_bench,
+)
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+_PROFILED = replace(DEFAULT_BENCH_CONFIG, depth_profile=DEFAULT_DEPTH_PROFILE)
+
+_IDENTITY = BenchIdentity(
+    model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+    n_gpu_layers=99,
+    n_batch=2048,
+    n_ubatch=512,
+    type_k="f16",
+    type_v="f16",
+    n_threads=16,
+    flash_attn=1,
+    use_mmap=True,
+)
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _line(name: str, n_depth: int, avg_ts: float) -> str:
+    """Build one llama-bench JSONL line for ``name`` at ``n_depth``."""
+    pp = name == "pp512"
+    return json.dumps(
+        {
+            "build": 1234,
+            "model": _IDENTITY.model_filename,
+            "name": name,
+            "n_gpu_layers": _IDENTITY.n_gpu_layers,
+            "n_batch": _IDENTITY.n_batch,
+            "n_ubatch": _IDENTITY.n_ubatch,
+            "type_k": _IDENTITY.type_k,
+            "type_v": _IDENTITY.type_v,
+            "n_threads": _IDENTITY.n_threads,
+            "flash_attn": _IDENTITY.flash_attn,
+            "split_mode": _IDENTITY.split_mode,
+            "n_prompt": 512 if pp else 0,
+            "n_gen": 0 if pp else 128,
+            "n_depth": n_depth,
+            "avg_ts": avg_ts,
+            "stddev_ts": 0.0,
+            "samples_ns": [1_000_000],
+            "samples_ts": [avg_ts],
+        }
+    )
+
+
+class TestDepthProfileConfig:
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"depth_profile": (0, 4096)},
+            {"depth_profile": (-1, 32768)},
+            {"depth_profile": DEFAULT_DEPTH_PROFILE, "adaptive": AdaptiveRepetitions()},
+        ],
+    )
+    def test_rejects_profiles_that_break_the_contract(self, changes: dict[str, object]) -> None:
+        with pytest.raises(ValueError, match="depth profile"):
+            _ = replace(DEFAULT_BENCH_CONFIG, **changes)
+
+    def test_command_requests_every_depth_in_one_launch(self) -> None:
+        cmd = build_bench_command("/usr/bin/llama-bench", _PROFILED, _IDENTITY)
+        assert cmd[cmd.index("-d") + 1] == "0,4096,16384,32768"
+        plain = build_bench_command("/usr/bin/llama-bench", DEFAULT_BENCH_CONFIG, _IDENTITY)
+        assert plain[plain.index("-d") + 1] == "32768"
+
+
+class TestDepthCurve:
+    def test_only_context_depth_rows_are_measurements(self) -> None:
+        # Given pp512/tg128 rows at three depths.
+        raw = "\n".join(
+            _line(name, depth, ts)
+            for depth, scale in ((0, 2.0), (16384, 1.5), (32768, 1.0))
+            for name, ts in (("pp512", 250.0 * scale), ("tg128", 40.0 * scale))
+        )
+        # When parsed.
+        result = parse_bench_jsonl(raw, _IDENTITY, ("pp512", "tg128"))
+        # Then the measurements are the 32768 rows and the curve has every row.
+        assert {m.workload_name: m.avg_ts for m in result.measurements} == {
+            "pp512": 250.0,
+            "tg128": 40.0,
+        }
+        assert [(p.workload_name, p.n_depth, p.avg_ts) for p in result.depth_curve] == [
+            ("pp512", 0, 500.0),
+            ("pp512", 16384, 375.0),
+            ("pp512", 32768, 250.0),
+            ("tg128", 0, 80.0),
+            ("tg128", 16384, 60.0),
+            ("tg128", 32768, 40.0),
+        ]
+
+    def test_single_depth_output_has_no_curve(self) -> None:
+        raw = "\n".join((_line("pp512", 32768, 250.0), _line("tg128", 32768, 40.0)))
+        result = parse_bench_jsonl(raw, _IDENTITY, ("pp512", "tg128"))
+        assert result.depth_curve == ()
+        assert depth_metrics(result) == {}
+
+    def test_slope_and_auc_summarize_the_curve(self) -> None:
+        # Given a curve falling 1 t/s per 1024 tokens, bent at 1024.
+        curve = (
+            DepthPoint("tg128", 0, 40.0),
+            DepthPoint("tg128", 1024, 39.0),
+            DepthPoint("tg128", 3072, 37.0),
+        )
+        result = BenchResult(model="m", build=1, measurements=(), raw_jsonl="", depth_curve=curve)
+        # Then the slope is per 1024 tokens and the AUC is the mean throughput.
+        metrics = depth_metrics(result)
+        assert metrics["tg128_depth_slope_ts"] == pytest.approx(-1.0)
+        assert metrics["tg128_depth_auc_ts"] == pytest.approx(38.5)
+
+
+class TestDepthProfiledScreen:
+    def test_one_launch_records_depth_metrics_and_unchanged_scores(
+        self, run_root_base: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a fake llama-bench that reads faster at shallower depths.
+        ctrl = tmp_path / "control.json"
+        _ = ctrl.write_text(json.dumps({"mode": "happy", "model": _IDENTITY.model_filename}))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+        launches = tmp_path / "launches.txt"
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_LAUNCHES", str(launches))
+        ledger = Ledger.create_run(
+            RunArtifactRoot.for_run("depth-1", base=run_root_base),
+            RunIdentity(
+                manifest_hash="sha256:manifest",
+                config_hash="sha256:config",
+                optimizer_version="0.1.0",
+                optuna_version="4.9.0",
+                checkpoint_format="pickle.v1",
+                max_retries=2,
+                seed=42,
+                process_group_pid=os.getpid(),
+            ),
+        )
+        with ledger:
+            ledger.start_run()
+            trial = ledger.create_trial(
+                TrialConfig(
+                    config_id="cfg-1",
+                    config_hash="hash-1",
+                    candidate_id="ornith-1.0-9b-q4_k_m",
+                    backend="rocm",
+                    quant="Q4_K_M",
+                )
+            )
+            _ = ledger.start_trial(trial.trial_id)
+            # When a depth-profiled screen runs.
+            result = run_supervised_bench(
+                ProcessSupervisor(),
+                _BelowLimitProvider(),
+                _FAST,
+                ledger,
+                BenchScreenRequest(
+                    trial_id=trial.trial_id,
+                    bench_config=_PROFILED,
+                    identity=_IDENTITY,
+                    binary=str(_BENCH_FIXTURE),
+                    output_dir=tmp_path / "output",
+                ),
+            )
+            recorded = ledger.dump()["trials"][0]["attempts"][0]["metrics"]
+        # Then one launch covered every depth and the 32768 scores are unchanged.
+        assert launches.read_text() == "1"
+        assert result.outcome is None
+        assert result.result is not None
+        assert len(result.result.depth_curve) == 2 * len(DEFAULT_DEPTH_PROFILE)
+        assert result.metrics["pp512_avg_ts"] == pytest.approx(250.0)
+        assert result.metrics["pp512_depth_slope_ts"] < 0
+        assert result.metrics["tg128_depth_auc_ts"] > result.metrics["tg128_avg_ts"]
+        assert recorded["pp512_depth_slope_ts"] == result.metrics["pp512_depth_slope_ts"]
@@ -0,0 +1,205 @@
+"""Behavior tests for drift-corrected screening (T6).
+
+The drift curve must interpolate reference measurements relative to the
+first one, and a screening sweep on a card that slows with every launch must
+interleave reference trials and record drift-normalised throughput that is
+comparable across the sweep while the raw throughput keeps its decay.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    BenchIdentity,
+    BenchScreenRequest,
+    DriftCurve,
+    DriftReference,
+    screen_with_drift,
+)
+from llama_optimizer.bench_drift import DriftPoint
+from llama_optimizer.bench_supervision import BenchSupervision
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.lifecycle import TrialId
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+class TestDriftCurve:
+    def test_factor_interpolates_between_references_and_holds_at_the_ends(self) -> None:
+        curve = DriftCurve(
+            (
+                DriftPoint(_T0, {"pp512": 200.0}),
+                DriftPoint(_T0 + timedelta(minutes=10), {"pp512": 180.0}),
+            )
+        )
+        assert curve.factor("pp512", _T0 - timedelta(minutes=1)) == 1.0
+        assert curve.factor("pp512", _T0 + timedelta(minutes=5)) == pytest.approx(0.95)
+        assert curve.factor("pp512", _T0 + timedelta(hours=1)) == pytest.approx(0.9)
+        assert curve.factor("tg128", _T0) is None
+
+    def test_reference_interval_must_be_positive(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="interval"):
+            _ = DriftReference(
+                TrialConfig("ref", "hash-ref", "cand", "rocm", "Q4_K_M"),
+                _request(tmp_path, TrialId("unused")),
+                every=0,
+            )
+
+
+def _request(tmp_path: Path, trial_id: TrialId) -> BenchScreenRequest:
+    return BenchScreenRequest(
+        trial_id=trial_id,
+        bench_config=DEFAULT_BENCH_CONFIG,
+        identity=BenchIdentity(
+            model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+            n_gpu_layers=99,
+            n_batch=2048,
+            n_ubatch=512,
+            type_k="f16",
+            type_v="f16",
+            n_threads=16,
+            flash_attn=1,
+            use_mmap=True,
+        ),
+        binary=str(_BENCH_FIXTURE),
+        output_dir=tmp_path / "output",
+    )
+
+
+@pytest.fixture
+def ledger(run_root_base: Path) -> Generator[Ledger]:
+    """Create a RUNNING ledger for drift-corrected screening."""
+    led = Ledger.create_run(
+        RunArtifactRoot.for_run("drift-1", base=run_root_base),
+        RunIdentity(
+            manifest_hash="sha256:manifest",
+            config_hash="sha256:config",
+            optimizer_version="0.1.0",
+            optuna_version="4.9.0",
+            checkpoint_format="pickle.v1",
+            max_retries=2,
+            seed=42,
+            process_group_pid=os.getpid(),
+        ),
+    )
+    led.start_run()
+    try:
+        yield led
+    finally:
+        led.close()
+
+
+class TestScreenWithDrift:
+    def test_heating_card_is_normalised_by_interleaved_references(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a card that reads 2% slower on every launch.
+        ctrl = tmp_path / "control.json"
+        control = {"mode": "happy", "model": "ornith-1.0-9b-Q4_K_M.gguf", "decay_per_launch": 0.02}
+        _ = ctrl.write_text(json.dumps(control))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_LAUNCHES", str(tmp_path / "launches.txt"))
+        requests: list[BenchScreenRequest] = []
+        for n in range(4):
+            trial = ledger.create_trial(
+                TrialConfig(f"cfg-{n}", f"hash-{n}", "ornith-1.0-9b-q4_k_m", "rocm", "Q4_K_M")
+            )
+            _ = ledger.start_trial(trial.trial_id)
+            requests.append(_request(tmp_path, trial.trial_id))
+        reference = DriftReference(
+            TrialConfig("ref", "hash-ref", "ornith-1.0-9b-q4_k_m", "rocm", "Q4_K_M"),
+            _request(tmp_path, TrialId("template")),
+            every=2,
+        )
+        # When screening four identical configs with a reference every two trials.
+        screening = screen_with_drift(
+            BenchSupervision(ProcessSupervisor(), _BelowLimitProvider(), _FAST),
+            ledger,
+            requests,
+            reference,
+        )
+        # Then references ran first, after trial two, and after the last trial.
+        assert len(screening.references) == 3
+        assert (tmp_path / "launches.txt").read_text() == "7"
+        raw = [t.metrics["pp512_avg_ts"] for t in screening.trials]
+        norm = [t.metrics["pp512_avg_ts_drift_norm"] for t in screening.trials]
+        assert raw[0] / raw[-1] > 1.05
+        assert all(v == pytest.approx(250.0, rel=0.015) for v in norm)
+        # And the normalised figures were recorded next to the raw ones.
+        dump = {t["config_id"]: t for t in ledger.dump()["trials"]}
+        assert set(dump) == {"cfg-0", "cfg-1", "cfg-2", "cfg-3", "ref~ref0", "ref~ref1", "ref~ref2"}
+        recorded = dump["cfg-3"]["attempts"][0]["metrics"]
+        assert recorded["pp512_avg_ts_drift_norm"] == pytest.approx(norm[-1])
+        assert recorded["pp512_avg_ts"] == pytest.approx(raw[-1])
+        # And no reference trial is left RUNNING, while its measurement is kept.
+        refs = [trial for config_id, trial in dump.items() if "~ref" in config_id]
+        assert {t["phase"] for t in refs} == {"abandoned"}
+        assert all(t["attempts"][0]["metrics"]["pp512_avg_ts"] > 0 for t in refs)
+        assert {dump[f"cfg-{n}"]["phase"] for n in range(4)} == {"running"}
+
+    def test_reference_that_did_not_score_is_abandoned(
+        self, ledger: Ledger, tmp_path: Path
+    ) -> None:
+        # Given a reference binary that cannot load its model.
+        failing = tmp_path / "failing-bench"
+        _ = failing.write_text("#!/bin/sh\necho 'error: failed to load model' >&2\nexit 1\n")
+        failing.chmod(0o755)
+        reference = DriftReference(
+            TrialConfig("ref", "hash-ref", "ornith-1.0-9b-q4_k_m", "rocm", "Q4_K_M"),
+            replace(_request(tmp_path, TrialId("template")), binary=str(failing)),
+        )
+        # When screening no trials around it.
+        screening = screen_with_drift(
+            BenchSupervision(ProcessSupervisor(), _BelowLimitProvider(), _FAST),
+            ledger,
+            [],
+            reference,
+        )
+        # Then the reference is abandoned with its outcome, not left RUNNING.
+        (result,) = screening.references
+        (trial,) = ledger.dump()["trials"]
+        assert result.outcome is not None
+        assert trial["phase"] == "abandoned"
+        assert trial["outcome"] == result.outcome.value
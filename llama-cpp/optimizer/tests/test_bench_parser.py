@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import math
+from dataclasses import replace
 
 import pytest
 
@@ -62,6 +63,7 @@ def _make_jsonl_line(  # noqa: PLR0913
     threads: int = _IDENTITY.n_threads,
     flash: int = _IDENTITY.flash_attn,
     n_depth: int = 32768,
+    split_mode: str = _IDENTITY.split_mode,
 ) -> str:
     """Build one JSONL line matching the llama-bench machine schema."""
     if samples_ns is None:
@@ -79,6 +81,7 @@ def _make_jsonl_line(  # noqa: PLR0913
         "type_v": type_v,
         "n_threads": threads,
         "flash_attn": flash,
+        "split_mode": split_mode,
         "n_prompt": n_prompt,
         "n_gen": n_gen,
         "n_depth": n_depth,
@@ -194,6 +197,20 @@ class TestBuildBenchCommand:
         cmd = build_bench_command("/usr/bin/llama-bench", DEFAULT_BENCH_CONFIG, identity)
         assert cmd[cmd.index("-mmp") + 1] == "0"
 
+    def test_split_mode_is_explicit_and_tensor_split_only_when_set(self) -> None:
+        # Given the default single-card identity and a row-split dual-card one.
+        default = build_bench_command("/usr/bin/llama-bench", DEFAULT_BENCH_CONFIG, _IDENTITY)
+        split = build_bench_command(
+            "/usr/bin/llama-bench",
+            DEFAULT_BENCH_CONFIG,
+            replace(_IDENTITY, split_mode="row", tensor_split="3/1"),
+        )
+        # Then -sm is always passed and -ts only for the explicit split.
+        assert default[default.index("-sm") + 1] == "layer"
+        assert "-ts" not in default
+        assert split[split.index("-sm") + 1] == "row"
+        assert split[split.index("-ts") + 1] == "3/1"
+
 
 # --- JSONL parser happy path ------------------------------------------------
 
@@ -250,6 +267,26 @@ class TestParseBenchJsonlHappy:
         assert len(pp.samples) == 5
         assert [s.ns for s in pp.samples] == samples_ns
 
+    def test_repeated_workload_lines_pool_their_samples(self) -> None:
+        # Given two adaptive rounds, each reporting both workloads.
+        tg = _make_jsonl_line(name="tg128", n_prompt=0, n_gen=128)
+        raw = "\n".join(
+            [
+                _make_jsonl_line(samples_ns=[1, 1], samples_ts=[100.0, 110.0]),
+                tg,
+                _make_jsonl_line(samples_ns=[1], samples_ts=[120.0]),
+                tg,
+            ]
+        )
+        # When parsing the pooled stream.
+        result = parse_bench_jsonl(raw, expected=_IDENTITY, expected_workload_names=_WORKLOADS)
+        # Then each workload is one measurement over every round's samples.
+        assert [m.workload_name for m in result.measurements] == ["pp512", "tg128"]
+        pp = result.measurements[0]
+        assert [s.ts for s in pp.samples] == [100.0, 110.0, 120.0]
+        assert pp.avg_ts == pytest.approx(110.0)
+        assert pp.stddev_ts == pytest.approx(10.0)
+
 
 # --- JSONL parser failure cases ---------------------------------------------
 
@@ -277,6 +314,11 @@ class TestParseBenchJsonlFailures:
         with pytest.raises(MeasurementFailureError, match="identity mismatch"):
             _ = parse_bench_jsonl(raw, expected=_IDENTITY, expected_workload_names=_WORKLOADS)
 
+    def test_wrong_split_mode_identity_is_measurement_failure(self) -> None:
+        raw = _make_jsonl_line(name="pp512", split_mode="row") + "\n"
+        with pytest.raises(MeasurementFailureError, match="identity mismatch split_mode"):
+            _ = parse_bench_jsonl(raw, expected=_IDENTITY, expected_workload_names=_WORKLOADS)
+
     def test_nan_throughput_is_measurement_failure(self) -> None:
         raw = _make_jsonl_line(name="pp512", avg_ts=math.nan) + "\n"
         with pytest.raises(MeasurementFailureError, match="avg_ts invalid"):
@@ -41,6 +41,7 @@ from llama_optimizer.lifecycle import (
 from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
 from llama_optimizer.telemetry import (
     Bytes,
+    DeviceReading,
     Diagnostics,
     HardChannel,
     HardChannelProvider,
@@ -111,6 +112,36 @@ class _BreachingProvider(HardChannelProvider):
         )
 
 
+@dataclass
+class _SecondaryBreachProvider(HardChannelProvider):
+    """Dual-card provider whose secondary card breaches after the preflight read."""
+
+    calls: int = 0
+
+    @override
+    def sample(self) -> HardChannel:
+        self.calls += 1
+        used1 = 14_000_000_000 if self.calls > 1 else 1_000_000_000
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+            devices=(
+                DeviceReading(
+                    device="card0", total=Bytes(17_163_091_968), used=Bytes(1_000_000_000)
+                ),
+                DeviceReading(device="card1", total=Bytes(17_163_091_968), used=Bytes(used1)),
+            ),
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
 def _identity() -> RunIdentity:
     return RunIdentity(
         manifest_hash="sha256:manifest",
@@ -258,6 +289,20 @@ class TestTelemetryRecording:
         assert result.supervisor_result.peak_used is not None
         assert int(result.supervisor_result.peak_used) > 0
 
+    def test_every_series_point_recorded_to_ledger(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        led, trial_id = ledger_trial
+        result = _run(led, trial_id, tmp_path, monkeypatch)
+        series = result.supervisor_result.series
+        attempts = [a for t in led.dump()["trials"] for a in t["attempts"]]
+        attempt = next(a for a in attempts if a["attempt_id"] == result.attempt_id)
+        assert len(attempt["telemetry"]) == len(series)
+        assert attempt["telemetry"][-1]["peak_vram_bytes"] == series.peak_used
+
 
 class TestResourceBreach:
     def test_vram_breach_is_resource_infeasible(
@@ -271,6 +316,27 @@ class TestResourceBreach:
         assert result.outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
         assert result.result is None
 
+    def test_secondary_card_breach_is_persisted_against_that_card(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Given card0 far below the ceiling while card1 climbs above it after launch.
+        led, trial_id = ledger_trial
+        # When screening and reading the attempt's telemetry back from the ledger.
+        result = _run(led, trial_id, tmp_path, monkeypatch, provider=_SecondaryBreachProvider())
+        attempts = [a for t in led.dump()["trials"] for a in t["attempts"]]
+        rows = next(a for a in attempts if a["attempt_id"] == result.attempt_id)["telemetry"]
+        # Then the breach is recorded on card1 with card1's bytes, not card0's.
+        assert result.outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        breached = [r for r in rows if r["breached"]]
+        assert breached
+        assert {(r["device"], r["vram_used_bytes"]) for r in breached} == {
+            ("card1", 14_000_000_000)
+        }
+        assert {r["peak_vram_bytes"] for r in rows if r["device"] == "card0"} == {1_000_000_000}
+
 
 # --- Failure classifications ------------------------------------------------
 
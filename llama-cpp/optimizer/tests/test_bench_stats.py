@@ -0,0 +1,72 @@
+"""Behavior tests for robust sample statistics (T6/T11).
+
+Median, MAD, and trimmed mean must match hand-computed values, a gross outlier
+must be flagged and kept out of the interval, and the seeded bootstrap must be
+reproducible and cover the sample median.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from llama_optimizer.bench_stats import (
+    BootstrapConfig,
+    bootstrap_ci,
+    median_abs_deviation,
+    outlier_mask,
+    scaled_median_ci,
+    summarize,
+    trimmed_mean,
+)
+
+_SAMPLES = (248.0, 250.0, 251.0, 249.0, 252.0, 250.0, 120.0)
+
+
+class TestRobustEstimates:
+    def test_median_mad_and_trimmed_mean(self) -> None:
+        assert median_abs_deviation([1.0, 2.0, 3.0, 4.0, 100.0]) == 1.0
+        assert trimmed_mean([1.0, 2.0, 3.0, 4.0, 100.0], 0.2) == 3.0
+
+    def test_gross_outlier_is_flagged_and_rejected(self) -> None:
+        # Given one thermally throttled repetition among steady ones.
+        assert outlier_mask(_SAMPLES) == (False,) * 6 + (True,)
+        # When summarizing the samples.
+        summary = summarize(_SAMPLES)
+        # Then the interval and trimmed mean ignore it.
+        assert summary.outliers == 1
+        assert summary.median == 250.0
+        assert 248.0 <= summary.ci_low <= summary.median <= summary.ci_high <= 252.0
+        assert summary.trimmed_mean == pytest.approx(250.0)
+
+    def test_identical_samples_have_no_outliers(self) -> None:
+        assert outlier_mask([5.0, 5.0, 5.0]) == (False, False, False)
+
+
+class TestBootstrap:
+    def test_seeded_interval_is_reproducible(self) -> None:
+        config = BootstrapConfig(resamples=500, seed=7)
+        assert bootstrap_ci(_SAMPLES, config=config) == bootstrap_ci(_SAMPLES, config=config)
+        assert bootstrap_ci([42.0]) == (42.0, 42.0)
+
+    def test_metrics_are_named_per_workload(self) -> None:
+        metrics = summarize([1.0, 2.0, 3.0]).metrics("pp512", "ts")
+        assert set(metrics) == {
+            "pp512_median_ts",
+            "pp512_mad_ts",
+            "pp512_trimmed_mean_ts",
+            "pp512_ci_low_ts",
+            "pp512_ci_high_ts",
+            "pp512_outliers",
+        }
+
+    def test_aggregate_takes_the_relative_spread_of_its_per_request_rates(self) -> None:
+        # Given per-request rates around a median of 50 and an aggregate of 100.
+        rates = (40.0, 45.0, 50.0, 55.0, 60.0)
+        low, high = bootstrap_ci(rates)
+        # Then the aggregate's interval keeps the same relative width.
+        assert scaled_median_ci(100.0, rates) == pytest.approx((2 * low, 2 * high))
+        assert scaled_median_ci(100.0, ()) == (100.0, 100.0)
+
+    def test_config_rejects_over_trimming(self) -> None:
+        with pytest.raises(ValueError, match="trim"):
+            _ = BootstrapConfig(trim=0.5)
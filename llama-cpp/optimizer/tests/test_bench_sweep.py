@@ -0,0 +1,314 @@
+"""Behavior tests for single-process llama-bench sweeps (T6).
+
+Trials sharing a model load must be screened by one supervised llama-bench
+process whose comma-list command covers every config, whose JSONL is routed
+back to each trial's identity (dropping unrequested product combinations),
+and whose per-trial attempts are recorded with the shared telemetry. The
+planner must never mix model loads and must bound cartesian-product waste.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    BenchIdentity,
+    BenchScreenRequest,
+    MeasurementFailureError,
+    build_bench_command,
+    build_sweep_command,
+    demux_bench_jsonl,
+    plan_bench_sweeps,
+    run_supervised_bench_sweep,
+)
+from llama_optimizer.bench_sweep import sweep_size
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.lifecycle import NonScoredOutcome, TrialId
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+_BASE = BenchIdentity(
+    model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+    n_gpu_layers=99,
+    n_batch=2048,
+    n_ubatch=512,
+    type_k="f16",
+    type_v="f16",
+    n_threads=16,
+    flash_attn=1,
+    use_mmap=True,
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+@dataclass(frozen=True)
+class _HeldBreachProvider(HardChannelProvider):
+    """Reports a VRAM breach once the fake llama-bench writes its hold marker."""
+
+    marker: Path
+
+    @override
+    def sample(self) -> HardChannel:
+        used = 14_000_000_000 if self.marker.exists() else 1_000_000_000
+        return HardChannel(
+            total=Bytes(17_163_091_968), used=Bytes(used), collected_at=datetime.now(UTC), raw=""
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _line(identity: BenchIdentity, name: str = "pp512") -> str:
+    return json.dumps(
+        {
+            "model": identity.model_filename,
+            "build": 1,
+            "n_gpu_layers": identity.n_gpu_layers,
+            "n_batch": identity.n_batch,
+            "n_ubatch": identity.n_ubatch,
+            "type_k": identity.type_k,
+            "type_v": identity.type_v,
+            "n_threads": identity.n_threads,
+            "flash_attn": identity.flash_attn,
+            "split_mode": identity.split_mode,
+            "name": name,
+        }
+    )
+
+
+def _request(identity: BenchIdentity, trial_id: str, output_dir: Path) -> BenchScreenRequest:
+    return BenchScreenRequest(
+        trial_id=TrialId(trial_id),
+        bench_config=DEFAULT_BENCH_CONFIG,
+        identity=identity,
+        binary=str(_BENCH_FIXTURE),
+        output_dir=output_dir,
+    )
+
+
+@pytest.fixture
+def ledger(run_root_base: Path) -> Generator[Ledger]:
+    """Create a RUNNING ledger for sweep screening."""
+    led = Ledger.create_run(
+        RunArtifactRoot.for_run("sweep-1", base=run_root_base),
+        RunIdentity(
+            manifest_hash="sha256:manifest",
+            config_hash="sha256:config",
+            optimizer_version="0.1.0",
+            optuna_version="4.9.0",
+            checkpoint_format="pickle.v1",
+            max_retries=2,
+            seed=42,
+            process_group_pid=os.getpid(),
+        ),
+    )
+    led.start_run()
+    try:
+        yield led
+    finally:
+        led.close()
+
+
+def _sweep_requests(
+    ledger: Ledger, identities: list[BenchIdentity], output_dir: Path
+) -> list[BenchScreenRequest]:
+    requests: list[BenchScreenRequest] = []
+    for index, identity in enumerate(identities):
+        trial = ledger.create_trial(
+            TrialConfig(
+                config_id=f"cfg-{index}",
+                config_hash=f"hash-{index}",
+                candidate_id="ornith-1.0-9b-q4_k_m",
+                backend="rocm",
+                quant="Q4_K_M",
+            )
+        )
+        _ = ledger.start_trial(trial.trial_id)
+        requests.append(_request(identity, str(trial.trial_id), output_dir))
+    return requests
+
+
+def _control(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mode: str = "happy", **extra: object
+) -> Path:
+    ctrl = tmp_path / "control.json"
+    _ = ctrl.write_text(json.dumps({"mode": mode, "model": _BASE.model_filename} | extra))
+    launches = tmp_path / "launches.txt"
+    monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+    monkeypatch.setenv("LLAMA_BENCH_FAKE_LAUNCHES", str(launches))
+    return launches
+
+
+class TestSweepCommand:
+    def test_single_identity_matches_the_per_trial_command(self) -> None:
+        command = build_sweep_command("llama-bench", DEFAULT_BENCH_CONFIG, [_BASE])
+        assert command == build_bench_command("llama-bench", DEFAULT_BENCH_CONFIG, _BASE)
+
+    def test_lists_distinct_values_in_first_seen_order(self) -> None:
+        # Given three configs that differ in ubatch and flash attention.
+        identities = [
+            replace(_BASE, n_ubatch=256),
+            replace(_BASE, n_ubatch=512, flash_attn=0),
+            replace(_BASE, n_ubatch=256, flash_attn=0),
+        ]
+        # When building one sweep command.
+        command = build_sweep_command("llama-bench", DEFAULT_BENCH_CONFIG, identities)
+        # Then varying flags become comma lists and shared flags stay scalar.
+        assert command[command.index("-ub") + 1] == "256,512"
+        assert command[command.index("-fa") + 1] == "on,off"
+        assert command[command.index("-b") + 1] == "2048"
+        assert command.count("-m") == 1
+
+    def test_rejects_mixed_model_loads(self) -> None:
+        other = replace(_BASE, model_filename="other.gguf")
+        with pytest.raises(ValueError, match="cannot mix"):
+            _ = build_sweep_command("llama-bench", DEFAULT_BENCH_CONFIG, [_BASE, other])
+
+
+class TestDemux:
+    def test_routes_lines_and_drops_unrequested_combinations(self) -> None:
+        # Given a product run that also emitted an unrequested config.
+        small, large = replace(_BASE, n_ubatch=256), replace(_BASE, n_batch=4096)
+        extra = replace(_BASE, n_batch=4096, n_ubatch=256)
+        raw = "\n".join([_line(small), _line(extra), _line(large), _line(small, "tg128"), ""])
+        # When demultiplexing for the two requested identities.
+        routed = demux_bench_jsonl(raw, [small, large, _BASE])
+        # Then each identity gets only its own lines, and silence is empty.
+        assert routed[small].splitlines() == [_line(small), _line(small, "tg128")]
+        assert routed[large].splitlines() == [_line(large)]
+        assert routed[_BASE] == ""
+
+    def test_unattributable_line_fails_the_sweep(self) -> None:
+        with pytest.raises(MeasurementFailureError):
+            _ = demux_bench_jsonl("not json\n", [_BASE])
+
+
+class TestPlanner:
+    def test_groups_by_model_load_and_bounds_product_waste(self, tmp_path: Path) -> None:
+        # Given two models and four configs whose full product would be 2x2x2.
+        configs = [
+            replace(_BASE, n_batch=1024, n_ubatch=256),
+            replace(_BASE, n_batch=2048, n_ubatch=512),
+            replace(_BASE, n_batch=1024, n_ubatch=256, flash_attn=0),
+            replace(_BASE, n_batch=2048, n_ubatch=512, flash_attn=0),
+        ]
+        other = replace(_BASE, model_filename="other.gguf")
+        requests = [_request(i, f"t{n}", tmp_path) for n, i in enumerate([*configs, other])]
+        # When planning with no tolerated waste.
+        sweeps = plan_bench_sweeps(requests, max_waste=0.0)
+        # Then every request is planned once, loads never mix, and no sweep wastes runs.
+        assert sorted(r.trial_id for s in sweeps for r in s) == sorted(r.trial_id for r in requests)
+        for sweep in sweeps:
+            identities = [r.identity for r in sweep]
+            assert len({i.model_filename for i in identities}) == 1
+            assert sweep_size(identities) == len(identities)
+        # And a generous budget packs the first model into one sweep.
+        assert len(plan_bench_sweeps(requests, max_waste=3.0)) == 2
+
+
+class TestSupervisedSweep:
+    def test_one_launch_screens_every_trial(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given three trials that differ only in ubatch.
+        launches = _control(tmp_path, monkeypatch)
+        identities = [replace(_BASE, n_ubatch=u) for u in (256, 512, 1024)]
+        requests = _sweep_requests(ledger, identities, tmp_path / "output")
+        # When screening them as one sweep.
+        results = run_supervised_bench_sweep(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, requests
+        )
+        # Then llama-bench launched once and each attempt scored its own config.
+        assert launches.read_text() == "1"
+        assert not results.unstarted
+        results = results.screened
+        assert [r.outcome for r in results] == [None, None, None]
+        assert [r.metrics["pp512_avg_ts"] for r in results] == [125.0, 250.0, 500.0]
+        assert len({r.attempt_id for r in results}) == 3
+        dump = ledger.dump()
+        attempts = [a for t in dump["trials"] for a in t["attempts"]]
+        assert {a["phase"] for a in attempts} == {"succeeded"}
+        assert all(a["telemetry"] for a in attempts)
+
+    def test_load_failure_blames_the_first_config_and_returns_the_rest(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _ = _control(tmp_path, monkeypatch, mode="load-fail")
+        identities = [replace(_BASE, n_ubatch=u) for u in (256, 512)]
+        requests = _sweep_requests(ledger, identities, tmp_path / "output")
+        results = run_supervised_bench_sweep(
+            ProcessSupervisor(), _BelowLimitProvider(), _FAST, ledger, requests
+        )
+        assert [r.outcome for r in results.screened] == [
+            NonScoredOutcome.DETERMINISTIC_LOAD_FAILURE,
+            NonScoredOutcome.TRANSIENT_FAILURE,
+        ]
+        assert all(not r.metrics for r in results.screened)
+        assert results.unstarted == (requests[1],)
+
+    def test_mid_sweep_breach_keeps_finished_configs_and_blames_the_running_one(
+        self, ledger: Ledger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a sweep whose VRAM breaches once the first of three configs finished.
+        marker = tmp_path / "held"
+        _ = _control(tmp_path, monkeypatch, hold_after_configs=1, hold_marker=str(marker))
+        identities = [replace(_BASE, n_ubatch=u) for u in (256, 512, 1024)]
+        requests = _sweep_requests(ledger, identities, tmp_path / "output")
+        # When screening them as one sweep.
+        results = run_supervised_bench_sweep(
+            ProcessSupervisor(), _HeldBreachProvider(marker), _FAST, ledger, requests
+        )
+        # Then the finished config scores, the running one alone is infeasible,
+        # and the never-started one is handed back for a re-run.
+        assert [r.outcome for r in results.screened] == [
+            None,
+            NonScoredOutcome.RESOURCE_INFEASIBLE,
+            NonScoredOutcome.TRANSIENT_FAILURE,
+        ]
+        assert results.screened[0].metrics["pp512_avg_ts"] == 125.0
+        assert results.unstarted == (requests[2],)
+        # And the re-run trial can start a fresh attempt.
+        retry = ledger.start_attempt(requests[2].trial_id)
+        assert retry.parent_attempt_id == results.screened[2].attempt_id
@@ -0,0 +1,183 @@
+"""Behavior tests for predictive VRAM breach aborts (T5).
+
+The predictor is replayed against recorded-shape startup traces in
+``fixtures/traces`` (250 ms hard-channel readings during model load): loads
+that plateau below the 13 GiB ceiling must never be aborted, and loads that
+climb through it must be aborted before the first breaching reading. The
+supervisor and bench runner integrations must keep the ``resource-infeasible``
+outcome while recording the distinct reason and the estimated time saved.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import override
+
+import pytest
+
+from llama_optimizer.breach_predictor import (
+    PREDICTED_BREACH_REASON,
+    BreachPredictor,
+    BreachPredictorConfig,
+)
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import (
+    VRAM_CEILING_BYTES,
+    Bytes,
+    Diagnostics,
+    HardChannel,
+    HardChannelProvider,
+)
+
+_TRACES = Path(__file__).resolve().parent / "fixtures" / "traces"
+_CEILING = int(VRAM_CEILING_BYTES)
+_GIB = 1 << 30
+
+
+def _load_trace(name: str) -> list[tuple[timedelta, Bytes]]:
+    points: list[tuple[timedelta, Bytes]] = []
+    for line in (_TRACES / f"{name}.jsonl").read_text().splitlines():
+        point: dict[str, int] = json.loads(line)  # pyright: ignore[reportAny]
+        points.append((timedelta(milliseconds=point["t_ms"]), Bytes(point["used"])))
+    return points
+
+
+def _replay(name: str, config: BreachPredictorConfig) -> tuple[int | None, int | None]:
+    """Return (index of first prediction, index of first real breach)."""
+    predictor = BreachPredictor(config)
+    predicted: int | None = None
+    breached: int | None = None
+    for index, (elapsed, used) in enumerate(_load_trace(name)):
+        if breached is None and int(used) >= _CEILING:
+            breached = index
+        if predicted is None and predictor.observe(elapsed, used) is not None:
+            predicted = index
+    return predicted, breached
+
+
+class TestTraceValidation:
+    @pytest.mark.parametrize("trace", ["load-plateau-9g", "load-plateau-11g"])
+    def test_below_ceiling_loads_are_never_aborted(self, trace: str) -> None:
+        predicted, breached = _replay(trace, BreachPredictorConfig())
+        assert breached is None
+        assert predicted is None
+
+    @pytest.mark.parametrize("trace", ["load-breach-15g", "load-breach-slow-14g"])
+    def test_breaching_loads_abort_before_first_breach(self, trace: str) -> None:
+        # Given a recorded load that climbs through the ceiling.
+        # When replaying it through the default predictor.
+        predicted, breached = _replay(trace, BreachPredictorConfig())
+        # Then the abort fires strictly before the first breaching reading.
+        assert breached is not None
+        assert predicted is not None
+        assert predicted < breached
+
+    def test_longer_horizon_aborts_earlier(self) -> None:
+        short, _ = _replay("load-breach-slow-14g", BreachPredictorConfig())
+        long, _ = _replay(
+            "load-breach-slow-14g", BreachPredictorConfig(horizon=timedelta(seconds=4))
+        )
+        assert short is not None
+        assert long is not None
+        assert long < short
+
+
+class TestPredictor:
+    def test_flat_readings_never_predict(self) -> None:
+        predictor = BreachPredictor(BreachPredictorConfig())
+        for i in range(20):
+            assert predictor.observe(timedelta(seconds=i), Bytes(12 * _GIB)) is None
+
+    def test_prediction_reports_saved_time_and_reason(self) -> None:
+        predictor = BreachPredictor(BreachPredictorConfig())
+        prediction = None
+        for i in range(40):
+            prediction = predictor.observe(timedelta(seconds=i * 0.25), Bytes(i * _GIB // 2))
+            if prediction is not None:
+                break
+        assert prediction is not None
+        assert int(prediction.projected_peak) >= _CEILING
+        assert prediction.estimated_saved > timedelta(0)
+        assert prediction.describe().startswith(PREDICTED_BREACH_REASON)
+        assert json.loads(prediction.to_json())["estimated_saved_seconds"] > 0
+
+    def test_few_noisy_readings_need_the_student_t_bound(self) -> None:
+        # Given four noisy readings (2 degrees of freedom) climbing toward the ceiling,
+        # whose slope clears a Normal 95% bound but not the Student-t one.
+        predictor = BreachPredictor(BreachPredictorConfig())
+        readings = [9.7, 11.3, 11.1, 12.7]
+        # When observing them one second apart.
+        predictions = [
+            predictor.observe(timedelta(seconds=i), Bytes(int(gib * _GIB)))
+            for i, gib in enumerate(readings)
+        ]
+        # Then no abort fires on that noise.
+        assert predictions == [None] * len(readings)
+
+    def test_readings_after_startup_window_are_ignored(self) -> None:
+        config = BreachPredictorConfig(startup=timedelta(seconds=1))
+        predictor = BreachPredictor(config)
+        for i in range(20):
+            elapsed = timedelta(seconds=2 + i)
+            assert predictor.observe(elapsed, Bytes(i * _GIB)) is None
+
+    @pytest.mark.parametrize(("window", "min_samples"), [(8, 2), (3, 4)])
+    def test_rejects_underdetermined_window(self, window: int, min_samples: int) -> None:
+        with pytest.raises(ValueError, match="min_samples"):
+            _ = BreachPredictorConfig(window=window, min_samples=min_samples)
+
+    @pytest.mark.parametrize("confidence", [0.2, 1.0])
+    def test_rejects_confidence_outside_range(self, confidence: float) -> None:
+        with pytest.raises(ValueError, match="confidence"):
+            _ = BreachPredictorConfig(confidence=confidence)
+
+    def test_rejects_non_positive_horizon(self) -> None:
+        with pytest.raises(ValueError, match="horizon"):
+            _ = BreachPredictorConfig(horizon=timedelta(0))
+
+
+@dataclass
+class _RisingProvider(HardChannelProvider):
+    """Preflight is idle; each later reading climbs by ``step`` toward the ceiling."""
+
+    step: int = _GIB
+    _calls: int = field(default=0, init=False)
+
+    @override
+    def sample(self) -> HardChannel:
+        self._calls += 1
+        used = min(self._calls * self.step, _CEILING - 1)
+        return HardChannel(
+            total=Bytes(17_163_091_968), used=Bytes(used), collected_at=datetime.now(UTC), raw=""
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+class TestSupervisorIntegration:
+    def test_rising_load_is_aborted_before_any_breach(self) -> None:
+        # Given a child whose VRAM climbs 1 GiB per tick but never reaches the ceiling.
+        config = SupervisorConfig(
+            interval=timedelta(milliseconds=20),
+            deadline=timedelta(seconds=30),
+            grace=timedelta(milliseconds=400),
+            provider_timeout=timedelta(seconds=2),
+            max_staleness=timedelta(seconds=30),
+            breach_predictor=BreachPredictorConfig(),
+        )
+        # When supervising it with the predictor enabled.
+        result = ProcessSupervisor().run(["sleep", "30"], provider=_RisingProvider(), config=config)
+        # Then it is stopped as resource-infeasible on the prediction alone.
+        assert result.outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        assert result.predicted_breach is not None
+        assert result.peak_used is not None
+        assert int(result.peak_used) < _CEILING
+        assert result.terminated_group is True
@@ -0,0 +1,195 @@
+"""Behavior tests for concurrent supervision under a shared VRAM budget (T5).
+
+Several REAL child subprocesses are admitted at once against one ceiling. The
+admission controller must hold children whose estimated share does not fit,
+the shared sampler must terminate every running group on an aggregate breach
+or telemetry loss, and no admitted child may outlive its result.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import override
+
+import pytest
+
+from llama_optimizer.concurrent_supervisor import (
+    AdmissionController,
+    ConcurrentSupervisor,
+    TrialLaunch,
+)
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.supervisor import ChildExit, SupervisorConfig
+from llama_optimizer.telemetry import (
+    VRAM_CEILING_BYTES,
+    Bytes,
+    Diagnostics,
+    HardChannel,
+    HardChannelProvider,
+    TelemetryLossError,
+)
+
+_CEILING = int(VRAM_CEILING_BYTES)
+_GIB = 1 << 30
+_CONFIG = SupervisorConfig(
+    interval=timedelta(milliseconds=20),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=400),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+def _sample(used: int) -> HardChannel:
+    return HardChannel(
+        total=Bytes(17_163_091_968), used=Bytes(used), collected_at=datetime.now(UTC), raw=""
+    )
+
+
+@dataclass
+class _SharedProvider(HardChannelProvider):
+    """Thread-safe provider: call 1 is preflight, later calls step through ``script``."""
+
+    preflight: int = _GIB
+    script: list[int] = field(default_factory=list)
+    fail_on_call: int = 0
+    _calls: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    @override
+    def sample(self) -> HardChannel:
+        with self._lock:
+            self._calls += 1
+            call = self._calls
+        if call == self.fail_on_call:
+            raise TelemetryLossError(reason="malformed: scripted", raw="")
+        if call == 1 or not self.script:
+            return _sample(self.preflight)
+        return _sample(self.script[min(call - 2, len(self.script) - 1)])
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _sleeper(seconds: float, estimate: int = _GIB) -> TrialLaunch:
+    return TrialLaunch(
+        command=(sys.executable, "-c", f"import time; time.sleep({seconds})"),
+        estimated_vram=Bytes(estimate),
+    )
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestAdmission:
+    def test_reservations_respect_the_ceiling_and_release(self) -> None:
+        # Given 1 GiB already in use under the 13 GiB ceiling.
+        admission = AdmissionController(ceiling=VRAM_CEILING_BYTES, baseline=Bytes(_GIB))
+        # When reserving two 5 GiB shares and then a third.
+        assert admission.try_reserve(Bytes(5 * _GIB))
+        assert admission.try_reserve(Bytes(5 * _GIB))
+        # Then the third is held until a share is released.
+        assert not admission.try_reserve(Bytes(5 * _GIB))
+        admission.release(Bytes(5 * _GIB))
+        assert admission.try_reserve(Bytes(5 * _GIB))
+        assert not admission.feasible(Bytes(12 * _GIB))
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            _ = ConcurrentSupervisor(max_concurrency=0)
+
+
+class TestConcurrentRuns:
+    def test_small_trials_overlap(self) -> None:
+        # Given three 0.4 s children that comfortably share the budget.
+        supervisor = ConcurrentSupervisor(max_concurrency=3)
+        started = time.monotonic()
+        # When supervising them together.
+        results = supervisor.run(
+            [_sleeper(0.4) for _ in range(3)], provider=_SharedProvider(), config=_CONFIG
+        )
+        elapsed = time.monotonic() - started
+        # Then all exit cleanly, faster than running them back to back.
+        assert [r.outcome for r in results] == [ChildExit(0)] * 3
+        assert all(r.launched and not r.terminated_group for r in results)
+        assert elapsed < 1.2
+        assert all(len(r.series) > 0 for r in results)
+
+    def test_budget_serializes_trials_that_do_not_fit_together(self) -> None:
+        # Given two 0.3 s children whose 7 GiB estimates only fit one at a time.
+        supervisor = ConcurrentSupervisor(max_concurrency=2)
+        started = time.monotonic()
+        results = supervisor.run(
+            [_sleeper(0.3, 7 * _GIB), _sleeper(0.3, 7 * _GIB)],
+            provider=_SharedProvider(),
+            config=_CONFIG,
+        )
+        # Then both succeed, but the second waited for the first's share.
+        assert [r.outcome for r in results] == [ChildExit(0)] * 2
+        assert time.monotonic() - started >= 0.6
+
+    def test_infeasible_estimate_is_never_launched(self) -> None:
+        supervisor = ConcurrentSupervisor(max_concurrency=2)
+        results = supervisor.run(
+            [_sleeper(0.1, 13 * _GIB), _sleeper(0.1)], provider=_SharedProvider(), config=_CONFIG
+        )
+        assert results[0].outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        assert results[0].launched is False
+        assert results[1].outcome == ChildExit(0)
+
+
+class TestGroupFailClosed:
+    def test_aggregate_breach_terminates_every_running_child(self) -> None:
+        # Given two long children and a provider whose aggregate reading breaches.
+        provider = _SharedProvider(script=[2 * _GIB, 2 * _GIB, 2 * _GIB, _CEILING])
+        supervisor = ConcurrentSupervisor(max_concurrency=2)
+        # When supervising them together.
+        results = supervisor.run([_sleeper(60), _sleeper(60)], provider=provider, config=_CONFIG)
+        # Then both groups are terminated and flagged as an unattributed group breach.
+        assert [r.outcome for r in results] == [NonScoredOutcome.RESOURCE_INFEASIBLE] * 2
+        assert all(r.group_breach for r in results)
+        assert all(r.terminated_group for r in results)
+        for result in results:
+            assert result.process_group_pid is not None
+            assert not _alive(result.process_group_pid)
+
+    def test_lone_child_breach_is_resource_infeasible(self) -> None:
+        provider = _SharedProvider(script=[2 * _GIB, _CEILING])
+        supervisor = ConcurrentSupervisor(max_concurrency=1)
+        results = supervisor.run([_sleeper(60)], provider=provider, config=_CONFIG)
+        assert results[0].outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        assert results[0].group_breach is False
+        assert results[0].peak_used == Bytes(_CEILING)
+
+    def test_telemetry_loss_aborts_running_and_cancels_pending(self) -> None:
+        # Given one slot, so the second child is still waiting for admission.
+        provider = _SharedProvider(script=[2 * _GIB], fail_on_call=4)
+        supervisor = ConcurrentSupervisor(max_concurrency=1)
+        # When the hard channel fails mid-run.
+        results = supervisor.run([_sleeper(60), _sleeper(60)], provider=provider, config=_CONFIG)
+        # Then the running child is telemetry-loss and the pending one never launched.
+        assert results[0].outcome is NonScoredOutcome.TELEMETRY_LOSS
+        assert results[0].terminated_group is True
+        assert results[1].outcome is NonScoredOutcome.CANCELLED
+        assert results[1].launched is False
+
+    def test_preflight_breach_launches_nothing(self) -> None:
+        provider = _SharedProvider(preflight=_CEILING)
+        results = ConcurrentSupervisor(max_concurrency=2).run(
+            [_sleeper(60), _sleeper(60)], provider=provider, config=_CONFIG
+        )
+        assert [r.outcome for r in results] == [NonScoredOutcome.RESOURCE_INFEASIBLE] * 2
+        assert not any(r.launched for r in results)
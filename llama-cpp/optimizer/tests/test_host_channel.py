@@ -0,0 +1,187 @@
+"""Behavior tests for the soft host CPU/RAM/IO channel (T5).
+
+The ``/proc`` fallback must sum counters over exactly the child's process
+group, the cgroup v2 probe must read ``cpu.stat``/``memory.stat``/``io.stat``
+and remove its cgroup, the per-trial cgroup is only used under a delegated
+parent with the memory controller, and the supervisor must return and the
+ledger persist the readings taken alongside the hard channel.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.host_channel import (
+    SOURCE_CGROUP,
+    SOURCE_PROC,
+    CgroupProbe,
+    HostChannelConfig,
+    ProcGroupProbe,
+    open_host_probe,
+)
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.supervisor import ChildExit, ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_TICK_NS = 1_000_000_000 // os.sysconf("SC_CLK_TCK")
+_PAGE = os.sysconf("SC_PAGE_SIZE")
+_BURN = "import time\nend = time.monotonic() + 0.4\nwhile time.monotonic() < end: pass"
+
+
+def _stat(pid: int, pgrp: int, *, majflt: int, utime: int, rss: int) -> str:
+    # pid (comm) state ppid pgrp session tty tpgid flags minflt cminflt majflt
+    # cmajflt utime stime cutime cstime prio nice threads itreal start vsize rss
+    return (
+        f"{pid} (llama (bench) x) S 1 {pgrp} {pgrp} 0 -1 0 0 0 {majflt} 1 "
+        f"{utime} 2 3 4 20 0 1 0 100 4096 {rss} 18446744073709551615\n"
+    )
+
+
+def _fake_proc(root: Path, pid: int, stat: str, io: str | None = None) -> None:
+    entry = root / str(pid)
+    entry.mkdir(parents=True)
+    _ = (entry / "stat").write_text(stat)
+    if io is not None:
+        _ = (entry / "io").write_text(io)
+
+
+class _IdleProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1 << 30),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+class TestProcGroupProbe:
+    def test_sums_only_members_of_the_process_group(self, tmp_path: Path) -> None:
+        # Given two members of group 40 (one with unreadable io) and a stranger.
+        _fake_proc(
+            tmp_path,
+            40,
+            _stat(40, 40, majflt=5, utime=10, rss=100),
+            "rchar: 9\nread_bytes: 4096\nwrite_bytes: 512\n",
+        )
+        _fake_proc(tmp_path, 41, _stat(41, 40, majflt=2, utime=20, rss=50))
+        _fake_proc(tmp_path, 99, _stat(99, 99, majflt=1000, utime=1000, rss=1000))
+        (tmp_path / "self").mkdir()
+        # When reading the group.
+        row = ProcGroupProbe(40, proc_root=tmp_path).read()
+        # Then user+system+children ticks, pages, and major faults are summed.
+        assert row is not None
+        assert row.source == SOURCE_PROC
+        assert row.cpu_time_ns == (10 + 2 + 3 + 4 + 20 + 2 + 3 + 4) * _TICK_NS
+        assert row.rss_bytes == 150 * _PAGE
+        assert row.major_faults == 5 + 1 + 2 + 1
+        assert (row.read_bytes, row.write_bytes) == (4096, 512)
+
+    def test_vanished_group_yields_no_reading(self, tmp_path: Path) -> None:
+        _fake_proc(tmp_path, 99, _stat(99, 99, majflt=0, utime=0, rss=1))
+        assert ProcGroupProbe(40, proc_root=tmp_path).read() is None
+
+
+class TestCgroupProbe:
+    def test_reads_counters_and_removes_the_cgroup(self, tmp_path: Path) -> None:
+        # Given a per-trial cgroup's counter files.
+        cgroup = tmp_path / "llama-opt-1"
+        cgroup.mkdir()
+        _ = (cgroup / "cpu.stat").write_text("usage_usec 2500\nuser_usec 2000\n")
+        _ = (cgroup / "memory.stat").write_text(
+            "anon 4096\nfile 99\nfile_mapped 8192\npgmajfault 7\n"
+        )
+        _ = (cgroup / "io.stat").write_text(
+            "8:0 rbytes=100 wbytes=10 rios=1 wios=1\n259:0 rbytes=5 wbytes=1\n"
+        )
+        probe = CgroupProbe(cgroup)
+        # When reading it.
+        row = probe.read()
+        # Then CPU, anon+mapped memory, major faults, and IO bytes are reported.
+        assert row is not None
+        assert row.source == SOURCE_CGROUP
+        assert (row.cpu_time_ns, row.rss_bytes, row.major_faults) == (2_500_000, 12_288, 7)
+        assert (row.read_bytes, row.write_bytes) == (105, 11)
+        for name in ("cpu.stat", "memory.stat", "io.stat"):
+            (cgroup / name).unlink()
+        probe.close()
+        assert not cgroup.exists()
+
+
+class TestOpenHostProbe:
+    def test_falls_back_to_proc_without_a_delegated_memory_parent(self, tmp_path: Path) -> None:
+        _ = (tmp_path / "cgroup.subtree_control").write_text("cpu io\n")
+        delegated = HostChannelConfig(cgroup_parent=tmp_path)
+        assert isinstance(open_host_probe(os.getpid(), delegated), ProcGroupProbe)
+        assert isinstance(open_host_probe(os.getpid(), HostChannelConfig()), ProcGroupProbe)
+
+    def test_rejects_invalid_config(self) -> None:
+        with pytest.raises(ValueError, match="interval"):
+            _ = HostChannelConfig(interval=timedelta(0))
+
+
+class TestSupervisedHostChannel:
+    def test_readings_are_returned_and_persisted(self, run_root_base: Path) -> None:
+        # Given a supervisor with the host channel sampling every 50 ms.
+        config = SupervisorConfig(
+            interval=timedelta(milliseconds=20),
+            deadline=timedelta(seconds=30),
+            grace=timedelta(milliseconds=400),
+            provider_timeout=timedelta(seconds=2),
+            max_staleness=timedelta(seconds=5),
+            host_channel=HostChannelConfig(interval=timedelta(milliseconds=50)),
+        )
+        # When supervising a CPU-bound child.
+        result = ProcessSupervisor().run(
+            [sys.executable, "-c", _BURN], provider=_IdleProvider(), config=config
+        )
+        # Then cumulative CPU time was observed climbing from /proc.
+        assert result.outcome == ChildExit(0)
+        series = result.host_series
+        assert len(series) >= 2
+        assert {row.source for row in series} == {SOURCE_PROC}
+        assert series[-1].cpu_time_ns > series[0].cpu_time_ns
+        # And the ledger round-trips the readings for the attempt.
+        root = RunArtifactRoot.for_run("host-1", base=run_root_base)
+        identity = RunIdentity(
+            manifest_hash="sha256:manifest",
+            config_hash="sha256:config",
+            optimizer_version="0.1.0",
+            optuna_version="4.9.0",
+            checkpoint_format="pickle.v1",
+            max_retries=2,
+            seed=42,
+            process_group_pid=os.getpid(),
+        )
+        with Ledger.create_run(root, identity) as ledger:
+            ledger.start_run()
+            trial = ledger.create_trial(
+                TrialConfig(
+                    config_id="cfg-1",
+                    config_hash="hash-1",
+                    candidate_id="ornith-9b-q4_k_m",
+                    backend="rocm",
+                    quant="Q4_K_M",
+                )
+            )
+            _ = ledger.start_trial(trial.trial_id)
+            attempt_id = ledger.start_attempt(trial.trial_id).attempt_id
+            ledger.record_host_samples(attempt_id, series)
+            assert ledger.host_samples(attempt_id) == series
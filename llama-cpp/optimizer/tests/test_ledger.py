@@ -21,14 +21,16 @@ from pathlib import Path
 
 import pytest
 
-from llama_optimizer import ledger_io, ledger_materialize, ledger_store
+from llama_optimizer import ledger_io, ledger_materialize, ledger_schema, ledger_store
 from llama_optimizer.artifacts import RunArtifactRoot
 from llama_optimizer.ledger import Ledger
 from llama_optimizer.ledger_records import (
     RunIdentity,
     RunLockHeldError,
     SchemaMismatchError,
+    TelemetryRow,
     TrialConfig,
+    exec_write,
 )
 from llama_optimizer.ledger_schema import SCHEMA_VERSION, schema_version
 from llama_optimizer.lifecycle import (
@@ -96,6 +98,101 @@ class TestSchemaVersioning:
         assert exc_info.value.expected == SCHEMA_VERSION
         assert exc_info.value.actual == SCHEMA_VERSION + 1
 
+    def test_v3_ledger_gains_telemetry_intervals_on_open(self, run_root_base: Path) -> None:
+        # Given a v3 ledger holding one telemetry point, written before intervals existed.
+        root = _root("schema-4", run_root_base)
+        with Ledger.create_run(root, _identity()) as ledger:
+            ledger.start_run()
+            trial = ledger.create_trial(_config("v3"))
+            _ = ledger.start_trial(trial.trial_id)
+            attempt = ledger.start_attempt(trial.trial_id)
+            ledger.record_telemetry(
+                attempt.attempt_id, vram_used_bytes=1000, peak_vram_bytes=1000, breached=False
+            )
+        conn = sqlite3.connect(root.resolve_artifact("study.sqlite3"))
+        _ = conn.executescript("""
+            ALTER TABLE telemetry DROP COLUMN device;
+            ALTER TABLE telemetry DROP COLUMN interval_ns;
+            UPDATE schema_meta SET schema_version = 3;
+        """)
+        conn.close()
+        # When reopening it and recording a point with its sampling interval.
+        with Ledger.open(root) as reopened:
+            reopened.record_telemetry_series(
+                attempt.attempt_id,
+                [TelemetryRow(2000, 2000, breached=False, sampled_at="t", interval_ns=250_000_000)],
+            )
+            version = schema_version(reopened.connection)
+            rows = ledger_io.fetch_rows(
+                reopened.connection, "SELECT interval_ns FROM telemetry ORDER BY sample_id"
+            )
+        intervals = [ledger_materialize.row_int(row, "interval_ns") for row in rows]
+        # Then the explicit v3 -> v4 step ran and the old point reads as unrecorded.
+        assert version == SCHEMA_VERSION
+        assert intervals == [0, 250_000_000]
+
+    def test_partially_applied_migration_is_rerun_on_open(self, run_root_base: Path) -> None:
+        # Given a v3 ledger whose v3 -> v4 column landed before its version bump.
+        root = _root("schema-5", run_root_base)
+        with Ledger.create_run(root, _identity()) as ledger:
+            ledger.start_run()
+        conn = sqlite3.connect(root.resolve_artifact("study.sqlite3"))
+        _ = conn.executescript("""
+            ALTER TABLE telemetry DROP COLUMN device;
+            UPDATE schema_meta SET schema_version = 3;
+        """)
+        conn.close()
+        # When reopening it.
+        with Ledger.open(root) as reopened:
+            version = schema_version(reopened.connection)
+            columns = ledger_io.fetch_rows(
+                reopened.connection, "SELECT name FROM pragma_table_info('telemetry')"
+            )
+        # Then the step is stamped without a duplicate ALTER and the next one runs.
+        assert version == SCHEMA_VERSION
+        names = [ledger_materialize.row_str(row, "name") for row in columns]
+        assert names.count("interval_ns") == 1
+        assert names.count("device") == 1
+
+    def test_interrupted_migration_step_rolls_back_with_its_version(
+        self, run_root_base: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a v3 ledger and a crash right before the step's version bump.
+        root = _root("schema-6", run_root_base)
+        with Ledger.create_run(root, _identity()) as ledger:
+            ledger.start_run()
+        conn = sqlite3.connect(root.resolve_artifact("study.sqlite3"))
+        _ = conn.executescript("""
+            ALTER TABLE telemetry DROP COLUMN device;
+            ALTER TABLE telemetry DROP COLUMN interval_ns;
+            UPDATE schema_meta SET schema_version = 3;
+        """)
+        conn.close()
+
+        def crash_on_bump(
+            conn: sqlite3.Connection, sql: str, params: tuple[object, ...] = ()
+        ) -> None:
+            if sql.startswith("UPDATE schema_meta"):
+                message = "disk I/O error"
+                raise sqlite3.OperationalError(message)
+            exec_write(conn, sql, params)
+
+        monkeypatch.setattr(ledger_schema, "exec_write", crash_on_bump)
+        # When the migration fails mid-step.
+        with pytest.raises(sqlite3.OperationalError):
+            _ = Ledger.open(root)
+        conn = sqlite3.connect(root.resolve_artifact("study.sqlite3"))
+        conn.row_factory = sqlite3.Row
+        version = schema_version(conn)
+        columns = ledger_io.fetch_rows(conn, "SELECT name FROM pragma_table_info('telemetry')")
+        conn.close()
+        # Then neither the ALTER nor the bump persisted, and a later open upgrades it.
+        assert version == 3
+        assert "interval_ns" not in [ledger_materialize.row_str(row, "name") for row in columns]
+        monkeypatch.undo()
+        with Ledger.open(root) as reopened:
+            assert schema_version(reopened.connection) == SCHEMA_VERSION
+
     def test_foreign_keys_are_enabled(self, run_root_base: Path) -> None:
         root = _root("schema-3", run_root_base)
         with Ledger.create_run(root, _identity()) as ledger:
@@ -0,0 +1,211 @@
+"""Behavior tests for GGUF page-cache prewarming (T6).
+
+Residency must be read from the kernel with ``mincore``, each model file must be
+prewarmed only before its first trial, a cold-read measurement must evict first,
+and a bench screening attempt with a warmer must record the read metrics and a
+prewarm span while a missing model file leaves screening unaffected.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    BenchIdentity,
+    BenchScreenRequest,
+    run_supervised_bench,
+)
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.page_cache import (
+    PageCacheWarmer,
+    PrewarmConfig,
+    PrewarmMethod,
+    residency,
+    timed_read,
+)
+from llama_optimizer.phase_spans import Phase
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from llama_optimizer.lifecycle import TrialId
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _model(tmp_path: Path, size: int = 1 << 20) -> Path:
+    path = tmp_path / "ornith-1.0-9b-Q4_K_M.gguf"
+    _ = path.write_bytes(os.urandom(size))
+    return path
+
+
+class TestResidency:
+    def test_file_read_through_the_cache_is_fully_resident(self, tmp_path: Path) -> None:
+        # Given a model file that was just read sequentially.
+        model = _model(tmp_path)
+        _ = timed_read(model)
+        # When asking the kernel which pages are cached.
+        seen = residency(model)
+        # Then every page is resident.
+        assert seen.total_pages == -(-(1 << 20) // os.sysconf("SC_PAGE_SIZE"))
+        assert seen.fraction == 1.0
+
+    def test_empty_file_counts_as_resident(self, tmp_path: Path) -> None:
+        empty = tmp_path / "empty.gguf"
+        empty.touch()
+        assert residency(empty).fraction == 1.0
+
+
+class TestPageCacheWarmer:
+    @pytest.mark.parametrize("method", list(PrewarmMethod))
+    def test_prewarms_each_model_once(self, tmp_path: Path, method: PrewarmMethod) -> None:
+        # Given a warmer shared by every trial of a run.
+        model = _model(tmp_path)
+        warmer = PageCacheWarmer(PrewarmConfig(method=method))
+        # When two trials of the same candidate ask for it.
+        first = warmer.ensure(model)
+        second = warmer.ensure(tmp_path / "." / model.name)
+        # Then only the first trial pays for the prewarm stage.
+        assert first is not None
+        assert first.after.fraction == 1.0
+        assert first.cold_read_s is None
+        assert set(first.metrics()) == {
+            "model_resident_before",
+            "model_resident_after",
+            "model_prewarm_s",
+            "model_warm_read_s",
+        }
+        assert second is None
+
+    def test_measure_cold_reports_a_cold_read(self, tmp_path: Path) -> None:
+        report = PageCacheWarmer(PrewarmConfig(measure_cold=True)).ensure(_model(tmp_path))
+        assert report is not None
+        assert report.cold_read_s is not None
+        assert report.metrics()["model_cold_read_s"] == report.cold_read_s
+
+
+class TestBenchPrewarm:
+    def _ledger(self, run_root_base: Path) -> tuple[Ledger, TrialId]:
+        ledger = Ledger.create_run(
+            RunArtifactRoot.for_run("prewarm-1", base=run_root_base),
+            RunIdentity(
+                manifest_hash="sha256:manifest",
+                config_hash="sha256:config",
+                optimizer_version="0.1.0",
+                optuna_version="4.9.0",
+                checkpoint_format="pickle.v1",
+                max_retries=2,
+                seed=42,
+                process_group_pid=os.getpid(),
+            ),
+        )
+        ledger.start_run()
+        trial = ledger.create_trial(
+            TrialConfig(
+                config_id="cfg-1",
+                config_hash="hash-1",
+                candidate_id="ornith-1.0-9b-q4_k_m",
+                backend="rocm",
+                quant="Q4_K_M",
+            )
+        )
+        _ = ledger.start_trial(trial.trial_id)
+        return ledger, trial.trial_id
+
+    def _request(self, trial_id: TrialId, model: Path, tmp_path: Path) -> BenchScreenRequest:
+        return BenchScreenRequest(
+            trial_id=trial_id,
+            bench_config=DEFAULT_BENCH_CONFIG,
+            identity=BenchIdentity(
+                model_filename=str(model),
+                n_gpu_layers=99,
+                n_batch=2048,
+                n_ubatch=512,
+                type_k="f16",
+                type_v="f16",
+                n_threads=16,
+                flash_attn=1,
+                use_mmap=True,
+            ),
+            binary=str(_BENCH_FIXTURE),
+            output_dir=tmp_path / "output",
+            page_cache=PageCacheWarmer(),
+        )
+
+    def test_first_trial_records_read_metrics_and_a_prewarm_span(
+        self, run_root_base: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a real model file and a warmer on the screening request.
+        model = _model(tmp_path)
+        ctrl = tmp_path / "control.json"
+        _ = ctrl.write_text(json.dumps({"mode": "happy", "model": str(model)}))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+        ledger, trial_id = self._ledger(run_root_base)
+        with ledger:
+            # When screening the trial.
+            result = run_supervised_bench(
+                ProcessSupervisor(),
+                _BelowLimitProvider(),
+                _FAST,
+                ledger,
+                self._request(trial_id, model, tmp_path),
+            )
+            # Then the warm read joins the bench metrics and the stage is timed.
+            assert result.outcome is None
+            assert result.metrics["model_resident_after"] == 1.0
+            assert "model_warm_read_s" in result.metrics
+            phases = [span.phase for span in ledger.phase_spans(result.attempt_id)]
+            assert phases[0] == Phase.PREWARM
+
+    def test_missing_model_file_does_not_block_screening(
+        self, run_root_base: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        missing = tmp_path / "absent.gguf"
+        ctrl = tmp_path / "control.json"
+        _ = ctrl.write_text(json.dumps({"mode": "happy", "model": str(missing)}))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+        ledger, trial_id = self._ledger(run_root_base)
+        with ledger:
+            result = run_supervised_bench(
+                ProcessSupervisor(),
+                _BelowLimitProvider(),
+                _FAST,
+                ledger,
+                self._request(trial_id, missing, tmp_path),
+            )
+            assert result.outcome is None
+            assert not any(name.startswith("model_") for name in result.metrics)
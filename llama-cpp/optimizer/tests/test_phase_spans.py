@@ -0,0 +1,239 @@
+"""Behavior tests for per-phase attempt timing spans (T5).
+
+The recorder must stamp every phase with monotonic nanoseconds and its thread
+(keeping spans whose block raised), the supervisor must time preflight, launch,
+supervision, and termination, spans must round-trip through the ledger's
+``phase_spans`` table (including a v1 ledger migrated in place), and the
+optional Chrome trace must be well-formed, relative, and thread-stable.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import PhaseSpanRow, RunIdentity, TrialConfig
+from llama_optimizer.ledger_schema import SCHEMA_VERSION, schema_version
+from llama_optimizer.phase_spans import (
+    PHASE_TRACE_ARTIFACT_KIND,
+    Phase,
+    SpanRecorder,
+    chrome_trace_json,
+    record_phase_spans,
+)
+from llama_optimizer.supervisor import ChildExit, ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from llama_optimizer.lifecycle import AttemptId
+
+
+class _Clock:
+    """Monotonic-ns stub advancing 1 ms per read."""
+
+    def __init__(self) -> None:
+        self.now: int = 5_000_000
+
+    def __call__(self) -> int:
+        self.now += 1_000_000
+        return self.now
+
+
+class _IdleProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1 << 30),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _config() -> SupervisorConfig:
+    return SupervisorConfig(
+        interval=timedelta(milliseconds=20),
+        deadline=timedelta(seconds=30),
+        grace=timedelta(milliseconds=400),
+        provider_timeout=timedelta(seconds=2),
+        max_staleness=timedelta(seconds=5),
+    )
+
+
+def _attempt(root: RunArtifactRoot) -> tuple[Ledger, AttemptId]:
+    identity = RunIdentity(
+        manifest_hash="sha256:manifest",
+        config_hash="sha256:config",
+        optimizer_version="0.1.0",
+        optuna_version="4.9.0",
+        checkpoint_format="pickle.v1",
+        max_retries=2,
+        seed=42,
+        process_group_pid=os.getpid(),
+    )
+    ledger = Ledger.create_run(root, identity)
+    ledger.start_run()
+    trial = ledger.create_trial(
+        TrialConfig(
+            config_id="cfg-1",
+            config_hash="hash-1",
+            candidate_id="ornith-9b-q4_k_m",
+            backend="rocm",
+            quant="Q4_K_M",
+        )
+    )
+    _ = ledger.start_trial(trial.trial_id)
+    return ledger, ledger.start_attempt(trial.trial_id).attempt_id
+
+
+class TestSpanRecorder:
+    def test_spans_carry_phase_thread_and_clock_stamps(self) -> None:
+        # Given an injected clock.
+        recorder = SpanRecorder(clock=_Clock())
+        # When timing two consecutive phases.
+        with recorder.span(Phase.PREFLIGHT):
+            pass
+        with recorder.span(Phase.LAUNCH):
+            pass
+        # Then each span is stamped on entry and exit by the recording thread.
+        me = threading.get_ident()
+        assert recorder.spans == (
+            PhaseSpanRow(phase="preflight", thread=me, start_ns=6_000_000, end_ns=7_000_000),
+            PhaseSpanRow(phase="launch", thread=me, start_ns=8_000_000, end_ns=9_000_000),
+        )
+
+    def test_span_is_kept_when_the_block_raises(self) -> None:
+        recorder = SpanRecorder(clock=_Clock())
+        with pytest.raises(RuntimeError), recorder.span(Phase.LOAD):
+            raise RuntimeError
+        assert [s.phase for s in recorder.spans] == ["load"]
+
+    def test_spans_from_other_threads_are_ordered_by_start(self) -> None:
+        # Given a worker thread timing a phase inside the main thread's span.
+        recorder = SpanRecorder(clock=_Clock())
+
+        def work() -> None:
+            with recorder.span(Phase.SUPERVISED):
+                pass
+
+        with recorder.span(Phase.MEASUREMENT):
+            worker = threading.Thread(target=work)
+            worker.start()
+            worker.join()
+        # Then the overlapping spans are ordered by start and keep distinct threads.
+        outer, inner = recorder.spans
+        assert (outer.phase, inner.phase) == ("measurement", "supervised")
+        assert outer.thread != inner.thread
+
+
+class TestChromeTrace:
+    def test_emits_relative_complete_events_with_stable_thread_ids(self) -> None:
+        # Given spans from two threads with arbitrary idents.
+        spans = [
+            PhaseSpanRow(phase="load", thread=777, start_ns=3_000_000, end_ns=5_500_000),
+            PhaseSpanRow(phase="supervised", thread=999, start_ns=2_000_000, end_ns=9_000_000),
+        ]
+        # When rendering the trace.
+        body: dict[str, list[dict[str, object]]] = json.loads(  # pyright: ignore[reportAny]
+            chrome_trace_json(spans, name="attempt-1")
+        )
+        # Then timestamps are µs from the first start and tids are renumbered 1..n.
+        meta, first, second = body["traceEvents"]
+        assert meta["ph"] == "M"
+        assert (first["name"], first["ph"], first["tid"], first["ts"], first["dur"]) == (
+            "supervised",
+            "X",
+            1,
+            0.0,
+            7000.0,
+        )
+        assert (second["name"], second["tid"], second["ts"], second["dur"]) == (
+            "load",
+            2,
+            1000.0,
+            2500.0,
+        )
+
+
+class TestSupervisorSpans:
+    def test_run_times_every_supervisor_phase(self) -> None:
+        # Given a recorder threaded into a short supervised child.
+        recorder = SpanRecorder()
+        # When the child exits cleanly.
+        result = ProcessSupervisor().run(
+            [sys.executable, "-c", "pass"],
+            provider=_IdleProvider(),
+            config=_config(),
+            spans=recorder,
+        )
+        # Then preflight, launch, supervision, and termination are each timed once.
+        assert result.outcome == ChildExit(0)
+        phases = [s.phase for s in recorder.spans]
+        assert phases == ["preflight", "launch", "supervised", "termination"]
+        assert all(s.end_ns >= s.start_ns for s in recorder.spans)
+
+
+class TestLedgerPersistence:
+    def test_round_trips_spans_and_links_the_trace(
+        self, run_root_base: Path, tmp_path: Path
+    ) -> None:
+        # Given a recorded attempt.
+        ledger, attempt_id = _attempt(RunArtifactRoot.for_run("spans-1", base=run_root_base))
+        recorder = SpanRecorder(clock=_Clock())
+        with recorder.span(Phase.PREFLIGHT):
+            pass
+        with recorder.span(Phase.RECORDING):
+            pass
+        trace = tmp_path / "attempt.trace.json"
+        # When persisting with a trace export.
+        with ledger:
+            record_phase_spans(ledger, attempt_id, recorder, trace_path=trace)
+            stored = ledger.phase_spans(attempt_id)
+            dump = ledger.dump()
+        # Then the spans read back in order and the trace is a linked artifact.
+        assert stored == recorder.spans
+        (attempt,) = dump["trials"][0]["attempts"]
+        assert [a["kind"] for a in attempt["artifacts"]] == [PHASE_TRACE_ARTIFACT_KIND]
+        trace_body: dict[str, list[object]] = json.loads(trace.read_text())  # pyright: ignore[reportAny]
+        assert trace_body["traceEvents"]
+
+    def test_v1_ledger_is_migrated_on_open(self, run_root_base: Path) -> None:
+        # Given a ledger written before phase spans existed.
+        root = RunArtifactRoot.for_run("spans-2", base=run_root_base)
+        ledger, _ = _attempt(root)
+        ledger.close()
+        conn = sqlite3.connect(root.resolve_artifact("study.sqlite3"))
+        _ = conn.executescript("""
+            DROP TABLE phase_spans;
+            DROP TABLE host_samples;
+            ALTER TABLE telemetry DROP COLUMN device;
+            ALTER TABLE telemetry DROP COLUMN interval_ns;
+            UPDATE schema_meta SET schema_version = 1;
+        """)
+        conn.close()
+        # When reopening it.
+        with Ledger.open(root) as reopened:
+            version = schema_version(reopened.connection)
+            tables = reopened.connection.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'phase_spans'"
+            ).fetchall()
+        # Then the explicit v1 -> v2 step ran.
+        assert version == SCHEMA_VERSION
+        assert len(tables) == 1
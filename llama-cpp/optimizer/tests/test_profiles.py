@@ -35,6 +35,7 @@ from llama_optimizer.profiles import (
     ProfileVramError,
     build_manifest,
     canonical_manifest_json,
+    device_vram_limits,
     parse_profile,
     parse_profile_bytes,
 )
@@ -229,6 +230,28 @@ class TestCanonicalManifest:
         for sha in PUBLISHER_SHA256.values():
             assert f'"{sha}"' in text
 
+    def test_single_card_profile_defaults_card0_ceiling(self) -> None:
+        # Given the single-card profile (no per-card limits declared).
+        profile = parse_profile(ORNITH_PROFILE)
+        # Then card0 carries the pinned ceiling and the manifest omits the map.
+        assert device_vram_limits(profile) == {"card0": REQUIRED_VRAM_LIMIT_BYTES}
+        assert "vram_limits" not in canonical_manifest_json(build_manifest(profile))
+
+    def test_multi_card_limits_are_parsed_and_bound(self) -> None:
+        # Given a dual-GPU profile with a smaller second card.
+        data = _toml_with(
+            (
+                "vram_total_bytes = 17179869184",
+                "vram_total_bytes = 17179869184\n"
+                + "vram_limits = { card1 = 7516192768, card0 = 13958643712 }",
+            )
+        )
+        # When parsing and binding the manifest.
+        profile = parse_profile_bytes(data)
+        # Then each card has its own ceiling, ordered by card index.
+        assert device_vram_limits(profile) == {"card0": 13_958_643_712, "card1": 7_516_192_768}
+        assert '"card1": 7516192768' in canonical_manifest_json(build_manifest(profile))
+
     def test_canonical_json_is_byte_deterministic(self) -> None:
         # Given two independent emissions of the same manifest.
         manifest = build_manifest(parse_profile(ORNITH_PROFILE))
@@ -297,6 +320,19 @@ class TestProfileTypedErrors:
             )
         assert exc_info.value.actual == 1000
 
+    def test_secondary_card_limit_must_keep_card0_pinned(self) -> None:
+        # Given per-card limits whose card0 entry drifts from the pinned ceiling.
+        with pytest.raises(ProfileVramError, match="card0"):
+            _ = parse_profile_bytes(
+                _toml_with(
+                    (
+                        "vram_total_bytes = 17179869184",
+                        "vram_total_bytes = 17179869184\n"
+                        + "vram_limits = { card0 = 1000, card1 = 1000 }",
+                    )
+                )
+            )
+
     def test_resolve_main_url_is_rejected_as_mutable(self) -> None:
         # Given a candidate URL that uses the mutable main ref.
         pinned = (
@@ -285,6 +285,71 @@ class TestParetoFrontier:
         frontier_ids = {c.config.config_id for c in result.frontier}
         assert frontier_ids == {"cfg-a"}
 
+    def test_noise_level_gap_inside_overlapping_intervals_does_not_dominate(self) -> None:
+        # Given B trails A only on ttft p95, by less than the bootstrap interval.
+        noisy = {"ttft_ms_p95_ci_low": 180.0, "ttft_ms_p95_ci_high": 230.0}
+        att_a = _attempt("att-a", {**_METRIC_VALUES_FULL, **noisy})
+        att_b = _attempt("att-b", {**_METRIC_VALUES_FULL, **noisy, "ttft_ms_p95": 205.0})
+        trials = [_trial("t1", "cfg-a", [att_a]), _trial("t2", "cfg-b", [att_b])]
+        configs = (_config("cfg-a"), _config("cfg-b"))
+        # Then both stay on the frontier.
+        assert set(_by_id(_generate_report(trials, configs))) == {"cfg-a", "cfg-b"}
+        # And without intervals the point comparison still removes B.
+        plain_a = _attempt("att-a", _METRIC_VALUES_FULL)
+        plain_b = _attempt("att-b", {**_METRIC_VALUES_FULL, "ttft_ms_p95": 205.0})
+        trials = [_trial("t1", "cfg-a", [plain_a]), _trial("t2", "cfg-b", [plain_b])]
+        assert set(_by_id(_generate_report(trials, configs))) == {"cfg-a"}
+
+    def test_throughput_gap_inside_overlapping_intervals_does_not_dominate(self) -> None:
+        # Given B trails A only on both throughputs, by less than their intervals.
+        noisy = {
+            "prompt_throughput_ci_low": 90.0,
+            "prompt_throughput_ci_high": 110.0,
+            "generation_throughput_ci_low": 45.0,
+            "generation_throughput_ci_high": 55.0,
+        }
+        slower = {"prompt_throughput": 97.0, "generation_throughput": 48.0}
+        att_a = _attempt("att-a", {**_METRIC_VALUES_FULL, **noisy})
+        att_b = _attempt("att-b", {**_METRIC_VALUES_FULL, **noisy, **slower})
+        trials = [_trial("t1", "cfg-a", [att_a]), _trial("t2", "cfg-b", [att_b])]
+        configs = (_config("cfg-a"), _config("cfg-b"))
+        # Then both stay on the frontier.
+        assert set(_by_id(_generate_report(trials, configs))) == {"cfg-a", "cfg-b"}
+        # And without intervals the throughput gap removes B.
+        plain_b = _attempt("att-b", {**_METRIC_VALUES_FULL, **slower})
+        trials = [
+            _trial("t1", "cfg-a", [_attempt("att-a", _METRIC_VALUES_FULL)]),
+            _trial("t2", "cfg-b", [plain_b]),
+        ]
+        assert set(_by_id(_generate_report(trials, configs))) == {"cfg-a"}
+
+    def test_interval_dominance_cycle_keeps_every_candidate(self) -> None:
+        # Given three candidates where each clears the next's interval on one
+        # metric while every other gap overlaps: A > B, B > C, C > A.
+        def metrics(
+            values: tuple[float, float, float], widths: tuple[float, ...]
+        ) -> dict[str, float]:
+            keys = ("prompt_throughput", "generation_throughput", "ttft_ms_p95")
+            flat = {**_METRIC_VALUES_FULL, **dict(zip(keys, values, strict=True))}
+            for key, value, width in zip(keys, values, widths, strict=True):
+                flat[f"{key}_ci_low"] = value - width
+                flat[f"{key}_ci_high"] = value + width
+            return flat
+
+        att_a = _attempt("att-a", metrics((200.0, 75.0, 200.0), (5.0, 35.0, 5.0)))
+        att_b = _attempt("att-b", metrics((100.0, 100.0, 150.0), (5.0, 5.0, 90.0)))
+        att_c = _attempt("att-c", metrics((150.0, 50.0, 100.0), (90.0, 5.0, 5.0)))
+        trials = [
+            _trial("t1", "cfg-a", [att_a]),
+            _trial("t2", "cfg-b", [att_b]),
+            _trial("t3", "cfg-c", [att_c]),
+        ]
+        configs = (_config("cfg-a"), _config("cfg-b"), _config("cfg-c"))
+        # Then point-value Pareto dominance keeps all three and one is selected.
+        result = _generate_report(trials, configs)
+        assert set(_by_id(result)) == {"cfg-a", "cfg-b", "cfg-c"}
+        assert result.selected is not None
+
 
 class TestBalancedScoring:
     def test_contributions_sum_to_score(self) -> None:
@@ -465,6 +530,31 @@ class TestFailedAttempt:
         assert result.selected is not None
 
 
+class TestSlotSweep:
+    def test_best_slot_count_is_exposed(self) -> None:
+        # Given an attempt scored on its best slot count of a sweep.
+        metrics = {
+            **_METRIC_VALUES_FULL,
+            "best_parallel": 2,
+            "slots2_aggregate_generation_ts": 80.0,
+        }
+        trial = _trial("t1", "cfg-a", [_attempt("att-1", metrics)])
+        # When the report is generated.
+        result = _generate_report([trial], (_config("cfg-a"),))
+        # Then the chosen slot count is carried into JSON and markdown.
+        assert result.selected is not None
+        assert result.selected.best_parallel == 2
+        assert json.loads(result.json_text)["selected"]["best_parallel"] == 2
+        assert "- best_parallel: 2 slots" in result.markdown_text
+
+    def test_unswept_candidate_has_no_slot_count(self) -> None:
+        trial = _trial("t1", "cfg-a", [_attempt("att-1", _METRIC_VALUES_FULL)])
+        result = _generate_report([trial], (_config("cfg-a"),))
+        assert result.selected is not None
+        assert result.selected.best_parallel is None
+        assert "best_parallel" not in json.loads(result.json_text)["selected"]
+
+
 class TestDeterministicOutput:
     def test_json_is_deterministic_across_calls(self) -> None:
         attempt = _attempt("att-1", _METRIC_VALUES_FULL)
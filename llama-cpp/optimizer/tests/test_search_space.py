@@ -146,6 +146,39 @@ class TestApplicability:
         assert validate_applicability(space, {"batch": 1024, "ubatch": 256}) == []
 
 
+class TestMultiGpuDimensions:
+    def test_split_mode_and_tensor_split_are_searchable(self) -> None:
+        # Given a dual-GPU table searching split mode and tensor split.
+        table = {
+            **_well_formed_table(),
+            "max_native_combinations": 8_000_000,
+            "split_mode": {"values": ["layer", "row"]},
+            "tensor_split": {"values": ["1/1", "3/1"]},
+        }
+        # When parsing.
+        space = parse_search_space(table)
+        # Then both are ordinary dimensions in the native product.
+        ids = {str(d.dimension_id) for d in space.dimensions}
+        assert {"split_mode", "tensor_split"} <= ids
+
+    @pytest.mark.parametrize(
+        ("key", "values"),
+        [
+            ("split_mode", ["layer", "diagonal"]),
+            ("tensor_split", ["1/x"]),
+            ("tensor_split", ["0/0"]),
+        ],
+    )
+    def test_rejects_unknown_split_values(self, key: str, values: list[str]) -> None:
+        with pytest.raises(InvalidRangeError, match=key):
+            _ = parse_search_space({**_well_formed_table(), key: {"values": values}})
+
+    def test_tensor_split_without_splitting_is_flagged(self) -> None:
+        space = parse_search_space(_well_formed_table())
+        notes = validate_applicability(space, {"split_mode": "none", "tensor_split": "1/1"})
+        assert notes == ["tensor_split is ignored when split_mode is none"]
+
+
 class TestSearchSpaceImmutability:
     def test_search_space_is_frozen(self) -> None:
         # Given a parsed space.
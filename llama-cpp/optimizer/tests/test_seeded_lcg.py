@@ -0,0 +1,27 @@
+"""Behavior tests for the shared seeded LCG (T9).
+
+A seed must reproduce every draw, draws must stay within their range, and
+the shuffle must permute any sequence without losing or duplicating items.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+
+from llama_optimizer.seeded_lcg import LCG_RANGE, lcg_draws, lcg_unit, seeded_shuffle
+
+
+class TestSeededLcg:
+    def test_a_seed_reproduces_its_draws(self) -> None:
+        first = list(islice(lcg_draws(7), 100))
+        assert first == list(islice(lcg_draws(7), 100))
+        assert first != list(islice(lcg_draws(8), 100))
+        assert all(0 <= draw < LCG_RANGE for draw in first)
+        assert 0.0 <= lcg_unit(2**64 - 1) < 1.0
+
+    def test_shuffle_is_a_seeded_permutation(self) -> None:
+        items = tuple(range(20))
+        shuffled = seeded_shuffle(items, 3)
+        assert sorted(shuffled) == list(items)
+        assert shuffled == seeded_shuffle(items, 3)
+        assert shuffled != seeded_shuffle(items, 4)
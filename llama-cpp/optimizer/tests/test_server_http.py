@@ -0,0 +1,189 @@
+"""Behavior tests for keep-alive llama-server workload dispatch (T9).
+
+Dispatch must reuse one persistent connection per worker across the whole
+interleaved sequence, record connection setup separately from request time,
+and recover transparently when the server closes or drops a connection. A
+streamed request is timed per token on the same persistent connection, and
+a pre-built payload's trace gap delays its release.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, ClassVar, final, override
+
+import pytest
+
+from llama_optimizer.lifecycle import TrialId
+from llama_optimizer.server import (
+    CODING_SPEC,
+    TOOL_USE_SPEC,
+    FinalistRequest,
+    KeepAlivePool,
+    ServerConfig,
+    ServerIdentity,
+    total_request_count,
+)
+from llama_optimizer.server_http import dispatch_sequence
+from llama_optimizer.server_payloads import Payload, request_body
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+_CONFIG = ServerConfig(
+    repetitions=3,
+    delay_seconds=0,
+    parallel=2,
+    readiness_timeout_seconds=5,
+    cooldown_seconds=0,
+    request_specs=(CODING_SPEC, TOOL_USE_SPEC),
+)
+
+_IDENTITY = ServerIdentity(
+    model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+    backend="rocm",
+    build_label="b1234",
+    n_gpu_layers=99,
+    n_batch=2048,
+    n_ubatch=512,
+    type_k="f16",
+    type_v="f16",
+    n_threads=16,
+    flash_attn=1,
+    use_mmap=True,
+)
+
+
+@final
+class _Handler(BaseHTTPRequestHandler):
+    """Answer every POST with a tiny completion, counting TCP connections."""
+
+    protocol_version: str = "HTTP/1.1"
+    disable_nagle_algorithm: ClassVar[bool] = True
+    connections: ClassVar[list[int]] = []
+    drop_after_response: ClassVar[bool] = False
+
+    @override
+    def setup(self) -> None:
+        super().setup()
+        _Handler.connections.append(1)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if b'"stream": true' in body:
+            self._stream()
+            return
+        payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        _ = self.wfile.write(payload)
+        # Close without announcing it, leaving the client a stale keep-alive socket.
+        self.close_connection = _Handler.drop_after_response
+
+    def _stream(self) -> None:
+        """Send three SSE tokens 10 ms apart as a chunked body."""
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for token in ("a", "b", "c"):
+            time.sleep(0.01)
+            self._chunk(f"data: {json.dumps({'choices': [{'delta': {'content': token}}]})}\n\n")
+        self._chunk("data: [DONE]\n\n")
+        _ = self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, text: str) -> None:
+        data = text.encode()
+        _ = self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Generator[int]:
+    """Serve :class:`_Handler` on an ephemeral port and yield the port."""
+    _Handler.connections = []
+    _Handler.drop_after_response = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd.server_address[1]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _request(tmp_path: Path) -> FinalistRequest:
+    return FinalistRequest(
+        trial_id=TrialId("trial-1"),
+        identity=_IDENTITY,
+        config=_CONFIG,
+        binary="llama-server",
+        output_dir=tmp_path,
+    )
+
+
+class TestKeepAliveDispatch:
+    def test_sequence_reuses_one_connection_per_worker(self, server: int, tmp_path: Path) -> None:
+        # When the whole interleaved sequence is dispatched with two workers.
+        records = dispatch_sequence(_request(tmp_path), server, threading.current_thread())
+        # Then every request succeeded over at most two TCP connections.
+        assert len(records) == total_request_count(_CONFIG)
+        assert all(r.status == 200 and not r.error for r in records)
+        assert len(_Handler.connections) <= _CONFIG.parallel
+        connected = [r for r in records if r.connect_ms > 0]
+        assert 1 <= len(connected) <= _CONFIG.parallel
+
+    def test_trace_gaps_delay_each_release(self, server: int, tmp_path: Path) -> None:
+        # Given pre-built payloads whose second measured request follows a 100 ms gap.
+        request = _request(tmp_path)
+        body = request_body(CODING_SPEC.name, 100)
+        gaps = [0.0] * total_request_count(_CONFIG)
+        gaps[3] = 0.1
+        payloads = tuple(Payload(body, gap) for gap in gaps)
+        # When the sequence is dispatched with them.
+        records = dispatch_sequence(request, server, threading.current_thread(), payloads)
+        # Then that request was not released before its gap had passed.
+        assert records[3].offset_ms - records[2].offset_ms >= 100.0
+
+    def test_pool_reconnects_when_the_server_drops_an_idle_connection(self, server: int) -> None:
+        # Given a server that silently closes each connection after one response.
+        _Handler.drop_after_response = True
+        pool = KeepAlivePool(server)
+        # When one worker sends three requests in a row.
+        results = [pool.send(request_body(CODING_SPEC.name, 100)) for _ in range(3)]
+        pool.close()
+        # Then each stale socket was replaced and no request failed.
+        assert [r.status for r in results] == [200, 200, 200]
+        assert all(r.connect_ms > 0 for r in results)
+        assert len(_Handler.connections) == 3
+
+    def test_unreachable_server_is_a_transport_error(self) -> None:
+        pool = KeepAlivePool(1)
+        result = pool.send(request_body(CODING_SPEC.name, 100))
+        assert result.status == 0
+        assert result.error
+
+    def test_streamed_requests_are_timed_per_token_on_one_connection(self, server: int) -> None:
+        # Given a pool requesting SSE streams.
+        pool = KeepAlivePool(server, stream=True)
+        # When one worker sends two streamed requests.
+        body = request_body(CODING_SPEC.name, 100, stream=True)
+        results = [pool.send(body) for _ in range(2)]
+        pool.close()
+        # Then each carries its token timing and the connection was reused.
+        assert len(_Handler.connections) == 1
+        for result in results:
+            assert result.status == 200
+            assert result.timing is not None
+            assert result.timing.tokens == 3
+            assert result.timing.ttft_ms >= 10.0
+            assert all(gap >= 5.0 for gap in result.timing.itl_ms)
+            assert "[DONE]" in result.body
@@ -0,0 +1,87 @@
+"""Behavior tests for the open-loop finalist load sweep (T9).
+
+Arrivals must be seeded and hit the requested mean rate, step summaries must
+judge the TTFT SLO and error budget, and the knee search must bracket the
+highest rate a server sustains within the SLO.
+"""
+
+from __future__ import annotations
+
+import statistics
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llama_optimizer.server import CODING_SPEC, LoadStep, LoadSweepConfig, ServerConfig
+from llama_optimizer.server_load import arrival_offsets, find_max_qps, summarize_step
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SWEEP = LoadSweepConfig(slo_ttft_ms_p95=200.0, min_qps=1.0, max_qps=16.0, search_steps=5)
+
+
+def _queueing_step(capacity_qps: float) -> Callable[[float], LoadStep]:
+    """Return a step function whose TTFT explodes past ``capacity_qps``."""
+
+    def step(qps: float) -> LoadStep:
+        ttft = 100.0 if qps <= capacity_qps else 1000.0
+        return summarize_step(qps, [(ttft, ttft + 500.0)] * 10, _SWEEP)
+
+    return step
+
+
+class TestArrivals:
+    def test_poisson_arrivals_are_seeded_at_the_mean_rate(self) -> None:
+        offsets = arrival_offsets(4.0, 2000, seed=9)
+        assert offsets == arrival_offsets(4.0, 2000, seed=9)
+        assert offsets != arrival_offsets(4.0, 2000, seed=10)
+        gaps = [b - a for a, b in zip([0.0, *offsets], offsets, strict=False)]
+        assert statistics.fmean(gaps) == pytest.approx(0.25, rel=0.1)
+        assert statistics.stdev(gaps) == pytest.approx(0.25, rel=0.15)
+
+    def test_trace_gaps_are_rescaled_to_the_rate(self) -> None:
+        offsets = arrival_offsets(2.0, 4, seed=0, trace=(1.0, 3.0))
+        assert offsets == pytest.approx([0.25, 1.0, 1.25, 2.0])
+
+
+class TestStepSummary:
+    def test_errors_beyond_the_budget_miss_the_slo(self) -> None:
+        step = summarize_step(2.0, [(50.0, 400.0), None], _SWEEP)
+        assert step.error_rate == 0.5
+        assert step.ttft_ms_p95 == 50.0
+        assert not step.meets_slo
+
+    def test_p95_ttft_over_the_slo_misses_it(self) -> None:
+        step = summarize_step(2.0, [(50.0, 400.0)] * 19 + [(900.0, 1300.0)], _SWEEP)
+        assert step.ttft_ms_p99 == 900.0
+        assert step.meets_slo is (step.ttft_ms_p95 <= _SWEEP.slo_ttft_ms_p95)
+
+
+class TestKneeSearch:
+    def test_bisection_brackets_the_capacity(self) -> None:
+        # Given a server that keeps TTFT within the SLO up to 6 qps.
+        # When the knee is searched between 1 and 16 qps.
+        result = find_max_qps(_queueing_step(6.0), _SWEEP)
+        # Then the answer sits just below the capacity, within the resolution.
+        assert 6.0 - 15.0 / 2**_SWEEP.search_steps <= result.max_qps_at_slo <= 6.0
+        assert len(result.steps) == 2 + _SWEEP.search_steps
+        assert [s.qps for s in result.steps[:2]] == [1.0, 16.0]
+
+    def test_bounds_short_circuit_the_search(self) -> None:
+        slow = find_max_qps(_queueing_step(0.5), _SWEEP)
+        fast = find_max_qps(_queueing_step(99.0), _SWEEP)
+        assert (slow.max_qps_at_slo, len(slow.steps)) == (0.0, 1)
+        assert (fast.max_qps_at_slo, len(fast.steps)) == (16.0, 2)
+
+    def test_load_sweep_requires_streaming(self) -> None:
+        with pytest.raises(ValueError, match="stream"):
+            _ = ServerConfig(
+                repetitions=1,
+                delay_seconds=0,
+                parallel=1,
+                readiness_timeout_seconds=5,
+                cooldown_seconds=0,
+                request_specs=(CODING_SPEC,),
+                load=_SWEEP,
+            )
@@ -0,0 +1,118 @@
+"""Behavior tests for corpus- and trace-driven request payloads (T9).
+
+Corpus specs must sample the versioned corpus prompts reproducibly from their
+seed, trace specs must replay each entry's prompt length, ``max_tokens`` and
+inter-arrival gap, and every body must be serialised once and shared across
+repetitions. Missing or malformed sources are typed errors.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llama_optimizer.server import (
+    CODING_SPEC,
+    PayloadSourceError,
+    RequestKind,
+    RequestSpec,
+    ServerConfig,
+    build_payloads,
+    interleave_requests,
+)
+from llama_optimizer.server_payloads import read_corpus, read_trace
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+_CODING_CORPUS = Path(__file__).parent.parent / "corpora" / "coding-smoke.jsonl"
+
+
+def _config(*specs: RequestSpec, repetitions: int) -> ServerConfig:
+    return ServerConfig(
+        repetitions=repetitions,
+        delay_seconds=0,
+        parallel=1,
+        readiness_timeout_seconds=5,
+        cooldown_seconds=0,
+        request_specs=specs,
+    )
+
+
+def _prompt(body: bytes) -> str:
+    content: str = json.loads(body)["messages"][0]["content"]  # pyright: ignore[reportAny]
+    return content
+
+
+def _trace(tmp_path: Path, rows: Sequence[Mapping[str, object]]) -> Path:
+    path = tmp_path / "trace.jsonl"
+    _ = path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return path
+
+
+class TestCorpusPayloads:
+    def test_prompts_are_sampled_from_the_corpus_by_seed(self) -> None:
+        # Given a coding spec drawing on the versioned coding corpus.
+        spec = RequestSpec("coding-corpus", RequestKind.CODING, corpus=str(_CODING_CORPUS), seed=3)
+        sequence = interleave_requests(_config(spec, repetitions=5))
+        # When its payloads are built twice.
+        payloads = build_payloads(sequence)
+        # Then every corpus prompt is measured once, reproducibly, and the
+        # warmup does not repeat the first measured prompt.
+        measured = [_prompt(p.body) for p in payloads[1:]]
+        assert sorted(measured) == sorted(read_corpus(_CODING_CORPUS))
+        assert payloads == build_payloads(sequence)
+        assert _prompt(payloads[0].body) != measured[0]
+        reseeded = RequestSpec("coding-corpus", RequestKind.CODING, corpus=str(_CODING_CORPUS))
+        other = build_payloads(interleave_requests(_config(reseeded, repetitions=5)))
+        assert [_prompt(p.body) for p in other[1:]] != measured
+
+    def test_bodies_are_serialised_once_and_shared(self) -> None:
+        payloads = build_payloads(interleave_requests(_config(CODING_SPEC, repetitions=3)))
+        assert all(p.body is payloads[0].body for p in payloads)
+        assert _prompt(payloads[0].body) == CODING_SPEC.name
+
+    def test_missing_corpus_is_a_typed_error(self, tmp_path: Path) -> None:
+        spec = RequestSpec("gone", RequestKind.CODING, corpus=str(tmp_path / "gone.jsonl"))
+        with pytest.raises(PayloadSourceError, match="not found"):
+            _ = build_payloads(interleave_requests(_config(spec, repetitions=1)))
+
+
+class TestTracePayloads:
+    def test_trace_replays_lengths_caps_and_gaps(self, tmp_path: Path) -> None:
+        # Given a captured trace: one literal prompt, one length-only entry.
+        path = _trace(
+            tmp_path,
+            [
+                {"prompt": "hello", "max_tokens": 8, "offset_ms": 1000},
+                {"prompt_tokens": 4, "max_tokens": 32, "offset_ms": 1250},
+            ],
+        )
+        spec = RequestSpec("replay", RequestKind.LATENCY, trace=str(path))
+        # When two passes over the trace are built.
+        payloads = build_payloads(interleave_requests(_config(spec, repetitions=4)), stream=True)
+        # Then each entry keeps its prompt length and cap, and gaps restart per pass.
+        second: dict[str, object] = json.loads(payloads[2].body)  # pyright: ignore[reportAny]
+        assert _prompt(payloads[1].body) == "hello"
+        assert len(_prompt(payloads[2].body).split()) == 4
+        assert second["max_tokens"] == 32
+        assert second["stream"] is True
+        assert [p.gap_seconds for p in payloads] == pytest.approx([0.0, 0.0, 0.25, 0.0, 0.25])
+
+    def test_malformed_trace_entries_are_typed_errors(self, tmp_path: Path) -> None:
+        for row in ({"max_tokens": 8}, {"prompt": "x", "max_tokens": 0}):
+            with pytest.raises(PayloadSourceError):
+                _ = read_trace(_trace(tmp_path, [row]))
+        backwards = [
+            {"prompt": "a", "max_tokens": 1, "offset_ms": 5},
+            {"prompt": "b", "max_tokens": 1, "offset_ms": 1},
+        ]
+        with pytest.raises(PayloadSourceError, match="decrease"):
+            _ = read_trace(_trace(tmp_path, backwards))
+
+    def test_a_spec_names_one_source(self) -> None:
+        with pytest.raises(ValueError, match="corpus or a trace"):
+            _ = RequestSpec("both", RequestKind.CODING, corpus="a.jsonl", trace="b.jsonl")
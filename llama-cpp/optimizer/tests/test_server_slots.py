@@ -0,0 +1,110 @@
+"""Behavior tests for the ``--parallel`` slot-count sub-sweep (T9).
+
+The best slot count must be the fewest slots reaching the knee of the
+aggregate-throughput curve, ignoring failed runs, and a slot sweep must be a
+list of distinct positive counts. Aggregate throughput must count generated
+tokens over the measured requests' shared wall span.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from llama_optimizer.server import CODING_SPEC, ServerConfig, WorkloadRecord
+from llama_optimizer.server_classify import aggregate_generation_ts
+from llama_optimizer.server_slots import (
+    KNEE_FRACTION,
+    SlotRun,
+    SlotSweepResult,
+    best_slot_count,
+)
+from llama_optimizer.server_stream import StreamTiming
+
+
+def _run(parallel: int, aggregate_ts: float, *, scored: bool = True) -> SlotRun:
+    return SlotRun(
+        parallel=parallel,
+        scored=scored,
+        aggregate_generation_ts=aggregate_ts,
+        request_latency_ms_p50=1000.0 * parallel,
+        request_latency_ms_p95=1200.0 * parallel,
+    )
+
+
+def _record(index: int, offset_ms: float, body: str, timing: StreamTiming | None) -> WorkloadRecord:
+    return WorkloadRecord(
+        sequence_index=index,
+        spec_name=CODING_SPEC.name,
+        kind=CODING_SPEC.kind.value,
+        is_warmup=index == 0,
+        repetition=index,
+        status=200,
+        response_body=body,
+        elapsed_ms=1000.0,
+        error="",
+        offset_ms=offset_ms,
+        timing=timing,
+    )
+
+
+class TestBestSlotCount:
+    def test_fewest_slots_at_the_throughput_knee(self) -> None:
+        # Given throughput that plateaus from four slots on.
+        runs = [_run(1, 40.0), _run(2, 70.0), _run(4, 99.0), _run(8, 100.0)]
+        # Then four slots are within the knee fraction of the peak; eight add nothing.
+        assert best_slot_count(runs) == 4
+        # And the ledger metrics name the choice and every scored slot count.
+        metrics = SlotSweepResult(tuple(runs), 4).metrics()
+        assert metrics["best_parallel"] == 4.0
+        assert metrics["slots8_request_latency_ms_p95"] == 9600.0
+        assert SlotSweepResult((), None).metrics() == {}
+
+    def test_knee_fraction_tolerates_noise_below_the_peak(self) -> None:
+        runs = [_run(2, KNEE_FRACTION * 100.0), _run(4, 100.0)]
+        assert best_slot_count(runs) == 2
+
+    def test_failed_runs_are_ignored(self) -> None:
+        runs = [_run(1, 40.0), _run(2, 0.0, scored=False)]
+        assert best_slot_count(runs) == 1
+        assert best_slot_count([_run(2, 0.0, scored=False)]) is None
+
+    def test_slot_sweep_counts_must_be_distinct_and_positive(self) -> None:
+        for sweep in ((2, 2), (0, 1)):
+            with pytest.raises(ValueError, match="slot_sweep"):
+                _ = ServerConfig(
+                    repetitions=1,
+                    delay_seconds=0,
+                    parallel=1,
+                    readiness_timeout_seconds=5,
+                    cooldown_seconds=0,
+                    request_specs=(CODING_SPEC,),
+                    slot_sweep=sweep,
+                )
+
+
+class TestAggregateThroughput:
+    def test_tokens_over_the_measured_wall_span(self) -> None:
+        # Given a warmup, then two overlapping measured requests: one reporting
+        # usage, one streamed with 30 timed tokens.
+        usage = json.dumps({"usage": {"completion_tokens": 50}})
+        streamed = StreamTiming(ttft_ms=100.0, itl_ms=(10.0,) * 29, total_ms=1000.0)
+        records = [
+            _record(0, 0.0, usage, None),
+            _record(1, 1000.0, usage, None),
+            _record(2, 1500.0, "data: ...", streamed),
+        ]
+        # Then 80 tokens over 1.5 s give the aggregate rate; the warmup is excluded.
+        assert aggregate_generation_ts(records) == pytest.approx(80 / 1.5)
+
+    def test_queue_wait_extends_the_wall_span(self) -> None:
+        # Given a request released at 0 ms that waited 1 s for a worker.
+        usage = json.dumps({"usage": {"completion_tokens": 40}})
+        record = replace(_record(1, 0.0, usage, None), queued_ms=1000.0)
+        # Then the span runs to the end of the request, not 1 s after release.
+        assert aggregate_generation_ts([record]) == pytest.approx(40 / 2.0)
+
+    def test_unparseable_bodies_count_no_tokens(self) -> None:
+        assert aggregate_generation_ts([_record(1, 0.0, "not json", None)]) == 0.0
@@ -0,0 +1,99 @@
+"""Behavior tests for streamed-completion timing (T9).
+
+The SSE reader must count one token per non-empty delta, stop at ``[DONE]``,
+and reject malformed events; streamed client timings must replace the
+server-reported latency figures the reports rank on.
+"""
+
+from __future__ import annotations
+
+import http.client
+import io
+import json
+
+import pytest
+
+from llama_optimizer.server_classify import extract_metrics_map
+from llama_optimizer.server_stream import StreamTiming, read_sse_stream
+from llama_optimizer.server_types import ServerMetrics
+
+_METRICS = ServerMetrics(
+    prompt_throughput=900.0,
+    generation_throughput=40.0,
+    ttft_ms=(50.0, 60.0, 70.0),
+    request_latency_ms=(2500.0, 2600.0, 2700.0),
+    slots=2,
+    errors=0,
+    quality_pass=True,
+)
+
+
+def _event(content: str) -> bytes:
+    return b"data: " + json.dumps({"choices": [{"delta": {"content": content}}]}).encode() + b"\n\n"
+
+
+class TestReadSseStream:
+    def test_counts_non_empty_deltas_until_done(self) -> None:
+        # Given a role-only chunk, three content tokens, [DONE], and a trailer.
+        role = b'data: {"choices":[{"delta":{"role":"assistant"}}]}\n\n'
+        body = role + _event("a") + _event("b") + _event("c") + b"data: [DONE]\n\ntrailer"
+        # When the stream is read.
+        raw, timing = read_sse_stream(io.BytesIO(body), 0)
+        # Then three tokens were timed and the whole body was kept.
+        assert timing is not None
+        assert timing.tokens == 3
+        assert len(timing.itl_ms) == 2
+        assert timing.ttft_ms <= timing.total_ms
+        assert raw == body.decode()
+
+    def test_stream_without_tokens_has_no_timing(self) -> None:
+        _, timing = read_sse_stream(io.BytesIO(_event("") + b"data: [DONE]\n\n"), 0)
+        assert timing is None
+
+    def test_malformed_event_is_a_protocol_error(self) -> None:
+        with pytest.raises(http.client.HTTPException):
+            _ = read_sse_stream(io.BytesIO(b"data: {not json\n\n"), 0)
+
+
+class TestStreamedMetrics:
+    def test_decode_rate_covers_tokens_after_the_first(self) -> None:
+        timing = StreamTiming(ttft_ms=100.0, itl_ms=(20.0, 30.0), total_ms=160.0)
+        assert timing.decode_ts == pytest.approx(40.0)
+        assert StreamTiming(ttft_ms=100.0, itl_ms=(), total_ms=100.0).decode_ts is None
+
+    def test_client_timings_replace_server_latency(self) -> None:
+        # Given client-observed timings slower than the server reports.
+        streamed = (
+            StreamTiming(ttft_ms=120.0, itl_ms=(25.0, 25.0), total_ms=3000.0),
+            StreamTiming(ttft_ms=140.0, itl_ms=(20.0, 30.0), total_ms=3100.0),
+        )
+        # When the ledger metrics are flattened.
+        flat = extract_metrics_map(_METRICS, streamed)
+        # Then ranking keys are client-observed and the server's are kept aside.
+        assert flat["ttft_ms_p95"] == 140.0
+        assert flat["request_latency_ms_p95"] == 3100.0
+        assert flat["server_ttft_ms_p95"] == 70.0
+        assert flat["itl_ms_p95"] == 30.0
+        assert flat["decode_ts_p50"] == pytest.approx(40.0)
+        assert "ttft_ms_p95_ci_low" in flat
+
+    def test_single_token_streams_record_no_itl_or_decode_rate(self) -> None:
+        # Given streams that each timed just one token.
+        streamed = (StreamTiming(ttft_ms=120.0, itl_ms=(), total_ms=120.0),) * 2
+        flat = extract_metrics_map(_METRICS, streamed)
+        # Then no inter-token figure reads as perfect latency or zero throughput.
+        assert flat["ttft_ms_p95"] == 120.0
+        assert not any(key.startswith(("itl_ms", "decode_ts")) for key in flat)
+
+    def test_throughputs_carry_per_request_intervals(self) -> None:
+        # Given per-request generation rates spread around the aggregate.
+        flat = extract_metrics_map(_METRICS, generation_ts=(30.0, 40.0, 50.0))
+        # Then both aggregate throughputs are bounded by a scaled interval.
+        for name in ("prompt_throughput", "generation_throughput"):
+            assert flat[f"{name}_ci_low"] < flat[f"{name}_ci_high"]
+            assert flat[f"{name}_ci_low"] <= flat[name] <= flat[f"{name}_ci_high"]
+
+    def test_unstreamed_metrics_are_server_reported(self) -> None:
+        flat = extract_metrics_map(_METRICS)
+        assert flat["ttft_ms_p95"] == 70.0
+        assert not any(key.startswith(("server_", "itl_")) for key in flat)
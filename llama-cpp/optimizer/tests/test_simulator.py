@@ -0,0 +1,469 @@
+"""Behavior tests for the offline llama.cpp simulator (T6/T7/T9).
+
+The simulated executables must satisfy the real runners and parsers
+unchanged: a simulated llama-bench screen scores the model's throughput, an
+unloadable config fails like a real load failure, and a simulated
+llama-server passes finalist validation. The model and the in-process search
+harness must be seeded and reproducible.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import optuna
+import pytest
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import DEFAULT_BENCH_CONFIG, BenchIdentity, BenchScreenRequest
+from llama_optimizer.bench_runner import run_supervised_bench
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.phase_spans import Phase
+from llama_optimizer.search_space import parse_search_space
+from llama_optimizer.server import (
+    CODING_SPEC,
+    TOOL_USE_SPEC,
+    EligibilityStatus,
+    FinalistEntry,
+    FinalistRequest,
+    LoadSweepConfig,
+    ServerConfig,
+    ServerIdentity,
+    ValidationPlan,
+    run_supervised_server,
+    validate_finalists,
+)
+from llama_optimizer.server_lifecycle import SupervisorJob
+from llama_optimizer.sim_model import SIM_CONTROL_ENV, SimModel
+from llama_optimizer.sim_search import SimSearchPlan, simulate_search
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from llama_optimizer.bench import BenchScreenResult
+    from llama_optimizer.lifecycle import TrialId
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+_MODEL = SimModel(seed=7)
+_SPACE = parse_search_space(
+    {
+        "max_native_combinations": 128,
+        "kv_cache_types": [{"value": "f16"}, {"value": "q8_0"}, {"value": "q4_0"}],
+        "flash_attention": {"values": [True, False]},
+        "gpu_layers": {"min": 20, "max": 40, "step": 10},
+        "batch": {"values": [512, 2048]},
+        "ubatch": {"values": [128, 512]},
+    }
+)
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=50),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+_BENCH_IDENTITY = BenchIdentity(
+    model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+    n_gpu_layers=99,
+    n_batch=2048,
+    n_ubatch=512,
+    type_k="f16",
+    type_v="f16",
+    n_threads=16,
+    flash_attn=1,
+    use_mmap=True,
+)
+
+_SERVER_IDENTITY = ServerIdentity(
+    model_filename=_BENCH_IDENTITY.model_filename,
+    backend="rocm",
+    build_label="b4000",
+    n_gpu_layers=99,
+    n_batch=2048,
+    n_ubatch=512,
+    type_k="f16",
+    type_v="f16",
+    n_threads=16,
+    flash_attn=1,
+    use_mmap=True,
+)
+
+
+class _BelowLimitProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1_000_000_000),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+def _executable(tmp_path: Path, module: str) -> str:
+    """Write a launcher for ``llama_optimizer.<module>`` and return its path."""
+    path = tmp_path / module
+    _ = path.write_text(
+        f"#!{sys.executable}\n"
+        + "import sys\n"
+        + f"sys.path.insert(0, {str(_SRC)!r})\n"
+        + f"from llama_optimizer.{module} import main\n"
+        + "sys.exit(main())\n"
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
+def _control(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    model: dict[str, object],
+    time_scale: float = 0.0,
+    output_dir: Path | None = None,
+) -> Path:
+    """Write a simulator control file, point the environment at it, return the state file."""
+    state = tmp_path / "launches.txt"
+    ctrl = tmp_path / "sim.json"
+    control = {
+        "model": model,
+        "state_path": str(state),
+        "output_dir": str(output_dir or tmp_path / "out"),
+        "time_scale": time_scale,
+    }
+    _ = ctrl.write_text(json.dumps(control))
+    monkeypatch.setenv(SIM_CONTROL_ENV, str(ctrl))
+    return state
+
+
+@pytest.fixture
+def ledger_trial(run_root_base: Path) -> Generator[tuple[Ledger, TrialId]]:
+    """Create a RUNNING ledger with one RUNNING trial."""
+    led = Ledger.create_run(
+        RunArtifactRoot.for_run("sim-1", base=run_root_base),
+        RunIdentity(
+            manifest_hash="sha256:manifest",
+            config_hash="sha256:config",
+            optimizer_version="0.1.0",
+            optuna_version="4.9.0",
+            checkpoint_format="pickle.v1",
+            max_retries=2,
+            seed=42,
+            process_group_pid=os.getpid(),
+        ),
+    )
+    led.start_run()
+    trial = led.create_trial(
+        TrialConfig(
+            config_id="cfg-1",
+            config_hash="hash-1",
+            candidate_id="ornith-1.0-9b-q4_k_m",
+            backend="rocm",
+            quant="Q4_K_M",
+        )
+    )
+    _ = led.start_trial(trial.trial_id)
+    try:
+        yield led, trial.trial_id
+    finally:
+        led.close()
+
+
+class TestSimModel:
+    def test_kv_quantization_trades_vram_for_generation_speed(self) -> None:
+        q4 = replace(_BENCH_IDENTITY, type_k="q4_0", type_v="q4_0")
+        assert _MODEL.vram_bytes(q4, 32768) < _MODEL.vram_bytes(_BENCH_IDENTITY, 32768)
+        assert _MODEL.tg_ts(q4, 32768) > _MODEL.tg_ts(_BENCH_IDENTITY, 32768)
+        assert _MODEL.tg_ts(_BENCH_IDENTITY, 32768) < _MODEL.tg_ts(_BENCH_IDENTITY, 0)
+
+    def test_cpu_layers_are_slower_and_oversized_configs_fail(self) -> None:
+        partial = replace(_BENCH_IDENTITY, n_gpu_layers=20)
+        assert _MODEL.pp_ts(partial, 0) < _MODEL.pp_ts(_BENCH_IDENTITY, 0)
+        assert _MODEL.failure(_BENCH_IDENTITY, 32768, 0) is None
+        small = replace(_MODEL, vram_total=4_000_000_000)
+        assert small.failure(_BENCH_IDENTITY, 32768, 0) is not None
+        assert small.failure(partial, 0, 0) is None
+
+    def test_noise_is_seeded_per_config_and_launch(self) -> None:
+        stream = _MODEL.stream(_BENCH_IDENTITY, 3, "tg128")
+        assert _MODEL.noisy(40.0, 5, stream) == _MODEL.noisy(40.0, 5, stream)
+        assert stream != _MODEL.stream(_BENCH_IDENTITY, 4, "tg128")
+        assert all(abs(s - 40.0) <= 40.0 * _MODEL.noise_rel for s in _MODEL.noisy(40.0, 5, stream))
+
+
+class TestSimulatedBench:
+    def _screen(self, ledger_trial: tuple[Ledger, TrialId], tmp_path: Path) -> BenchScreenResult:
+        led, trial_id = ledger_trial
+        return run_supervised_bench(
+            ProcessSupervisor(),
+            _BelowLimitProvider(),
+            _FAST,
+            led,
+            BenchScreenRequest(
+                trial_id=trial_id,
+                bench_config=DEFAULT_BENCH_CONFIG,
+                identity=_BENCH_IDENTITY,
+                binary=_executable(tmp_path, "sim_bench"),
+                output_dir=tmp_path / "bench",
+            ),
+        )
+
+    def test_screen_scores_the_model_throughput(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Given a simulator with 1% noise.
+        state = _control(tmp_path, monkeypatch, {"seed": 7})
+        # When the real bench runner screens the simulated binary.
+        result = self._screen(ledger_trial, tmp_path)
+        # Then the parsed throughput is the model's, within its noise.
+        assert result.outcome is None
+        expected = _MODEL.tg_ts(_BENCH_IDENTITY, 32768)
+        assert result.metrics["tg128_avg_ts"] == pytest.approx(expected, rel=_MODEL.noise_rel)
+        assert state.read_text() == "1"
+
+    def test_config_that_does_not_fit_fails_to_load(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _ = _control(tmp_path, monkeypatch, {"vram_total": 4_000_000_000})
+        result = self._screen(ledger_trial, tmp_path)
+        assert result.outcome is not None
+        assert result.metrics == {}
+
+
+class TestSimulatedServer:
+    def test_finalist_validation_accepts_the_simulated_server(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Given a simulated server writing artifacts where the runner looks.
+        _ = _control(tmp_path, monkeypatch, {"seed": 7, "load_seconds": 0.01})
+        led, trial_id = ledger_trial
+        config = ServerConfig(
+            repetitions=2,
+            delay_seconds=0,
+            parallel=2,
+            readiness_timeout_seconds=5,
+            cooldown_seconds=0,
+            request_specs=(CODING_SPEC,),
+        )
+        # When the real finalist runner drives it.
+        result = run_supervised_server(
+            ProcessSupervisor(),
+            _BelowLimitProvider(),
+            _FAST,
+            led,
+            FinalistRequest(
+                trial_id=trial_id,
+                identity=_SERVER_IDENTITY,
+                config=config,
+                binary=_executable(tmp_path, "sim_server"),
+                output_dir=tmp_path / "out",
+            ),
+        )
+        # Then every artifact parses and the throughput is the model's.
+        assert result.outcome is None
+        assert result.metrics is not None
+        assert result.metrics.generation_throughput == pytest.approx(
+            _MODEL.tg_ts(_SERVER_IDENTITY, 32768)
+        )
+        assert len(result.metrics.ttft_ms) >= config.repetitions
+
+    def test_streamed_finalist_records_client_token_timing(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Given a simulated server paced at 1% of real time.
+        _ = _control(tmp_path, monkeypatch, {"seed": 7, "load_seconds": 0.01}, time_scale=0.01)
+        led, trial_id = ledger_trial
+        config = ServerConfig(
+            repetitions=2,
+            delay_seconds=0,
+            parallel=1,
+            readiness_timeout_seconds=5,
+            cooldown_seconds=0,
+            request_specs=(CODING_SPEC,),
+            stream=True,
+        )
+        # When the finalist runner streams every request.
+        result = run_supervised_server(
+            ProcessSupervisor(),
+            _BelowLimitProvider(),
+            _FAST,
+            led,
+            FinalistRequest(
+                trial_id=trial_id,
+                identity=_SERVER_IDENTITY,
+                config=config,
+                binary=_executable(tmp_path, "sim_server"),
+                output_dir=tmp_path / "out",
+            ),
+        )
+        # Then client-observed TTFT, ITL, and decode rate reached the ledger.
+        assert result.outcome is None
+        assert result.metrics_map["ttft_ms_p95"] > 0
+        assert result.metrics_map["itl_ms_p50"] > 0
+        assert "server_ttft_ms_p95" in result.metrics_map
+        log = (tmp_path / "out" / "dispatch_log.jsonl").read_text().splitlines()
+        assert all(json.loads(line)["ttft_ms"] is not None for line in log)
+
+    def test_load_sweep_records_max_qps_at_slo(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Given a one-slot simulated server paced at 1% of real time.
+        _ = _control(tmp_path, monkeypatch, {"seed": 7, "load_seconds": 0.01}, time_scale=0.01)
+        led, trial_id = ledger_trial
+        sweep = LoadSweepConfig(
+            slo_ttft_ms_p95=1000.0, min_qps=5.0, max_qps=40.0, step_requests=6, search_steps=1
+        )
+        config = ServerConfig(
+            repetitions=1,
+            delay_seconds=0,
+            parallel=1,
+            readiness_timeout_seconds=5,
+            cooldown_seconds=0,
+            request_specs=(CODING_SPEC,),
+            stream=True,
+            load=sweep,
+        )
+        # When the finalist runner adds the open-loop sweep.
+        result = run_supervised_server(
+            ProcessSupervisor(),
+            _BelowLimitProvider(),
+            _FAST,
+            led,
+            FinalistRequest(
+                trial_id=trial_id,
+                identity=_SERVER_IDENTITY,
+                config=config,
+                binary=_executable(tmp_path, "sim_server"),
+                output_dir=tmp_path / "out",
+            ),
+        )
+        # Then every step is on disk and the knee reached the ledger metrics.
+        assert result.outcome is None
+        sweep_log = (tmp_path / "out" / "load_sweep.json").read_text()
+        max_qps: float = json.loads(sweep_log)["max_qps_at_slo"]  # pyright: ignore[reportAny]
+        steps: list[dict[str, float]] = json.loads(sweep_log)["steps"]  # pyright: ignore[reportAny]
+        assert result.metrics_map["max_qps_at_slo"] == max_qps
+        assert steps[0]["qps"] == sweep.min_qps
+        assert all(step["requests"] == sweep.step_requests for step in steps)
+
+
+class TestSimulatedSlotSweep:
+    def test_one_attempt_is_scored_at_the_best_slot_count(
+        self,
+        ledger_trial: tuple[Ledger, TrialId],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Given a simulated server whose batched decode pays off sublinearly.
+        out = tmp_path / "out" / "finalist-0"
+        model: dict[str, object] = {"seed": 7, "load_seconds": 0.01}
+        _ = _control(tmp_path, monkeypatch, model, 0.01, out / "slots-{parallel}")
+        led, trial_id = ledger_trial
+        config = ServerConfig(
+            repetitions=4,
+            delay_seconds=0,
+            parallel=1,
+            readiness_timeout_seconds=5,
+            cooldown_seconds=0,
+            request_specs=(CODING_SPEC, TOOL_USE_SPEC),
+            slot_sweep=(1, 4),
+        )
+        finalist = FinalistEntry(
+            finalist_id="f-1",
+            identity=_SERVER_IDENTITY,
+            trial_id=trial_id,
+            eligibility=EligibilityStatus.ELIGIBLE,
+        )
+        # When the finalist is validated across both slot counts.
+        results = validate_finalists(
+            SupervisorJob(ProcessSupervisor(), _BelowLimitProvider(), _FAST),
+            led,
+            ValidationPlan(
+                finalists=(finalist,),
+                seed=1,
+                binary=_executable(tmp_path, "sim_server"),
+                output_base=tmp_path / "out",
+                config=config,
+            ),
+        )
+        # Then one attempt ran every slot count and is scored at the best one.
+        (result,) = results
+        assert result.outcome is None
+        assert (out / "slots-1" / "metrics.json").exists()
+        assert (out / "slots-4" / "metrics.json").exists()
+        best = result.metrics_map["best_parallel"]
+        assert best in (1.0, 4.0)
+        assert result.metrics_map["slots"] == best
+        assert result.metrics_map["slots1_aggregate_generation_ts"] > 0
+        assert result.metrics_map["slots4_aggregate_generation_ts"] > 0
+        assert b'"best_parallel"' in (out / "slot_sweep.json").read_bytes()
+        # And every launch's artifacts and spans are evidence on that attempt.
+        (attempt,) = [a for t in led.dump()["trials"] for a in t["attempts"]]
+        metrics_paths = {
+            a["relative_path"]
+            for a in attempt["artifacts"]
+            if a["kind"].startswith("server-metrics")
+        }
+        assert metrics_paths == {
+            str(out / "slots-1" / "metrics.json"),
+            str(out / "slots-4" / "metrics.json"),
+        }
+        launches = [s for s in led.phase_spans(result.attempt_id) if s.phase == Phase.LOAD]
+        assert len(launches) == 2
+
+
+class TestSimulatedSearch:
+    def test_search_is_reproducible_and_reaches_the_optimum(self) -> None:
+        plan = SimSearchPlan(trials=40)
+        first = simulate_search(_SPACE, _MODEL, plan, optuna.samplers.TPESampler(seed=1))
+        second = simulate_search(_SPACE, _MODEL, plan, optuna.samplers.TPESampler(seed=1))
+        assert first == second
+        assert first.time_to_best() is not None
+        assert first.trials[-1].elapsed_seconds > 0
+
+    def test_pruned_trials_charge_less_wall_time(self) -> None:
+        plan = SimSearchPlan(trials=30)
+        sampler_seed = 3
+        plain = simulate_search(
+            _SPACE, _MODEL, plan, optuna.samplers.RandomSampler(seed=sampler_seed)
+        )
+        pruned = simulate_search(
+            _SPACE,
+            _MODEL,
+            plan,
+            optuna.samplers.RandomSampler(seed=sampler_seed),
+            optuna.pruners.MedianPruner(n_startup_trials=3, n_warmup_steps=0),
+        )
+        assert [t.config for t in pruned.trials] == [t.config for t in plain.trials]
+        assert pruned.trials[-1].elapsed_seconds < plain.trials[-1].elapsed_seconds
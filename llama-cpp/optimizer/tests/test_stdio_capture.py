@@ -0,0 +1,194 @@
+"""Behavior tests for pipe-based stdio capture (T5).
+
+A piped child's streams must land in their sink files with an incremental
+SHA-256, complete lines must reach the live callback as they arrive, and the
+optimizer's own fd 1/2 must never carry child output. A llama-bench child that
+emits a line no requested config could produce must be cancelled early.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import signal
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+from llama_optimizer.artifacts import RunArtifactRoot
+from llama_optimizer.bench import (
+    DEFAULT_BENCH_CONFIG,
+    BenchIdentity,
+    BenchScreenRequest,
+    run_supervised_bench,
+)
+from llama_optimizer.ledger import Ledger
+from llama_optimizer.ledger_records import RunIdentity, TrialConfig
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.stdio_capture import PipedCommand, StdioCapture, StdioSink
+from llama_optimizer.supervisor import ChildExit, ProcessSupervisor, SupervisorConfig
+from llama_optimizer.telemetry import Bytes, Diagnostics, HardChannel, HardChannelProvider
+
+if TYPE_CHECKING:
+    import pytest
+
+_BENCH_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "llama-bench"
+_CHATTY = (
+    "import sys\n"
+    + "sys.stdout.write('first\\nsecond\\nno-newline')\n"
+    + "sys.stderr.write('warn\\n')"
+)
+
+_ESCAPEE = (
+    "import subprocess, sys\n"
+    + "p = subprocess.Popen(['sleep', '30'], start_new_session=True)\n"
+    + "open(sys.argv[1], 'w').write(str(p.pid))\n"
+    + "print('started', flush=True)"
+)
+
+_FAST = SupervisorConfig(
+    interval=timedelta(milliseconds=20),
+    deadline=timedelta(seconds=30),
+    grace=timedelta(milliseconds=500),
+    provider_timeout=timedelta(seconds=2),
+    max_staleness=timedelta(seconds=30),
+)
+
+
+class _IdleProvider(HardChannelProvider):
+    @override
+    def sample(self) -> HardChannel:
+        return HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(1 << 30),
+            collected_at=datetime.now(UTC),
+            raw="",
+        )
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        return Diagnostics(
+            temperature=None, power=None, gpu_use=None, clocks=None, pcie=None, raw=""
+        )
+
+
+class TestStdioCapture:
+    def test_streams_land_in_sinks_without_touching_parent_fds(
+        self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        # Given a child writing to both streams, the last line unterminated.
+        lines: list[str] = []
+        capture = StdioCapture(
+            StdioSink(tmp_path / "out.txt", on_line=lines.append),
+            StdioSink(tmp_path / "err.txt"),
+        )
+        # When supervising it through pipes.
+        result = ProcessSupervisor().run(
+            PipedCommand([sys.executable, "-c", _CHATTY], capture),
+            provider=_IdleProvider(),
+            config=_FAST,
+        )
+        out, err = capture.close(timedelta(seconds=1))
+        # Then each sink holds its stream, hashed as it was written.
+        assert result.outcome == ChildExit(0)
+        assert out.read_text() == "first\nsecond\nno-newline"
+        assert out.sha256 == hashlib.sha256(b"first\nsecond\nno-newline").hexdigest()
+        assert (out.size, err.read_text()) == (23, "warn\n")
+        # And the callback saw every line while the parent's fds stayed clean.
+        assert lines == ["first", "second", "no-newline"]
+        seen = capfd.readouterr()
+        assert "first" not in seen.out
+        assert "warn" not in seen.err
+
+    def test_pipe_held_past_cleanup_is_an_incomplete_capture(self, tmp_path: Path) -> None:
+        # Given a child that leaves a descendant in its own session holding stdout.
+        pid_file = tmp_path / "escapee.pid"
+        capture = StdioCapture(StdioSink(tmp_path / "out"), StdioSink(tmp_path / "err"))
+        # When supervising it through pipes.
+        try:
+            result = ProcessSupervisor().run(
+                PipedCommand([sys.executable, "-c", _ESCAPEE, str(pid_file)], capture),
+                provider=_IdleProvider(),
+                config=_FAST,
+            )
+            out, err = capture.close(timedelta(seconds=1))
+        finally:
+            if pid_file.exists():
+                os.kill(int(pid_file.read_text()), signal.SIGKILL)
+        # Then the partial stdout is flagged and the run is a cleanup failure.
+        assert (out.complete, err.complete) == (False, False)
+        assert out.size == len(b"started\n")
+        assert result.outcome is NonScoredOutcome.CLEANUP_FAILURE
+
+    def test_unlaunched_child_reports_empty_streams(self, tmp_path: Path) -> None:
+        capture = StdioCapture(StdioSink(tmp_path / "out"), StdioSink(tmp_path / "err"))
+        out, err = capture.close(timedelta(seconds=1))
+        assert out.sha256 == err.sha256 == hashlib.sha256(b"").hexdigest()
+        assert out.read_text() == ""
+
+
+class TestLiveBenchCheck:
+    def test_identity_mismatch_cancels_the_child_early(
+        self, run_root_base: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given a llama-bench that reports the wrong model, then stalls.
+        ctrl = tmp_path / "control.json"
+        _ = ctrl.write_text(json.dumps({"mode": "wrong-identity", "linger_s": 30.0}))
+        monkeypatch.setenv("LLAMA_BENCH_FAKE_CONTROL", str(ctrl))
+        ledger = Ledger.create_run(
+            RunArtifactRoot.for_run("stdio-1", base=run_root_base),
+            RunIdentity(
+                manifest_hash="sha256:manifest",
+                config_hash="sha256:config",
+                optimizer_version="0.1.0",
+                optuna_version="4.9.0",
+                checkpoint_format="pickle.v1",
+                max_retries=2,
+                seed=42,
+                process_group_pid=os.getpid(),
+            ),
+        )
+        with ledger:
+            ledger.start_run()
+            trial = ledger.create_trial(
+                TrialConfig(
+                    config_id="cfg-1",
+                    config_hash="hash-1",
+                    candidate_id="ornith-1.0-9b-q4_k_m",
+                    backend="rocm",
+                    quant="Q4_K_M",
+                )
+            )
+            _ = ledger.start_trial(trial.trial_id)
+            request = BenchScreenRequest(
+                trial_id=trial.trial_id,
+                bench_config=DEFAULT_BENCH_CONFIG,
+                identity=BenchIdentity(
+                    model_filename="ornith-1.0-9b-Q4_K_M.gguf",
+                    n_gpu_layers=99,
+                    n_batch=2048,
+                    n_ubatch=512,
+                    type_k="f16",
+                    type_v="f16",
+                    n_threads=16,
+                    flash_attn=1,
+                    use_mmap=True,
+                ),
+                binary=str(_BENCH_FIXTURE),
+                output_dir=tmp_path / "output",
+            )
+            # When screening it.
+            started = time.monotonic()
+            result = run_supervised_bench(
+                ProcessSupervisor(), _IdleProvider(), _FAST, ledger, request
+            )
+            # Then the first line aborted the run long before the stall ended.
+            assert time.monotonic() - started < 10
+            assert result.outcome is NonScoredOutcome.MEASUREMENT_FAILURE
+            assert result.supervisor_result.terminated_group
+            assert not result.metrics
+            attempt = ledger.dump()["trials"][0]["attempts"][0]
+            assert "identity mismatch model" in attempt["termination_reason"]
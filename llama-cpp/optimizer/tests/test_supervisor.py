@@ -20,14 +20,21 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, override
 
 import pytest
 
+from llama_optimizer.diagnostics_sampler import (
+    EMPTY_DIAGNOSTICS,
+    TimedDiagnostics,
+    align_diagnostics,
+)
 from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.process_wait import ChildWaiter, wait_group_gone
 from llama_optimizer.supervisor import (
     ChildExit,
     ProcessSupervisor,
@@ -36,6 +43,7 @@ from llama_optimizer.supervisor import (
 from llama_optimizer.telemetry import (
     VRAM_CEILING_BYTES,
     Bytes,
+    DeviceReading,
     Diagnostics,
     HardChannel,
     HardChannelProvider,
@@ -196,6 +204,96 @@ class TestSuccessfulBelowLimit:
             assert sample.collected_at.tzinfo is not None
 
 
+@dataclass
+class _SlowDiagnosticsProvider(_ScriptedProvider):
+    """Scripted provider whose diagnostics read blocks like a slow rocm-smi fork."""
+
+    diag_delay: timedelta = timedelta(milliseconds=300)
+
+    @override
+    def diagnostics(self) -> Diagnostics:
+        time.sleep(self.diag_delay.total_seconds())
+        return Diagnostics(
+            temperature="46.0c", power=None, gpu_use=None, clocks=None, pcie=None, raw="t"
+        )
+
+
+class TestDiagnosticsSampler:
+    def test_slow_diagnostics_do_not_stretch_hard_sampling(self) -> None:
+        # Given diagnostics that take 300 ms and a 20 ms hard-channel interval.
+        supervisor = ProcessSupervisor()
+        provider = _SlowDiagnosticsProvider(
+            preflight=_sample(100), samples=[_sample(200, collected_at=None)]
+        )
+        command = _python(["-c", "import time; time.sleep(0.4)"])
+        # When supervising a child that lives ~400 ms.
+        result = supervisor.run(command, provider=provider, config=_FAST)
+        # Then the hard channel kept its cadence instead of one read per diagnostics call.
+        assert isinstance(result.outcome, ChildExit)
+        assert len(result.samples) >= 5
+        # And the diagnostics series is aligned one-to-one with the hard samples.
+        assert len(result.diagnostics_series) == len(result.samples)
+
+    def test_align_pairs_latest_snapshot_at_or_before_sample(self) -> None:
+        # Given snapshots at t+1s and t+3s and hard samples at t, t+2s, t+4s.
+        base = datetime(2026, 6, 28, 12, 0, 0, tzinfo=UTC)
+        first = Diagnostics(
+            temperature="40c", power=None, gpu_use=None, clocks=None, pcie=None, raw="a"
+        )
+        second = Diagnostics(
+            temperature="50c", power=None, gpu_use=None, clocks=None, pcie=None, raw="b"
+        )
+        snapshots = [
+            TimedDiagnostics(base + timedelta(seconds=3), second),
+            TimedDiagnostics(base + timedelta(seconds=1), first),
+        ]
+        samples = [_sample(1, collected_at=base + timedelta(seconds=s)) for s in (0, 2, 4)]
+        # When aligning.
+        aligned = align_diagnostics(samples, snapshots)
+        # Then each sample takes the most recent earlier snapshot (empty before any).
+        assert aligned == (EMPTY_DIAGNOSTICS, first, second)
+
+
+class TestEventDrivenExit:
+    def test_child_exit_wakes_loop_before_interval(self) -> None:
+        # Given a 2 s sampling interval and a child that exits immediately.
+        config = SupervisorConfig(
+            interval=timedelta(seconds=2),
+            deadline=timedelta(seconds=30),
+            grace=timedelta(seconds=2),
+            provider_timeout=timedelta(seconds=2),
+            max_staleness=timedelta(seconds=30),
+        )
+        command = _python(["-c", "import sys; sys.exit(0)"])
+        # When supervising.
+        start = time.monotonic()
+        result = ProcessSupervisor().run(command, provider=_ScriptedProvider(), config=config)
+        elapsed = time.monotonic() - start
+        # Then the exit is observed without waiting out the interval.
+        assert isinstance(result.outcome, ChildExit)
+        assert elapsed < 1.0
+
+    def test_waiter_reports_exit_without_reaping(self) -> None:
+        proc = subprocess.Popen(_python(["-c", "pass"]))
+        with ChildWaiter(proc) as waiter:
+            assert waiter.wait(5.0)
+        assert proc.returncode is not None
+
+    def test_waiter_times_out_on_live_child(self) -> None:
+        proc = subprocess.Popen(_python(["-c", "import time; time.sleep(30)"]))
+        try:
+            with ChildWaiter(proc) as waiter:
+                assert not waiter.wait(0.05)
+        finally:
+            proc.kill()
+            _ = proc.wait()
+
+    def test_wait_group_gone_sees_missing_group(self) -> None:
+        proc = subprocess.Popen(_python(["-c", "pass"]), start_new_session=True)
+        _ = proc.wait()
+        assert wait_group_gone(proc.pid, 2.0)
+
+
 # --- Preflight blocking -----------------------------------------------------
 
 
@@ -245,6 +343,31 @@ class TestSampledBreach:
         # And the unrelated sentinel survives.
         assert _alive(sentinel.pid)
 
+    def test_breach_on_secondary_card_is_resource_infeasible(self) -> None:
+        # Given card0 comfortably feasible while card1 reaches its mapped ceiling.
+        def dual(used1: int) -> HardChannel:
+            return HardChannel(
+                total=Bytes(17_163_091_968),
+                used=Bytes(100),
+                collected_at=datetime.now(UTC),
+                raw="",
+                devices=(
+                    DeviceReading(device="card0", total=Bytes(17_163_091_968), used=Bytes(100)),
+                    DeviceReading(device="card1", total=Bytes(8_589_934_592), used=Bytes(used1)),
+                ),
+            )
+
+        provider = _ScriptedProvider(preflight=dual(1), samples=[dual(1), dual(4_000)])
+        config = replace(_FAST, device_ceilings={"card1": Bytes(4_000)})
+        # When supervising.
+        result = ProcessSupervisor().run(
+            _python(["-c", "import time; time.sleep(120)"]), provider=provider, config=config
+        )
+        # Then feasibility was judged per card and card1's peak is reported.
+        assert result.outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        assert result.device_peaks["card1"] == Bytes(4_000)
+        assert result.peak_used == Bytes(100)
+
 
 # --- Telemetry loss classes ------------------------------------------------
 
@@ -382,3 +505,14 @@ class TestCleanupInvariant:
         assert child_pid is not None
         _wait_gone(child_pid)
         assert _alive(sentinel.pid)
+
+    def test_failed_spawn_leaves_no_extra_threads(self, tmp_path: Path) -> None:
+        # Given a command whose binary does not exist.
+        supervisor = ProcessSupervisor()
+        provider = _ScriptedProvider(preflight=_sample(100), samples=[_sample(100)])
+        before = threading.active_count()
+        # When the spawn raises.
+        with pytest.raises(FileNotFoundError):
+            _ = supervisor.run([str(tmp_path / "missing")], provider=provider, config=_FAST)
+        # Then no sampler or helper thread was started and left running.
+        assert threading.active_count() == before
@@ -28,13 +28,16 @@ from llama_optimizer.telemetry import (
     USED_FIELD,
     VRAM_CEILING_BYTES,
     Bytes,
+    DeviceReading,
     Diagnostics,
     HardChannel,
     RocmSmiProvider,
     TelemetryLossError,
+    breached_devices,
     is_breach,
     parse_diagnostics,
     parse_hard_channel,
+    tightest_used,
 )
 
 FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "rocm-smi"
@@ -130,6 +133,28 @@ class TestParseHardChannel:
         sample = parse_hard_channel(raw, collected_at=_NOW)
         # Then card0 is authoritative (per-process VRAM is never summed as the hard signal).
         assert sample.used == Bytes(100)
+        # And every card is still carried as its own reading.
+        assert [(r.device, int(r.used)) for r in sample.readings()] == [
+            ("card0", 100),
+            ("card1", 200),
+        ]
+
+    def test_missing_expected_device_fails_closed(self) -> None:
+        # Given a single-card payload while two cards are expected.
+        raw = '{"card0":{"VRAM Total Memory (B)":"17163091968","VRAM Total Used Memory (B)":"1"}}'
+        # When parsing with card1 required.
+        with pytest.raises(TelemetryLossError) as exc:
+            _ = parse_hard_channel(raw, collected_at=_NOW, devices=("card0", "card1"))
+        # Then the missing card is named.
+        assert "card1" in exc.value.reason
+
+    def test_malformed_expected_secondary_device_fails_closed(self) -> None:
+        raw = (
+            '{"card0":{"VRAM Total Memory (B)":"17163091968","VRAM Total Used Memory (B)":"1"},'
+            '"card1":{"VRAM Total Memory (B)":"17163091968","VRAM Total Used Memory (B)":2}}'
+        )
+        with pytest.raises(TelemetryLossError, match="must be a string"):
+            _ = parse_hard_channel(raw, collected_at=_NOW, devices=("card0", "card1"))
 
 
 # --- Breach boundary --------------------------------------------------------
@@ -172,6 +197,33 @@ class TestBreachBoundary:
         # Then it is a breach.
         assert is_breach(sample)
 
+    def test_breach_is_judged_per_card_against_its_own_ceiling(self) -> None:
+        # Given two cards, the second over its smaller mapped ceiling only.
+        sample = HardChannel(
+            total=Bytes(17_163_091_968),
+            used=Bytes(100),
+            collected_at=_NOW,
+            raw="",
+            devices=(
+                DeviceReading(device="card0", total=Bytes(17_163_091_968), used=Bytes(100)),
+                DeviceReading(device="card1", total=Bytes(8_589_934_592), used=Bytes(7_000)),
+            ),
+        )
+        ceilings = {"card0": VRAM_CEILING_BYTES, "card1": Bytes(7_000)}
+        # When checking breach with and without the per-card map.
+        # Then only the mapped ceiling makes card1 infeasible.
+        assert breached_devices(sample, ceilings=ceilings) == ("card1",)
+        assert is_breach(sample, ceilings=ceilings)
+        assert not is_breach(sample)
+        # And the tightest card is rebased onto the default ceiling for prediction.
+        assert tightest_used(sample, ceilings=ceilings) == VRAM_CEILING_BYTES
+
+    def test_single_card_tightest_used_is_used(self) -> None:
+        sample = HardChannel(
+            total=Bytes(17_163_091_968), used=Bytes(12_345), collected_at=_NOW, raw=""
+        )
+        assert tightest_used(sample) == Bytes(12_345)
+
     def test_ceiling_constant_is_exact(self) -> None:
         # Given the plan's exact hard constant.
         # Then the module exposes it verbatim.
@@ -221,6 +273,17 @@ class TestRocmSmiProvider:
         assert sample.used == Bytes(_CEILING + 1)
         assert is_breach(sample)
 
+    def test_one_call_reads_every_required_card(self) -> None:
+        # Given the fixture reporting two cards and a provider requiring both.
+        provider = RocmSmiProvider(
+            str(FIXTURE), timeout=timedelta(seconds=5), devices=("card0", "card1")
+        )
+        with pytest.MonkeyPatch().context() as ctx:
+            ctx.setenv("ROCM_SMI_MODE", "extra_device")
+            sample = provider.sample()
+        # Then one sample carries both per-card readings.
+        assert {r.device: int(r.used) for r in sample.readings()} == {"card0": 100, "card1": 200}
+
     @pytest.mark.parametrize(
         ("mode", "reason_fragment"),
         [
@@ -340,7 +403,8 @@ class TestNoTypingEscapeHatchesInTelemetry:
         targets = sorted(
             p for name in ("telemetry.py", "supervisor.py") for p in (src_dir / name,).__iter__()
         )
-        targets = [src_dir / "telemetry.py", src_dir / "supervisor.py"]
+        modules = ("telemetry.py", "telemetry_sysfs.py", "supervisor.py")
+        targets = [src_dir / name for name in modules]
         offenders: list[str] = []
         for py_file in targets:
             if not py_file.exists():
@@ -0,0 +1,177 @@
+"""Behavior tests for trace replay and the supervisor overhead suite (T5).
+
+Recorded traces in ``fixtures/traces`` must replay through the supervisor with
+real or accelerated timing: recorded breaches, losses, and stale readings keep
+their fail-closed outcomes, and malformed recordings are rejected at load. The
+overhead suite must emit every metric as non-negative milliseconds in JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from llama_optimizer.cli import app
+from llama_optimizer.lifecycle import NonScoredOutcome
+from llama_optimizer.supervisor import ProcessSupervisor, SupervisorConfig
+from llama_optimizer.supervisor_overhead import OVERHEAD_SCHEMA, run_overhead_suite
+from llama_optimizer.telemetry import VRAM_CEILING_BYTES, Bytes, TelemetryLossError
+from llama_optimizer.telemetry_replay import (
+    ReplayProvider,
+    TraceFormatError,
+    TracePoint,
+    load_trace,
+    parse_trace_line,
+)
+
+_TRACES = Path(__file__).resolve().parent / "fixtures" / "traces"
+_METRICS = {
+    "spawn_ms",
+    "sample_jitter_ms",
+    "exit_detect_ms",
+    "breach_detect_ms",
+    "stale_detect_ms",
+    "terminate_ms",
+}
+_RAW = '{"card0":{"VRAM Total Memory (B)":"17163091968","VRAM Total Used Memory (B)":"807677952"}}'
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now: float = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _config(interval_ms: int = 20) -> SupervisorConfig:
+    return SupervisorConfig(
+        interval=timedelta(milliseconds=interval_ms),
+        deadline=timedelta(seconds=30),
+        grace=timedelta(milliseconds=400),
+        provider_timeout=timedelta(seconds=2),
+        max_staleness=timedelta(seconds=5),
+    )
+
+
+class TestTraceParsing:
+    def test_loads_recorded_fixture_in_offset_order(self) -> None:
+        points = load_trace(_TRACES / "load-breach-15g.jsonl")
+        assert points[0].offset == timedelta(0)
+        assert [p.offset for p in points] == sorted(p.offset for p in points)
+        assert max(int(p.used) for p in points) >= int(VRAM_CEILING_BYTES)
+
+    def test_raw_rocm_smi_payload_is_parsed_strictly(self) -> None:
+        point = parse_trace_line(json.dumps({"t_ms": 0, "raw": _RAW}))
+        assert point.used == Bytes(807_677_952)
+        with pytest.raises(TelemetryLossError):
+            _ = parse_trace_line(json.dumps({"t_ms": 0, "raw": '{"card0":{}}'}))
+
+    @pytest.mark.parametrize(
+        "line",
+        ['{"used": 1}', '{"t_ms": -1, "used": 1}', '{"t_ms": 0}', "[]", "not json"],
+    )
+    def test_malformed_lines_are_rejected(self, line: str) -> None:
+        with pytest.raises(TraceFormatError):
+            _ = parse_trace_line(line)
+
+
+class TestReplayTiming:
+    def test_accelerated_replay_advances_through_points(self) -> None:
+        # Given a 4x replay of readings recorded 1 s apart on an injected clock.
+        clock = _Clock()
+        points = [TracePoint(offset=timedelta(seconds=s), used=Bytes(s + 1)) for s in range(3)]
+        provider = ReplayProvider(points, speed=4.0, clock=clock)
+        # When wall-clock advances 0.25 s per read.
+        used: list[int] = []
+        for _ in range(4):
+            used.append(int(provider.sample().used))
+            clock.now += 0.25
+        # Then each read lands one recorded second later, holding the final point.
+        assert used == [1, 2, 3, 3]
+        assert provider.due_at(points[2]) == pytest.approx(100.5)
+
+    def test_recorded_loss_raises_and_age_backdates(self) -> None:
+        clock = _Clock()
+        provider = ReplayProvider(
+            [
+                TracePoint(offset=timedelta(0), age=timedelta(seconds=30)),
+                TracePoint(offset=timedelta(seconds=1), loss="missing: recorded"),
+            ],
+            clock=clock,
+        )
+        first = provider.sample()
+        clock.now += 1
+        with pytest.raises(TelemetryLossError, match="recorded"):
+            _ = provider.sample()
+        assert first.collected_at < datetime.now(UTC) - timedelta(seconds=29)
+
+    def test_rejects_empty_trace_and_non_positive_speed(self) -> None:
+        with pytest.raises(TraceFormatError):
+            _ = ReplayProvider([])
+        with pytest.raises(TraceFormatError, match="speed"):
+            _ = ReplayProvider([TracePoint(offset=timedelta(0))], speed=0)
+
+
+class TestReplayThroughSupervisor:
+    def test_recorded_breach_terminates_the_child(self) -> None:
+        # Given the 15 GiB load trace replayed 20x faster than recorded.
+        provider = ReplayProvider(load_trace(_TRACES / "load-breach-15g.jsonl"), speed=20.0)
+        # When supervising a long child against it.
+        result = ProcessSupervisor().run(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            provider=provider,
+            config=_config(),
+        )
+        # Then the recorded breach is classified fail-closed.
+        assert result.outcome is NonScoredOutcome.RESOURCE_INFEASIBLE
+        assert result.terminated_group is True
+
+    def test_recorded_stale_reading_is_telemetry_loss(self) -> None:
+        provider = ReplayProvider(
+            [
+                TracePoint(offset=timedelta(0), used=Bytes(1 << 30)),
+                TracePoint(
+                    offset=timedelta(milliseconds=60),
+                    used=Bytes(1 << 30),
+                    age=timedelta(seconds=30),
+                ),
+            ]
+        )
+        result = ProcessSupervisor().run(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            provider=provider,
+            config=_config(),
+        )
+        assert result.outcome is NonScoredOutcome.TELEMETRY_LOSS
+
+
+class TestOverheadSuite:
+    def test_reports_every_metric_as_non_negative_json(self) -> None:
+        # Given one short interval and a single repeat.
+        report = run_overhead_suite([timedelta(milliseconds=20)], repeats=1)
+        # When serializing the report.
+        body: dict[str, object] = json.loads(report.to_json())  # pyright: ignore[reportAny]
+        # Then every metric is present with non-negative milliseconds.
+        assert body["schema"] == OVERHEAD_SCHEMA
+        (entry,) = report.intervals
+        assert {name for name, _ in entry.metrics} == _METRICS
+        assert all(0 <= stat.median_ms <= stat.max_ms for _, stat in entry.metrics)
+
+    def test_rejects_empty_configuration(self) -> None:
+        with pytest.raises(ValueError, match="repeats"):
+            _ = run_overhead_suite([timedelta(milliseconds=20)], repeats=0)
+
+    def test_cli_writes_json_report(self, tmp_path: Path) -> None:
+        output = tmp_path / "overhead.json"
+        result = CliRunner().invoke(
+            app, ["overhead", "--interval-ms", "20", "--repeats", "1", "--output", str(output)]
+        )
+        assert result.exit_code == 0
+        body: dict[str, list[dict[str, object]]] = json.loads(output.read_text())  # pyright: ignore[reportAny]
+        assert body["intervals"][0]["interval_ms"] == 20.0
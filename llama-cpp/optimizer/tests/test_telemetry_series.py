@@ -0,0 +1,175 @@
+"""Behavior tests for the compact columnar telemetry recorder (T5).
+
+Readings are stored as ``array('q')`` columns with raw provider text kept only
+for the first, breaching, and stale points; optional min/max windows bound the
+retained point count while never dropping the true peak or breach evidence.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from llama_optimizer.telemetry import VRAM_CEILING_BYTES, Bytes, DeviceReading, HardChannel
+from llama_optimizer.telemetry_series import (
+    EMPTY_SERIES,
+    FLAG_BREACH,
+    FLAG_FIRST,
+    FLAG_STALE,
+    TelemetryRecorder,
+)
+
+_BASE = datetime(2026, 6, 28, 12, 0, 0, 123456, tzinfo=UTC)
+_CEILING = int(VRAM_CEILING_BYTES)
+
+
+def _sample(used: int, offset_ms: int = 0, raw: str = "raw") -> HardChannel:
+    return HardChannel(
+        total=Bytes(17_163_091_968),
+        used=Bytes(used),
+        collected_at=_BASE + timedelta(milliseconds=offset_ms),
+        raw=raw,
+    )
+
+
+class TestRecorder:
+    def test_roundtrips_readings_and_keeps_raw_only_for_first(self) -> None:
+        # Given three below-limit readings.
+        recorder = TelemetryRecorder()
+        for i, used in enumerate((100, 300, 200)):
+            recorder.append(_sample(used, i * 250, raw=f"payload-{i}"))
+        # When finishing.
+        series = recorder.finish()
+        # Then every reading is retained exactly, with raw text on the first only.
+        samples = series.samples()
+        assert [int(s.used) for s in samples] == [100, 300, 200]
+        assert samples[0].collected_at == _BASE
+        assert samples[2].collected_at == _BASE + timedelta(milliseconds=500)
+        assert [s.raw for s in samples] == ["payload-0", "", ""]
+        assert series.peak_used == Bytes(300)
+        assert series.sample_count == 3
+        assert list(series.flags) == [FLAG_FIRST, 0, 0]
+        assert list(series.monotonic_ns) == sorted(series.monotonic_ns)
+
+    def test_breach_and_stale_points_keep_raw_text(self) -> None:
+        recorder = TelemetryRecorder()
+        recorder.append(_sample(1, 0))
+        recorder.append(_sample(2, 10, raw="stale-payload"), stale=True)
+        recorder.append(_sample(_CEILING, 20, raw="breach-payload"))
+        series = recorder.finish()
+        assert dict(series.raw) == {0: "raw", 1: "stale-payload", 2: "breach-payload"}
+        assert list(series.flags) == [FLAG_FIRST, FLAG_STALE, FLAG_BREACH]
+
+    def test_min_max_window_bounds_points_and_keeps_peak(self) -> None:
+        # Given 100 readings downsampled in windows of 10.
+        recorder = TelemetryRecorder(downsample_window=10)
+        for i in range(100):
+            recorder.append(_sample(1_000 + (i * 37) % 101, i))
+        # When finishing.
+        series = recorder.finish()
+        # Then at most min+max per window (+ the pinned first point) survive,
+        # and the exact peak is still present.
+        assert len(series) <= 2 * 10 + 1
+        assert series.sample_count == 100
+        assert series.peak_used == Bytes(max(series.used))
+        times = list(series.collected_ns)
+        assert times == sorted(times)
+
+    def test_breach_survives_downsampling(self) -> None:
+        recorder = TelemetryRecorder(downsample_window=4)
+        for used in (10, 20, 30):
+            recorder.append(_sample(used))
+        recorder.append(_sample(5), stale=True)
+        recorder.append(_sample(_CEILING + 1))
+        series = recorder.finish()
+        assert any(flag & FLAG_BREACH for flag in series.flags)
+        assert any(flag & FLAG_STALE for flag in series.flags)
+        assert series.peak_used == Bytes(_CEILING + 1)
+
+    def test_tracks_per_card_peaks_and_per_card_breach(self) -> None:
+        # Given dual-card readings where card1 has a smaller mapped ceiling.
+        recorder = TelemetryRecorder(ceilings={"card1": Bytes(1_000)})
+        for used0, used1 in ((10, 500), (30, 200), (20, 1_000)):
+            devices = (
+                DeviceReading(device="card0", total=Bytes(10**10), used=Bytes(used0)),
+                DeviceReading(device="card1", total=Bytes(10**10), used=Bytes(used1)),
+            )
+            recorder.append(
+                HardChannel(
+                    total=Bytes(10**10),
+                    used=Bytes(used0),
+                    collected_at=_BASE,
+                    raw="r",
+                    devices=devices,
+                )
+            )
+        # When finishing.
+        series = recorder.finish()
+        # Then each card's peak is exact and the card1 breach is flagged.
+        assert dict(series.device_peaks) == {"card0": Bytes(30), "card1": Bytes(1_000)}
+        assert list(series.flags) == [FLAG_FIRST, 0, FLAG_BREACH]
+
+    @pytest.mark.parametrize("window", [-1, 1])
+    def test_rejects_degenerate_window(self, window: int) -> None:
+        with pytest.raises(ValueError, match="downsample_window"):
+            _ = TelemetryRecorder(downsample_window=window)
+
+
+class TestLedgerRows:
+    def test_rows_carry_running_peak_breach_and_sample_time(self) -> None:
+        recorder = TelemetryRecorder()
+        recorder.append(_sample(500, 0))
+        recorder.append(_sample(200, 100))
+        recorder.append(_sample(_CEILING, 200))
+        rows = recorder.finish().ledger_rows()
+        assert [r.vram_used_bytes for r in rows] == [500, 200, _CEILING]
+        assert [r.peak_vram_bytes for r in rows] == [500, 500, _CEILING]
+        assert [r.breached for r in rows] == [False, False, True]
+        assert rows[0].sampled_at == _BASE.isoformat()
+
+    def test_rows_carry_the_interval_chosen_after_each_reading(self) -> None:
+        recorder = TelemetryRecorder(downsample_window=2)
+        recorder.append(_sample(500, 0), interval=timedelta(milliseconds=250))
+        recorder.append(_sample(200, 100), interval=timedelta(milliseconds=50))
+        recorder.append(_sample(300, 200))
+        rows = recorder.finish().ledger_rows()
+        assert [r.interval_ns for r in rows] == [250_000_000, 50_000_000, 0]
+
+    def test_multi_card_rows_blame_the_breaching_card_with_its_own_bytes(self) -> None:
+        # Given dual-card readings where only card1 reaches its mapped ceiling.
+        recorder = TelemetryRecorder(ceilings={"card1": Bytes(1_000)})
+        for i, (used0, used1) in enumerate(((10, 500), (30, 1_000))):
+            devices = (
+                DeviceReading(device="card0", total=Bytes(10**10), used=Bytes(used0)),
+                DeviceReading(device="card1", total=Bytes(8 * 10**9), used=Bytes(used1)),
+            )
+            recorder.append(
+                HardChannel(
+                    total=Bytes(10**10),
+                    used=Bytes(used0),
+                    collected_at=_BASE + timedelta(milliseconds=i),
+                    raw="r",
+                    devices=devices,
+                )
+            )
+        # When materializing the series.
+        series = recorder.finish()
+        rows = series.ledger_rows()
+        # Then each card gets its own row, peak, and breach flag.
+        assert [(r.device, r.vram_used_bytes, r.breached) for r in rows] == [
+            ("card0", 10, False),
+            ("card1", 500, False),
+            ("card0", 30, False),
+            ("card1", 1_000, True),
+        ]
+        assert [r.peak_vram_bytes for r in rows] == [10, 500, 30, 1_000]
+        # And the readings rebuild with their devices.
+        assert series.samples()[1].devices[1] == DeviceReading(
+            device="card1", total=Bytes(8 * 10**9), used=Bytes(1_000)
+        )
+
+    def test_empty_series_has_no_rows_or_peak(self) -> None:
+        assert EMPTY_SERIES.ledger_rows() == ()
+        assert EMPTY_SERIES.peak_used is None
+        assert len(EMPTY_SERIES) == 0
@@ -0,0 +1,193 @@
+"""Behavior tests for the sysfs-backed hard-channel provider (T5).
+
+A fake ``/sys/class/drm/card0/device`` tree is built under ``tmp_path`` with
+the amdgpu ``mem_info_vram_total``/``mem_info_vram_used`` attributes and a
+small hwmon directory. The provider must honour the same fail-closed
+``telemetry-loss`` contract as the rocm-smi path, re-read values through the
+fds it opened once, and sample substantially faster than forking rocm-smi.
+No GPU is required.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llama_optimizer.telemetry import (
+    VRAM_CEILING_BYTES,
+    Bytes,
+    RocmSmiProvider,
+    TelemetryLossError,
+    is_breach,
+    is_stale,
+)
+from llama_optimizer.telemetry_sysfs import (
+    TOTAL_ATTR,
+    USED_ATTR,
+    SysfsVramProvider,
+    parse_sysfs_bytes,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+_ROCM_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "bin" / "rocm-smi"
+_TOTAL = 17_163_091_968
+_USED = 807_677_952
+_BENCH_ROUNDS = 20
+
+
+def _write_attr(root: Path, attr: str, value: str) -> None:
+    """Rewrite an attribute in place so already-open fds observe the change."""
+    _ = (root / "card0" / "device" / attr).write_text(value)
+
+
+@pytest.fixture
+def fake_sysfs(tmp_path: Path) -> Path:
+    """Build a fake amdgpu sysfs tree and return its DRM class root."""
+    root = tmp_path / "drm"
+    device = root / "card0" / "device"
+    hwmon = device / "hwmon" / "hwmon3"
+    hwmon.mkdir(parents=True)
+    _ = (device / TOTAL_ATTR).write_text(f"{_TOTAL}\n")
+    _ = (device / USED_ATTR).write_text(f"{_USED}\n")
+    _ = (device / "gpu_busy_percent").write_text("6\n")
+    _ = (device / "pp_dpm_sclk").write_text("0: 500Mhz \n1: 2528Mhz *\n")
+    _ = (device / "current_link_speed").write_text("16.0 GT/s PCIe\n")
+    _ = (device / "current_link_width").write_text("16\n")
+    _ = (hwmon / "temp1_input").write_text("46000\n")
+    _ = (hwmon / "power1_average").write_text("118000000\n")
+    return root
+
+
+@pytest.fixture
+def provider(fake_sysfs: Path) -> Generator[SysfsVramProvider]:
+    with SysfsVramProvider(root=fake_sysfs) as prov:
+        yield prov
+
+
+class TestParseSysfsBytes:
+    def test_parses_trailing_newline(self) -> None:
+        assert parse_sysfs_bytes("807677952\n", attr=USED_ATTR) == Bytes(_USED)
+
+    @pytest.mark.parametrize(
+        ("raw", "reason_fragment"),
+        [("", "empty"), ("  \n", "empty"), ("-1\n", "non-numeric"), ("12 MiB", "non-numeric")],
+    )
+    def test_rejects_empty_or_non_numeric(self, raw: str, reason_fragment: str) -> None:
+        with pytest.raises(TelemetryLossError) as exc:
+            _ = parse_sysfs_bytes(raw, attr=USED_ATTR)
+        assert reason_fragment in exc.value.reason
+        assert USED_ATTR in exc.value.reason
+
+
+class TestSysfsVramProvider:
+    def test_samples_below_limit_hard_channel(self, provider: SysfsVramProvider) -> None:
+        # Given a fake tree reporting low usage.
+        before = datetime.now(UTC)
+        # When sampling.
+        sample = provider.sample()
+        # Then total/used are typed bytes, stamped now, with raw attribute text.
+        assert sample.total == Bytes(_TOTAL)
+        assert sample.used == Bytes(_USED)
+        assert not is_breach(sample)
+        assert before <= sample.collected_at <= datetime.now(UTC)
+        assert not is_stale(sample, now=datetime.now(UTC), max_staleness=timedelta(seconds=5))
+        assert f"{USED_ATTR}={_USED}" in sample.raw
+
+    def test_reuses_fds_and_observes_updates(
+        self, provider: SysfsVramProvider, fake_sysfs: Path
+    ) -> None:
+        # Given a first sample has opened the attribute descriptors.
+        _ = provider.sample()
+        fds = provider.open_descriptors
+        # When the driver value moves to exactly the ceiling.
+        _write_attr(fake_sysfs, USED_ATTR, f"{int(VRAM_CEILING_BYTES)}\n")
+        sample = provider.sample()
+        # Then the same fds re-read the fresh value and it is a breach.
+        assert provider.open_descriptors == fds
+        assert sample.used == VRAM_CEILING_BYTES
+        assert is_breach(sample)
+
+    @pytest.mark.parametrize(
+        ("value", "reason_fragment"),
+        [("", "empty"), ("garbage\n", "non-numeric")],
+    )
+    def test_malformed_used_fails_closed(
+        self, provider: SysfsVramProvider, fake_sysfs: Path, value: str, reason_fragment: str
+    ) -> None:
+        _write_attr(fake_sysfs, USED_ATTR, value)
+        with pytest.raises(TelemetryLossError) as exc:
+            _ = provider.sample()
+        assert reason_fragment in exc.value.reason
+
+    def test_missing_attribute_fails_closed(self, fake_sysfs: Path) -> None:
+        # Given a tree without the used-bytes attribute.
+        (fake_sysfs / "card0" / "device" / USED_ATTR).unlink()
+        provider = SysfsVramProvider(root=fake_sysfs)
+        # When sampling, then it fails closed and holds no descriptors.
+        with pytest.raises(TelemetryLossError) as exc:
+            _ = provider.sample()
+        assert "missing sysfs attribute" in exc.value.reason
+        assert provider.open_descriptors == {}
+
+    def test_missing_card_fails_closed(self, fake_sysfs: Path) -> None:
+        provider = SysfsVramProvider("card7", root=fake_sysfs)
+        with pytest.raises(TelemetryLossError):
+            _ = provider.sample()
+
+    def test_close_is_idempotent(self, fake_sysfs: Path) -> None:
+        provider = SysfsVramProvider(root=fake_sysfs)
+        _ = provider.sample()
+        fds = list(provider.open_descriptors.values())
+        provider.close()
+        provider.close()
+        for fd in fds:
+            with pytest.raises(OSError, match="Bad file descriptor"):
+                _ = os.fstat(fd)
+
+    def test_diagnostics_reads_hwmon_and_link(self, provider: SysfsVramProvider) -> None:
+        diag = provider.diagnostics()
+        assert diag.temperature == "46.0c"
+        assert diag.power == "118.0W"
+        assert diag.gpu_use == "6%"
+        assert diag.clocks == "2528Mhz"
+        assert diag.pcie == "16.0 GT/s PCIe x16"
+        assert diag.raw
+
+    def test_diagnostics_never_raises_on_bare_tree(self, tmp_path: Path) -> None:
+        diag = SysfsVramProvider(root=tmp_path).diagnostics()
+        assert diag.temperature is None
+        assert diag.clocks is None
+        assert not diag.raw
+
+
+class TestSampleLatencyBenchmark:
+    """Micro-benchmark: pread sampling must beat forking rocm-smi per tick."""
+
+    def test_sysfs_sample_is_faster_than_rocm_smi(
+        self, provider: SysfsVramProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given both providers reporting the same device.
+        monkeypatch.setenv("ROCM_SMI_MODE", "valid")
+        rocm = RocmSmiProvider(str(_ROCM_FIXTURE), timeout=timedelta(seconds=5))
+        # When timing the median sample latency of each.
+        sysfs_ns = _median_sample_ns(provider.sample)
+        rocm_ns = _median_sample_ns(rocm.sample)
+        # Then the sysfs read is at least an order of magnitude cheaper.
+        assert sysfs_ns * 10 < rocm_ns, f"sysfs={sysfs_ns}ns rocm-smi={rocm_ns}ns"
+
+
+def _median_sample_ns(sample: Callable[[], object]) -> float:
+    timings: list[int] = []
+    for _ in range(_BENCH_ROUNDS):
+        start = time.perf_counter_ns()
+        _ = sample()
+        timings.append(time.perf_counter_ns() - start)
+    return statistics.median(timings)